@@ -99,6 +99,7 @@ get_workflow_version = _workflows_routes.get_workflow_version
 diff_workflow_versions = _workflows_routes.diff_workflow_versions
 
 create_workflow_run = _runs_routes.create_workflow_run
+create_workflow_runs = _runs_routes.create_workflow_runs
 list_workflow_runs = _runs_routes.list_workflow_runs
 get_workflow_run = _runs_routes.get_workflow_run
 list_workflow_execution_histories = _runs_routes.list_workflow_execution_histories
@@ -136,6 +137,7 @@ __all__ = [
     "create_credential_template",
     "create_workflow",
     "create_workflow_run",
+    "create_workflow_runs",
     "delete_credential",
     "delete_credential_template",
     "diff_workflow_versions",
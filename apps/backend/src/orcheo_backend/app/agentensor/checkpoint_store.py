@@ -15,6 +15,7 @@ from orcheo.agentensor.checkpoints import (
     AgentensorCheckpointNotFoundError,
     AgentensorCheckpointStore,
 )
+from orcheo.tracing.metrics import track_connection_pool
 from orcheo_backend.app.history.sqlite_utils import (
     connect_sqlite,
     ensure_sqlite_schema,
@@ -373,6 +374,7 @@ class PostgresAgentensorCheckpointStore(AgentensorCheckpointStore):
                 },
             )
             await self._pool.open()
+            track_connection_pool("agentensor", self._pool)
             return self._pool
 
     @asynccontextmanager
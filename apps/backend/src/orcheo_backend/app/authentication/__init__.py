@@ -16,6 +16,7 @@ from .dependencies import (
     authenticate_websocket,
     get_auth_rate_limiter,
     get_authenticator,
+    get_cached_service_token_manager,
     get_request_context,
     get_service_token_manager,
     reset_authentication_state,
@@ -39,7 +40,12 @@ from .policy import (
     require_workspace_access,
 )
 from .rate_limit import AuthRateLimiter, SlidingWindowRateLimiter
-from .service_tokens import ServiceTokenManager, ServiceTokenRecord
+from .service_tokens import (
+    ServiceTokenManager,
+    ServiceTokenRecord,
+    ServiceTokenUsage,
+    ServiceTokenUsageAggregator,
+)
 from .settings import (
     AuthSettings,
     _coerce_mode,
@@ -82,6 +88,8 @@ __all__ = [
     "RequestContext",
     "ServiceTokenManager",
     "ServiceTokenRecord",
+    "ServiceTokenUsage",
+    "ServiceTokenUsageAggregator",
     "SlidingWindowRateLimiter",
     "_auth_rate_limiter_cache",
     "_authenticator_cache",
@@ -114,6 +122,7 @@ __all__ = [
     "get_authorization_policy",
     "get_auth_rate_limiter",
     "get_authenticator",
+    "get_cached_service_token_manager",
     "get_request_context",
     "get_service_token_manager",
     "httpx",
@@ -70,6 +70,11 @@ def get_service_token_manager(*, refresh: bool = False) -> ServiceTokenManager:
     return manager
 
 
+def get_cached_service_token_manager() -> ServiceTokenManager | None:
+    """Return the ServiceTokenManager if one was created, without building it."""
+    return _token_manager_cache.get("manager")
+
+
 def get_auth_rate_limiter(*, refresh: bool = False) -> AuthRateLimiter:
     """Return the configured authentication rate limiter."""
     if refresh:
@@ -198,7 +203,7 @@ async def authenticate_request(request: Request) -> RequestContext:
     limiter = api.get_auth_rate_limiter()
     ip = request.client.host if request.client else None
     now = datetime.now(tz=UTC)
-    _enforce_ip_limit(limiter, ip, now)
+    await _enforce_ip_limit(limiter, ip, now)
 
     auth_header = request.headers.get("Authorization")
     token, auth_error = _parse_authorization_header(auth_header)
@@ -231,9 +236,11 @@ async def authenticate_request(request: Request) -> RequestContext:
     raise missing_error.as_http_exception() from missing_error
 
 
-def _enforce_ip_limit(limiter: AuthRateLimiter, ip: str | None, now: datetime) -> None:
+async def _enforce_ip_limit(
+    limiter: AuthRateLimiter, ip: str | None, now: datetime
+) -> None:
     try:
-        limiter.check_ip(ip, now=now)
+        await limiter.check_ip(ip, now=now)
     except AuthenticationError as exc:
         raise exc.as_http_exception() from exc
 
@@ -266,7 +273,7 @@ async def _attempt_bearer_auth_optional(
             raise exc.as_http_exception() from exc
         return None
     try:
-        limiter.check_identity(context.token_id or context.subject, now=now)
+        await limiter.check_identity(context.token_id or context.subject, now=now)
     except AuthenticationError as exc:
         raise exc.as_http_exception() from exc
     auth_telemetry.record_auth_success(context, ip=ip)
@@ -286,7 +293,7 @@ async def authenticate_websocket(websocket: WebSocket) -> RequestContext:  # noq
     ip = websocket.client.host if websocket.client else None
     now = datetime.now(tz=UTC)
     try:
-        limiter.check_ip(ip, now=now)
+        await limiter.check_ip(ip, now=now)
     except AuthenticationError as exc:
         auth_telemetry.record_auth_failure(reason=exc.code, ip=ip)
         await websocket.close(code=exc.websocket_code, reason=exc.message)
@@ -319,7 +326,7 @@ async def authenticate_websocket(websocket: WebSocket) -> RequestContext:  # noq
         raise
 
     try:
-        limiter.check_identity(context.token_id or context.subject, now=now)
+        await limiter.check_identity(context.token_id or context.subject, now=now)
     except AuthenticationError as exc:
         auth_telemetry.record_auth_failure(reason=exc.code, ip=ip)
         await websocket.close(code=exc.websocket_code, reason=exc.message)
@@ -1,12 +1,18 @@
 from __future__ import annotations
-from collections import deque
-from datetime import UTC, datetime, timedelta
+import math
+from datetime import datetime
 from fastapi import status
+from orcheo.ratelimit import RateLimitBackend, create_rate_limit_backend
 from .errors import AuthenticationError
 
 
 class SlidingWindowRateLimiter:
-    """Maintain a sliding window rate limiter for authentication events."""
+    """Rate limit authentication events per key over a rolling interval.
+
+    State lives in a :class:`~orcheo.ratelimit.RateLimitBackend` using GCRA, so
+    each key costs constant memory and a shared backend enforces the limit
+    across replicas. Keys are namespaced by ``code``.
+    """
 
     def __init__(
         self,
@@ -15,75 +21,84 @@ class SlidingWindowRateLimiter:
         *,
         code: str,
         message_template: str,
+        backend: RateLimitBackend | None = None,
     ) -> None:
         """Configure the limiter with bounds, window interval, and error metadata."""
         self._limit = max(int(limit), 0)
         self._interval = max(int(interval_seconds), 1)
         self._code = code
         self._message_template = message_template
-        self._events: dict[str, deque[datetime]] = {}
+        self._backend = backend or create_rate_limit_backend()
 
-    def hit(self, key: str, *, now: datetime | None = None) -> None:
+    async def hit(self, key: str, *, now: datetime | None = None) -> None:
         """Record an attempt and raise when the limit is exceeded."""
         if self._limit == 0 or not key:
             return
 
-        timestamp = now or datetime.now(tz=UTC)
-        window_start = timestamp - timedelta(seconds=self._interval)
-        bucket = self._events.setdefault(key, deque())
-
-        while bucket and bucket[0] <= window_start:
-            bucket.popleft()
-
-        if len(bucket) >= self._limit:
-            message = self._message_template.format(
-                key=key, limit=self._limit, interval=self._interval
-            )
-            raise AuthenticationError(
-                message,
-                code=self._code,
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                headers={"Retry-After": str(self._interval)},
-            )
+        decision = await self._backend.acquire(
+            f"{self._code}:{key}",
+            limit=self._limit,
+            period_seconds=self._interval,
+            now=now.timestamp() if now is not None else None,
+        )
+        if decision.allowed:
+            return
 
-        bucket.append(timestamp)
+        message = self._message_template.format(
+            key=key, limit=self._limit, interval=self._interval
+        )
+        retry_after = max(math.ceil(decision.retry_after), 1)
+        raise AuthenticationError(
+            message,
+            code=self._code,
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={"Retry-After": str(retry_after)},
+        )
 
     def reset(self) -> None:
         """Clear stored rate limiting state."""
-        self._events.clear()
+        self._backend.reset(f"{self._code}:")
 
 
 class AuthRateLimiter:
     """Aggregate rate limiting for per-IP and per-identity enforcement."""
 
     def __init__(
-        self, *, ip_limit: int, identity_limit: int, interval_seconds: int
+        self,
+        *,
+        ip_limit: int,
+        identity_limit: int,
+        interval_seconds: int,
+        backend: RateLimitBackend | None = None,
     ) -> None:
         """Configure rate limits for per-IP and per-identity buckets."""
+        backend = backend or create_rate_limit_backend()
         self._ip = SlidingWindowRateLimiter(
             ip_limit,
             interval_seconds,
             code="auth.rate_limited.ip",
             message_template="Too many authentication attempts from IP {key}",
+            backend=backend,
         )
         self._identity = SlidingWindowRateLimiter(
             identity_limit,
             interval_seconds,
             code="auth.rate_limited.identity",
             message_template="Too many authentication attempts for identity {key}",
+            backend=backend,
         )
 
-    def check_ip(self, ip: str | None, *, now: datetime | None = None) -> None:
+    async def check_ip(self, ip: str | None, *, now: datetime | None = None) -> None:
         """Enforce the configured rate limit for an IP address."""
         if ip:
-            self._ip.hit(ip, now=now)
+            await self._ip.hit(ip, now=now)
 
-    def check_identity(
+    async def check_identity(
         self, identity: str | None, *, now: datetime | None = None
     ) -> None:
         """Enforce the configured rate limit for an authenticated identity."""
         if identity:
-            self._identity.hit(identity, now=now)
+            await self._identity.hit(identity, now=now)
 
     def reset(self) -> None:
         """Reset internal counters for both limiters."""
@@ -1,7 +1,10 @@
 from __future__ import annotations
+import asyncio
 import hashlib
 import hmac
+import logging
 import secrets
+from collections import OrderedDict
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime, timedelta
@@ -11,6 +14,13 @@ from .errors import AuthenticationError
 from .telemetry import auth_telemetry
 
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_VERIFIED_TOKEN_TTL = timedelta(seconds=10)
+DEFAULT_VERIFIED_TOKEN_CACHE_SIZE = 1024
+DEFAULT_USAGE_FLUSH_INTERVAL_SECONDS = 5.0
+
+
 @dataclass(frozen=True)
 class ServiceTokenRecord:
     """Configuration describing a hashed service token."""
@@ -49,14 +59,119 @@ class ServiceTokenRecord:
         return not self.is_revoked() and not self.is_expired(now=now)
 
 
+@dataclass(frozen=True)
+class ServiceTokenUsage:
+    """Usage accumulated for a token between two flushes."""
+
+    count: int
+    last_used_at: datetime
+
+
+class ServiceTokenUsageAggregator:
+    """Coalesce token usage and persist it in periodic batches.
+
+    Authentications only update an in-memory tally. A background task started
+    on first use writes the tally through ``record_usage_batch`` every
+    ``flush_interval`` seconds and exits once nothing is pending. Usage that
+    fails to persist is merged back and retried on the next flush.
+    """
+
+    def __init__(
+        self,
+        repository: Any,
+        *,
+        flush_interval: float = DEFAULT_USAGE_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        """Store the repository and flush cadence."""
+        self._repository = repository
+        self._flush_interval = flush_interval
+        self._pending: dict[str, ServiceTokenUsage] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def pending(self) -> dict[str, ServiceTokenUsage]:
+        """Return a snapshot of usage that has not been persisted yet."""
+        return dict(self._pending)
+
+    def record(self, identifier: str, used_at: datetime) -> None:
+        """Count one use of ``identifier`` at ``used_at``."""
+        self._merge({identifier: ServiceTokenUsage(1, used_at)})
+        self._ensure_flusher()
+
+    async def flush(self) -> int:
+        """Persist pending usage and return the number of tokens written."""
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        try:
+            await self._repository.record_usage_batch(pending)
+        except Exception:
+            logger.warning(
+                "Failed to persist usage for %d service token(s)",
+                len(pending),
+                exc_info=True,
+            )
+            self._merge(pending)
+            return 0
+        return len(pending)
+
+    async def aclose(self) -> None:
+        """Stop the background flusher and persist any pending usage."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+
+    def _merge(self, usage: dict[str, ServiceTokenUsage]) -> None:
+        for identifier, entry in usage.items():
+            current = self._pending.get(identifier)
+            self._pending[identifier] = (
+                entry
+                if current is None
+                else ServiceTokenUsage(
+                    current.count + entry.count,
+                    max(current.last_used_at, entry.last_used_at),
+                )
+            )
+
+    def _ensure_flusher(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = self._task
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return
+        self._task = loop.create_task(self._run(), name="service-token-usage-flusher")
+
+    async def _run(self) -> None:
+        while self._pending:
+            await asyncio.sleep(self._flush_interval)
+            await self.flush()
+
+
 class ServiceTokenManager:
-    """Manage lifecycle of service tokens with database persistence."""
+    """Manage lifecycle of service tokens with database persistence.
+
+    Successfully verified tokens are cached by hash for ``verified_ttl`` so
+    repeated requests skip the database lookup, and usage is recorded through
+    a :class:`ServiceTokenUsageAggregator`. Minting, rotating or revoking a
+    token clears the cache of this manager; other processes observe those
+    changes once their cached entries expire.
+    """
 
     def __init__(
         self,
         repository: Any,
         *,
         clock: Callable[[], datetime] | None = None,
+        verified_ttl: timedelta = DEFAULT_VERIFIED_TOKEN_TTL,
+        max_verified_tokens: int = DEFAULT_VERIFIED_TOKEN_CACHE_SIZE,
+        usage_flush_interval: float = DEFAULT_USAGE_FLUSH_INTERVAL_SECONDS,
     ) -> None:
         """Initialize the manager with a token repository."""
         self._repository = repository
@@ -64,11 +179,24 @@ class ServiceTokenManager:
         self._cache: dict[str, ServiceTokenRecord] = {}
         self._cache_expires_at: datetime | None = None
         self._cache_ttl = timedelta(seconds=30)
+        self._verified: OrderedDict[str, tuple[ServiceTokenRecord, datetime]] = (
+            OrderedDict()
+        )
+        self._verified_ttl = verified_ttl
+        self._max_verified = max(int(max_verified_tokens), 1)
+        self._usage = ServiceTokenUsageAggregator(
+            repository, flush_interval=usage_flush_interval
+        )
+
+    @property
+    def usage(self) -> ServiceTokenUsageAggregator:
+        """Expose the aggregator buffering token usage."""
+        return self._usage
 
     async def _get_cache(self) -> dict[str, ServiceTokenRecord]:
         """Return cached active tokens, refreshing if stale."""
         now = self._clock()
-        if self._cache and self._cache_expires_at and now < self._cache_expires_at:
+        if self._cache_expires_at and now < self._cache_expires_at:
             return self._cache
 
         active_records = await self._repository.list_active(now=now)
@@ -77,9 +205,10 @@ class ServiceTokenManager:
         return self._cache
 
     def _invalidate_cache(self) -> None:
-        """Clear the token cache to force reload."""
+        """Clear the token caches to force reload."""
         self._cache.clear()
         self._cache_expires_at = None
+        self._verified.clear()
 
     async def all(self) -> tuple[ServiceTokenRecord, ...]:
         """Return all active service token records."""
@@ -89,12 +218,15 @@ class ServiceTokenManager:
     async def authenticate(self, token: str) -> ServiceTokenRecord:
         """Return the record for ``token`` or raise an AuthenticationError."""
         digest = hashlib.sha256(token.encode("utf-8")).hexdigest()
-        record = await self._repository.find_by_hash(digest)
-
-        if record is None or not record.matches(token):
-            raise AuthenticationError("Invalid bearer token", code="auth.invalid_token")
-
         check_time = self._clock()
+        record = self._cached_verified(digest, check_time)
+        if record is None:
+            record = await self._repository.find_by_hash(digest)
+            if record is None or not record.matches(token):
+                raise AuthenticationError(
+                    "Invalid bearer token", code="auth.invalid_token"
+                )
+
         if record.is_revoked():
             raise AuthenticationError(
                 "Service token has been revoked",
@@ -102,24 +234,52 @@ class ServiceTokenManager:
                 status_code=status.HTTP_403_FORBIDDEN,
             )
         if record.is_expired(now=check_time):
+            self._verified.pop(digest, None)
             raise AuthenticationError(
                 "Service token has expired",
                 code="auth.token_expired",
                 status_code=status.HTTP_403_FORBIDDEN,
             )
 
-        await self._repository.record_usage(record.identifier)
         usage_time = self._clock()
+        self._usage.record(record.identifier, usage_time)
         updated_record = replace(
             record,
             last_used_at=usage_time,
             use_count=record.use_count + 1,
         )
+        self._remember_verified(digest, updated_record, check_time)
         if record.identifier in self._cache:
             self._cache[record.identifier] = updated_record
 
         return updated_record
 
+    async def flush_usage(self) -> int:
+        """Persist buffered usage and return the number of tokens written."""
+        return await self._usage.flush()
+
+    async def aclose(self) -> None:
+        """Stop background usage flushing after persisting pending usage."""
+        await self._usage.aclose()
+
+    def _cached_verified(self, digest: str, now: datetime) -> ServiceTokenRecord | None:
+        entry = self._verified.get(digest)
+        if entry is None:
+            return None
+        record, cached_until = entry
+        if now >= cached_until:
+            del self._verified[digest]
+            return None
+        return record
+
+    def _remember_verified(
+        self, digest: str, record: ServiceTokenRecord, now: datetime
+    ) -> None:
+        cached_until = self._verified.pop(digest, (record, now + self._verified_ttl))[1]
+        self._verified[digest] = (record, cached_until)
+        while len(self._verified) > self._max_verified:
+            self._verified.popitem(last=False)
+
     async def mint(
         self,
         *,
@@ -28,6 +28,7 @@ with warnings.catch_warnings():
         WidgetRoot,
     )
 from langchain_core.messages import BaseMessage
+from orcheo.graph.blobs import with_resolved_blobs
 from orcheo.runtime.state_builder import build_initial_state as build_runtime_state
 
 
@@ -85,6 +86,7 @@ def build_initial_state(
 
 def extract_reply_from_state(state: Mapping[str, Any]) -> str | None:
     """Attempt to pull an assistant reply from the workflow state."""
+    state = with_resolved_blobs(state)
     if "reply" in state:
         reply = state["reply"]
         if reply is not None:
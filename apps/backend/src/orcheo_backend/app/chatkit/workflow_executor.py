@@ -13,6 +13,7 @@ from langchain_core.messages import BaseMessage
 from langchain_core.runnables import RunnableConfig
 from pydantic import BaseModel
 from orcheo.config import get_settings
+from orcheo.graph.blobs import aresolve_blob_refs
 from orcheo.graph.builder import build_graph
 from orcheo.models import CredentialAccessContext
 from orcheo.nodes.agent_tools.context import tool_progress_context
@@ -105,7 +106,7 @@ async def _append_chatkit_history_step(
 ) -> None:
     """Append a streamed node step to ChatKit execution history."""
     try:
-        await history_store.append_step(execution_id, step)
+        await history_store.append_step(execution_id, await aresolve_blob_refs(step))
     except RunHistoryError:
         logger.exception(
             "Failed to append chatkit history step for execution %s",
@@ -7,6 +7,7 @@ from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from typing import Any
 from chatkit.store import Store
+from orcheo.tracing.metrics import track_connection_pool
 from orcheo_backend.app.chatkit_store_postgres.schema import ensure_schema
 from orcheo_backend.app.chatkit_store_postgres.types import ChatKitRequestContext
 from orcheo_backend.app.chatkit_store_postgres.utils import now_utc
@@ -76,6 +77,7 @@ class BasePostgresStore(Store[ChatKitRequestContext]):
                 },
             )
             await self._pool.open()
+            track_connection_pool("chatkit", self._pool)
             return self._pool
 
     @asynccontextmanager
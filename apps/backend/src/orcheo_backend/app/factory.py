@@ -10,12 +10,15 @@ from fastapi import APIRouter, Depends, FastAPI, Request, Response
 from fastapi.exception_handlers import http_exception_handler
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import PlainTextResponse
+from orcheo.external_agents import close_warm_process_pools
 from orcheo.plugins import load_enabled_plugins
-from orcheo.tracing import configure_tracing
+from orcheo.runtime.http_clients import close_http_clients
+from orcheo.tracing import CONTENT_TYPE_LATEST, configure_tracing, render_metrics
 from orcheo.vault.oauth import OAuthCredentialService
 from orcheo_backend.app.authentication import (
     AuthenticationError,
     authenticate_request,
+    get_cached_service_token_manager,
     load_auth_settings,
 )
 from orcheo_backend.app.chatkit_runtime import (
@@ -39,7 +42,7 @@ from orcheo_backend.app.dependencies import (
 from orcheo_backend.app.history import RunHistoryStore
 from orcheo_backend.app.listener_runtime_service import ListenerRuntimeService
 from orcheo_backend.app.logging_config import configure_logging
-from orcheo_backend.app.repository import WorkflowRepository
+from orcheo_backend.app.repository import RunOutboxStore, WorkflowRepository
 from orcheo_backend.app.routers import (
     agentensor,
     auth,
@@ -59,6 +62,7 @@ from orcheo_backend.app.routers import (
 from orcheo_backend.app.routers import (
     chatkit as chatkit_router,
 )
+from orcheo_backend.app.run_outbox import RunOutboxRelay
 from orcheo_backend.app.service_token_endpoints import router as service_token_router
 from orcheo_backend.app.workflow_execution import configure_sensitive_logging
 
@@ -138,6 +142,79 @@ def _load_allowed_origins() -> list[str]:
     return origins or list(_DEFAULT_ALLOWED_ORIGINS)
 
 
+async def _start_run_outbox_relay(
+    repository: WorkflowRepository,
+) -> RunOutboxRelay | None:
+    """Start the run outbox relay when the repository persists an outbox."""
+    if not isinstance(repository, RunOutboxStore):
+        return None
+    relay = RunOutboxRelay.from_env(repository)
+    await relay.start()
+    return relay
+
+
+async def _stop_run_outbox_relay(relay: RunOutboxRelay | None) -> None:
+    if relay is not None:
+        await relay.stop()
+
+
+async def _flush_service_token_usage() -> None:
+    manager = get_cached_service_token_manager()
+    if manager is not None:
+        await manager.aclose()
+
+
+def _register_public_routes(application: FastAPI) -> None:
+    """Register unauthenticated operational routes."""
+
+    @application.get("/robots.txt", include_in_schema=False)
+    async def robots_txt() -> PlainTextResponse:
+        """Expose crawl policy for public backend deployments."""
+        return PlainTextResponse("User-agent: *\nDisallow: /\n")
+
+
+def _register_metrics_route(application: FastAPI) -> None:
+    """Register the authenticated Prometheus scrape endpoint."""
+
+    @application.get(
+        "/metrics",
+        include_in_schema=False,
+        dependencies=[Depends(authenticate_request)],
+    )
+    async def metrics() -> Response:
+        """Expose runtime metrics in the Prometheus text format."""
+        return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+
+def _apply_dependency_overrides(
+    application: FastAPI,
+    *,
+    repository: WorkflowRepository | None,
+    history_store: RunHistoryStore | None,
+    credential_service: OAuthCredentialService | None,
+) -> None:
+    """Install explicitly provided dependencies on the application."""
+    if repository is not None:
+        set_repository(repository)  # pragma: no mutate - override for tests
+        application.dependency_overrides[get_repository] = lambda: repository
+    if history_store is not None:
+        set_history_store(history_store)
+        application.dependency_overrides[get_history_store] = lambda: history_store
+    if credential_service is not None:
+        set_credential_service(credential_service)
+        set_vault(getattr(credential_service, "_vault", None))
+        application.dependency_overrides[get_credential_service] = (
+            lambda: credential_service
+        )
+    elif repository is not None:
+        inferred_service = getattr(repository, "_credential_service", None)
+        if inferred_service is not None:
+            set_credential_service(inferred_service)
+            application.dependency_overrides[get_credential_service] = (
+                lambda: inferred_service
+            )
+
+
 def create_app(
     repository: WorkflowRepository | None = None,
     *,
@@ -151,8 +228,11 @@ def create_app(
         """Manage application lifespan with startup and shutdown logic."""
         load_auth_settings(refresh=True)
         load_enabled_plugins(force=True)
+        active_repository = get_repository()
+        run_outbox_relay = await _start_run_outbox_relay(active_repository)
+        app.state.run_outbox_relay = run_outbox_relay
         listener_runtime = ListenerRuntimeService(
-            repository=get_repository(),
+            repository=active_repository,
             vault=get_vault(),
             runtime_store=get_listener_runtime_store(),
         )
@@ -167,14 +247,16 @@ def create_app(
             yield
         finally:
             await listener_runtime.stop()
+            await _stop_run_outbox_relay(run_outbox_relay)
+            await _flush_service_token_usage()
             await cancel_chatkit_cleanup_task()
+            await close_http_clients()
+            await close_warm_process_pools()
 
     application = FastAPI(lifespan=lifespan)
 
-    @application.get("/robots.txt", include_in_schema=False)
-    async def robots_txt() -> PlainTextResponse:
-        """Expose crawl policy for public backend deployments."""
-        return PlainTextResponse("User-agent: *\nDisallow: /\n")
+    _register_public_routes(application)
+    _register_metrics_route(application)
 
     allowed_origins = _load_allowed_origins()
 
@@ -186,27 +268,14 @@ def create_app(
         allow_headers=["*"],
     )
 
-    if repository is not None:
-        set_repository(repository)  # pragma: no mutate - override for tests
-        application.dependency_overrides[get_repository] = lambda: repository
-    if history_store is not None:
-        set_history_store(history_store)
-        application.dependency_overrides[get_history_store] = lambda: history_store
+    _apply_dependency_overrides(
+        application,
+        repository=repository,
+        history_store=history_store,
+        credential_service=credential_service,
+    )
     listener_runtime_store = get_listener_runtime_store()
     set_listener_runtime_store(listener_runtime_store)
-    if credential_service is not None:
-        set_credential_service(credential_service)
-        set_vault(getattr(credential_service, "_vault", None))
-        application.dependency_overrides[get_credential_service] = (
-            lambda: credential_service
-        )
-    elif repository is not None:
-        inferred_service = getattr(repository, "_credential_service", None)
-        if inferred_service is not None:
-            set_credential_service(inferred_service)
-            application.dependency_overrides[get_credential_service] = (
-                lambda: inferred_service
-            )
 
     application.include_router(api_router)
     application.include_router(chatkit_assets.router)
@@ -5,6 +5,7 @@ import asyncio
 from collections.abc import Mapping
 from datetime import datetime
 from typing import Any
+from orcheo.tracing.metrics import HISTORY_OPERATION_SECONDS
 from orcheo_backend.app.history.models import (
     RunHistoryError,
     RunHistoryNotFoundError,
@@ -25,6 +26,7 @@ class InMemoryRunHistoryStore:
         self._lock = asyncio.Lock()
         self._histories: dict[str, RunHistoryRecord] = {}
 
+    @HISTORY_OPERATION_SECONDS.time(store="memory", operation="start_run")
     async def start_run(
         self,
         *,
@@ -104,6 +106,7 @@ class InMemoryRunHistoryStore:
             self._histories[execution_id] = record
             return record.model_copy(deep=True)
 
+    @HISTORY_OPERATION_SECONDS.time(store="memory", operation="append_step")
     async def append_step(
         self,
         execution_id: str,
@@ -114,6 +117,7 @@ class InMemoryRunHistoryStore:
             record = self._require_record(execution_id)
             return record.append_step(normalize_json_mapping(payload))
 
+    @HISTORY_OPERATION_SECONDS.time(store="memory", operation="mark_completed")
     async def mark_completed(self, execution_id: str) -> RunHistoryRecord:
         """Mark the execution as completed."""
         async with self._lock:
@@ -121,6 +125,7 @@ class InMemoryRunHistoryStore:
             record.mark_completed()
             return record.model_copy(deep=True)
 
+    @HISTORY_OPERATION_SECONDS.time(store="memory", operation="mark_failed")
     async def mark_failed(self, execution_id: str, error: str) -> RunHistoryRecord:
         """Mark the execution as failed with the specified error message."""
         async with self._lock:
@@ -128,6 +133,7 @@ class InMemoryRunHistoryStore:
             record.mark_failed(error)
             return record.model_copy(deep=True)
 
+    @HISTORY_OPERATION_SECONDS.time(store="memory", operation="mark_cancelled")
     async def mark_cancelled(
         self,
         execution_id: str,
@@ -8,6 +8,7 @@ from collections.abc import AsyncIterator, Mapping
 from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any
+from orcheo.tracing.metrics import HISTORY_OPERATION_SECONDS, track_connection_pool
 from orcheo_backend.app.history.models import (
     RunHistoryError,
     RunHistoryNotFoundError,
@@ -123,6 +124,7 @@ class PostgresRunHistoryStore:
                 },
             )
             await self._pool.open()
+            track_connection_pool("history", self._pool)
             return self._pool
 
     @asynccontextmanager
@@ -158,6 +160,7 @@ class PostgresRunHistoryStore:
 
             self._initialized = True
 
+    @HISTORY_OPERATION_SECONDS.time(store="postgres", operation="start_run")
     async def start_run(
         self,
         *,
@@ -266,6 +269,7 @@ class PostgresRunHistoryStore:
                 trace_last_span_at=trace_started,
             )
 
+    @HISTORY_OPERATION_SECONDS.time(store="postgres", operation="append_step")
     async def append_step(
         self,
         execution_id: str,
@@ -320,10 +324,12 @@ class PostgresRunHistoryStore:
             payload=normalize_json_mapping(payload),
         )
 
+    @HISTORY_OPERATION_SECONDS.time(store="postgres", operation="mark_completed")
     async def mark_completed(self, execution_id: str) -> RunHistoryRecord:
         """Mark the execution as completed."""
         return await self._update_status(execution_id, status="completed", error=None)
 
+    @HISTORY_OPERATION_SECONDS.time(store="postgres", operation="mark_failed")
     async def mark_failed(
         self,
         execution_id: str,
@@ -332,6 +338,7 @@ class PostgresRunHistoryStore:
         """Mark the execution as failed with the specified error message."""
         return await self._update_status(execution_id, status="error", error=error)
 
+    @HISTORY_OPERATION_SECONDS.time(store="postgres", operation="mark_cancelled")
     async def mark_cancelled(
         self,
         execution_id: str,
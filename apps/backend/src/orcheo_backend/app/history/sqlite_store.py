@@ -8,6 +8,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 import aiosqlite
+from orcheo.tracing.metrics import HISTORY_OPERATION_SECONDS
 from orcheo_backend.app.history.models import (
     RunHistoryError,
     RunHistoryNotFoundError,
@@ -44,6 +45,7 @@ class SqliteRunHistoryStore:
         self._init_lock = asyncio.Lock()
         self._initialized = False
 
+    @HISTORY_OPERATION_SECONDS.time(store="sqlite", operation="start_run")
     async def start_run(
         self,
         *,
@@ -151,6 +153,7 @@ class SqliteRunHistoryStore:
                 trace_last_span_at=trace_started,
             )
 
+    @HISTORY_OPERATION_SECONDS.time(store="sqlite", operation="append_step")
     async def append_step(
         self,
         execution_id: str,
@@ -196,10 +199,12 @@ class SqliteRunHistoryStore:
             payload=normalize_json_mapping(payload),
         )
 
+    @HISTORY_OPERATION_SECONDS.time(store="sqlite", operation="mark_completed")
     async def mark_completed(self, execution_id: str) -> RunHistoryRecord:
         """Mark the execution as completed."""
         return await self._update_status(execution_id, status="completed", error=None)
 
+    @HISTORY_OPERATION_SECONDS.time(store="sqlite", operation="mark_failed")
     async def mark_failed(
         self,
         execution_id: str,
@@ -208,6 +213,7 @@ class SqliteRunHistoryStore:
         """Mark the execution as failed with the specified error message."""
         return await self._update_status(execution_id, status="error", error=error)
 
+    @HISTORY_OPERATION_SECONDS.time(store="sqlite", operation="mark_cancelled")
     async def mark_cancelled(
         self,
         execution_id: str,
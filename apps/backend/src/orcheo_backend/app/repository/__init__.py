@@ -13,7 +13,13 @@ from orcheo_backend.app.repository.errors import (
     WorkflowVersionNotFoundError,
 )
 from orcheo_backend.app.repository.in_memory import InMemoryWorkflowRepository
-from orcheo_backend.app.repository.protocol import VersionDiff, WorkflowRepository
+from orcheo_backend.app.repository.protocol import (
+    RunOutboxEntry,
+    RunOutboxStore,
+    VersionDiff,
+    WorkflowRepository,
+    WorkflowRunSpec,
+)
 
 
 if TYPE_CHECKING:  # pragma: no cover - import for typing only
@@ -37,6 +43,8 @@ __all__ = [
     "SqliteWorkflowRepository",
     "CronTriggerNotFoundError",
     "RepositoryError",
+    "RunOutboxEntry",
+    "RunOutboxStore",
     "VersionDiff",
     "WorkflowHandleConflictError",
     "Workflow",
@@ -44,6 +52,7 @@ __all__ = [
     "WorkflowPublishStateError",
     "WorkflowRun",
     "WorkflowRunNotFoundError",
+    "WorkflowRunSpec",
     "WorkflowVersion",
     "WorkflowVersionNotFoundError",
 ]
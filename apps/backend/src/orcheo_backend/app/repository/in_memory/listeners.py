@@ -1,7 +1,8 @@
 """Listener subscription persistence for the in-memory repository."""
 
 from __future__ import annotations
-from datetime import timedelta
+from collections.abc import Sequence
+from datetime import datetime, timedelta
 from uuid import UUID
 from orcheo.listeners import (
     ListenerCursor,
@@ -67,20 +68,24 @@ class ListenerRepositoryMixin(InMemoryRepositoryState):
         self,
         *,
         workflow_id: UUID | None = None,
+        updated_since: datetime | None = None,
     ) -> list[ListenerSubscription]:
-        """Return all listener subscriptions, optionally scoped to one workflow."""
+        """Return listener subscriptions, optionally scoped and filtered by age."""
         async with self._lock:
             if workflow_id is None:
-                return [
-                    subscription.model_copy(deep=True)
-                    for subscription in self._listener_subscriptions.values()
+                subscriptions = list(self._listener_subscriptions.values())
+            else:
+                subscriptions = [
+                    self._listener_subscriptions[subscription_id]
+                    for subscription_id in self._workflow_listener_subscriptions.get(
+                        workflow_id, []
+                    )
+                    if subscription_id in self._listener_subscriptions
                 ]
             return [
-                self._listener_subscriptions[subscription_id].model_copy(deep=True)
-                for subscription_id in self._workflow_listener_subscriptions.get(
-                    workflow_id, []
-                )
-                if subscription_id in self._listener_subscriptions
+                subscription.model_copy(deep=True)
+                for subscription in subscriptions
+                if updated_since is None or subscription.updated_at > updated_since
             ]
 
     async def get_listener_subscription(
@@ -126,6 +131,59 @@ class ListenerRepositoryMixin(InMemoryRepositoryState):
                 )
             return subscription.model_copy(deep=True)
 
+    async def claim_listener_subscriptions(
+        self,
+        *,
+        runtime_id: str,
+        lease_seconds: int,
+    ) -> list[ListenerSubscription]:
+        """Claim every active subscription that is unassigned or lease-expired."""
+        async with self._lock:
+            now = _utcnow()
+            claimed: list[ListenerSubscription] = []
+            for subscription in self._listener_subscriptions.values():
+                if subscription.status != ListenerSubscriptionStatus.ACTIVE:
+                    continue
+                if (
+                    subscription.assigned_runtime
+                    and subscription.lease_expires_at is not None
+                    and subscription.lease_expires_at > now
+                ):
+                    continue
+                should_record_claim = subscription.assigned_runtime != runtime_id
+                subscription.assigned_runtime = runtime_id
+                subscription.lease_expires_at = now + timedelta(seconds=lease_seconds)
+                if should_record_claim:
+                    subscription.record_event(
+                        actor=runtime_id,
+                        action="listener_subscription_claimed",
+                    )
+                claimed.append(subscription.model_copy(deep=True))
+            return claimed
+
+    async def renew_listener_subscription_leases(
+        self,
+        subscription_ids: Sequence[UUID],
+        *,
+        runtime_id: str,
+        lease_seconds: int,
+    ) -> list[UUID]:
+        """Extend leases still held by ``runtime_id`` and return their ids."""
+        async with self._lock:
+            lease_expires_at = _utcnow() + timedelta(seconds=lease_seconds)
+            renewed: list[UUID] = []
+            for subscription_id in subscription_ids:
+                subscription = self._listener_subscriptions.get(subscription_id)
+                if (
+                    subscription is None
+                    or subscription.status != ListenerSubscriptionStatus.ACTIVE
+                    or subscription.assigned_runtime != runtime_id
+                ):
+                    continue
+                subscription.lease_expires_at = lease_expires_at
+                renewed.append(subscription_id)
+            return renewed
+
     async def release_listener_subscription(
         self,
         subscription_id: UUID,
@@ -171,12 +229,23 @@ class ListenerRepositoryMixin(InMemoryRepositoryState):
         payload: ListenerDispatchPayload,
     ) -> WorkflowRun | None:
         """Dispatch a deduplicated listener event into the workflow run queue."""
+        runs = await self.dispatch_listener_events(subscription_id, [payload])
+        return runs[0] if runs else None
+
+    async def dispatch_listener_events(
+        self,
+        subscription_id: UUID,
+        payloads: Sequence[ListenerDispatchPayload],
+    ) -> list[WorkflowRun]:
+        """Dispatch a batch of listener events, skipping duplicates."""
+        if not payloads:
+            return []
         async with self._lock:
             subscription = self._listener_subscriptions.get(subscription_id)
             if subscription is None:
                 raise WorkflowNotFoundError(str(subscription_id))
             if subscription.status != ListenerSubscriptionStatus.ACTIVE:
-                return None
+                return []
 
             version = self._versions.get(subscription.workflow_version_id)
             if version is None:
@@ -185,36 +254,49 @@ class ListenerRepositoryMixin(InMemoryRepositoryState):
                 )
 
             now = _utcnow()
-            window = int(subscription.config.get("dedupe_window_seconds", 300))
             existing_records = self._listener_dedupe.setdefault(subscription_id, {})
-            expired = [
-                key
-                for key, record in existing_records.items()
-                if record.expires_at <= now
-            ]
-            for key in expired:
-                existing_records.pop(key, None)
-            if payload.dedupe_key in existing_records:
-                return None
+            candidates: dict[str, ListenerDispatchPayload] = {}
+            for payload in payloads:
+                candidates.setdefault(payload.dedupe_key, payload)
+            runs: list[WorkflowRun] = []
+            for payload in candidates.values():
+                record = existing_records.get(payload.dedupe_key)
+                if record is not None and record.expires_at > now:
+                    continue
+                existing_records[payload.dedupe_key] = ListenerDedupeRecord(
+                    subscription_id=subscription_id,
+                    dedupe_key=payload.dedupe_key,
+                    expires_at=now + subscription.dedupe_window,
+                )
+                run = self._create_run_locked(
+                    workflow_id=subscription.workflow_id,
+                    workflow_version_id=version.id,
+                    triggered_by="listener",
+                    input_payload=payload.model_copy(
+                        update={"listener_subscription_id": subscription_id}
+                    ).to_input_payload(),
+                    actor="listener",
+                )
+                runs.append(run.model_copy(deep=True))
 
-            existing_records[payload.dedupe_key] = ListenerDedupeRecord(
-                subscription_id=subscription_id,
-                dedupe_key=payload.dedupe_key,
-                expires_at=now + timedelta(seconds=window),
-            )
+            if runs:
+                subscription.last_event_at = now
+                subscription.last_error = None
+            return runs
 
-            subscription.last_event_at = now
-            subscription.last_error = None
-            run = self._create_run_locked(
-                workflow_id=subscription.workflow_id,
-                workflow_version_id=version.id,
-                triggered_by="listener",
-                input_payload=payload.model_copy(
-                    update={"listener_subscription_id": subscription_id}
-                ).to_input_payload(),
-                actor="listener",
-            )
-            return run.model_copy(deep=True)
+    async def purge_expired_listener_dedupe(self) -> int:
+        """Drop expired dedupe records and return how many were removed."""
+        async with self._lock:
+            now = _utcnow()
+            removed = 0
+            for records in self._listener_dedupe.values():
+                expired = [
+                    key for key, record in records.items() if record.expires_at <= now
+                ]
+                for key in expired:
+                    del records[key]
+                removed += len(expired)
+            return removed
 
     async def update_listener_subscription_status(
         self,
@@ -1,14 +1,17 @@
 """Workflow run lifecycle helpers."""
 
 from __future__ import annotations
+from collections.abc import Sequence
 from typing import Any
 from uuid import UUID
 from orcheo.models.workflow import WorkflowRun
 from orcheo_backend.app.repository.errors import (
     WorkflowNotFoundError,
     WorkflowRunNotFoundError,
+    WorkflowVersionNotFoundError,
 )
 from orcheo_backend.app.repository.in_memory.state import InMemoryRepositoryState
+from orcheo_backend.app.repository.protocol import WorkflowRunSpec
 
 
 class WorkflowRunMixin(InMemoryRepositoryState):
@@ -42,6 +45,41 @@ class WorkflowRunMixin(InMemoryRepositoryState):
             )
             return run.model_copy(deep=True)
 
+    async def create_runs(
+        self,
+        workflow_id: UUID,
+        runs: Sequence[WorkflowRunSpec],
+        *,
+        actor: str | None = None,
+    ) -> list[WorkflowRun]:
+        """Create several runs, validating every version before storing any."""
+        if not runs:
+            return []
+        async with self._lock:
+            workflow = self._workflows.get(workflow_id)
+            if workflow is None or workflow.is_archived:
+                raise WorkflowNotFoundError(str(workflow_id))
+            for spec in runs:
+                version = self._versions.get(spec.workflow_version_id)
+                if version is None or version.workflow_id != workflow_id:
+                    raise WorkflowVersionNotFoundError(str(spec.workflow_version_id))
+
+            await self._ensure_workflow_health(
+                workflow_id, actor=actor or runs[0].triggered_by
+            )
+
+            return [
+                self._create_run_locked(
+                    workflow_id=workflow_id,
+                    workflow_version_id=spec.workflow_version_id,
+                    triggered_by=spec.triggered_by,
+                    input_payload=spec.input_payload,
+                    actor=actor,
+                    runnable_config=spec.runnable_config,
+                ).model_copy(deep=True)
+                for spec in runs
+            ]
+
     async def list_runs_for_workflow(
         self, workflow_id: UUID, *, limit: int | None = None
     ) -> list[WorkflowRun]:
@@ -77,6 +77,7 @@ class InMemoryRepositoryState:
         input_payload: Mapping[str, Any],
         actor: str | None = None,
         runnable_config: Mapping[str, Any] | None = None,
+        run_id: UUID | None = None,
     ) -> WorkflowRun:
         """Create and store a workflow run. Caller must hold the lock."""
         if workflow_id not in self._workflows:  # pragma: no cover, defensive
@@ -128,6 +129,8 @@ class InMemoryRepositoryState:
             metadata=metadata,
             run_name=run_name,
         )
+        if run_id is not None:
+            run.id = run_id
         run.record_event(actor=actor or triggered_by, action="run_created")
         self._runs[run.id] = run
         self._version_runs.setdefault(workflow_version_id, []).append(run.id)
@@ -3,10 +3,11 @@
 from __future__ import annotations
 import logging
 from collections.abc import Mapping
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 from orcheo.models.workflow import WorkflowRun
+from orcheo.tracing.metrics import track_trigger_dispatch
 from orcheo.triggers.cron import CronTriggerConfig
 from orcheo.triggers.manual import ManualDispatchRequest
 from orcheo.triggers.webhook import WebhookRequest, WebhookTriggerConfig
@@ -32,7 +33,7 @@ class TriggerDispatchMixin(InMemoryRepositoryState):
         async with self._lock:
             if workflow_id not in self._workflows:
                 raise WorkflowNotFoundError(str(workflow_id))
-            return self._trigger_layer.configure_webhook(workflow_id, config)
+            return await self._trigger_layer.update_webhook_config(workflow_id, config)
 
     async def get_webhook_trigger_config(
         self, workflow_id: UUID
@@ -43,6 +44,7 @@ class TriggerDispatchMixin(InMemoryRepositoryState):
                 raise WorkflowNotFoundError(str(workflow_id))
             return self._trigger_layer.get_webhook_config(workflow_id)
 
+    @track_trigger_dispatch("webhook")
     async def handle_webhook_trigger(
         self,
         workflow_id: UUID,
@@ -52,8 +54,15 @@ class TriggerDispatchMixin(InMemoryRepositoryState):
         query_params: Mapping[str, str],
         payload: Any,
         source_ip: str | None,
+        enqueue_delay: timedelta | None = None,
+        run_id: UUID | None = None,
     ) -> WorkflowRun:
-        """Validate webhook input and enqueue a workflow run."""
+        """Validate webhook input and enqueue a workflow run.
+
+        The in-memory repository has no run outbox, so ``enqueue_delay`` is
+        accepted for interface compatibility only.
+        """
+        del enqueue_delay
         async with self._lock:
             workflow = self._workflows.get(workflow_id)
             if workflow is None:
@@ -76,7 +85,7 @@ class TriggerDispatchMixin(InMemoryRepositoryState):
                 payload=payload,
                 source_ip=source_ip,
             )
-            dispatch = self._trigger_layer.prepare_webhook_dispatch(
+            dispatch = await self._trigger_layer.prepare_webhook_dispatch(
                 workflow_id, request
             )
             run = self._create_run_locked(
@@ -85,6 +94,7 @@ class TriggerDispatchMixin(InMemoryRepositoryState):
                 triggered_by=dispatch.triggered_by,
                 input_payload=dispatch.input_payload,
                 actor=dispatch.actor,
+                run_id=run_id,
             )
             return run.model_copy(deep=True)
 
@@ -116,6 +126,7 @@ class TriggerDispatchMixin(InMemoryRepositoryState):
                 raise WorkflowNotFoundError(str(workflow_id))
             self._trigger_layer.remove_cron_config(workflow_id)
 
+    @track_trigger_dispatch("cron")
     async def dispatch_due_cron_runs(
         self, *, now: datetime | None = None
     ) -> list[WorkflowRun]:
@@ -163,6 +174,7 @@ class TriggerDispatchMixin(InMemoryRepositoryState):
                 runs.append(run.model_copy(deep=True))
             return runs
 
+    @track_trigger_dispatch("manual")
     async def dispatch_manual_runs(
         self, request: ManualDispatchRequest
     ) -> list[WorkflowRun]:
@@ -1,9 +1,9 @@
 """Contracts shared by repository implementations."""
 
 from __future__ import annotations
-from collections.abc import Iterable, Mapping
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Protocol, runtime_checkable
 from uuid import UUID
 from orcheo.listeners import (
@@ -35,6 +35,24 @@ class VersionDiff:
     diff: list[str]
 
 
+@dataclass(slots=True, frozen=True)
+class RunOutboxEntry:
+    """A run claimed from the outbox for publication to the worker queue."""
+
+    run_id: UUID
+    attempts: int
+
+
+@dataclass(slots=True, frozen=True)
+class WorkflowRunSpec:
+    """Parameters for one run created through :meth:`create_runs`."""
+
+    workflow_version_id: UUID
+    triggered_by: str
+    input_payload: dict[str, Any]
+    runnable_config: dict[str, Any] | None = None
+
+
 @runtime_checkable
 class WorkflowRepository(Protocol):
     """Protocol describing workflow repository behaviour."""
@@ -152,6 +170,19 @@ class WorkflowRepository(Protocol):
     ) -> WorkflowRun:
         """Create a workflow run for the specified version."""
 
+    async def create_runs(
+        self,
+        workflow_id: UUID,
+        runs: Sequence[WorkflowRunSpec],
+        *,
+        actor: str | None = None,
+    ) -> list[WorkflowRun]:
+        """Create several workflow runs atomically, in order.
+
+        Every version and the workflow's credential health are checked before
+        anything is stored, so a failure leaves no run behind.
+        """
+
     async def list_runs_for_workflow(
         self, workflow_id: UUID, *, limit: int | None = None
     ) -> list[WorkflowRun]:
@@ -216,8 +247,17 @@ class WorkflowRepository(Protocol):
         query_params: Mapping[str, str],
         payload: Any,
         source_ip: str | None,
+        enqueue_delay: timedelta | None = None,
+        run_id: UUID | None = None,
     ) -> WorkflowRun:
-        """Handle an inbound webhook event by enqueuing a run."""
+        """Handle an inbound webhook event by enqueuing a run.
+
+        ``enqueue_delay`` holds the run back from workers so the caller can
+        finish preparing it before releasing it, see
+        :meth:`RunOutboxStore.release_run_outbox`. ``run_id`` assigns the
+        run's identifier, for runs whose checkpoint thread was started before
+        the run was recorded.
+        """
 
     async def configure_cron_trigger(
         self, workflow_id: UUID, config: CronTriggerConfig
@@ -257,8 +297,13 @@ class WorkflowRepository(Protocol):
         self,
         *,
         workflow_id: UUID | None = None,
+        updated_since: datetime | None = None,
     ) -> list[ListenerSubscription]:
-        """Return listener subscriptions, optionally filtered by workflow."""
+        """Return listener subscriptions, optionally filtered by workflow.
+
+        When ``updated_since`` is given only subscriptions modified after that
+        instant are returned, which lets supervisors follow a change feed.
+        """
 
     async def get_listener_subscription(
         self,
@@ -275,6 +320,23 @@ class WorkflowRepository(Protocol):
     ) -> ListenerSubscription | None:
         """Lease the subscription for a runtime if it is currently available."""
 
+    async def claim_listener_subscriptions(
+        self,
+        *,
+        runtime_id: str,
+        lease_seconds: int,
+    ) -> list[ListenerSubscription]:
+        """Lease every active subscription that is unassigned or lease-expired."""
+
+    async def renew_listener_subscription_leases(
+        self,
+        subscription_ids: Sequence[UUID],
+        *,
+        runtime_id: str,
+        lease_seconds: int,
+    ) -> list[UUID]:
+        """Extend leases still held by ``runtime_id`` and return their ids."""
+
     async def release_listener_subscription(
         self,
         subscription_id: UUID,
@@ -302,6 +364,16 @@ class WorkflowRepository(Protocol):
     ) -> WorkflowRun | None:
         """Dispatch a normalized listener event into the run queue."""
 
+    async def dispatch_listener_events(
+        self,
+        subscription_id: UUID,
+        payloads: Sequence[ListenerDispatchPayload],
+    ) -> list[WorkflowRun]:
+        """Dispatch a batch of listener events, returning runs for new events."""
+
+    async def purge_expired_listener_dedupe(self) -> int:
+        """Delete expired listener dedupe records and return the count removed."""
+
     async def update_listener_subscription_status(
         self,
         subscription_id: UUID,
@@ -313,4 +385,46 @@ class WorkflowRepository(Protocol):
         """Update the operational status for a listener subscription."""
 
 
-__all__ = ["WorkflowRepository", "VersionDiff"]
+@runtime_checkable
+class RunOutboxStore(Protocol):
+    """Protocol for repositories that persist runs awaiting worker dispatch.
+
+    Runs are recorded in the outbox within the transaction that creates them
+    and are published to the broker by a relay once committed.
+    """
+
+    def set_run_outbox_notifier(self, notifier: Callable[[], None] | None) -> None:
+        """Register a callback invoked after new outbox entries are committed."""
+
+    async def claim_run_outbox(
+        self, *, limit: int, lease_seconds: float
+    ) -> list[RunOutboxEntry]:
+        """Lease up to ``limit`` unpublished entries that are due for publishing."""
+
+    async def mark_run_outbox_published(self, run_ids: Sequence[UUID]) -> None:
+        """Record that the given runs were handed to the broker."""
+
+    async def reschedule_run_outbox(
+        self, retry_at: Mapping[UUID, datetime], *, error: str
+    ) -> None:
+        """Make failed entries available again at the given times."""
+
+    async def release_run_outbox(self, run_id: UUID) -> None:
+        """Make a held-back entry available for publishing immediately."""
+
+    async def requeue_stale_run_outbox(
+        self,
+        *,
+        published_before: datetime,
+        retry_delay: Callable[[int], float],
+    ) -> int:
+        """Re-arm published entries whose runs are still pending.
+
+        Each re-armed entry becomes due ``retry_delay(attempts)`` seconds from
+        now, so runs that keep getting stuck are re-published less and less
+        often. Entries for runs that have left the pending state are removed.
+        Returns the number of entries scheduled for re-publication.
+        """
+
+
+__all__ = ["RunOutboxEntry", "RunOutboxStore", "WorkflowRepository", "VersionDiff"]
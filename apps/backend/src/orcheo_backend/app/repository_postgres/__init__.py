@@ -3,6 +3,7 @@
 from __future__ import annotations
 from orcheo.vault.oauth import OAuthCredentialService
 from orcheo_backend.app.repository_postgres._listeners import ListenerRepositoryMixin
+from orcheo_backend.app.repository_postgres._outbox import RunOutboxMixin
 from orcheo_backend.app.repository_postgres._retry import RetryPolicyMixin
 from orcheo_backend.app.repository_postgres._runs import WorkflowRunMixin
 from orcheo_backend.app.repository_postgres._triggers import TriggerRepositoryMixin
@@ -13,6 +14,7 @@ from orcheo_backend.app.repository_postgres._workflows import WorkflowRepository
 class PostgresWorkflowRepository(
     ListenerRepositoryMixin,
     TriggerRepositoryMixin,
+    RunOutboxMixin,
     RetryPolicyMixin,
     WorkflowRunMixin,
     WorkflowVersionMixin,
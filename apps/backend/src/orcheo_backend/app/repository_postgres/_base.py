@@ -5,7 +5,7 @@ import asyncio
 import importlib
 import json
 import logging
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any
@@ -17,6 +17,7 @@ from orcheo.models.workflow import (
     WorkflowRunStatus,
     WorkflowVersion,
 )
+from orcheo.tracing.metrics import track_connection_pool
 from orcheo.triggers.cron import CronTriggerConfig
 from orcheo.triggers.layer import TriggerLayer
 from orcheo.triggers.retry import RetryPolicyConfig
@@ -113,6 +114,10 @@ CREATE INDEX IF NOT EXISTS idx_listener_subscriptions_workflow
     ON listener_subscriptions(workflow_id);
 CREATE INDEX IF NOT EXISTS idx_listener_subscriptions_version
     ON listener_subscriptions(workflow_version_id);
+CREATE INDEX IF NOT EXISTS idx_listener_subscriptions_lease
+    ON listener_subscriptions(status, lease_expires_at);
+CREATE INDEX IF NOT EXISTS idx_listener_subscriptions_updated
+    ON listener_subscriptions(updated_at);
 
 CREATE TABLE IF NOT EXISTS listener_cursors (
     subscription_id TEXT PRIMARY KEY,
@@ -127,12 +132,27 @@ CREATE TABLE IF NOT EXISTS listener_dedupe (
     expires_at TIMESTAMPTZ NOT NULL,
     PRIMARY KEY (subscription_id, dedupe_key)
 );
+CREATE INDEX IF NOT EXISTS idx_listener_dedupe_expires
+    ON listener_dedupe(expires_at);
+
+CREATE TABLE IF NOT EXISTS run_outbox (
+    run_id TEXT PRIMARY KEY,
+    available_at TIMESTAMPTZ NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    published_at TIMESTAMPTZ,
+    created_at TIMESTAMPTZ NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_run_outbox_pending
+    ON run_outbox(available_at) WHERE published_at IS NULL;
 """
 
 
 class PostgresRepositoryBase:
     """Provide connection pooling, schema initialization, trigger-layer hydration."""
 
+    _run_outbox_notifier: Callable[[], None] | None = None
+
     def __init__(
         self,
         dsn: str,
@@ -174,6 +194,16 @@ class PostgresRepositoryBase:
     def _release_cron_run(self, run_id: UUID) -> None:
         self._trigger_layer.release_cron_run(run_id)
 
+    def _notify_run_outbox(self) -> None:
+        """Wake the outbox relay after runs were committed to the outbox."""
+        notifier = self._run_outbox_notifier
+        if notifier is None:
+            return
+        try:
+            notifier()
+        except Exception:  # pragma: no cover - defensive
+            logger.exception("Run outbox notifier failed")
+
     @staticmethod
     def _dump_model(model: Workflow | WorkflowVersion | WorkflowRun) -> str:
         return json.dumps(model.model_dump(mode="json"))
@@ -233,6 +263,7 @@ class PostgresRepositoryBase:
                 },
             )
             await self._pool.open()
+            track_connection_pool("repository", self._pool)
             return self._pool
 
     @asynccontextmanager
@@ -1,10 +1,11 @@
 """Listener repository helpers for PostgreSQL-backed persistence."""
 
 from __future__ import annotations
-from datetime import timedelta
+import json
+from collections.abc import Sequence
+from datetime import datetime, timedelta
 from typing import Any
 from uuid import UUID
-import orcheo_backend.app.repository_postgres._triggers as trigger_module
 from orcheo.listeners import (
     ListenerCursor,
     ListenerDedupeRecord,
@@ -17,6 +18,7 @@ from orcheo.models.base import _utcnow
 from orcheo.models.workflow import WorkflowRun
 from orcheo_backend.app.repository import (
     WorkflowNotFoundError,
+    WorkflowVersionNotFoundError,
 )
 from orcheo_backend.app.repository_postgres._persistence import PostgresPersistenceMixin
 
@@ -142,17 +144,24 @@ class ListenerRepositoryMixin(PostgresPersistenceMixin):
         self,
         *,
         workflow_id: UUID | None = None,
+        updated_since: datetime | None = None,
     ) -> list[ListenerSubscription]:
         await self._ensure_initialized()
         async with self._lock:
             query = "SELECT payload FROM listener_subscriptions"
-            params: tuple[str, ...] = ()
+            clauses: list[str] = []
+            params: list[Any] = []
             if workflow_id is not None:
-                query += " WHERE workflow_id = %s"
-                params = (str(workflow_id),)
+                clauses.append("workflow_id = %s")
+                params.append(str(workflow_id))
+            if updated_since is not None:
+                clauses.append("updated_at > %s")
+                params.append(updated_since)
+            if clauses:
+                query += " WHERE " + " AND ".join(clauses)
             query += " ORDER BY created_at ASC"
             async with self._connection() as conn:
-                cursor = await conn.execute(query, params)
+                cursor = await conn.execute(query, tuple(params))
                 rows = await cursor.fetchall()
             result: list[ListenerSubscription] = []
             for row in rows:
@@ -268,6 +277,123 @@ class ListenerRepositoryMixin(PostgresPersistenceMixin):
                     return None
                 return subscription.model_copy(deep=True)
 
+    async def claim_listener_subscriptions(
+        self,
+        *,
+        runtime_id: str,
+        lease_seconds: int,
+    ) -> list[ListenerSubscription]:
+        """Claim every active subscription that is unassigned or lease-expired.
+
+        Candidates are selected and locked in one query; ``SKIP LOCKED`` lets
+        concurrent runtimes claim disjoint sets, and all claims are written
+        back in a single ``UPDATE``.
+        """
+        await self._ensure_initialized()
+        async with self._lock:
+            async with self._connection() as conn:
+                now = _utcnow()
+                cursor = await conn.execute(
+                    """
+                    SELECT payload
+                      FROM listener_subscriptions
+                     WHERE status = %s
+                       AND (
+                           assigned_runtime IS NULL
+                           OR lease_expires_at IS NULL
+                           OR lease_expires_at <= %s
+                       )
+                  ORDER BY created_at ASC
+                       FOR UPDATE SKIP LOCKED
+                    """,
+                    (ListenerSubscriptionStatus.ACTIVE.value, now),
+                )
+                rows = await cursor.fetchall()
+                if not rows:
+                    return []
+                lease_expires_at = now + timedelta(seconds=lease_seconds)
+                claimed: list[ListenerSubscription] = []
+                params: list[Any] = [runtime_id, lease_expires_at]
+                for row in rows:
+                    payload = row["payload"]
+                    subscription = (
+                        ListenerSubscription.model_validate_json(payload)
+                        if isinstance(payload, str)
+                        else ListenerSubscription.model_validate(payload)
+                    )
+                    should_record_claim = subscription.assigned_runtime != runtime_id
+                    subscription.assigned_runtime = runtime_id
+                    subscription.lease_expires_at = lease_expires_at
+                    if should_record_claim:
+                        subscription.record_event(
+                            actor=runtime_id,
+                            action="listener_subscription_claimed",
+                        )
+                    params.extend(
+                        (
+                            str(subscription.id),
+                            self._dump_listener_subscription(subscription),
+                            subscription.updated_at,
+                        )
+                    )
+                    claimed.append(subscription)
+                await conn.execute(
+                    """
+                    UPDATE listener_subscriptions
+                       SET assigned_runtime = %s,
+                           lease_expires_at = %s,
+                           payload = claimed.payload::jsonb,
+                           updated_at = claimed.updated_at::timestamptz
+                      FROM (VALUES """
+                    + ", ".join(["(%s, %s, %s)"] * len(claimed))
+                    + """) AS claimed(id, payload, updated_at)
+                     WHERE listener_subscriptions.id = claimed.id
+                    """,
+                    tuple(params),
+                )
+                return [subscription.model_copy(deep=True) for subscription in claimed]
+
+    async def renew_listener_subscription_leases(
+        self,
+        subscription_ids: Sequence[UUID],
+        *,
+        runtime_id: str,
+        lease_seconds: int,
+    ) -> list[UUID]:
+        """Extend leases still held by ``runtime_id`` and return their ids.
+
+        Renewal is a lease heartbeat rather than a subscription change, so
+        ``updated_at`` is left untouched for change-feed readers.
+        """
+        if not subscription_ids:
+            return []
+        await self._ensure_initialized()
+        lease_expires_at = _utcnow() + timedelta(seconds=lease_seconds)
+        async with self._lock:
+            async with self._connection() as conn:
+                cursor = await conn.execute(
+                    """
+                    UPDATE listener_subscriptions
+                       SET lease_expires_at = %s,
+                           payload = jsonb_set(
+                               payload, '{lease_expires_at}', %s::jsonb
+                           )
+                     WHERE id = ANY(%s)
+                       AND assigned_runtime = %s
+                       AND status = %s
+                    RETURNING id
+                    """,
+                    (
+                        lease_expires_at,
+                        json.dumps(lease_expires_at.isoformat()),
+                        [str(subscription_id) for subscription_id in subscription_ids],
+                        runtime_id,
+                        ListenerSubscriptionStatus.ACTIVE.value,
+                    ),
+                )
+                rows = await cursor.fetchall()
+        return [UUID(row["id"]) for row in rows]
+
     async def release_listener_subscription(
         self,
         subscription_id: UUID,
@@ -365,7 +491,17 @@ class ListenerRepositoryMixin(PostgresPersistenceMixin):
         subscription_id: UUID,
         payload: ListenerDispatchPayload,
     ) -> WorkflowRun | None:
+        runs = await self.dispatch_listener_events(subscription_id, [payload])
+        return runs[0] if runs else None
+
+    async def dispatch_listener_events(
+        self,
+        subscription_id: UUID,
+        payloads: Sequence[ListenerDispatchPayload],
+    ) -> list[WorkflowRun]:
         await self._ensure_initialized()
+        if not payloads:
+            return []
         async with self._lock:
             now = _utcnow()
             async with self._connection() as conn:
@@ -383,47 +519,38 @@ class ListenerRepositoryMixin(PostgresPersistenceMixin):
                     else ListenerSubscription.model_validate(subscription_payload)
                 )
                 if subscription.status != ListenerSubscriptionStatus.ACTIVE:
-                    return None
-                await conn.execute(
-                    "DELETE FROM listener_dedupe WHERE expires_at <= %s",
-                    (now,),
+                    return []
+                version = await self._get_version_locked(
+                    subscription.workflow_version_id
                 )
-                dedupe_cursor = await conn.execute(
-                    """
-                    SELECT 1
-                      FROM listener_dedupe
-                     WHERE subscription_id = %s
-                       AND dedupe_key = %s
-                       AND expires_at > %s
-                    """,
-                    (str(subscription_id), payload.dedupe_key, now),
+                if version.workflow_id != subscription.workflow_id:
+                    raise WorkflowVersionNotFoundError(str(version.id))
+                candidates: dict[str, ListenerDispatchPayload] = {}
+                for payload in payloads:
+                    candidates.setdefault(payload.dedupe_key, payload)
+                accepted_keys = await self._claim_listener_dedupe_keys(
+                    conn, subscription, list(candidates), now=now
                 )
-                if await dedupe_cursor.fetchone():
-                    return None
-
-                dedupe = ListenerDedupeRecord(
-                    subscription_id=subscription_id,
-                    dedupe_key=payload.dedupe_key,
-                    expires_at=now
-                    + timedelta(
-                        seconds=int(
-                            subscription.config.get("dedupe_window_seconds", 300)
-                        )
-                    ),
-                )
-                await conn.execute(
-                    """
-                    INSERT INTO listener_dedupe (
-                        subscription_id, dedupe_key, payload, expires_at
+                accepted = [
+                    payload
+                    for key, payload in candidates.items()
+                    if key in accepted_keys
+                ]
+                if not accepted:
+                    return []
+                runs = [
+                    self._build_run(
+                        version,
+                        triggered_by="listener",
+                        input_payload=payload.model_copy(
+                            update={"listener_subscription_id": subscription_id}
+                        ).to_input_payload(),
+                        actor="listener",
                     )
-                    VALUES (%s, %s, %s, %s)
-                    """,
-                    (
-                        str(subscription_id),
-                        dedupe.dedupe_key,
-                        self._dump_listener_dedupe(dedupe),
-                        dedupe.expires_at,
-                    ),
+                    for payload in accepted
+                ]
+                await self._insert_runs_locked(
+                    conn, subscription.workflow_id, runs, enqueue=True
                 )
                 subscription.last_event_at = now
                 subscription.last_error = None
@@ -441,19 +568,68 @@ class ListenerRepositoryMixin(PostgresPersistenceMixin):
                         str(subscription_id),
                     ),
                 )
-            version = await self._get_version_locked(subscription.workflow_version_id)
-            run = await self._create_run_locked(
-                workflow_id=subscription.workflow_id,
-                workflow_version_id=version.id,
-                triggered_by="listener",
-                input_payload=payload.model_copy(
-                    update={"listener_subscription_id": subscription_id}
-                ).to_input_payload(),
-                actor="listener",
+            self._track_created_runs(subscription.workflow_id, runs)
+            run_copies = [run.model_copy(deep=True) for run in runs]
+        self._notify_run_outbox()
+        return run_copies
+
+    async def _claim_listener_dedupe_keys(
+        self,
+        conn: Any,
+        subscription: ListenerSubscription,
+        dedupe_keys: list[str],
+        *,
+        now: datetime,
+    ) -> set[str]:
+        """Record ``dedupe_keys`` and return those not seen within the window.
+
+        Expired records are overwritten in place so they do not suppress new
+        events before the periodic sweeper removes them.
+        """
+        expires_at = now + subscription.dedupe_window
+        params: list[Any] = []
+        for key in dedupe_keys:
+            record = ListenerDedupeRecord(
+                subscription_id=subscription.id,
+                dedupe_key=key,
+                expires_at=expires_at,
+            )
+            params.extend(
+                (
+                    str(subscription.id),
+                    key,
+                    self._dump_listener_dedupe(record),
+                    expires_at,
+                )
+            )
+        params.append(now)
+        cursor = await conn.execute(
+            """
+            INSERT INTO listener_dedupe (
+                subscription_id, dedupe_key, payload, expires_at
+            )
+            VALUES """
+            + ", ".join(["(%s, %s, %s, %s)"] * len(dedupe_keys))
+            + """
+            ON CONFLICT (subscription_id, dedupe_key) DO UPDATE SET
+                payload = EXCLUDED.payload,
+                expires_at = EXCLUDED.expires_at
+             WHERE listener_dedupe.expires_at <= %s
+            RETURNING dedupe_key
+            """,
+            tuple(params),
+        )
+        return {row["dedupe_key"] for row in await cursor.fetchall()}
+
+    async def purge_expired_listener_dedupe(self) -> int:
+        """Delete expired listener dedupe records and return how many were removed."""
+        await self._ensure_initialized()
+        async with self._connection() as conn:
+            cursor = await conn.execute(
+                "DELETE FROM listener_dedupe WHERE expires_at <= %s",
+                (_utcnow(),),
             )
-            run_copy = run.model_copy(deep=True)
-        trigger_module._enqueue_run_for_execution(run_copy)
-        return run_copy
+            return max(cursor.rowcount, 0)
 
     async def update_listener_subscription_status(
         self,
@@ -0,0 +1,149 @@
+"""Run outbox persistence used by the broker relay."""
+
+from __future__ import annotations
+from collections.abc import Callable, Mapping, Sequence
+from datetime import datetime, timedelta
+from uuid import UUID
+from orcheo.models.base import _utcnow
+from orcheo.models.workflow import WorkflowRunStatus
+from orcheo_backend.app.repository.protocol import RunOutboxEntry
+from orcheo_backend.app.repository_postgres._persistence import PostgresPersistenceMixin
+
+
+class RunOutboxMixin(PostgresPersistenceMixin):
+    """Lease, acknowledge and re-arm runs recorded in the outbox."""
+
+    def set_run_outbox_notifier(self, notifier: Callable[[], None] | None) -> None:
+        """Register a callback invoked after new outbox entries are committed."""
+        self._run_outbox_notifier = notifier
+
+    async def claim_run_outbox(
+        self, *, limit: int, lease_seconds: float
+    ) -> list[RunOutboxEntry]:
+        """Lease up to ``limit`` unpublished entries that are due for publishing.
+
+        Claimed entries become invisible to other relays for ``lease_seconds``;
+        ``SKIP LOCKED`` lets concurrent relays claim disjoint batches.
+        """
+        await self._ensure_initialized()
+        now = _utcnow()
+        async with self._connection() as conn:
+            cursor = await conn.execute(
+                """
+                UPDATE run_outbox
+                   SET available_at = %s, attempts = attempts + 1
+                 WHERE run_id IN (
+                       SELECT run_id
+                         FROM run_outbox
+                        WHERE published_at IS NULL
+                          AND available_at <= %s
+                     ORDER BY available_at
+                        LIMIT %s
+                   FOR UPDATE SKIP LOCKED
+                 )
+             RETURNING run_id, attempts
+                """,
+                (now + timedelta(seconds=lease_seconds), now, limit),
+            )
+            rows = await cursor.fetchall()
+        return [
+            RunOutboxEntry(run_id=UUID(row["run_id"]), attempts=row["attempts"])
+            for row in rows
+        ]
+
+    async def mark_run_outbox_published(self, run_ids: Sequence[UUID]) -> None:
+        """Record that the given runs were handed to the broker."""
+        if not run_ids:
+            return
+        await self._ensure_initialized()
+        async with self._connection() as conn:
+            await conn.execute(
+                """
+                UPDATE run_outbox
+                   SET published_at = %s, last_error = NULL
+                 WHERE run_id = ANY(%s)
+                """,
+                (_utcnow(), [str(run_id) for run_id in run_ids]),
+            )
+
+    async def reschedule_run_outbox(
+        self, retry_at: Mapping[UUID, datetime], *, error: str
+    ) -> None:
+        """Make failed entries available again at the given times."""
+        if not retry_at:
+            return
+        await self._ensure_initialized()
+        async with self._connection() as conn:
+            for run_id, available_at in retry_at.items():
+                await conn.execute(
+                    """
+                    UPDATE run_outbox
+                       SET available_at = %s, last_error = %s
+                     WHERE run_id = %s
+                    """,
+                    (available_at, error, str(run_id)),
+                )
+
+    async def release_run_outbox(self, run_id: UUID) -> None:
+        """Make a held-back entry available for publishing immediately."""
+        await self._ensure_initialized()
+        async with self._connection() as conn:
+            await conn.execute(
+                """
+                UPDATE run_outbox
+                   SET available_at = %s
+                 WHERE run_id = %s AND published_at IS NULL
+                """,
+                (_utcnow(), str(run_id)),
+            )
+        self._notify_run_outbox()
+
+    async def requeue_stale_run_outbox(
+        self,
+        *,
+        published_before: datetime,
+        retry_delay: Callable[[int], float],
+    ) -> int:
+        """Re-arm published entries whose runs are still pending."""
+        await self._ensure_initialized()
+        now = _utcnow()
+        pending = WorkflowRunStatus.PENDING.value
+        async with self._connection() as conn:
+            await conn.execute(
+                """
+                DELETE FROM run_outbox AS o
+                 WHERE o.published_at IS NOT NULL
+                   AND NOT EXISTS (
+                       SELECT 1
+                         FROM workflow_runs AS r
+                        WHERE r.id = o.run_id AND r.status = %s
+                   )
+                """,
+                (pending,),
+            )
+            cursor = await conn.execute(
+                """
+                SELECT o.run_id, o.attempts
+                  FROM run_outbox AS o
+                  JOIN workflow_runs AS r ON r.id = o.run_id
+                 WHERE r.status = %s
+                   AND o.published_at <= %s
+                   FOR UPDATE OF o SKIP LOCKED
+                """,
+                (pending, published_before),
+            )
+            stale = await cursor.fetchall()
+            for row in stale:
+                available_at = now + timedelta(seconds=retry_delay(row["attempts"]))
+                await conn.execute(
+                    """
+                    UPDATE run_outbox
+                       SET published_at = NULL, available_at = %s
+                     WHERE run_id = %s
+                    """,
+                    (available_at, row["run_id"]),
+                )
+        return len(stale)
+
+
+__all__ = ["RunOutboxMixin"]
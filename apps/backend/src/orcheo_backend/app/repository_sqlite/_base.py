@@ -4,7 +4,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from pathlib import Path
@@ -48,6 +48,8 @@ def _deserialize_legacy_workflow_payload(payload_json: str) -> Workflow:
 class SqliteRepositoryBase:
     """Provide locking, connections, and trigger-layer hydration."""
 
+    _run_outbox_notifier: Callable[[], None] | None = None
+
     def __init__(
         self,
         database_path: str | Path,
@@ -75,6 +77,16 @@ class SqliteRepositoryBase:
     def _release_cron_run(self, run_id: UUID) -> None:
         self._trigger_layer.release_cron_run(run_id)
 
+    def _notify_run_outbox(self) -> None:
+        """Wake the outbox relay after runs were committed to the outbox."""
+        notifier = self._run_outbox_notifier
+        if notifier is None:
+            return
+        try:
+            notifier()
+        except Exception:  # pragma: no cover - defensive
+            logger.exception("Run outbox notifier failed")
+
     @staticmethod
     def _dump_model(model: Workflow | WorkflowVersion | WorkflowRun) -> str:
         return json.dumps(model.model_dump(mode="json"))
@@ -200,6 +212,10 @@ class SqliteRepositoryBase:
                         ON listener_subscriptions(workflow_id);
                     CREATE INDEX IF NOT EXISTS idx_listener_subscriptions_version
                         ON listener_subscriptions(workflow_version_id);
+                    CREATE INDEX IF NOT EXISTS idx_listener_subscriptions_lease
+                        ON listener_subscriptions(status, lease_expires_at);
+                    CREATE INDEX IF NOT EXISTS idx_listener_subscriptions_updated
+                        ON listener_subscriptions(updated_at);
                     CREATE TABLE IF NOT EXISTS listener_cursors (
                         subscription_id TEXT PRIMARY KEY,
                         payload TEXT NOT NULL,
@@ -212,6 +228,18 @@ class SqliteRepositoryBase:
                         expires_at TEXT NOT NULL,
                         PRIMARY KEY (subscription_id, dedupe_key)
                     );
+                    CREATE INDEX IF NOT EXISTS idx_listener_dedupe_expires
+                        ON listener_dedupe(expires_at);
+                    CREATE TABLE IF NOT EXISTS run_outbox (
+                        run_id TEXT PRIMARY KEY,
+                        available_at TEXT NOT NULL,
+                        attempts INTEGER NOT NULL DEFAULT 0,
+                        last_error TEXT,
+                        published_at TEXT,
+                        created_at TEXT NOT NULL
+                    );
+                    CREATE INDEX IF NOT EXISTS idx_run_outbox_pending
+                        ON run_outbox(available_at) WHERE published_at IS NULL;
                     """
                 )
                 await self._ensure_cron_schema_migrations(conn)
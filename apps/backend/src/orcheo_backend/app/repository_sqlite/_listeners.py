@@ -1,10 +1,10 @@
 """Listener repository helpers for SQLite-backed persistence."""
 
 from __future__ import annotations
-from datetime import timedelta
+from collections.abc import Sequence
+from datetime import datetime, timedelta
 from typing import Any
 from uuid import UUID
-import orcheo_backend.app.repository_sqlite._triggers as trigger_module
 from orcheo.listeners import (
     ListenerCursor,
     ListenerDedupeRecord,
@@ -17,6 +17,7 @@ from orcheo.models.base import _utcnow
 from orcheo.models.workflow import WorkflowRun
 from orcheo_backend.app.repository import (
     WorkflowNotFoundError,
+    WorkflowVersionNotFoundError,
 )
 from orcheo_backend.app.repository_sqlite._persistence import SqlitePersistenceMixin
 
@@ -139,17 +140,24 @@ class ListenerRepositoryMixin(SqlitePersistenceMixin):
         self,
         *,
         workflow_id: UUID | None = None,
+        updated_since: datetime | None = None,
     ) -> list[ListenerSubscription]:
         await self._ensure_initialized()
         async with self._lock:
             query = "SELECT payload FROM listener_subscriptions"
-            params: tuple[str, ...] = ()
+            clauses: list[str] = []
+            params: list[str] = []
             if workflow_id is not None:
-                query += " WHERE workflow_id = ?"
-                params = (str(workflow_id),)
+                clauses.append("workflow_id = ?")
+                params.append(str(workflow_id))
+            if updated_since is not None:
+                clauses.append("updated_at > ?")
+                params.append(updated_since.isoformat())
+            if clauses:
+                query += " WHERE " + " AND ".join(clauses)
             query += " ORDER BY created_at ASC"
             async with self._connection() as conn:
-                cursor = await conn.execute(query, params)
+                cursor = await conn.execute(query, tuple(params))
                 rows = await cursor.fetchall()
             return [
                 ListenerSubscription.model_validate_json(row["payload"]).model_copy(
@@ -229,6 +237,108 @@ class ListenerRepositoryMixin(SqlitePersistenceMixin):
                 )
                 return subscription.model_copy(deep=True)
 
+    async def claim_listener_subscriptions(
+        self,
+        *,
+        runtime_id: str,
+        lease_seconds: int,
+    ) -> list[ListenerSubscription]:
+        """Claim every active subscription that is unassigned or lease-expired."""
+        await self._ensure_initialized()
+        async with self._lock:
+            async with self._connection() as conn:
+                now = _utcnow()
+                cursor = await conn.execute(
+                    """
+                    SELECT payload
+                      FROM listener_subscriptions
+                     WHERE status = ?
+                       AND (
+                           assigned_runtime IS NULL
+                           OR lease_expires_at IS NULL
+                           OR lease_expires_at <= ?
+                       )
+                  ORDER BY created_at ASC
+                    """,
+                    (ListenerSubscriptionStatus.ACTIVE.value, now.isoformat()),
+                )
+                rows = await cursor.fetchall()
+                lease_expires_at = now + timedelta(seconds=lease_seconds)
+                claimed: list[ListenerSubscription] = []
+                for row in rows:
+                    subscription = ListenerSubscription.model_validate_json(
+                        row["payload"]
+                    )
+                    should_record_claim = subscription.assigned_runtime != runtime_id
+                    subscription.assigned_runtime = runtime_id
+                    subscription.lease_expires_at = lease_expires_at
+                    if should_record_claim:
+                        subscription.record_event(
+                            actor=runtime_id,
+                            action="listener_subscription_claimed",
+                        )
+                    claimed.append(subscription)
+                await conn.executemany(
+                    """
+                    UPDATE listener_subscriptions
+                       SET assigned_runtime = ?, lease_expires_at = ?, payload = ?,
+                           updated_at = ?
+                     WHERE id = ?
+                    """,
+                    [
+                        (
+                            runtime_id,
+                            lease_expires_at.isoformat(),
+                            self._dump_listener_subscription(subscription),
+                            subscription.updated_at.isoformat(),
+                            str(subscription.id),
+                        )
+                        for subscription in claimed
+                    ],
+                )
+                return [subscription.model_copy(deep=True) for subscription in claimed]
+
+    async def renew_listener_subscription_leases(
+        self,
+        subscription_ids: Sequence[UUID],
+        *,
+        runtime_id: str,
+        lease_seconds: int,
+    ) -> list[UUID]:
+        """Extend leases still held by ``runtime_id`` and return their ids.
+
+        Renewal is a lease heartbeat rather than a subscription change, so
+        ``updated_at`` is left untouched for change-feed readers.
+        """
+        if not subscription_ids:
+            return []
+        await self._ensure_initialized()
+        lease_expires_at = (_utcnow() + timedelta(seconds=lease_seconds)).isoformat()
+        async with self._lock:
+            async with self._connection() as conn:
+                cursor = await conn.execute(
+                    """
+                    UPDATE listener_subscriptions
+                       SET lease_expires_at = ?,
+                           payload = json_set(payload, '$.lease_expires_at', ?)
+                     WHERE assigned_runtime = ?
+                       AND status = ?
+                       AND id IN ("""
+                    + ", ".join("?" * len(subscription_ids))
+                    + """)
+                    RETURNING id
+                    """,
+                    (
+                        lease_expires_at,
+                        lease_expires_at,
+                        runtime_id,
+                        ListenerSubscriptionStatus.ACTIVE.value,
+                        *(str(subscription_id) for subscription_id in subscription_ids),
+                    ),
+                )
+                rows = await cursor.fetchall()
+        return [UUID(row["id"]) for row in rows]
+
     async def release_listener_subscription(
         self,
         subscription_id: UUID,
@@ -317,7 +427,17 @@ class ListenerRepositoryMixin(SqlitePersistenceMixin):
         subscription_id: UUID,
         payload: ListenerDispatchPayload,
     ) -> WorkflowRun | None:
+        runs = await self.dispatch_listener_events(subscription_id, [payload])
+        return runs[0] if runs else None
+
+    async def dispatch_listener_events(
+        self,
+        subscription_id: UUID,
+        payloads: Sequence[ListenerDispatchPayload],
+    ) -> list[WorkflowRun]:
         await self._ensure_initialized()
+        if not payloads:
+            return []
         async with self._lock:
             now = _utcnow()
             async with self._connection() as conn:
@@ -330,47 +450,38 @@ class ListenerRepositoryMixin(SqlitePersistenceMixin):
                     raise WorkflowNotFoundError(str(subscription_id))
                 subscription = ListenerSubscription.model_validate_json(row["payload"])
                 if subscription.status != ListenerSubscriptionStatus.ACTIVE:
-                    return None
-                await conn.execute(
-                    "DELETE FROM listener_dedupe WHERE expires_at <= ?",
-                    (now.isoformat(),),
-                )
-                dedupe_cursor = await conn.execute(
-                    """
-                    SELECT 1
-                      FROM listener_dedupe
-                     WHERE subscription_id = ?
-                       AND dedupe_key = ?
-                       AND expires_at > ?
-                    """,
-                    (str(subscription_id), payload.dedupe_key, now.isoformat()),
+                    return []
+                version = await self._get_version_locked(
+                    subscription.workflow_version_id
                 )
-                if await dedupe_cursor.fetchone():
-                    return None
-
-                dedupe = ListenerDedupeRecord(
-                    subscription_id=subscription_id,
-                    dedupe_key=payload.dedupe_key,
-                    expires_at=now
-                    + timedelta(
-                        seconds=int(
-                            subscription.config.get("dedupe_window_seconds", 300)
-                        )
-                    ),
+                if version.workflow_id != subscription.workflow_id:
+                    raise WorkflowVersionNotFoundError(str(version.id))
+                candidates: dict[str, ListenerDispatchPayload] = {}
+                for payload in payloads:
+                    candidates.setdefault(payload.dedupe_key, payload)
+                accepted_keys = await self._claim_listener_dedupe_keys(
+                    conn, subscription, list(candidates), now=now
                 )
-                await conn.execute(
-                    """
-                    INSERT INTO listener_dedupe (
-                        subscription_id, dedupe_key, payload, expires_at
+                accepted = [
+                    payload
+                    for key, payload in candidates.items()
+                    if key in accepted_keys
+                ]
+                if not accepted:
+                    return []
+                runs = [
+                    self._build_run(
+                        version,
+                        triggered_by="listener",
+                        input_payload=payload.model_copy(
+                            update={"listener_subscription_id": subscription_id}
+                        ).to_input_payload(),
+                        actor="listener",
                     )
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (
-                        str(subscription_id),
-                        dedupe.dedupe_key,
-                        self._dump_listener_dedupe(dedupe),
-                        dedupe.expires_at.isoformat(),
-                    ),
+                    for payload in accepted
+                ]
+                await self._insert_runs_locked(
+                    conn, subscription.workflow_id, runs, enqueue=True
                 )
                 subscription.last_event_at = now
                 subscription.last_error = None
@@ -388,19 +499,68 @@ class ListenerRepositoryMixin(SqlitePersistenceMixin):
                         str(subscription_id),
                     ),
                 )
-            version = await self._get_version_locked(subscription.workflow_version_id)
-            run = await self._create_run_locked(
-                workflow_id=subscription.workflow_id,
-                workflow_version_id=version.id,
-                triggered_by="listener",
-                input_payload=payload.model_copy(
-                    update={"listener_subscription_id": subscription_id}
-                ).to_input_payload(),
-                actor="listener",
+            self._track_created_runs(subscription.workflow_id, runs)
+            run_copies = [run.model_copy(deep=True) for run in runs]
+        self._notify_run_outbox()
+        return run_copies
+
+    async def _claim_listener_dedupe_keys(
+        self,
+        conn: Any,
+        subscription: ListenerSubscription,
+        dedupe_keys: list[str],
+        *,
+        now: datetime,
+    ) -> set[str]:
+        """Record ``dedupe_keys`` and return those not seen within the window.
+
+        Expired records are overwritten in place so they do not suppress new
+        events before the periodic sweeper removes them.
+        """
+        expires_at = now + subscription.dedupe_window
+        params: list[Any] = []
+        for key in dedupe_keys:
+            record = ListenerDedupeRecord(
+                subscription_id=subscription.id,
+                dedupe_key=key,
+                expires_at=expires_at,
+            )
+            params.extend(
+                (
+                    str(subscription.id),
+                    key,
+                    self._dump_listener_dedupe(record),
+                    expires_at.isoformat(),
+                )
+            )
+        params.append(now.isoformat())
+        cursor = await conn.execute(
+            """
+            INSERT INTO listener_dedupe (
+                subscription_id, dedupe_key, payload, expires_at
+            )
+            VALUES """
+            + ", ".join(["(?, ?, ?, ?)"] * len(dedupe_keys))
+            + """
+            ON CONFLICT (subscription_id, dedupe_key) DO UPDATE SET
+                payload = excluded.payload,
+                expires_at = excluded.expires_at
+             WHERE listener_dedupe.expires_at <= ?
+            RETURNING dedupe_key
+            """,
+            tuple(params),
+        )
+        return {row["dedupe_key"] for row in await cursor.fetchall()}
+
+    async def purge_expired_listener_dedupe(self) -> int:
+        """Delete expired listener dedupe records and return how many were removed."""
+        await self._ensure_initialized()
+        async with self._connection() as conn:
+            cursor = await conn.execute(
+                "DELETE FROM listener_dedupe WHERE expires_at <= ?",
+                (_utcnow().isoformat(),),
             )
-            run_copy = run.model_copy(deep=True)
-        trigger_module._enqueue_run_for_execution(run_copy)
-        return run_copy
+            return max(cursor.rowcount, 0)
 
     async def update_listener_subscription_status(
         self,
@@ -0,0 +1,160 @@
+"""Run outbox persistence used by the broker relay."""
+
+from __future__ import annotations
+from collections.abc import Callable, Mapping, Sequence
+from datetime import datetime, timedelta
+from uuid import UUID
+from orcheo.models.base import _utcnow
+from orcheo.models.workflow import WorkflowRunStatus
+from orcheo_backend.app.repository.protocol import RunOutboxEntry
+from orcheo_backend.app.repository_sqlite._persistence import SqlitePersistenceMixin
+
+
+class RunOutboxMixin(SqlitePersistenceMixin):
+    """Lease, acknowledge and re-arm runs recorded in the outbox."""
+
+    def set_run_outbox_notifier(self, notifier: Callable[[], None] | None) -> None:
+        """Register a callback invoked after new outbox entries are committed."""
+        self._run_outbox_notifier = notifier
+
+    async def claim_run_outbox(
+        self, *, limit: int, lease_seconds: float
+    ) -> list[RunOutboxEntry]:
+        """Lease up to ``limit`` unpublished entries that are due for publishing.
+
+        Claimed entries become invisible to other relays for ``lease_seconds``.
+        """
+        await self._ensure_initialized()
+        now = _utcnow()
+        async with self._connection() as conn:
+            cursor = await conn.execute(
+                """
+                UPDATE run_outbox
+                   SET available_at = ?, attempts = attempts + 1
+                 WHERE run_id IN (
+                       SELECT run_id
+                         FROM run_outbox
+                        WHERE published_at IS NULL
+                          AND available_at <= ?
+                     ORDER BY available_at
+                        LIMIT ?
+                 )
+             RETURNING run_id, attempts
+                """,
+                (
+                    (now + timedelta(seconds=lease_seconds)).isoformat(),
+                    now.isoformat(),
+                    limit,
+                ),
+            )
+            rows = await cursor.fetchall()
+        return [
+            RunOutboxEntry(run_id=UUID(row["run_id"]), attempts=row["attempts"])
+            for row in rows
+        ]
+
+    async def mark_run_outbox_published(self, run_ids: Sequence[UUID]) -> None:
+        """Record that the given runs were handed to the broker."""
+        if not run_ids:
+            return
+        await self._ensure_initialized()
+        published_at = _utcnow().isoformat()
+        async with self._connection() as conn:
+            await conn.executemany(
+                """
+                UPDATE run_outbox
+                   SET published_at = ?, last_error = NULL
+                 WHERE run_id = ?
+                """,
+                [(published_at, str(run_id)) for run_id in run_ids],
+            )
+
+    async def reschedule_run_outbox(
+        self, retry_at: Mapping[UUID, datetime], *, error: str
+    ) -> None:
+        """Make failed entries available again at the given times."""
+        if not retry_at:
+            return
+        await self._ensure_initialized()
+        async with self._connection() as conn:
+            await conn.executemany(
+                """
+                UPDATE run_outbox
+                   SET available_at = ?, last_error = ?
+                 WHERE run_id = ?
+                """,
+                [
+                    (available_at.isoformat(), error, str(run_id))
+                    for run_id, available_at in retry_at.items()
+                ],
+            )
+
+    async def release_run_outbox(self, run_id: UUID) -> None:
+        """Make a held-back entry available for publishing immediately."""
+        await self._ensure_initialized()
+        async with self._connection() as conn:
+            await conn.execute(
+                """
+                UPDATE run_outbox
+                   SET available_at = ?
+                 WHERE run_id = ? AND published_at IS NULL
+                """,
+                (_utcnow().isoformat(), str(run_id)),
+            )
+        self._notify_run_outbox()
+
+    async def requeue_stale_run_outbox(
+        self,
+        *,
+        published_before: datetime,
+        retry_delay: Callable[[int], float],
+    ) -> int:
+        """Re-arm published entries whose runs are still pending."""
+        await self._ensure_initialized()
+        now = _utcnow()
+        pending = WorkflowRunStatus.PENDING.value
+        async with self._connection() as conn:
+            await conn.execute(
+                """
+                DELETE FROM run_outbox
+                 WHERE published_at IS NOT NULL
+                   AND NOT EXISTS (
+                       SELECT 1
+                         FROM workflow_runs
+                        WHERE workflow_runs.id = run_outbox.run_id
+                          AND workflow_runs.status = ?
+                   )
+                """,
+                (pending,),
+            )
+            cursor = await conn.execute(
+                """
+                SELECT run_outbox.run_id, run_outbox.attempts
+                  FROM run_outbox
+                  JOIN workflow_runs ON workflow_runs.id = run_outbox.run_id
+                 WHERE workflow_runs.status = ?
+                   AND run_outbox.published_at <= ?
+                """,
+                (pending, published_before.isoformat()),
+            )
+            stale = list(await cursor.fetchall())
+            await conn.executemany(
+                """
+                UPDATE run_outbox
+                   SET published_at = NULL, available_at = ?
+                 WHERE run_id = ?
+                """,
+                [
+                    (
+                        (
+                            now + timedelta(seconds=retry_delay(row["attempts"]))
+                        ).isoformat(),
+                        row["run_id"],
+                    )
+                    for row in stale
+                ],
+            )
+        return len(stale)
+
+
+__all__ = ["RunOutboxMixin"]
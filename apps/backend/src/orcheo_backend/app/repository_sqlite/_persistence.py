@@ -3,8 +3,10 @@
 from __future__ import annotations
 import json
 from collections.abc import Mapping
+from datetime import timedelta
 from typing import Any
 from uuid import UUID
+from orcheo.models.base import _utcnow
 from orcheo.models.workflow import Workflow, WorkflowRun, WorkflowVersion
 from orcheo.models.workflow_refs import workflow_ref_is_uuid
 from orcheo.runtime.runnable_config import merge_runnable_configs
@@ -173,11 +175,44 @@ class SqlitePersistenceMixin(SqliteRepositoryBase):
         input_payload: Mapping[str, Any],
         actor: str | None,
         runnable_config: Mapping[str, Any] | None = None,
+        enqueue: bool = False,
+        enqueue_delay: timedelta | None = None,
+        run_id: UUID | None = None,
     ) -> WorkflowRun:
         version = await self._get_version_locked(workflow_version_id)
         if version.workflow_id != workflow_id:
             raise WorkflowVersionNotFoundError(str(workflow_version_id))
 
+        run = self._build_run(
+            version,
+            triggered_by=triggered_by,
+            input_payload=input_payload,
+            actor=actor,
+            runnable_config=runnable_config,
+        )
+        if run_id is not None:
+            run.id = run_id
+        async with self._connection() as conn:
+            await self._insert_runs_locked(
+                conn,
+                workflow_id,
+                [run],
+                enqueue=enqueue,
+                enqueue_delay=enqueue_delay,
+            )
+        self._track_created_runs(workflow_id, [run])
+        return run
+
+    @staticmethod
+    def _build_run(
+        version: WorkflowVersion,
+        *,
+        triggered_by: str,
+        input_payload: Mapping[str, Any],
+        actor: str | None,
+        runnable_config: Mapping[str, Any] | None = None,
+    ) -> WorkflowRun:
+        """Return a new pending run for ``version`` without persisting it."""
         config_payload: dict[str, Any] | None = None
         if runnable_config:
             if hasattr(runnable_config, "model_dump"):
@@ -211,7 +246,7 @@ class SqlitePersistenceMixin(SqliteRepositoryBase):
             else None
         )
         run = WorkflowRun(
-            workflow_version_id=workflow_version_id,
+            workflow_version_id=version.id,
             triggered_by=triggered_by,
             input_payload=dict(input_payload),
             runnable_config=config_payload if isinstance(config_payload, dict) else {},
@@ -221,38 +256,73 @@ class SqlitePersistenceMixin(SqliteRepositoryBase):
             run_name=run_name,
         )
         run.record_event(actor=actor or triggered_by, action="run_created")
+        return run
 
-        async with self._connection() as conn:
-            await conn.execute(
-                """
-                INSERT INTO workflow_runs (
-                    id,
-                    workflow_id,
-                    workflow_version_id,
-                    status,
-                    triggered_by,
-                    payload,
-                    created_at,
-                    updated_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+    async def _insert_runs_locked(
+        self,
+        conn: Any,
+        workflow_id: UUID,
+        runs: list[WorkflowRun],
+        *,
+        enqueue: bool = False,
+        enqueue_delay: timedelta | None = None,
+    ) -> None:
+        """Insert ``runs`` with a single multi-row statement on ``conn``.
+
+        When ``enqueue`` is set the runs are also recorded in the run outbox
+        within the same transaction so the relay publishes them once committed.
+        ``enqueue_delay`` holds the outbox entries back until it elapses or
+        they are released explicitly.
+        """
+        if not runs:
+            return
+        row = "(?, ?, ?, ?, ?, ?, ?, ?)"
+        params: list[Any] = []
+        for run in runs:
+            params.extend(
                 (
                     str(run.id),
                     str(workflow_id),
-                    str(workflow_version_id),
+                    str(run.workflow_version_id),
                     run.status.value,
                     run.triggered_by,
                     self._dump_model(run),
                     run.created_at.isoformat(),
                     run.updated_at.isoformat(),
-                ),
+                )
+            )
+        await conn.execute(
+            """
+            INSERT INTO workflow_runs (
+                id,
+                workflow_id,
+                workflow_version_id,
+                status,
+                triggered_by,
+                payload,
+                created_at,
+                updated_at
+            )
+            VALUES """
+            + ", ".join([row] * len(runs)),
+            tuple(params),
+        )
+        if enqueue:
+            now = _utcnow()
+            available_at = (now + (enqueue_delay or timedelta())).isoformat()
+            await conn.executemany(
+                """
+                INSERT INTO run_outbox (run_id, available_at, attempts, created_at)
+                VALUES (?, ?, 0, ?)
+                """,
+                [(str(run.id), available_at, now.isoformat()) for run in runs],
             )
 
-        self._trigger_layer.track_run(workflow_id, run.id)
-        if triggered_by == "cron":
-            self._trigger_layer.register_cron_run(run.id)
-        return run
+    def _track_created_runs(self, workflow_id: UUID, runs: list[WorkflowRun]) -> None:
+        for run in runs:
+            self._trigger_layer.track_run(workflow_id, run.id)
+            if run.triggered_by == "cron":
+                self._trigger_layer.register_cron_run(run.id)
 
 
 __all__ = ["SqlitePersistenceMixin"]
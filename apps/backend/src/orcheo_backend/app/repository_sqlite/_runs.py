@@ -1,11 +1,15 @@
 """Workflow run persistence and lifecycle helpers."""
 
 from __future__ import annotations
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any
 from uuid import UUID
-from orcheo.models.workflow import WorkflowRun
-from orcheo_backend.app.repository import WorkflowNotFoundError
+from orcheo.models.workflow import WorkflowRun, WorkflowRunStatus, WorkflowVersion
+from orcheo_backend.app.repository import (
+    WorkflowNotFoundError,
+    WorkflowRunSpec,
+    WorkflowVersionNotFoundError,
+)
 from orcheo_backend.app.repository_sqlite._persistence import SqlitePersistenceMixin
 
 
@@ -38,6 +42,47 @@ class WorkflowRunMixin(SqlitePersistenceMixin):
             )
             return run.model_copy(deep=True)
 
+    async def create_runs(
+        self,
+        workflow_id: UUID,
+        runs: Sequence[WorkflowRunSpec],
+        *,
+        actor: str | None = None,
+    ) -> list[WorkflowRun]:
+        """Create several runs with one insert so the batch commits atomically."""
+        if not runs:
+            return []
+        await self._ensure_initialized()
+        async with self._lock:
+            workflow = await self._get_workflow_locked(workflow_id)
+            if workflow.is_archived:
+                raise WorkflowNotFoundError(str(workflow_id))
+            versions: dict[UUID, WorkflowVersion] = {}
+            for spec in runs:
+                if spec.workflow_version_id in versions:
+                    continue
+                version = await self._get_version_locked(spec.workflow_version_id)
+                if version.workflow_id != workflow_id:
+                    raise WorkflowVersionNotFoundError(str(spec.workflow_version_id))
+                versions[version.id] = version
+            await self._ensure_workflow_health(
+                workflow_id, actor=actor or runs[0].triggered_by
+            )
+            created = [
+                self._build_run(
+                    versions[spec.workflow_version_id],
+                    triggered_by=spec.triggered_by,
+                    input_payload=spec.input_payload,
+                    actor=actor,
+                    runnable_config=spec.runnable_config,
+                )
+                for spec in runs
+            ]
+            async with self._connection() as conn:
+                await self._insert_runs_locked(conn, workflow_id, created)
+            self._track_created_runs(workflow_id, created)
+            return [run.model_copy(deep=True) for run in created]
+
     async def list_runs_for_workflow(
         self, workflow_id: UUID, *, limit: int | None = None
     ) -> list[WorkflowRun]:
@@ -68,7 +113,13 @@ class WorkflowRunMixin(SqlitePersistenceMixin):
             return await self._get_run_locked(run_id)
 
     async def mark_run_started(self, run_id: UUID, *, actor: str) -> WorkflowRun:
-        return await self._update_run(run_id, lambda run: run.mark_started(actor=actor))
+        # The status guard makes workers in different processes race on the
+        # row itself: only one of them sees the pending run updated.
+        return await self._update_run(
+            run_id,
+            lambda run: run.mark_started(actor=actor),
+            expected_status=WorkflowRunStatus.PENDING,
+        )
 
     async def mark_run_succeeded(
         self,
@@ -120,6 +171,7 @@ class WorkflowRunMixin(SqlitePersistenceMixin):
             async with self._connection() as conn:
                 await conn.executescript(
                     """
+                    DELETE FROM run_outbox;
                     DELETE FROM workflow_runs;
                     DELETE FROM workflow_versions;
                     DELETE FROM workflows;
@@ -137,25 +189,42 @@ class WorkflowRunMixin(SqlitePersistenceMixin):
         self,
         run_id: UUID,
         updater: Callable[[WorkflowRun], None],
+        *,
+        expected_status: WorkflowRunStatus | None = None,
     ) -> WorkflowRun:
         await self._ensure_initialized()
         async with self._lock:
             run = await self._get_run_locked(run_id)
             updater(run)
+            params = (
+                run.status.value,
+                self._dump_model(run),
+                run.updated_at.isoformat(),
+                str(run.id),
+            )
             async with self._connection() as conn:
-                await conn.execute(
+                if expected_status is None:
+                    await conn.execute(
+                        """
+                        UPDATE workflow_runs
+                           SET status = ?, payload = ?, updated_at = ?
+                         WHERE id = ?
+                        """,
+                        params,
+                    )
+                    return run.model_copy(deep=True)
+                cursor = await conn.execute(
                     """
                     UPDATE workflow_runs
                        SET status = ?, payload = ?, updated_at = ?
-                     WHERE id = ?
+                     WHERE id = ? AND status = ?
+                 RETURNING id
                     """,
-                    (
-                        run.status.value,
-                        self._dump_model(run),
-                        run.updated_at.isoformat(),
-                        str(run.id),
-                    ),
+                    (*params, expected_status.value),
                 )
+                if await cursor.fetchone() is None:
+                    msg = f"Run is no longer {expected_status.value}."
+                    raise ValueError(msg)
             return run.model_copy(deep=True)
 
 
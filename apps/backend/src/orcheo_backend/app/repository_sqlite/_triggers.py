@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 from collections.abc import Mapping
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 from orcheo.models.workflow import WorkflowRun
+from orcheo.tracing.metrics import track_trigger_dispatch
 from orcheo.triggers.cron import CronTriggerConfig
 from orcheo.triggers.manual import ManualDispatchRequest
 from orcheo.triggers.webhook import WebhookRequest, WebhookTriggerConfig
@@ -18,28 +19,6 @@ from orcheo_backend.app.repository_sqlite._base import logger
 from orcheo_backend.app.repository_sqlite._persistence import SqlitePersistenceMixin
 
 
-def _enqueue_run_for_execution(run: WorkflowRun) -> None:
-    """Enqueue a Celery task to execute the workflow run.
-
-    This function is best-effort: if Celery/Redis is unavailable,
-    the run remains pending and can be retried manually.
-
-    NOTE: This must only be called AFTER the run has been committed to the database.
-    """
-    try:
-        from orcheo_backend.worker.tasks import execute_run
-
-        execute_run.delay(str(run.id))
-        logger.info("Enqueued run %s for execution", run.id)
-    except Exception as exc:
-        logger.warning(
-            "Failed to enqueue run %s for execution: %s. "
-            "Run will remain pending until manually retried.",
-            run.id,
-            exc,
-        )
-
-
 class TriggerRepositoryMixin(SqlitePersistenceMixin):
     """Coordinate trigger configuration and dispatch flows."""
 
@@ -51,7 +30,9 @@ class TriggerRepositoryMixin(SqlitePersistenceMixin):
         await self._ensure_initialized()
         async with self._lock:
             await self._get_workflow_locked(workflow_id)
-            normalized = self._trigger_layer.configure_webhook(workflow_id, config)
+            normalized = await self._trigger_layer.update_webhook_config(
+                workflow_id, config
+            )
             async with self._connection() as conn:
                 await conn.execute(
                     """
@@ -71,6 +52,7 @@ class TriggerRepositoryMixin(SqlitePersistenceMixin):
             await self._get_workflow_locked(workflow_id)
             return self._trigger_layer.get_webhook_config(workflow_id)
 
+    @track_trigger_dispatch("webhook")
     async def handle_webhook_trigger(
         self,
         workflow_id: UUID,
@@ -80,6 +62,8 @@ class TriggerRepositoryMixin(SqlitePersistenceMixin):
         query_params: Mapping[str, str],
         payload: Any,
         source_ip: str | None,
+        enqueue_delay: timedelta | None = None,
+        run_id: UUID | None = None,
     ) -> WorkflowRun:
         await self._ensure_initialized()
         async with self._lock:
@@ -93,7 +77,7 @@ class TriggerRepositoryMixin(SqlitePersistenceMixin):
                 payload=payload,
                 source_ip=source_ip,
             )
-            dispatch = self._trigger_layer.prepare_webhook_dispatch(
+            dispatch = await self._trigger_layer.prepare_webhook_dispatch(
                 workflow_id, request
             )
             run = await self._create_run_locked(
@@ -102,10 +86,13 @@ class TriggerRepositoryMixin(SqlitePersistenceMixin):
                 triggered_by=dispatch.triggered_by,
                 input_payload=dispatch.input_payload,
                 actor=dispatch.actor,
+                enqueue=True,
+                enqueue_delay=enqueue_delay,
+                run_id=run_id,
             )
             run_copy = run.model_copy(deep=True)
-        # Enqueue AFTER lock is released to ensure commit is fully visible
-        _enqueue_run_for_execution(run_copy)
+        if enqueue_delay is None:
+            self._notify_run_outbox()
         return run_copy
 
     async def configure_cron_trigger(
@@ -153,6 +140,7 @@ class TriggerRepositoryMixin(SqlitePersistenceMixin):
                 )
             self._trigger_layer.remove_cron_config(workflow_id)
 
+    @track_trigger_dispatch("cron")
     async def dispatch_due_cron_runs(
         self, *, now: datetime | None = None
     ) -> list[WorkflowRun]:
@@ -193,6 +181,7 @@ class TriggerRepositoryMixin(SqlitePersistenceMixin):
                         "timezone": plan.timezone,
                     },
                     actor="cron",
+                    enqueue=True,
                 )
                 self._trigger_layer.commit_cron_dispatch(plan.workflow_id)
                 # Persist the last_dispatched_at to survive worker restarts
@@ -210,11 +199,11 @@ class TriggerRepositoryMixin(SqlitePersistenceMixin):
                             (last_dispatched.isoformat(), str(plan.workflow_id)),
                         )
                 runs.append(run.model_copy(deep=True))
-        # Enqueue AFTER lock is released to ensure commits are fully visible
-        for run in runs:
-            _enqueue_run_for_execution(run)
+        if runs:
+            self._notify_run_outbox()
         return runs
 
+    @track_trigger_dispatch("manual")
     async def dispatch_manual_runs(
         self, request: ManualDispatchRequest
     ) -> list[WorkflowRun]:
@@ -251,11 +240,11 @@ class TriggerRepositoryMixin(SqlitePersistenceMixin):
                     triggered_by=plan.triggered_by,
                     input_payload=resolved.input_payload,
                     actor=plan.actor,
+                    enqueue=True,
                 )
                 runs.append(run.model_copy(deep=True))
-        # Enqueue AFTER lock is released to ensure commits are fully visible
-        for run in runs:
-            _enqueue_run_for_execution(run)
+        if runs:
+            self._notify_run_outbox()
         return runs
 
 
@@ -275,7 +275,7 @@ def _extract_session_subject(request: Request) -> str | None:
     return None
 
 
-def _rate_limit(
+async def _rate_limit(
     limiter: SlidingWindowRateLimiter,
     key: str | None,
     *,
@@ -284,7 +284,7 @@ def _rate_limit(
     if not key:
         return
     try:
-        limiter.hit(key, now=now)
+        await limiter.hit(key, now=now)
     except AuthenticationError as exc:
         raise exc.as_http_exception() from exc
 
@@ -314,7 +314,7 @@ async def authenticate_chatkit_invocation(
 
     now = datetime.now(tz=UTC)
     client_host = request.client.host if request.client else None
-    _rate_limit(_IP_RATE_LIMITER, client_host, now=now)
+    await _rate_limit(_IP_RATE_LIMITER, client_host, now=now)
 
     jwt_result = await _authenticate_jwt_request(
         request=request,
@@ -790,7 +790,7 @@ async def _authenticate_jwt_request(
             )
 
     identity = chatkit_claims.get("token_id") or claims.get("sub")
-    _rate_limit(_JWT_RATE_LIMITER, str(identity) if identity else None, now=now)
+    await _rate_limit(_JWT_RATE_LIMITER, str(identity) if identity else None, now=now)
 
     try:
         workflow = await repository.get_workflow(workflow_id)
@@ -830,7 +830,7 @@ async def _authenticate_publish_request(
             auth_mode="publish",
         )
 
-    _rate_limit(_WORKFLOW_RATE_LIMITER, str(workflow_id), now=now)
+    await _rate_limit(_WORKFLOW_RATE_LIMITER, str(workflow_id), now=now)
 
     session_subject = _extract_session_subject(request)
     if workflow.require_login and not session_subject:
@@ -844,7 +844,7 @@ async def _authenticate_publish_request(
             auth_mode="publish",
         )
 
-    _rate_limit(_SESSION_RATE_LIMITER, session_subject, now=now)
+    await _rate_limit(_SESSION_RATE_LIMITER, session_subject, now=now)
 
     actor = f"workflow:{workflow_id}"
     return ChatKitAuthResult(
@@ -1,6 +1,7 @@
 """Workflow run management routes."""
 
 from __future__ import annotations
+from typing import Any, NoReturn
 from uuid import UUID
 from fastapi import APIRouter, HTTPException, Query, status
 from orcheo.models.workflow import WorkflowRun
@@ -16,7 +17,9 @@ from orcheo_backend.app.history import RunHistoryNotFoundError
 from orcheo_backend.app.history_utils import history_to_response
 from orcheo_backend.app.repository import (
     WorkflowNotFoundError,
+    WorkflowRepository,
     WorkflowRunNotFoundError,
+    WorkflowRunSpec,
     WorkflowVersionNotFoundError,
 )
 from orcheo_backend.app.schemas.runs import (
@@ -28,7 +31,10 @@ from orcheo_backend.app.schemas.runs import (
     RunSucceedRequest,
 )
 from orcheo_backend.app.schemas.traces import TraceResponse
-from orcheo_backend.app.schemas.workflows import WorkflowRunCreateRequest
+from orcheo_backend.app.schemas.workflows import (
+    WorkflowRunBatchCreateRequest,
+    WorkflowRunCreateRequest,
+)
 from orcheo_backend.app.trace_utils import build_trace_response
 
 
@@ -49,27 +55,79 @@ async def create_workflow_run(
     """Create a workflow execution run."""
     workflow_uuid = await resolve_workflow_ref_id(repository, workflow_ref)
     try:
-        config_payload = (
-            request.runnable_config.model_dump(mode="json")
-            if request.runnable_config is not None
-            else None
-        )
-        return await repository.create_run(
-            workflow_uuid,
-            workflow_version_id=request.workflow_version_id,
-            triggered_by=request.triggered_by,
-            input_payload=request.input_payload,
-            runnable_config=config_payload,
+        return await _create_run(repository, workflow_uuid, request)
+    except WorkflowNotFoundError as exc:
+        raise_not_found("Workflow not found", exc)
+    except WorkflowVersionNotFoundError as exc:
+        raise_not_found("Workflow version not found", exc)
+    except CredentialHealthError as exc:
+        _raise_credential_health(exc)
+
+
+@router.post(
+    "/workflows/{workflow_ref}/runs/batch",
+    response_model=list[WorkflowRun],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_workflow_runs(
+    workflow_ref: str,
+    request: WorkflowRunBatchCreateRequest,
+    repository: RepositoryDep,
+    _service: CredentialServiceDep,
+) -> list[WorkflowRun]:
+    """Create several workflow execution runs in one round trip.
+
+    The batch is atomic: a missing version or failing credential health check
+    rejects the whole batch without creating any run. Runs are returned in
+    request order.
+    """
+    workflow_uuid = await resolve_workflow_ref_id(repository, workflow_ref)
+    specs = [
+        WorkflowRunSpec(
+            workflow_version_id=item.workflow_version_id,
+            triggered_by=item.triggered_by,
+            input_payload=item.input_payload,
+            runnable_config=_runnable_config_payload(item),
         )
+        for item in request.runs
+    ]
+    try:
+        return await repository.create_runs(workflow_uuid, specs)
     except WorkflowNotFoundError as exc:
         raise_not_found("Workflow not found", exc)
     except WorkflowVersionNotFoundError as exc:
         raise_not_found("Workflow version not found", exc)
     except CredentialHealthError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
-            detail={"message": str(exc), "failures": exc.report.failures},
-        ) from exc
+        _raise_credential_health(exc)
+
+
+async def _create_run(
+    repository: WorkflowRepository,
+    workflow_id: UUID,
+    request: WorkflowRunCreateRequest,
+) -> WorkflowRun:
+    return await repository.create_run(
+        workflow_id,
+        workflow_version_id=request.workflow_version_id,
+        triggered_by=request.triggered_by,
+        input_payload=request.input_payload,
+        runnable_config=_runnable_config_payload(request),
+    )
+
+
+def _runnable_config_payload(
+    request: WorkflowRunCreateRequest,
+) -> dict[str, Any] | None:
+    if request.runnable_config is None:
+        return None
+    return request.runnable_config.model_dump(mode="json")
+
+
+def _raise_credential_health(exc: CredentialHealthError) -> NoReturn:
+    raise HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+        detail={"message": str(exc), "failures": exc.report.failures},
+    ) from exc
 
 
 _DEFAULT_RUNS_LIMIT = 50
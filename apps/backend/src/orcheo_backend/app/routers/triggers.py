@@ -4,18 +4,24 @@ from __future__ import annotations
 import json
 import logging
 from collections.abc import Mapping
+from datetime import timedelta
 from typing import Any
 from uuid import UUID, uuid4
 from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 from fastapi.responses import JSONResponse, PlainTextResponse
 from langchain_core.runnables import RunnableConfig
 from orcheo.config import get_settings
+from orcheo.graph.blobs import aresolve_blob_refs
 from orcheo.graph.builder import build_graph
 from orcheo.models import CredentialAccessContext
 from orcheo.models.workflow import WorkflowRun, WorkflowVersion
 from orcheo.persistence import create_checkpointer, create_graph_store
 from orcheo.runtime.credentials import CredentialResolver, credential_resolution
-from orcheo.runtime.runnable_config import merge_runnable_configs
+from orcheo.runtime.runnable_config import (
+    IMMEDIATE_RESPONSE_CHECK_KEY,
+    WEBHOOK_HANDOFF_METADATA_KEY,
+    merge_runnable_configs,
+)
 from orcheo.runtime.state_builder import build_initial_state
 from orcheo.triggers.cron import CronTriggerConfig
 from orcheo.triggers.manual import ManualDispatchRequest
@@ -24,11 +30,14 @@ from orcheo.vault.oauth import CredentialHealthError
 from orcheo_backend.app.dependencies import (
     RepositoryDep,
     VaultDep,
+    get_history_store,
     resolve_workflow_ref_id,
 )
 from orcheo_backend.app.errors import raise_not_found, raise_webhook_error
+from orcheo_backend.app.history import RunHistoryError
 from orcheo_backend.app.repository import (
     CronTriggerNotFoundError,
+    RunOutboxStore,
     WorkflowNotFoundError,
     WorkflowVersionNotFoundError,
 )
@@ -45,6 +54,11 @@ router = APIRouter()
 # validation (HMAC signatures, shared secrets, etc.) configured per workflow.
 public_webhook_router = APIRouter()
 
+# Upper bound on how long an immediate-response run is held back from workers
+# while it executes inline. Runs are released as soon as the response is ready;
+# the timeout only matters if the API process dies mid-execution.
+IMMEDIATE_RESPONSE_HANDOFF_TIMEOUT = timedelta(minutes=5)
+
 
 def _parse_webhook_body(
     raw_body: bytes, *, preserve_raw_body: bool
@@ -93,11 +107,14 @@ def _build_webhook_state(
     return build_initial_state(graph_config, inputs, runtime_config)
 
 
-def _extract_immediate_response(
+async def _extract_immediate_response(
     final_state: Mapping[str, Any],
 ) -> tuple[dict[str, Any] | None, bool]:
     """Extract immediate_response and should_process from workflow results.
 
+    An ``immediate_response`` offloaded to the blob store is loaded in a
+    worker thread.
+
     Returns:
         Tuple of (immediate_response dict or None, should_process bool).
         should_process indicates whether async processing should continue
@@ -106,7 +123,7 @@ def _extract_immediate_response(
     results = final_state.get("results", {})
     for node_result in results.values():
         if isinstance(node_result, dict) and "immediate_response" in node_result:
-            immediate = node_result["immediate_response"]
+            immediate = await aresolve_blob_refs(node_result["immediate_response"])
             if isinstance(immediate, dict) and immediate.get("content") is not None:
                 should_process = node_result.get("should_process", False)
                 return immediate, should_process
@@ -170,19 +187,187 @@ async def _try_immediate_response(
         )
         return None, True
 
-    immediate, should_process = _extract_immediate_response(final_state)
+    immediate, should_process = await _extract_immediate_response(final_state)
     if immediate is None:
         return None, True
+    return _build_immediate_response(immediate), should_process
+
 
+def _build_immediate_response(
+    immediate: Mapping[str, Any],
+) -> PlainTextResponse | JSONResponse | Response:
+    """Return the HTTP response described by an ``immediate_response`` payload."""
     content = immediate.get("content", "")
     content_type = immediate.get("content_type", "text/plain")
     status_code = immediate.get("status_code", 200)
 
     if content_type == "application/json":
-        response = _build_json_immediate_response(content, status_code)
-    else:
-        response = PlainTextResponse(content=str(content), status_code=status_code)
-    return response, should_process
+        return _build_json_immediate_response(content, status_code)
+    return PlainTextResponse(content=str(content), status_code=status_code)
+
+
+async def _execute_until_immediate_response(
+    version: WorkflowVersion,
+    execution_id: str,
+    inputs: dict[str, Any],
+    vault: VaultDep,
+    steps: list[Any],
+) -> tuple[dict[str, Any] | None, bool]:
+    """Execute ``version`` inline, one superstep at a time, until it yields a reply.
+
+    The graph is checkpointed on the ``execution_id`` thread after every
+    superstep and stops at the first ``immediate_response``, leaving the
+    remaining nodes for a worker to resume from the persisted checkpoint.
+    Executed steps are appended to ``steps`` so they can be recorded once a
+    run is handed off.
+
+    Returns:
+        Tuple of (immediate_response or None, whether work is left for a
+        worker). Nothing is left when the graph finished or when the reply set
+        ``should_process`` to false.
+    """
+    graph_config = version.graph
+    settings = get_settings()
+
+    credential_context = CredentialAccessContext(workflow_id=version.workflow_id)
+    resolver = CredentialResolver(vault, context=credential_context)
+
+    merged_config = merge_runnable_configs(version.runnable_config, None)
+    runtime_config: RunnableConfig = merged_config.to_runnable_config(execution_id)
+    runtime_config["configurable"][IMMEDIATE_RESPONSE_CHECK_KEY] = True
+    # Tag inline checkpoints so the worker knows it may resume from them.
+    runtime_config["metadata"] = {
+        **runtime_config.get("metadata", {}),
+        WEBHOOK_HANDOFF_METADATA_KEY: True,
+    }
+    state_config = merged_config.to_state_config(execution_id)
+
+    with credential_resolution(resolver):
+        async with create_checkpointer(settings) as checkpointer:
+            async with create_graph_store(settings) as graph_store:
+                compiled = build_graph(graph_config).compile(
+                    checkpointer=checkpointer,
+                    store=graph_store,
+                    interrupt_after="*",
+                )
+                step_input: Any = _build_webhook_state(
+                    graph_config, inputs, state_config
+                )
+                while True:
+                    async for step in compiled.astream(
+                        step_input, config=runtime_config, stream_mode="updates"
+                    ):
+                        if "__interrupt__" not in step:
+                            steps.append(await aresolve_blob_refs(step))
+                    snapshot = await compiled.aget_state(runtime_config)
+                    immediate, should_process = await _extract_immediate_response(
+                        snapshot.values
+                    )
+                    if not snapshot.next or (
+                        immediate is not None and not should_process
+                    ):
+                        return immediate, False
+                    if immediate is not None:
+                        return immediate, True
+                    step_input = None
+
+
+async def _record_inline_history(
+    version: WorkflowVersion,
+    execution_id: str,
+    inputs: dict[str, Any],
+    steps: list[Any],
+) -> None:
+    """Start the history of a handed-off run with the steps executed inline."""
+    history_store = get_history_store()
+    merged_config = merge_runnable_configs(version.runnable_config, None)
+    try:
+        await history_store.start_run(
+            workflow_id=str(version.workflow_id),
+            execution_id=execution_id,
+            inputs=inputs,
+            runnable_config=merged_config.to_json_config(execution_id),
+            tags=merged_config.tags,
+            callbacks=merged_config.callbacks,
+            metadata=merged_config.metadata,
+            run_name=merged_config.run_name,
+        )
+        for step in steps:
+            await history_store.append_step(execution_id, step)
+    except RunHistoryError:
+        logger.exception("Failed to record run history for execution %s", execution_id)
+
+
+async def _respond_and_hand_off(
+    repository: RepositoryDep,
+    outbox: RunOutboxStore,
+    vault: VaultDep,
+    workflow_id: UUID,
+    method: str,
+    headers: dict[str, str],
+    query_params: dict[str, Any],
+    payload: Any,
+    source_ip: str | None,
+) -> PlainTextResponse | JSONResponse | Response | WorkflowRun:
+    """Answer an immediate-response webhook from a single workflow execution.
+
+    The workflow executes inline, on the checkpoint thread of a run that is
+    not recorded yet, only until a node emits ``immediate_response``. When
+    work is left, the run is then created under that identifier and a worker
+    resumes it from the checkpoint, so no node executes twice. Verification
+    pings and replies with ``should_process`` set to false never create a run.
+    """
+    try:
+        version = await repository.get_latest_version(workflow_id)
+    except WorkflowNotFoundError as exc:
+        raise_not_found("Workflow not found", exc)
+    except WorkflowVersionNotFoundError as exc:
+        raise_not_found("Workflow version not found", exc)
+
+    run_id = uuid4()
+    inputs: dict[str, Any] = {
+        "method": method,
+        "headers": headers,
+        "query_params": query_params,
+        "body": payload,
+    }
+    steps: list[Any] = []
+    immediate: dict[str, Any] | None = None
+    handoff = True
+    try:
+        immediate, handoff = await _execute_until_immediate_response(
+            version, str(run_id), inputs, vault, steps
+        )
+    except Exception:
+        # The worker resumes from the last checkpoint written inline.
+        logger.warning(
+            "Inline immediate-response execution failed for run %s",
+            run_id,
+            exc_info=True,
+        )
+    if not handoff:
+        if immediate is None:
+            return JSONResponse(content={"status": "accepted"}, status_code=202)
+        return _build_immediate_response(immediate)
+
+    run = await _queue_webhook_run(
+        repository,
+        workflow_id,
+        method,
+        headers,
+        query_params,
+        payload,
+        source_ip,
+        enqueue_delay=IMMEDIATE_RESPONSE_HANDOFF_TIMEOUT,
+        run_id=run_id,
+    )
+    try:
+        await _record_inline_history(version, str(run_id), inputs, steps)
+    finally:
+        await outbox.release_run_outbox(run.id)
+    if immediate is None:
+        return run
+    return _build_immediate_response(immediate)
 
 
 def _build_json_immediate_response(
@@ -245,6 +430,9 @@ async def _queue_webhook_run(
     query_params: dict[str, Any],
     payload: Any,
     source_ip: str | None,
+    *,
+    enqueue_delay: timedelta | None = None,
+    run_id: UUID | None = None,
 ) -> WorkflowRun:
     """Queue a webhook-triggered workflow run."""
     try:
@@ -255,6 +443,8 @@ async def _queue_webhook_run(
             query_params=query_params,
             payload=payload,
             source_ip=source_ip,
+            enqueue_delay=enqueue_delay,
+            run_id=run_id,
         )
     except WebhookValidationError as exc:
         raise_webhook_error(exc)
@@ -335,7 +525,20 @@ async def invoke_webhook_trigger(
     # Check for immediate response (e.g., WeCom URL verification)
     immediate_response: PlainTextResponse | JSONResponse | Response | None = None
     should_queue = True
+    source_ip = getattr(request.client, "host", None)
     if _should_try_immediate_response(query_params):
+        if isinstance(repository, RunOutboxStore):
+            return await _respond_and_hand_off(
+                repository,
+                repository,
+                vault,
+                workflow_uuid,
+                request.method,
+                headers,
+                query_params,
+                payload,
+                source_ip,
+            )
         try:
             version = await repository.get_latest_version(workflow_uuid)
             immediate_response, should_queue = await _try_immediate_response(
@@ -349,7 +552,6 @@ async def invoke_webhook_trigger(
     # Queue async run if workflow indicates processing is needed
     run: WorkflowRun | None = None
     if should_queue:
-        source_ip = getattr(request.client, "host", None)
         run = await _queue_webhook_run(
             repository,
             workflow_uuid,
@@ -6,6 +6,12 @@ import uuid
 from typing import Any
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from orcheo_backend.app.authentication import AuthenticationError
+from orcheo_backend.app.workflow_stream import (
+    CompactWorkflowStream,
+    StreamOptions,
+    StreamOptionsError,
+    get_workflow_stream,
+)
 
 
 router = APIRouter()
@@ -41,6 +47,8 @@ async def workflow_websocket(websocket: WebSocket, workflow_ref: str) -> None:
         resolved_workflow_id = str(await repository.resolve_workflow_ref(workflow_ref))
         while True:
             data = await websocket.receive_json()
+            if not await _negotiate_stream(websocket, data):
+                break
 
             message_type = data.get("type")
             if message_type == "run_workflow":
@@ -106,13 +114,39 @@ async def workflow_websocket(websocket: WebSocket, workflow_ref: str) -> None:
         await _safe_close_websocket(websocket)
 
 
+async def _negotiate_stream(websocket: WebSocket, data: dict[str, Any]) -> bool:
+    """Switch to the compact protocol when the client asks for it.
+
+    Returns ``False`` after reporting invalid stream options to the client.
+    Each message starts from a fresh stream, so sequence numbers and state
+    snapshots never carry over from an earlier run on the same socket.
+    """
+    websocket.state.workflow_stream = None
+    try:
+        options = StreamOptions.parse(data.get("stream"))
+    except StreamOptionsError as exc:
+        await _safe_send_error_payload(
+            websocket, {"status": "error", "error": str(exc)}
+        )
+        return False
+    if options is not None:
+        stream = CompactWorkflowStream(websocket, options)
+        websocket.state.workflow_stream = stream
+        await stream.start()
+    return True
+
+
 async def _safe_send_error_payload(
     websocket: WebSocket,
     payload: dict[str, Any],
 ) -> None:
     """Send a JSON error payload if the websocket is still open."""
+    stream = get_workflow_stream(websocket)
     try:
-        await websocket.send_json(payload)
+        if stream is None:
+            await websocket.send_json(payload)
+        else:
+            await stream.send("event", payload)
     except WebSocketDisconnect:
         return
     except RuntimeError as exc:
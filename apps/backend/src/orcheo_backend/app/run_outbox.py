@@ -0,0 +1,229 @@
+"""Relay that publishes runs recorded in the run outbox to the worker queue."""
+
+from __future__ import annotations
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Callable, Sequence
+from datetime import timedelta
+from uuid import UUID
+from orcheo.models.base import _utcnow
+from orcheo_backend.app.repository import RunOutboxEntry, RunOutboxStore
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RUN_OUTBOX_BATCH_SIZE = 100
+DEFAULT_RUN_OUTBOX_POLL_INTERVAL_SECONDS = 1.0
+DEFAULT_RUN_OUTBOX_LEASE_SECONDS = 60.0
+DEFAULT_RUN_OUTBOX_BACKOFF_SECONDS = 1.0
+DEFAULT_RUN_OUTBOX_MAX_BACKOFF_SECONDS = 300.0
+DEFAULT_RUN_OUTBOX_SWEEP_INTERVAL_SECONDS = 60.0
+DEFAULT_RUN_OUTBOX_STUCK_AFTER_SECONDS = 300.0
+DEFAULT_RUN_OUTBOX_MAX_REQUEUE_DELAY_SECONDS = 3600.0
+
+_MAX_BACKOFF_EXPONENT = 32
+
+PublishRuns = Callable[[Sequence[UUID]], None]
+
+
+def publish_runs_to_broker(run_ids: Sequence[UUID]) -> None:
+    """Publish ``execute_run`` tasks for ``run_ids`` over one broker producer.
+
+    The run identifier doubles as the Celery task id, so re-publishing a run
+    after a partial failure or a sweep yields the same task. Workers skip runs
+    that are no longer pending, which makes duplicate deliveries harmless.
+    """
+    from orcheo_backend.worker.tasks import execute_run
+
+    with execute_run.app.producer_or_acquire() as producer:
+        for run_id in run_ids:
+            execute_run.apply_async(
+                (str(run_id),), task_id=str(run_id), producer=producer
+            )
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, raw)
+        return default
+
+
+class RunOutboxRelay:
+    """Drain the run outbox into the broker without blocking the event loop.
+
+    Broker calls run in a worker thread. Entries are leased in batches, marked
+    published on success and rescheduled with exponential backoff on failure.
+    A periodic sweep re-arms runs that were published but never picked up,
+    waiting longer before each further re-publication of the same run.
+    """
+
+    def __init__(
+        self,
+        store: RunOutboxStore,
+        *,
+        publish: PublishRuns = publish_runs_to_broker,
+        batch_size: int = DEFAULT_RUN_OUTBOX_BATCH_SIZE,
+        poll_interval_seconds: float = DEFAULT_RUN_OUTBOX_POLL_INTERVAL_SECONDS,
+        lease_seconds: float = DEFAULT_RUN_OUTBOX_LEASE_SECONDS,
+        backoff_seconds: float = DEFAULT_RUN_OUTBOX_BACKOFF_SECONDS,
+        max_backoff_seconds: float = DEFAULT_RUN_OUTBOX_MAX_BACKOFF_SECONDS,
+        sweep_interval_seconds: float = DEFAULT_RUN_OUTBOX_SWEEP_INTERVAL_SECONDS,
+        stuck_after_seconds: float = DEFAULT_RUN_OUTBOX_STUCK_AFTER_SECONDS,
+        max_requeue_delay_seconds: float = (
+            DEFAULT_RUN_OUTBOX_MAX_REQUEUE_DELAY_SECONDS
+        ),
+    ) -> None:
+        """Configure batching, retry backoff and sweep cadence."""
+        self._store = store
+        self._publish = publish
+        self._batch_size = max(1, batch_size)
+        self._poll_interval = poll_interval_seconds
+        self._lease_seconds = lease_seconds
+        self._backoff_seconds = backoff_seconds
+        self._max_backoff_seconds = max_backoff_seconds
+        self._sweep_interval = sweep_interval_seconds
+        self._stuck_after = timedelta(seconds=stuck_after_seconds)
+        self._max_requeue_delay = max_requeue_delay_seconds
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @classmethod
+    def from_env(cls, store: RunOutboxStore) -> RunOutboxRelay:
+        """Build a relay using ``ORCHEO_RUN_OUTBOX_*`` environment overrides."""
+        return cls(
+            store,
+            batch_size=int(
+                _env_float(
+                    "ORCHEO_RUN_OUTBOX_BATCH_SIZE", DEFAULT_RUN_OUTBOX_BATCH_SIZE
+                )
+            ),
+            poll_interval_seconds=_env_float(
+                "ORCHEO_RUN_OUTBOX_POLL_INTERVAL_SECONDS",
+                DEFAULT_RUN_OUTBOX_POLL_INTERVAL_SECONDS,
+            ),
+            stuck_after_seconds=_env_float(
+                "ORCHEO_RUN_OUTBOX_STUCK_AFTER_SECONDS",
+                DEFAULT_RUN_OUTBOX_STUCK_AFTER_SECONDS,
+            ),
+        )
+
+    def wake(self) -> None:
+        """Ask the relay loop to drain the outbox immediately."""
+        self._wakeup.set()
+
+    def backoff_for(self, attempts: int) -> float:
+        """Return the retry delay in seconds after ``attempts`` failed tries."""
+        exponent = min(max(attempts - 1, 0), _MAX_BACKOFF_EXPONENT)
+        return min(self._backoff_seconds * (2**exponent), self._max_backoff_seconds)
+
+    def requeue_delay_for(self, attempts: int) -> float:
+        """Return the delay in seconds before re-publishing a stuck run again.
+
+        The first re-publication is immediate; each later one waits twice as
+        long as the previous, starting from the stuck window.
+        """
+        exponent = min(max(attempts - 1, 0), _MAX_BACKOFF_EXPONENT)
+        delay = self._stuck_after.total_seconds() * (2**exponent - 1)
+        return min(delay, self._max_requeue_delay)
+
+    async def start(self) -> None:
+        """Register with the store and start the background relay loop."""
+        if self._task is not None:
+            return
+        self._store.set_run_outbox_notifier(self.wake)
+        self._task = asyncio.create_task(self._run(), name="run-outbox-relay")
+
+    async def stop(self) -> None:
+        """Stop the relay loop and detach from the store."""
+        self._store.set_run_outbox_notifier(None)
+        task = self._task
+        self._task = None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def relay_once(self) -> int:
+        """Publish one batch of due entries and return how many were published."""
+        entries = await self._store.claim_run_outbox(
+            limit=self._batch_size, lease_seconds=self._lease_seconds
+        )
+        if not entries:
+            return 0
+        run_ids = [entry.run_id for entry in entries]
+        try:
+            await asyncio.to_thread(self._publish, run_ids)
+        except Exception as exc:
+            await self._reschedule(entries, exc)
+            return 0
+        await self._store.mark_run_outbox_published(run_ids)
+        logger.info("Published %d run(s) from the outbox", len(run_ids))
+        return len(run_ids)
+
+    async def drain(self) -> int:
+        """Publish batches until the outbox has no more due entries."""
+        total = 0
+        while True:
+            published = await self.relay_once()
+            total += published
+            if published < self._batch_size:
+                return total
+
+    async def sweep_once(self) -> int:
+        """Re-arm published runs that are still pending after the stuck window."""
+        requeued = await self._store.requeue_stale_run_outbox(
+            published_before=_utcnow() - self._stuck_after,
+            retry_delay=self.requeue_delay_for,
+        )
+        if requeued:
+            logger.warning("Re-publishing %d stuck pending run(s)", requeued)
+        return requeued
+
+    async def _reschedule(
+        self, entries: Sequence[RunOutboxEntry], exc: Exception
+    ) -> None:
+        now = _utcnow()
+        retry_at = {
+            entry.run_id: now + timedelta(seconds=self.backoff_for(entry.attempts))
+            for entry in entries
+        }
+        logger.warning(
+            "Failed to publish %d run(s) to the broker: %s. Retrying with backoff.",
+            len(entries),
+            exc,
+        )
+        await self._store.reschedule_run_outbox(retry_at, error=str(exc))
+
+    async def _run(self) -> None:
+        next_sweep = time.monotonic()
+        while True:
+            self._wakeup.clear()
+            try:
+                if time.monotonic() >= next_sweep:
+                    next_sweep = time.monotonic() + self._sweep_interval
+                    await self.sweep_once()
+                await self.drain()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Run outbox relay iteration failed")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._poll_interval)
+            except TimeoutError:
+                pass
+
+
+__all__ = [
+    "RunOutboxRelay",
+    "publish_runs_to_broker",
+]
@@ -137,6 +137,17 @@ class WorkflowRunCreateRequest(BaseModel):
     runnable_config: RunnableConfigModel | None = None
 
 
+MAX_RUN_BATCH_SIZE = 500
+
+
+class WorkflowRunBatchCreateRequest(BaseModel):
+    """Payload for creating several workflow runs in one request."""
+
+    runs: list[WorkflowRunCreateRequest] = Field(
+        min_length=1, max_length=MAX_RUN_BATCH_SIZE
+    )
+
+
 class WorkflowVersionDiffResponse(BaseModel):
     """Response payload for workflow version diffs."""
 
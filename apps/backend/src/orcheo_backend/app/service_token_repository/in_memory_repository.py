@@ -1,10 +1,11 @@
 """In-memory service token repository for tests."""
 
 from __future__ import annotations
+from collections.abc import Mapping
 from dataclasses import replace
 from datetime import UTC, datetime
 from typing import Any
-from orcheo_backend.app.authentication import ServiceTokenRecord
+from orcheo_backend.app.authentication import ServiceTokenRecord, ServiceTokenUsage
 from .protocol import ServiceTokenRepository
 
 
@@ -82,6 +83,25 @@ class InMemoryServiceTokenRepository(ServiceTokenRepository):
             }
         )
 
+    async def record_usage_batch(self, usage: Mapping[str, ServiceTokenUsage]) -> None:
+        """Apply usage aggregated per token."""
+        for token_id, entry in usage.items():
+            record = self._tokens.get(token_id)
+            if record is not None:
+                self._tokens[token_id] = replace(
+                    record,
+                    last_used_at=entry.last_used_at,
+                    use_count=record.use_count + entry.count,
+                )
+            self._audit_log.append(
+                {
+                    "token_id": token_id,
+                    "action": "used",
+                    "timestamp": entry.last_used_at.isoformat(),
+                    "details": {"count": entry.count},
+                }
+            )
+
     async def get_audit_log(
         self, token_id: str, *, limit: int = 100
     ) -> list[dict[str, Any]]:
@@ -4,11 +4,12 @@ from __future__ import annotations
 import asyncio
 import importlib
 import json
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Mapping
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from typing import Any
-from orcheo_backend.app.authentication import ServiceTokenRecord
+from orcheo.tracing.metrics import track_connection_pool
+from orcheo_backend.app.authentication import ServiceTokenRecord, ServiceTokenUsage
 from orcheo_backend.app.service_token_repository.protocol import ServiceTokenRepository
 from orcheo_backend.app.service_token_repository.sqlite_serialization import (
     serialize_datetime,
@@ -161,6 +162,7 @@ class PostgresServiceTokenRepository(ServiceTokenRepository):
                 },
             )
             await self._pool.open()
+            track_connection_pool("service_tokens", self._pool)
             return self._pool
 
     @asynccontextmanager
@@ -352,6 +354,38 @@ class PostgresServiceTokenRepository(ServiceTokenRepository):
                 ),
             )
 
+    async def record_usage_batch(self, usage: Mapping[str, ServiceTokenUsage]) -> None:
+        """Apply usage aggregated per token with one statement per table."""
+        if not usage:
+            return
+        await self._ensure_initialized()
+        token_ids = list(usage)
+        counts = [usage[token_id].count for token_id in token_ids]
+        last_used = [usage[token_id].last_used_at for token_id in token_ids]
+        details = [json.dumps({"count": count}) for count in counts]
+        async with self._connection() as conn:
+            await conn.execute(
+                """
+                UPDATE service_tokens AS tokens
+                SET last_used_at = GREATEST(tokens.last_used_at, batch.last_used_at),
+                    use_count = COALESCE(tokens.use_count, 0) + batch.count
+                FROM unnest(%s::text[], %s::int[], %s::timestamptz[])
+                    AS batch(identifier, count, last_used_at)
+                WHERE tokens.identifier = batch.identifier
+                """,
+                (token_ids, counts, last_used),
+            )
+            await conn.execute(
+                """
+                INSERT INTO service_token_audit_log
+                    (token_id, action, timestamp, details)
+                SELECT batch.token_id, 'used', batch.timestamp, batch.details
+                FROM unnest(%s::text[], %s::timestamptz[], %s::jsonb[])
+                    AS batch(token_id, timestamp, details)
+                """,
+                (token_ids, last_used, details),
+            )
+
     async def get_audit_log(
         self, token_id: str, *, limit: int = 100
     ) -> list[dict[str, Any]]:
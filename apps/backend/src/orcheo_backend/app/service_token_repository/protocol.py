@@ -1,9 +1,10 @@
 """Protocol definition for service token repositories."""
 
 from __future__ import annotations
+from collections.abc import Mapping
 from datetime import datetime
 from typing import Any, Protocol
-from orcheo_backend.app.authentication import ServiceTokenRecord
+from orcheo_backend.app.authentication import ServiceTokenRecord, ServiceTokenUsage
 
 
 class ServiceTokenRepository(Protocol):
@@ -49,6 +50,10 @@ class ServiceTokenRepository(Protocol):
         """Track token usage for analytics and audit."""
         ...  # pragma: no cover
 
+    async def record_usage_batch(self, usage: Mapping[str, ServiceTokenUsage]) -> None:
+        """Apply usage aggregated per token and log one audit entry per token."""
+        ...  # pragma: no cover
+
     async def get_audit_log(
         self, token_id: str, *, limit: int = 100
     ) -> list[dict[str, Any]]:
@@ -3,10 +3,11 @@
 from __future__ import annotations
 import json
 import sqlite3
+from collections.abc import Mapping
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
-from orcheo_backend.app.authentication import ServiceTokenRecord
+from orcheo_backend.app.authentication import ServiceTokenRecord, ServiceTokenUsage
 from orcheo_backend.app.service_token_repository.sqlite_schema import ensure_schema
 from orcheo_backend.app.service_token_repository.sqlite_serialization import (
     row_to_record,
@@ -187,6 +188,41 @@ class SqliteServiceTokenRepository(ServiceTokenRepository):
             )
             conn.commit()
 
+    async def record_usage_batch(self, usage: Mapping[str, ServiceTokenUsage]) -> None:
+        """Apply usage aggregated per token in a single transaction."""
+        if not usage:
+            return
+        with sqlite3.connect(self._db_path) as conn:
+            conn.executemany(
+                """
+                UPDATE service_tokens
+                SET last_used_at = ?,
+                    use_count = use_count + ?
+                WHERE identifier = ?
+                """,
+                [
+                    (entry.last_used_at.isoformat(), entry.count, token_id)
+                    for token_id, entry in usage.items()
+                ],
+            )
+            conn.executemany(
+                """
+                INSERT INTO service_token_audit_log
+                    (token_id, action, timestamp, details)
+                VALUES (?, ?, ?, ?)
+                """,
+                [
+                    (
+                        token_id,
+                        "used",
+                        entry.last_used_at.isoformat(),
+                        json.dumps({"count": entry.count}),
+                    )
+                    for token_id, entry in usage.items()
+                ],
+            )
+            conn.commit()
+
     async def get_audit_log(
         self, token_id: str, *, limit: int = 100
     ) -> list[dict[str, Any]]:
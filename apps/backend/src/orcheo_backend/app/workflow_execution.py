@@ -16,7 +16,9 @@ from orcheo.agentensor.evaluation import EvaluationRequest
 from orcheo.agentensor.training import TrainingRequest
 from orcheo.config import get_settings
 from orcheo.external_agents import scoped_external_agent_environment
+from orcheo.graph.blobs import aresolve_blob_refs
 from orcheo.graph.state import State
+from orcheo.nodes.agent_tools.context import tool_progress_context
 from orcheo.nodes.agentensor import AgentensorNode
 from orcheo.nodes.browser import close_browser_sessions_for_scope
 from orcheo.runtime.credentials import CredentialResolver, credential_resolution
@@ -26,6 +28,7 @@ from orcheo.runtime.runnable_config import (
 )
 from orcheo.runtime.state_builder import build_initial_state
 from orcheo.tracing import (
+    WorkflowInstrumentation,
     get_tracer,
     record_workflow_cancellation,
     record_workflow_completion,
@@ -33,6 +36,7 @@ from orcheo.tracing import (
     record_workflow_step,
     workflow_span,
 )
+from orcheo.tracing.metrics import GRAPH_BUILD_SECONDS, track_run
 from orcheo.tracing.model_metadata import strip_trace_metadata
 from orcheo_backend.app.dependencies import (
     credential_context_from_workflow,
@@ -54,6 +58,7 @@ from orcheo_backend.app.history import (
     RunHistoryStore,
 )
 from orcheo_backend.app.trace_utils import build_trace_update
+from orcheo_backend.app.workflow_stream import FrameKind, get_workflow_stream
 
 
 logger = logging.getLogger(__name__)
@@ -135,10 +140,20 @@ def _sanitize_public_step_payload(payload: Mapping[str, Any]) -> dict[str, Any]:
     return sanitized if isinstance(sanitized, dict) else dict(payload)
 
 
-async def _safe_send_json(websocket: WebSocket, payload: Any) -> bool:
-    """Send JSON only while the websocket is open."""
+async def _safe_send_json(
+    websocket: WebSocket, payload: Any, *, kind: FrameKind = "event"
+) -> bool:
+    """Send JSON only while the websocket is open.
+
+    Clients that negotiated the compact protocol receive ``payload`` as
+    frames of the given ``kind`` instead.
+    """
+    stream = get_workflow_stream(websocket)
     try:
-        await websocket.send_json(payload)
+        if stream is None:
+            await websocket.send_json(payload)
+        else:
+            await stream.send(kind, payload)
     except WebSocketDisconnect:
         logger.debug("Websocket disconnected before payload could be sent.")
         return False
@@ -160,6 +175,9 @@ async def _emit_trace_update(
     complete: bool = False,
 ) -> None:
     """Fetch the latest history snapshot and stream a trace update."""
+    stream = get_workflow_stream(websocket)
+    if stream is not None and not stream.wants_trace:
+        return
     try:
         record = await history_store.get_history(execution_id)
     except RunHistoryError:
@@ -171,7 +189,7 @@ async def _emit_trace_update(
         record, step=step, include_root=include_root, complete=complete
     )
     if update is not None:
-        await _safe_send_json(websocket, update.model_dump(mode="json"))
+        await _safe_send_json(websocket, update.model_dump(mode="json"), kind="trace")
 
 
 async def _stream_workflow_updates(
@@ -183,28 +201,46 @@ async def _stream_workflow_updates(
     websocket: WebSocket,
     tracer: Tracer,
 ) -> None:
-    """Stream workflow updates to the client while recording history."""
-    async for step in compiled_graph.astream(
-        state,
-        config=config,  # type: ignore[arg-type]
-        stream_mode="updates",
-    ):  # pragma: no cover
-        _log_step_debug(step)
-        record_workflow_step(tracer, step)
-        history_step = await history_store.append_step(execution_id, step)
-        try:
-            await _safe_send_json(websocket, _sanitize_public_step_payload(step))
-        except Exception as exc:  # pragma: no cover
-            logger.error("Error processing messages: %s", exc)
-            raise
+    """Stream workflow updates to the client while recording history.
 
-        await _emit_trace_update(
-            history_store,
-            websocket,
-            execution_id,
-            step=history_step,
+    Progress reported by running nodes (tool sub-workflows, external agent
+    output) is forwarded as events without being recorded in history.
+    """
+    instrumentation = WorkflowInstrumentation(tracer, graph=compiled_graph)
+
+    async def _forward_progress(update: Mapping[str, Any]) -> None:
+        await _safe_send_json(
+            websocket, _sanitize_public_step_payload(update), kind="event"
         )
 
+    try:
+        with tool_progress_context(_forward_progress):
+            async for step in compiled_graph.astream(
+                state,
+                config=instrumentation.attach(config),  # type: ignore[arg-type]
+                stream_mode="updates",
+            ):  # pragma: no cover
+                _log_step_debug(step)
+                record_workflow_step(tracer, step, instrumentation=instrumentation)
+                resolved = await aresolve_blob_refs(step)
+                history_step = await history_store.append_step(execution_id, resolved)
+                try:
+                    await _safe_send_json(
+                        websocket, _sanitize_public_step_payload(resolved), kind="step"
+                    )
+                except Exception as exc:  # pragma: no cover
+                    logger.error("Error processing messages: %s", exc)
+                    raise
+
+                await _emit_trace_update(
+                    history_store,
+                    websocket,
+                    execution_id,
+                    step=history_step,
+                )
+    finally:
+        instrumentation.close()
+
     final_state = await compiled_graph.aget_state(cast(RunnableConfig, config))
     _log_final_state_debug(final_state.values)
 
@@ -394,13 +430,16 @@ async def execute_workflow(
     )
 
     try:
-        with workflow_span(
-            tracer,
-            workflow_id=workflow_id,
-            execution_id=execution_id,
-            inputs=inputs,
-            runnable_config=parsed_config,
-        ) as span_context:
+        with (
+            track_run("websocket"),
+            workflow_span(
+                tracer,
+                workflow_id=workflow_id,
+                execution_id=execution_id,
+                inputs=inputs,
+                runnable_config=parsed_config,
+            ) as span_context,
+        ):
             await history_store.start_run(
                 workflow_id=workflow_id,
                 execution_id=execution_id,
@@ -425,11 +464,12 @@ async def execute_workflow(
                 with credential_resolution(resolver):
                     async with create_checkpointer(settings) as checkpointer:
                         async with create_graph_store(settings) as graph_store:
-                            graph = build_graph(graph_config)
-                            compiled_graph = graph.compile(
-                                checkpointer=checkpointer,
-                                store=graph_store,
-                            )
+                            with GRAPH_BUILD_SECONDS.time(source="websocket"):
+                                graph = build_graph(graph_config)
+                                compiled_graph = graph.compile(
+                                    checkpointer=checkpointer,
+                                    store=graph_store,
+                                )
 
                             state = _build_initial_state(
                                 graph_config, inputs, state_config
@@ -0,0 +1,247 @@
+"""Compact websocket streaming protocol for workflow executions.
+
+Clients opt in by adding a ``stream`` object to their ``run_workflow`` (or
+evaluation/training) message::
+
+    {"protocol": "orcheo.compact.v1", "channels": ["steps", "trace"],
+     "encoding": "json"}
+
+The server answers with a ``hello`` frame echoing the negotiated options and
+then sends short frames tagged with ``t`` (frame type) and ``s`` (sequence):
+
+* ``step`` - the sanitized node update (``d``), on the ``steps`` channel.
+* ``trace`` - a ``trace:update`` message (``d``) whose spans no longer carry
+  ``orcheo.workflow.state.before``/``after`` snapshots.
+* ``state`` - a JSON patch (``p``, RFC 6902 subset) turning the previous state
+  snapshot into the one after the span identified by ``span``.
+* ``tokens`` - token usage (``in``/``out``) reported by a node.
+* ``event`` - status, progress and error payloads (``d``), always delivered.
+
+Frames are JSON text by default or msgpack binary frames when requested and
+``ormsgpack`` is installed. Transport compression is left to the websocket
+``permessage-deflate`` extension negotiated by the ASGI server.
+"""
+
+from __future__ import annotations
+import importlib
+import json
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Literal
+from fastapi import WebSocket
+from orcheo_backend.app.trace_utils import _extract_token_usage
+
+
+COMPACT_PROTOCOL = "orcheo.compact.v1"
+STREAM_CHANNELS = frozenset({"steps", "trace", "state", "tokens"})
+DEFAULT_STREAM_CHANNELS = frozenset({"steps", "trace", "state"})
+STATE_BEFORE_ATTRIBUTE = "orcheo.workflow.state.before"
+STATE_AFTER_ATTRIBUTE = "orcheo.workflow.state.after"
+
+StreamEncoding = Literal["json", "msgpack"]
+FrameKind = Literal["step", "trace", "event"]
+
+_ormsgpack: Any | None
+try:  # pragma: no cover - optional dependency
+    _ormsgpack = importlib.import_module("ormsgpack")
+except Exception:  # pragma: no cover - fallback when dependency missing
+    _ormsgpack = None
+
+
+class StreamOptionsError(ValueError):
+    """Raised when a client requests an unsupported stream configuration."""
+
+
+@dataclass(frozen=True, slots=True)
+class StreamOptions:
+    """Channels and frame encoding negotiated for a compact stream."""
+
+    channels: frozenset[str] = DEFAULT_STREAM_CHANNELS
+    encoding: StreamEncoding = "json"
+
+    @classmethod
+    def parse(cls, raw: Any) -> StreamOptions | None:
+        """Return compact stream options, or ``None`` for the legacy protocol."""
+        if raw is None:
+            return None
+        if not isinstance(raw, Mapping):
+            raise StreamOptionsError("stream options must be an object")
+        if raw.get("protocol", COMPACT_PROTOCOL) != COMPACT_PROTOCOL:
+            raise StreamOptionsError(
+                f"Unsupported stream protocol: {raw.get('protocol')!r}"
+            )
+        raw_channels = raw.get("channels")
+        channels = (
+            DEFAULT_STREAM_CHANNELS
+            if raw_channels is None
+            else frozenset(str(channel) for channel in raw_channels)
+        )
+        unknown = channels - STREAM_CHANNELS
+        if unknown:
+            raise StreamOptionsError(
+                f"Unsupported stream channels: {', '.join(sorted(unknown))}"
+            )
+        encoding = raw.get("encoding", "json")
+        if encoding not in ("json", "msgpack"):
+            raise StreamOptionsError(f"Unsupported stream encoding: {encoding!r}")
+        if encoding == "msgpack" and _ormsgpack is None:
+            encoding = "json"
+        return cls(channels=channels, encoding=encoding)
+
+
+def _escape_pointer(key: str) -> str:
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def json_patch(before: Any, after: Any, path: str = "") -> list[dict[str, Any]]:
+    """Return JSON patch operations that turn ``before`` into ``after``.
+
+    Appended list items become ``add`` operations on ``/-`` so growing message
+    histories only ship the new entries.
+    """
+    if before == after:
+        return []
+    if isinstance(before, Mapping) and isinstance(after, Mapping):
+        operations: list[dict[str, Any]] = [
+            {"op": "remove", "path": f"{path}/{_escape_pointer(str(key))}"}
+            for key in before
+            if key not in after
+        ]
+        for key, value in after.items():
+            child = f"{path}/{_escape_pointer(str(key))}"
+            if key in before:
+                operations.extend(json_patch(before[key], value, child))
+            else:
+                operations.append({"op": "add", "path": child, "value": value})
+        return operations
+    if _is_list(before) and _is_list(after):
+        size = len(before)
+        if len(after) >= size and list(after[:size]) == list(before):
+            return [
+                {"op": "add", "path": f"{path}/-", "value": item}
+                for item in after[size:]
+            ]
+        if len(after) == size:
+            operations = []
+            for index, (old, new) in enumerate(zip(before, after, strict=True)):
+                operations.extend(json_patch(old, new, f"{path}/{index}"))
+            return operations
+    return [{"op": "replace", "path": path, "value": after}]
+
+
+def _is_list(value: Any) -> bool:
+    return isinstance(value, Sequence) and not isinstance(value, str | bytes)
+
+
+class CompactWorkflowStream:
+    """Translate execution payloads into compact frames for one websocket."""
+
+    def __init__(self, websocket: WebSocket, options: StreamOptions) -> None:
+        """Bind the stream to ``websocket`` using the negotiated ``options``."""
+        self._websocket = websocket
+        self._options = options
+        self._sequence = 0
+        self._state: dict[str, Any] = {}
+
+    @property
+    def options(self) -> StreamOptions:
+        """Return the negotiated stream options."""
+        return self._options
+
+    @property
+    def wants_trace(self) -> bool:
+        """Return whether trace updates need to be built for this client."""
+        return bool(self._options.channels & {"trace", "state"})
+
+    async def start(self) -> None:
+        """Acknowledge the negotiated protocol to the client."""
+        await self._send(
+            {
+                "t": "hello",
+                "protocol": COMPACT_PROTOCOL,
+                "channels": sorted(self._options.channels),
+                "encoding": self._options.encoding,
+            }
+        )
+
+    async def send(self, kind: FrameKind, payload: Any) -> None:
+        """Send ``payload`` as frames for the channels the client subscribed."""
+        channels = self._options.channels
+        if kind == "step":
+            if "steps" in channels:
+                await self._send({"t": "step", "d": payload})
+            if "tokens" in channels and isinstance(payload, Mapping):
+                await self._send_tokens(payload)
+        elif kind == "trace":
+            await self._send_trace(payload)
+        else:
+            await self._send({"t": "event", "d": payload})
+
+    async def _send_tokens(self, step: Mapping[str, Any]) -> None:
+        for node, update in step.items():
+            if not isinstance(update, Mapping):
+                continue
+            token_input, token_output = _extract_token_usage(update)
+            if token_input is None and token_output is None:
+                continue
+            await self._send(
+                {
+                    "t": "tokens",
+                    "node": node,
+                    "in": token_input or 0,
+                    "out": token_output or 0,
+                }
+            )
+
+    async def _send_trace(self, update: Mapping[str, Any]) -> None:
+        channels = self._options.channels
+        spans: list[Any] = []
+        for span in update.get("spans", []):
+            attributes = dict(span.get("attributes") or {})
+            attributes.pop(STATE_BEFORE_ATTRIBUTE, None)
+            after = attributes.pop(STATE_AFTER_ATTRIBUTE, None)
+            if "state" in channels and isinstance(after, dict):
+                patch = json_patch(self._state, after)
+                self._state = after
+                await self._send(
+                    {
+                        "t": "state",
+                        "span": span.get("span_id"),
+                        "node": span.get("name"),
+                        "p": patch,
+                    }
+                )
+            spans.append({**span, "attributes": attributes})
+        if "trace" in channels:
+            await self._send({"t": "trace", "d": {**update, "spans": spans}})
+
+    async def _send(self, frame: dict[str, Any]) -> None:
+        self._sequence += 1
+        frame["s"] = self._sequence
+        if self._options.encoding == "msgpack" and _ormsgpack is not None:
+            await self._websocket.send_bytes(
+                _ormsgpack.packb(frame, option=_ormsgpack.OPT_NON_STR_KEYS)
+            )
+            return
+        await self._websocket.send_text(
+            json.dumps(frame, separators=(",", ":"), ensure_ascii=False)
+        )
+
+
+def get_workflow_stream(websocket: Any) -> CompactWorkflowStream | None:
+    """Return the compact stream negotiated on ``websocket`` if any."""
+    state = getattr(websocket, "state", None)
+    stream = getattr(state, "workflow_stream", None)
+    return stream if isinstance(stream, CompactWorkflowStream) else None
+
+
+__all__ = [
+    "COMPACT_PROTOCOL",
+    "DEFAULT_STREAM_CHANNELS",
+    "STREAM_CHANNELS",
+    "CompactWorkflowStream",
+    "StreamOptions",
+    "StreamOptionsError",
+    "get_workflow_stream",
+    "json_patch",
+]
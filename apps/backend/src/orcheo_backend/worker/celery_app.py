@@ -8,6 +8,11 @@ from celery import Celery
 # Configuration from environment
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 CRON_DISPATCH_INTERVAL = float(os.getenv("CRON_DISPATCH_INTERVAL", "60"))
+LISTENER_DEDUPE_SWEEP_INTERVAL = float(
+    os.getenv("LISTENER_DEDUPE_SWEEP_INTERVAL", "300")
+)
+RUN_OUTBOX_RELAY_INTERVAL = float(os.getenv("RUN_OUTBOX_RELAY_INTERVAL", "30"))
+BLOB_STORE_SWEEP_INTERVAL = float(os.getenv("BLOB_STORE_SWEEP_INTERVAL", "3600"))
 CELERY_BEAT_SCHEDULE_FILE = os.getenv(
     "CELERY_BEAT_SCHEDULE_FILE", "celerybeat-schedule"
 )
@@ -30,12 +35,24 @@ celery_app.conf.update(
     worker_prefetch_multiplier=1,  # Fetch one task at a time for fairness
 )
 
-# Celery Beat schedule for cron dispatch
+# Celery Beat schedule for cron dispatch, outbox relay, dedupe and blob cleanup
 celery_app.conf.beat_schedule = {
     "dispatch-cron-triggers": {
         "task": "orcheo_backend.worker.tasks.dispatch_cron_triggers",
         "schedule": CRON_DISPATCH_INTERVAL,
     },
+    "purge-listener-dedupe": {
+        "task": "orcheo_backend.worker.tasks.purge_listener_dedupe",
+        "schedule": LISTENER_DEDUPE_SWEEP_INTERVAL,
+    },
+    "relay-run-outbox": {
+        "task": "orcheo_backend.worker.tasks.relay_run_outbox",
+        "schedule": RUN_OUTBOX_RELAY_INTERVAL,
+    },
+    "purge-blob-store": {
+        "task": "orcheo_backend.worker.tasks.purge_blob_store",
+        "schedule": BLOB_STORE_SWEEP_INTERVAL,
+    },
 }
 celery_app.conf.beat_schedule_filename = CELERY_BEAT_SCHEDULE_FILE
 
@@ -10,7 +10,15 @@ from contextlib import contextmanager
 from typing import Any
 from uuid import UUID
 from celery import Task
-from celery.signals import task_failure, task_postrun, task_prerun
+from celery.signals import (
+    task_failure,
+    task_postrun,
+    task_prerun,
+    worker_init,
+    worker_process_init,
+    worker_process_shutdown,
+    worker_shutdown,
+)
 from orcheo_backend.worker.celery_app import celery_app
 
 
@@ -19,6 +27,84 @@ logger = logging.getLogger(__name__)
 # Track task start times for duration calculation
 _task_start_times: dict[str, float] = {}
 
+WORKER_METRICS_PORT_ENV = "ORCHEO_WORKER_METRICS_PORT"
+# Prefork children bind the next free port after the parent's.
+_METRICS_PORT_SEARCH = 64
+
+
+def _start_worker_metrics_server() -> None:
+    """Serve this process's metrics when a worker metrics port is configured."""
+    raw_port = os.getenv(WORKER_METRICS_PORT_ENV, "").strip()
+    if not raw_port:
+        return
+    from orcheo.tracing import start_metrics_server
+
+    try:
+        server = start_metrics_server(
+            int(raw_port), max_port_offset=_METRICS_PORT_SEARCH
+        )
+    except (OSError, ValueError):
+        logger.warning("Unable to start worker metrics server", exc_info=True)
+        return
+    logger.info("Serving worker metrics on port %s", server.server_address[1])
+
+
+def _collect_queue_depth() -> None:
+    """Report the number of messages waiting in the default task queue.
+
+    The broker connection is borrowed from the app's connection pool, so
+    scrapes reuse an open connection instead of dialling the broker each time.
+    """
+    from orcheo.tracing.metrics import QUEUE_DEPTH
+
+    queue = celery_app.conf.task_default_queue
+    with celery_app.pool.acquire(block=True) as connection:
+        declared = connection.default_channel.queue_declare(queue=queue, passive=True)
+    QUEUE_DEPTH.set(declared.message_count, queue=queue)
+
+
+@worker_init.connect
+def worker_init_handler(**kwargs: Any) -> None:
+    """Expose queue depth and metrics from the main worker process."""
+    from orcheo.tracing.metrics import REGISTRY
+
+    REGISTRY.add_collector(_collect_queue_depth)
+    _start_worker_metrics_server()
+
+
+@worker_process_init.connect
+def worker_process_init_handler(**kwargs: Any) -> None:
+    """Expose metrics from each prefork pool process."""
+    _start_worker_metrics_server()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def worker_shutdown_handler(**kwargs: Any) -> None:
+    """Close pooled clients and processes owned by this process's event loop."""
+    from orcheo.external_agents import close_warm_process_pools
+    from orcheo.runtime.http_clients import close_http_clients
+
+    loop = _get_event_loop()
+    if loop.is_running():
+        return
+    try:
+        loop.run_until_complete(close_http_clients())
+    except Exception:
+        logger.warning("Failed to close pooled HTTP clients", exc_info=True)
+    try:
+        loop.run_until_complete(close_warm_process_pools())
+    except Exception:
+        logger.warning("Failed to stop warm external agent processes", exc_info=True)
+
+
+def _observe_task_duration(task_name: str, duration_ms: float, status: str) -> None:
+    from orcheo.tracing.metrics import TASK_DURATION_SECONDS
+
+    TASK_DURATION_SECONDS.observe(
+        duration_ms / 1000, task=task_name, status=status.lower()
+    )
+
 
 @task_prerun.connect
 def task_prerun_handler(
@@ -45,6 +131,9 @@ def task_postrun_handler(
     duration_ms = None
     if task_id and task_id in _task_start_times:
         duration_ms = (time.monotonic() - _task_start_times.pop(task_id)) * 1000
+        _observe_task_duration(
+            task_name, duration_ms, str(kwargs.get("state") or "success")
+        )
         logger.info(
             "Task completed: %s (id=%s, duration=%.2fms)",
             task_name,
@@ -65,8 +154,11 @@ def task_failure_handler(
     """Log when a task fails."""
     task_name = task.name if task else "unknown"
     # Clean up start time if present
-    if task_id:
-        _task_start_times.pop(task_id, None)
+    started = _task_start_times.pop(task_id, None) if task_id else None
+    if started is not None:
+        _observe_task_duration(
+            task_name, (time.monotonic() - started) * 1000, "failure"
+        )
     logger.error(
         "Task failed: %s (id=%s, error=%s)",
         task_name,
@@ -198,6 +290,7 @@ async def _execute_workflow(run: Any) -> dict[str, Any]:
     from orcheo.persistence import create_checkpointer, create_graph_store
     from orcheo.runtime.credentials import CredentialResolver, credential_resolution
     from orcheo.runtime.runnable_config import merge_runnable_configs
+    from orcheo.tracing.metrics import GRAPH_BUILD_SECONDS
     from orcheo_backend.app.dependencies import (
         get_history_store,
         get_repository,
@@ -225,26 +318,35 @@ async def _execute_workflow(run: Any) -> dict[str, Any]:
         merged_config = merge_runnable_configs(stored_config, None)
         runtime_config: RunnableConfig = merged_config.to_runnable_config(execution_id)
         state_config = merged_config.to_state_config(execution_id)
-        await _start_history_record(
-            history_store=history_store,
-            workflow_id=str(version.workflow_id),
-            execution_id=execution_id,
-            inputs=inputs,
-            merged_config=merged_config,
-            history_error_cls=RunHistoryError,
-        )
 
         external_agent_environ = _external_agent_provider_environment()
         with _patched_environment(external_agent_environ):
             with credential_resolution(resolver):
                 async with create_checkpointer(settings) as checkpointer:
                     async with create_graph_store(settings) as graph_store:
-                        graph = build_graph(graph_config)
-                        compiled = graph.compile(
-                            checkpointer=checkpointer,
-                            store=graph_store,
-                        )
-                        state = _build_initial_state(graph_config, inputs, state_config)
+                        with GRAPH_BUILD_SECONDS.time(source="worker"):
+                            graph = build_graph(graph_config)
+                            compiled = graph.compile(
+                                checkpointer=checkpointer,
+                                store=graph_store,
+                            )
+                        state: Any = None
+                        if await _resume_handed_off_run(compiled, runtime_config):
+                            # Immediate-response webhooks hand off a partially
+                            # executed run; resume it from its checkpoint.
+                            logger.info("Resuming run %s from checkpoint", run_id)
+                        else:
+                            await _start_history_record(
+                                history_store=history_store,
+                                workflow_id=str(version.workflow_id),
+                                execution_id=execution_id,
+                                inputs=inputs,
+                                merged_config=merged_config,
+                                history_error_cls=RunHistoryError,
+                            )
+                            state = _build_initial_state(
+                                graph_config, inputs, state_config
+                            )
                         await _stream_run_history_steps(
                             compiled=compiled,
                             state=state,
@@ -256,7 +358,7 @@ async def _execute_workflow(run: Any) -> dict[str, Any]:
                         final_state = await compiled.aget_state(runtime_config)
                         final_state = getattr(final_state, "values", final_state)
 
-        output = _extract_output(final_state)
+        output = await _resolved_output(final_state)
         await repository.mark_run_succeeded(
             run.id,
             actor=WORKER_ACTOR,
@@ -278,6 +380,26 @@ async def _execute_workflow(run: Any) -> dict[str, Any]:
         )
 
 
+async def _resume_handed_off_run(compiled: Any, runtime_config: Any) -> bool:
+    """Return whether the run's latest checkpoint came from a webhook hand-off.
+
+    Other runs restart from scratch on retry rather than resuming wherever a
+    previous failed attempt stopped. Handed-off runs keep the marker on the
+    checkpoints written while resuming, so their own retries resume as well.
+    """
+    from orcheo.runtime.runnable_config import WEBHOOK_HANDOFF_METADATA_KEY
+
+    snapshot = await compiled.aget_state(runtime_config)
+    metadata = getattr(snapshot, "metadata", None) or {}
+    if not metadata.get(WEBHOOK_HANDOFF_METADATA_KEY):
+        return False
+    runtime_config["metadata"] = {
+        **runtime_config.get("metadata", {}),
+        WEBHOOK_HANDOFF_METADATA_KEY: True,
+    }
+    return True
+
+
 async def _start_history_record(
     *,
     history_store: Any,
@@ -317,18 +439,33 @@ async def _stream_run_history_steps(
     history_error_cls: type[Exception],
 ) -> None:
     """Append streamed node updates to the run history store."""
-    async for step in compiled.astream(
-        state,
-        config=runtime_config,  # type: ignore[arg-type]
-        stream_mode="updates",
-    ):
-        try:
-            await history_store.append_step(execution_id, step)
-        except history_error_cls:
-            logger.exception(
-                "Failed to append run history step for execution %s",
-                execution_id,
-            )
+    from orcheo.graph.blobs import aresolve_blob_refs
+    from orcheo.tracing import (
+        WorkflowInstrumentation,
+        get_tracer,
+        record_workflow_step,
+    )
+
+    tracer = get_tracer(__name__)
+    instrumentation = WorkflowInstrumentation(tracer, graph=compiled)
+    try:
+        async for step in compiled.astream(
+            state,
+            config=instrumentation.attach(runtime_config),
+            stream_mode="updates",
+        ):
+            record_workflow_step(tracer, step, instrumentation=instrumentation)
+            try:
+                await history_store.append_step(
+                    execution_id, await aresolve_blob_refs(step)
+                )
+            except history_error_cls:
+                logger.exception(
+                    "Failed to append run history step for execution %s",
+                    execution_id,
+                )
+    finally:
+        instrumentation.close()
 
 
 async def _mark_history_completed(
@@ -349,6 +486,13 @@ async def _mark_history_completed(
         )
 
 
+async def _resolved_output(final_state: Any) -> dict[str, Any] | None:
+    """Return the run output with offloaded blob references loaded."""
+    from orcheo.graph.blobs import aresolve_blob_refs
+
+    return _extract_output(await aresolve_blob_refs(final_state))
+
+
 def _extract_output(final_state: Any) -> dict[str, Any] | None:
     """Extract output from final workflow state.
 
@@ -434,7 +578,12 @@ async def _execute_run_async(run_id: str) -> dict[str, Any]:
     if start_error:
         return start_error
 
-    return await _execute_workflow(run)
+    from orcheo.tracing.metrics import track_run
+
+    with track_run("worker") as outcome:
+        result = await _execute_workflow(run)
+        outcome.status = result.get("status")
+    return result
 
 
 @celery_app.task(bind=True, max_retries=0)
@@ -466,6 +615,29 @@ async def _dispatch_cron_triggers_async() -> list[str]:
     return [str(run.id) for run in runs]
 
 
+async def _purge_listener_dedupe_async() -> int:
+    """Delete expired listener dedupe records and return how many were removed."""
+    from orcheo_backend.app.dependencies import get_repository
+
+    repository = get_repository()
+    return await repository.purge_expired_listener_dedupe()
+
+
+async def _relay_run_outbox_async() -> dict[str, int]:
+    """Re-arm stuck outbox entries and publish every due run."""
+    from orcheo_backend.app.dependencies import get_repository
+    from orcheo_backend.app.repository import RunOutboxStore
+    from orcheo_backend.app.run_outbox import RunOutboxRelay
+
+    repository = get_repository()
+    if not isinstance(repository, RunOutboxStore):
+        return {"requeued": 0, "published": 0}
+    relay = RunOutboxRelay.from_env(repository)
+    requeued = await relay.sweep_once()
+    published = await relay.drain()
+    return {"requeued": requeued, "published": published}
+
+
 async def _refresh_external_agent_status_async(provider_name: str) -> dict[str, str]:
     """Refresh worker-scoped status for one external agent provider."""
     from orcheo_backend.worker.external_agents import (
@@ -513,6 +685,70 @@ def dispatch_cron_triggers(self: Task) -> dict[str, Any]:  # noqa: ARG001
     return {"dispatched_runs": run_ids}
 
 
+@celery_app.task(bind=True)
+def purge_listener_dedupe(self: Task) -> dict[str, Any]:  # noqa: ARG001
+    """Remove expired listener dedupe records.
+
+    Invoked periodically by Celery Beat so listener dispatch does not have to
+    clean up expired records on every event.
+
+    Args:
+        self: Celery task instance (unused, required by bind=True)
+
+    Returns:
+        dict with keys: purged (number of records removed)
+    """
+    loop = _get_event_loop()
+    purged = loop.run_until_complete(_purge_listener_dedupe_async())
+    logger.info("Purged %d expired listener dedupe records", purged)
+    return {"purged": purged}
+
+
+@celery_app.task(bind=True)
+def purge_blob_store(self: Task) -> dict[str, Any]:  # noqa: ARG001
+    """Remove offloaded blobs older than the configured retention window.
+
+    Invoked periodically by Celery Beat.
+
+    Args:
+        self: Celery task instance (unused, required by bind=True)
+
+    Returns:
+        dict with keys: purged (number of blobs removed)
+    """
+    from orcheo.graph.blobs import prune_blob_store
+
+    purged = prune_blob_store()
+    if purged:
+        logger.info("Purged %d expired blobs", purged)
+    return {"purged": purged}
+
+
+@celery_app.task(bind=True)
+def relay_run_outbox(self: Task) -> dict[str, Any]:  # noqa: ARG001
+    """Publish outbox runs that the API relay has not delivered.
+
+    Invoked periodically by Celery Beat. It publishes runs created outside
+    the API process (such as cron dispatches) and re-publishes runs that
+    stayed pending after being handed to the broker.
+
+    Args:
+        self: Celery task instance (unused, required by bind=True)
+
+    Returns:
+        dict with keys: requeued, published (number of runs)
+    """
+    loop = _get_event_loop()
+    result = loop.run_until_complete(_relay_run_outbox_async())
+    if result["published"] or result["requeued"]:
+        logger.info(
+            "Relayed %d outbox run(s), %d re-armed as stuck",
+            result["published"],
+            result["requeued"],
+        )
+    return dict(result)
+
+
 @celery_app.task(bind=True)
 def refresh_external_agent_status(
     self: Task,  # noqa: ARG001
@@ -557,6 +793,8 @@ __all__ = [
     "disconnect_external_agent",
     "dispatch_cron_triggers",
     "execute_run",
+    "purge_listener_dedupe",
     "refresh_external_agent_status",
+    "relay_run_outbox",
     "start_external_agent_login",
 ]
@@ -1,6 +1,7 @@
 """Python SDK for interacting with the Orcheo backend."""
 
 from orcheo_sdk.client import (
+    AsyncOrcheoClient,
     HttpWorkflowExecutor,
     OrcheoClient,
     WorkflowExecutionError,
@@ -13,6 +14,7 @@ from orcheo_sdk.workflow import (
 
 
 __all__ = [
+    "AsyncOrcheoClient",
     "DeploymentRequest",
     "HttpWorkflowExecutor",
     "OrcheoClient",
@@ -8,6 +8,41 @@ from orcheo_sdk.cli.state import CLIState
 from orcheo_sdk.services import get_latest_workflow_version_data
 
 
+COMPACT_STREAM_PROTOCOL = "orcheo.compact.v1"
+_COMPACT_PAYLOAD_FRAMES = frozenset({"step", "trace", "event"})
+
+
+def _compact_stream_request(state: CLIState) -> dict[str, Any] | None:
+    """Return compact stream options unless raw JSON updates are printed.
+
+    Human output only needs node updates and trace span names, so state
+    snapshots are not requested.
+    """
+    if state.verbose_results and not state.human:
+        return None
+    return {"protocol": COMPACT_STREAM_PROTOCOL, "channels": ["steps", "trace"]}
+
+
+def _decode_stream_message(update: Any, *, compact: bool) -> tuple[Any | None, bool]:
+    """Unwrap compact frames into legacy updates.
+
+    Returns the update to handle (``None`` to skip the frame) and whether the
+    server switched to the compact protocol.
+    """
+    if not isinstance(update, dict):
+        return update, compact
+    if not compact:
+        if (
+            update.get("t") == "hello"
+            and update.get("protocol") == COMPACT_STREAM_PROTOCOL
+        ):
+            return None, True
+        return update, False
+    if update.get("t") in _COMPACT_PAYLOAD_FRAMES:
+        return update.get("d"), True
+    return None, True
+
+
 def _resolve_ws_headers(state: CLIState) -> dict[str, str] | None:
     """Return websocket auth headers if a token is available."""
     token = state.client.get_active_token()
@@ -81,6 +116,9 @@ async def _stream_workflow_run(
         payload["runnable_config"] = runnable_config
     if stored_runnable_config is not None:
         payload["stored_runnable_config"] = stored_runnable_config
+    stream_options = _compact_stream_request(state)
+    if stream_options is not None:
+        payload["stream"] = stream_options
 
     if state.verbose_results and not state.human:
         print_json(
@@ -249,8 +287,11 @@ async def _process_stream_messages(state: CLIState, websocket: Any) -> str:
         _handle_generic_update,
     )
 
+    compact = False
     async for message in websocket:
-        update = json.loads(message)
+        update, compact = _decode_stream_message(json.loads(message), compact=compact)
+        if update is None:
+            continue
         if state.verbose_results and not state.human:
             print_json(update)
             status = update.get("status")
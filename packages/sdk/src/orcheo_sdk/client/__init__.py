@@ -1,11 +1,13 @@
 """Client helpers for interacting with the Orcheo backend."""
 
 import httpx
+from orcheo_sdk.client.async_client import AsyncOrcheoClient
 from orcheo_sdk.client.executor import HttpWorkflowExecutor, WorkflowExecutionError
 from orcheo_sdk.client.orcheo_client import OrcheoClient
 
 
 __all__ = [
+    "AsyncOrcheoClient",
     "HttpWorkflowExecutor",
     "OrcheoClient",
     "WorkflowExecutionError",
@@ -0,0 +1,293 @@
+"""Asynchronous HTTP client for triggering workflows at high volume."""
+
+from __future__ import annotations
+import asyncio
+import importlib.util
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from types import TracebackType
+from typing import Any
+import httpx
+from orcheo_sdk.client.executor import WorkflowExecutionError
+from orcheo_sdk.client.orcheo_client import OrcheoClient
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class AsyncOrcheoClient:
+    """Async counterpart of :class:`HttpWorkflowExecutor`.
+
+    A single ``httpx.AsyncClient`` is shared across every request so
+    connections (and their TLS sessions) are kept alive and reused. HTTP/2 is
+    negotiated when the optional ``h2`` package is installed, allowing many
+    concurrent requests to be multiplexed over one connection. Use the client
+    as an async context manager, or call :meth:`aclose` when finished.
+    """
+
+    def __init__(
+        self,
+        client: OrcheoClient,
+        *,
+        auth_token: str | None = None,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        retry_statuses: tuple[int, ...] = (500, 502, 503, 504),
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        http2: bool | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        """Configure retries, connection limits and the underlying transport.
+
+        Args:
+            client: URL and header composition helper.
+            auth_token: Optional bearer token attached to each request.
+            timeout: Per-request timeout in seconds.
+            max_retries: Retries for transport errors and ``retry_statuses``.
+            backoff_factor: Initial retry delay, doubled after each attempt.
+            retry_statuses: HTTP status codes retried for idempotent
+                requests. Creating a run is not idempotent, so run triggers
+                are only retried when the request never reached the server.
+            max_connections: Upper bound on open connections in the pool.
+            max_keepalive_connections: Idle connections kept for reuse.
+            http2: Force HTTP/2 on or off; defaults to on when ``h2`` exists.
+            transport: Optional transport used when creating the HTTP client.
+            http_client: Externally managed client; it is not closed by
+                :meth:`aclose`.
+            sleep: Awaitable used to wait between retries.
+        """
+        self.client = client
+        self.auth_token = auth_token
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.retry_statuses = retry_statuses
+        self._sleep = sleep
+        self._owns_http_client = http_client is None
+        if http_client is None:
+            http_client = httpx.AsyncClient(
+                base_url=client.base_url.rstrip("/"),
+                timeout=timeout,
+                http2=_http2_available() if http2 is None else http2,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                ),
+                transport=transport,
+            )
+        self._http_client = http_client
+
+    async def __aenter__(self) -> AsyncOrcheoClient:
+        """Return the client for use in ``async with`` blocks."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the shared HTTP client."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client when it is owned by this instance."""
+        if self._owns_http_client:
+            await self._http_client.aclose()
+
+    async def trigger_run(
+        self,
+        workflow_id: str,
+        *,
+        workflow_version_id: str,
+        triggered_by: str,
+        inputs: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        runnable_config: Mapping[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Create a workflow run and return the backend payload.
+
+        The request is only retried when it never reached the server, since
+        re-sending it after a timeout or server error could create the run
+        twice.
+        """
+        payload = _run_payload(
+            workflow_version_id, triggered_by, inputs, runnable_config
+        )
+        response = await self._post_with_retries(
+            self.client.workflow_trigger_url(workflow_id),
+            payload,
+            headers,
+            error_message="Failed to trigger workflow run",
+            idempotent=False,
+        )
+        return response.json()
+
+    async def trigger_runs(
+        self,
+        workflow_id: str,
+        inputs: Iterable[Mapping[str, Any]],
+        *,
+        workflow_version_id: str,
+        triggered_by: str,
+        runnable_config: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        batch_size: int | None = 100,
+        max_concurrency: int = 8,
+    ) -> list[dict[str, Any]]:
+        """Create one run per entry in ``inputs`` and return them in order.
+
+        Runs are grouped into chunks of ``batch_size`` and sent to the batch
+        endpoint; pass ``batch_size=None`` to issue one request per run against
+        backends without batch support. At most ``max_concurrency`` requests are
+        in flight at once. The first failure cancels outstanding requests and is
+        raised as :class:`WorkflowExecutionError`. Like :meth:`trigger_run`,
+        requests are only retried when they never reached the server.
+        """
+        if max_concurrency < 1:
+            msg = "max_concurrency must be at least 1"
+            raise ValueError(msg)
+        if batch_size is not None and batch_size < 1:
+            msg = "batch_size must be at least 1"
+            raise ValueError(msg)
+        payloads = [
+            _run_payload(workflow_version_id, triggered_by, item, runnable_config)
+            for item in inputs
+        ]
+        if not payloads:
+            return []
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def send_single(payload: dict[str, Any]) -> list[dict[str, Any]]:
+            async with semaphore:
+                response = await self._post_with_retries(
+                    self.client.workflow_trigger_url(workflow_id),
+                    payload,
+                    headers,
+                    error_message="Failed to trigger workflow run",
+                    idempotent=False,
+                )
+            return [response.json()]
+
+        async def send_batch(chunk: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            async with semaphore:
+                response = await self._post_with_retries(
+                    self.client.workflow_batch_trigger_url(workflow_id),
+                    {"runs": chunk},
+                    headers,
+                    error_message="Failed to trigger workflow runs",
+                    idempotent=False,
+                )
+            return response.json()
+
+        if batch_size is None:
+            coroutines = [send_single(payload) for payload in payloads]
+        else:
+            coroutines = [
+                send_batch(payloads[start : start + batch_size])
+                for start in range(0, len(payloads), batch_size)
+            ]
+        tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+        try:
+            chunks = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return [run for chunk in chunks for run in chunk]
+
+    async def get_credential_health(
+        self, workflow_id: str, *, headers: Mapping[str, str] | None = None
+    ) -> dict[str, Any]:
+        """Fetch the credential health report for a workflow."""
+        response = await self._http_client.get(
+            self.client.credential_health_url(workflow_id),
+            headers=self._build_headers(headers),
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def validate_credentials(
+        self,
+        workflow_id: str,
+        *,
+        actor: str = "system",
+        headers: Mapping[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Trigger credential validation and return the backend response."""
+        response = await self._http_client.post(
+            self.client.credential_validation_url(workflow_id),
+            json={"actor": actor},
+            headers=self._build_headers(headers),
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def _build_headers(self, overrides: Mapping[str, str] | None) -> dict[str, str]:
+        headers = self.client.prepare_headers(overrides or {})
+        if self.auth_token and "Authorization" not in headers:
+            headers["Authorization"] = f"Bearer {self.auth_token}"
+        return headers
+
+    async def _post_with_retries(
+        self,
+        url: str,
+        payload: Mapping[str, Any],
+        headers: Mapping[str, str] | None,
+        *,
+        error_message: str,
+        idempotent: bool = True,
+    ) -> httpx.Response:
+        """POST ``payload`` to ``url``, retrying transient failures.
+
+        Non-idempotent requests are only retried on connection failures, where
+        the request cannot have reached the server.
+        """
+        request_headers = self._build_headers(headers)
+        delay = self.backoff_factor
+        for attempt in range(self.max_retries + 1):
+            final_attempt = attempt == self.max_retries
+            try:
+                response = await self._http_client.post(
+                    url, json=payload, headers=request_headers
+                )
+                response.raise_for_status()
+                return response
+            except httpx.HTTPStatusError as exc:
+                status_code = exc.response.status_code
+                retryable = idempotent and status_code in self.retry_statuses
+                if not retryable or final_attempt:
+                    msg = f"{error_message} (status {status_code})"
+                    raise WorkflowExecutionError(msg, status_code=status_code) from exc
+            except httpx.HTTPError as exc:
+                unsent = isinstance(exc, httpx.ConnectError | httpx.ConnectTimeout)
+                if final_attempt or not (idempotent or unsent):
+                    raise WorkflowExecutionError(error_message) from exc
+            if delay > 0:
+                await self._sleep(delay)
+                delay *= 2
+        raise WorkflowExecutionError(error_message)  # pragma: no cover - defensive
+
+
+def _run_payload(
+    workflow_version_id: str,
+    triggered_by: str,
+    inputs: Mapping[str, Any] | None,
+    runnable_config: Mapping[str, Any] | None,
+) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "workflow_version_id": workflow_version_id,
+        "triggered_by": triggered_by,
+        "input_payload": dict(inputs or {}),
+    }
+    if runnable_config is not None:
+        payload["runnable_config"] = dict(runnable_config)
+    return payload
+
+
+__all__ = ["AsyncOrcheoClient"]
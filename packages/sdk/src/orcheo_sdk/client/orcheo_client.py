@@ -24,6 +24,10 @@ class OrcheoClient:
             raise ValueError(msg)
         return f"{self.base_url.rstrip('/')}/api/workflows/{workflow_id}/runs"
 
+    def workflow_batch_trigger_url(self, workflow_id: str) -> str:
+        """Return the URL for triggering several workflow runs at once."""
+        return f"{self.workflow_trigger_url(workflow_id)}/batch"
+
     def credential_health_url(self, workflow_id: str) -> str:
         """Return the URL for querying credential health."""
         workflow_id = workflow_id.strip()
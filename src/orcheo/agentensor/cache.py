@@ -0,0 +1,102 @@
+"""On-disk cache for Agentensor evaluation outputs and evaluator outcomes."""
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+_MISSING = object()
+
+
+def fingerprint(payload: Any) -> str:
+    """Return a stable SHA-256 fingerprint for a JSON-like payload."""
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class EvaluationCache:
+    """Filesystem cache keyed by case, prompt version and evaluator fingerprints.
+
+    Graph outputs are cached per ``(case, prompt version)`` and evaluator outcomes
+    per ``(case, prompt version, evaluator)``, so re-running an evaluation only
+    executes the graph for cases whose inputs or prompts changed and only runs the
+    evaluators whose definitions changed.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Create the cache rooted at ``directory``."""
+        self.directory = Path(directory).expanduser()
+
+    def get_output(self, case_key: str, prompt_version: str) -> Any:
+        """Return the cached ``(output, duration_ms)`` pair or ``None``."""
+        entry = self._read(fingerprint(["output", case_key, prompt_version]))
+        if entry is _MISSING:
+            return None
+        return entry["output"], float(entry["duration_ms"])
+
+    def set_output(
+        self,
+        case_key: str,
+        prompt_version: str,
+        output: Any,
+        duration_ms: float,
+    ) -> None:
+        """Persist the graph output produced for a case."""
+        self._write(
+            fingerprint(["output", case_key, prompt_version]),
+            {"output": output, "duration_ms": duration_ms},
+        )
+
+    def get_outcome(
+        self, case_key: str, prompt_version: str, evaluator_key: str
+    ) -> dict[str, Any] | None:
+        """Return a cached evaluator outcome or ``None``."""
+        entry = self._read(
+            fingerprint(["outcome", case_key, prompt_version, evaluator_key])
+        )
+        return None if entry is _MISSING else entry
+
+    def set_outcome(
+        self,
+        case_key: str,
+        prompt_version: str,
+        evaluator_key: str,
+        outcome: dict[str, Any],
+    ) -> None:
+        """Persist an evaluator outcome for a case."""
+        self._write(
+            fingerprint(["outcome", case_key, prompt_version, evaluator_key]),
+            outcome,
+        )
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _read(self, key: str) -> Any:
+        try:
+            with self._path(key).open(encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return _MISSING
+
+    def _write(self, key: str, payload: Any) -> None:
+        try:
+            encoded = json.dumps(payload)
+        except (TypeError, ValueError):
+            return
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(encoded)
+            os.replace(tmp_name, path)
+        except OSError:  # pragma: no cover - defensive cleanup
+            Path(tmp_name).unlink(missing_ok=True)
+
+
+__all__ = ["EvaluationCache", "fingerprint"]
@@ -3,6 +3,7 @@
 from abc import abstractmethod
 from langchain_core.runnables import RunnableConfig
 from langgraph.types import Send
+from orcheo.graph.blobs import with_resolved_blobs
 from orcheo.graph.state import State
 from orcheo.nodes.base import BaseRunnable
 
@@ -17,7 +18,8 @@ class BaseEdge(BaseRunnable):
 
     async def __call__(self, state: State, config: RunnableConfig) -> str | list[Send]:
         """Execute the edge and return the routing decision."""
-        runnable = self.resolved_for_run(state, config=config)
+        state = with_resolved_blobs(state)
+        runnable = await self.aresolved_for_run(state, config=config)
         result = await runnable.run(state, config)
         return result
 
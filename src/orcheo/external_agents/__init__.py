@@ -1,6 +1,10 @@
 """External agent runtime management for CLI-backed workflow nodes."""
 
-from orcheo.external_agents.manifest import RuntimeManifestStore, provider_lock
+from orcheo.external_agents.manifest import (
+    RuntimeManifestStore,
+    async_provider_lock,
+    provider_lock,
+)
 from orcheo.external_agents.models import (
     AuthProbeResult,
     AuthStatus,
@@ -17,15 +21,22 @@ from orcheo.external_agents.models import (
 from orcheo.external_agents.paths import default_runtime_root, ensure_runtime_root
 from orcheo.external_agents.process import execute_process
 from orcheo.external_agents.runtime import (
+    DEFAULT_LOCK_TIMEOUT_SECONDS,
     DEFAULT_MAINTENANCE_INTERVAL,
     ExternalAgentRuntimeManager,
     scoped_external_agent_environment,
 )
+from orcheo.external_agents.session_pool import (
+    WarmProcessPool,
+    close_warm_process_pools,
+    get_warm_process_pool,
+)
 
 
 __all__ = [
     "AuthProbeResult",
     "AuthStatus",
+    "DEFAULT_LOCK_TIMEOUT_SECONDS",
     "DEFAULT_MAINTENANCE_INTERVAL",
     "ExternalAgentError",
     "ExternalAgentRuntimeManager",
@@ -37,10 +48,14 @@ __all__ = [
     "RuntimeManifestStore",
     "RuntimeResolution",
     "RuntimeVerificationError",
+    "WarmProcessPool",
     "WorkingDirectoryValidationError",
+    "async_provider_lock",
+    "close_warm_process_pools",
     "default_runtime_root",
     "ensure_runtime_root",
     "execute_process",
+    "get_warm_process_pool",
     "provider_lock",
     "scoped_external_agent_environment",
 ]
@@ -1,12 +1,14 @@
 """Manifest persistence and provider-local locking helpers."""
 
 from __future__ import annotations
+import asyncio
 import fcntl
 import json
 import os
 import tempfile
-from collections.abc import Iterator
-from contextlib import contextmanager
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
 from orcheo.external_agents.models import (
     ProviderLockUnavailableError,
@@ -44,6 +46,42 @@ def provider_lock(
             fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
 
 
+@asynccontextmanager
+async def async_provider_lock(
+    runtime_root: Path,
+    provider: str,
+    *,
+    timeout: float | None = None,
+    poll_interval: float = 0.05,
+) -> AsyncIterator[None]:
+    """Acquire the provider-local lock without blocking the event loop.
+
+    The lock is polled with non-blocking ``flock`` calls, sleeping between
+    attempts, and :class:`ProviderLockUnavailableError` is raised once
+    ``timeout`` seconds pass without acquiring it.
+    """
+    lock_path = provider_lock_path(runtime_root, provider)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    with open(lock_path, "a+", encoding="utf-8") as handle:
+        while True:
+            try:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError as exc:
+                if deadline is not None and time.monotonic() >= deadline:
+                    msg = (
+                        f"Timed out after {timeout}s waiting for the provider lock "
+                        f"for '{provider}'."
+                    )
+                    raise ProviderLockUnavailableError(msg) from exc
+                await asyncio.sleep(poll_interval)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
 class RuntimeManifestStore:
     """Filesystem-backed manifest store for external agent runtimes."""
 
@@ -59,6 +97,14 @@ class RuntimeManifestStore:
         payload = json.loads(manifest_path.read_text(encoding="utf-8"))
         return RuntimeManifest.model_validate(payload)
 
+    def stamp(self, provider: str) -> tuple[int, int, int] | None:
+        """Return a cheap change marker for the manifest of ``provider``."""
+        try:
+            stat = provider_manifest_path(self.runtime_root, provider).stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_ino, stat.st_size
+
     def save(self, manifest: RuntimeManifest) -> RuntimeManifest:
         """Persist ``manifest`` atomically."""
         provider_dir = provider_root(self.runtime_root, manifest.provider)
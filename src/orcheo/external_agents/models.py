@@ -60,6 +60,10 @@ class ProcessExecutionResult(BaseModel):
     exit_code: int | None = None
     timed_out: bool = False
     duration_seconds: float
+    stdout_truncated: bool = False
+    stderr_truncated: bool = False
+    stdout_log_path: Path | None = None
+    stderr_log_path: Path | None = None
 
 
 class AuthProbeResult(BaseModel):
@@ -12,6 +12,7 @@ DEFAULT_RUNTIME_ROOT_UNDER_DATA = Path("/data") / DEFAULT_RUNTIME_DIR_NAME
 DEFAULT_RUNTIME_ROOT_UNDER_HOME = Path("~/.orcheo") / DEFAULT_RUNTIME_DIR_NAME
 RUNTIMES_DIR_NAME = "runtimes"
 STAGING_DIR_NAME = "staging"
+LOGS_DIR_NAME = "logs"
 
 
 def default_runtime_root(
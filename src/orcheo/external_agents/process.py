@@ -2,72 +2,279 @@
 
 from __future__ import annotations
 import asyncio
+import codecs
+import logging
 import os
 import signal
 import time
-from collections.abc import Mapping
+import uuid
+from collections.abc import Awaitable, Callable, Mapping
 from pathlib import Path
+from typing import BinaryIO
 from orcheo.external_agents.models import ProcessExecutionResult
 
 
+logger = logging.getLogger(__name__)
+
+OutputCallback = Callable[[str, str], Awaitable[None]]
+"""Receives ``(stream_name, line)`` for each line a process writes."""
+
+MAX_RETAINED_LOGS = 100
+_MAX_LINE_CHARS = 64 * 1024
+
+
+class _StreamCapture:
+    """Capture one process stream as a bounded tail, a log file and lines.
+
+    Only the last ``max_bytes`` are kept in memory. When ``log_path`` is set
+    the full stream is written there; the file is removed again if the tail
+    turned out to hold the complete output.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_bytes: int | None = None,
+        log_path: Path | None = None,
+        on_output: OutputCallback | None = None,
+    ) -> None:
+        self.name = name
+        self.total_bytes = 0
+        self.log_path = log_path
+        self._max_bytes = max_bytes
+        self._tail = bytearray()
+        self._log: BinaryIO | None = None
+        if log_path is not None:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._log = open(log_path, "wb")  # noqa: SIM115 - closed in close_log()
+        self._on_output = on_output
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._partial = ""
+
+    @property
+    def truncated(self) -> bool:
+        """Return whether output was dropped from the in-memory tail."""
+        return self._max_bytes is not None and self.total_bytes > self._max_bytes
+
+    async def feed(self, chunk: bytes) -> None:
+        """Record ``chunk`` and forward the lines it completes."""
+        self.total_bytes += len(chunk)
+        if self._log is not None:
+            self._log.write(chunk)
+        self._tail += chunk
+        if self._max_bytes is not None and len(self._tail) > self._max_bytes:
+            del self._tail[: len(self._tail) - self._max_bytes]
+        if self._on_output is None:
+            return
+        text = self._partial + self._decoder.decode(chunk)
+        *lines, self._partial = text.split("\n")
+        if len(self._partial) > _MAX_LINE_CHARS:
+            lines.append(self._partial)
+            self._partial = ""
+        for line in lines:
+            await self._emit(line.removesuffix("\r"))
+
+    async def finish(self) -> None:
+        """Flush the last partial line and drop the log if nothing was cut."""
+        if self._on_output is not None:
+            remaining = self._partial + self._decoder.decode(b"", final=True)
+            self._partial = ""
+            if remaining:
+                await self._emit(remaining.removesuffix("\r"))
+        self.close_log()
+        if not self.truncated and self.log_path is not None:
+            self.log_path.unlink(missing_ok=True)
+            self.log_path = None
+
+    def close_log(self) -> None:
+        """Close the log file handle; safe to call more than once."""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def text(self) -> str:
+        """Return the retained tail decoded as UTF-8."""
+        tail = bytes(self._tail)
+        if self.truncated:
+            # Skip continuation bytes of a character cut by the tail window.
+            start = 0
+            while start < min(len(tail), 3) and tail[start] & 0xC0 == 0x80:
+                start += 1
+            tail = tail[start:]
+        return tail.decode("utf-8", errors="replace")
+
+    async def _emit(self, line: str) -> None:
+        if self._on_output is None:  # pragma: no cover - guarded by callers
+            return
+        try:
+            await self._on_output(self.name, line)
+        except Exception:
+            logger.warning(
+                "Output callback failed for %s; further lines are not forwarded.",
+                self.name,
+                exc_info=True,
+            )
+            self._on_output = None
+
+
 async def execute_process(
     command: list[str],
     *,
     cwd: Path | None = None,
     env: Mapping[str, str] | None = None,
     timeout_seconds: int | float | None = None,
+    on_output: OutputCallback | None = None,
+    max_output_bytes: int | None = None,
+    log_dir: Path | None = None,
+    input_text: str | None = None,
+    process: asyncio.subprocess.Process | None = None,
 ) -> ProcessExecutionResult:
-    """Execute a command and capture partial output on failure or timeout."""
+    """Execute a command and capture partial output on failure or timeout.
+
+    Args:
+        command: Program and arguments to execute.
+        cwd: Working directory for the process.
+        env: Environment for the process.
+        timeout_seconds: Terminate the process group after this many seconds.
+        on_output: Awaited with ``(stream_name, line)`` as lines are written.
+        max_output_bytes: Keep only this many trailing bytes of each stream in
+            the result.
+        log_dir: Directory receiving the complete output of streams that
+            exceeded ``max_output_bytes``; the log paths are returned in the
+            result.
+        input_text: Text written to the process's stdin, which is then closed.
+        process: An already started process for ``command`` (for example from
+            a warm pool) to use instead of spawning one. It must have been
+            started by :func:`spawn_process` with ``stdin=True`` when
+            ``input_text`` is given.
+    """
     started_at = time.monotonic()
-    process = await asyncio.create_subprocess_exec(
-        *command,
-        cwd=str(cwd) if cwd is not None else None,
-        env=dict(env) if env is not None else None,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-        start_new_session=True,
-    )
+    if process is None:
+        process = await spawn_process(
+            command, cwd=cwd, env=env, stdin=input_text is not None
+        )
 
-    stdout_chunks: list[bytes] = []
-    stderr_chunks: list[bytes] = []
-    stdout_task = asyncio.create_task(_read_stream(process.stdout, stdout_chunks))
-    stderr_task = asyncio.create_task(_read_stream(process.stderr, stderr_chunks))
+    log_prefix = f"{int(time.time())}-{uuid.uuid4().hex[:12]}"
+    stdout, stderr = (
+        _StreamCapture(
+            name,
+            max_bytes=max_output_bytes,
+            log_path=(
+                log_dir / f"{log_prefix}.{name}.log"
+                if log_dir is not None and max_output_bytes is not None
+                else None
+            ),
+            on_output=on_output,
+        )
+        for name in ("stdout", "stderr")
+    )
+    stdout_task = asyncio.create_task(_read_stream(process.stdout, stdout))
+    stderr_task = asyncio.create_task(_read_stream(process.stderr, stderr))
 
     timed_out = False
     exit_code: int | None
     try:
-        if timeout_seconds is None:
-            exit_code = await process.wait()
-        else:
-            exit_code = await asyncio.wait_for(process.wait(), timeout_seconds)
-    except TimeoutError:
-        timed_out = True
-        exit_code = await _terminate_process_group(process)
+        try:
+            exit_code = await asyncio.wait_for(
+                _feed_and_wait(process, input_text), timeout_seconds
+            )
+        except TimeoutError:
+            timed_out = True
+            exit_code = await _terminate_process_group(process)
 
-    await asyncio.gather(stdout_task, stderr_task)
+        await asyncio.gather(stdout_task, stderr_task)
+        await stdout.finish()
+        await stderr.finish()
+    finally:
+        # Release the log files even when the caller is cancelled before the
+        # streams reach EOF; the cancelled readers would only close them later.
+        stdout_task.cancel()
+        stderr_task.cancel()
+        stdout.close_log()
+        stderr.close_log()
+    if log_dir is not None and (stdout.log_path or stderr.log_path):
+        _prune_logs(log_dir, keep=MAX_RETAINED_LOGS)
     duration_seconds = time.monotonic() - started_at
     return ProcessExecutionResult(
         command=command,
-        stdout=b"".join(stdout_chunks).decode("utf-8", errors="replace"),
-        stderr=b"".join(stderr_chunks).decode("utf-8", errors="replace"),
+        stdout=stdout.text(),
+        stderr=stderr.text(),
         exit_code=exit_code,
         timed_out=timed_out,
         duration_seconds=duration_seconds,
+        stdout_truncated=stdout.truncated,
+        stderr_truncated=stderr.truncated,
+        stdout_log_path=stdout.log_path,
+        stderr_log_path=stderr.log_path,
     )
 
 
+async def spawn_process(
+    command: list[str],
+    *,
+    cwd: Path | None = None,
+    env: Mapping[str, str] | None = None,
+    stdin: bool = False,
+) -> asyncio.subprocess.Process:
+    """Start ``command`` in its own session with piped output streams."""
+    return await asyncio.create_subprocess_exec(
+        *command,
+        cwd=str(cwd) if cwd is not None else None,
+        env=dict(env) if env is not None else None,
+        stdin=asyncio.subprocess.PIPE if stdin else None,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        start_new_session=True,
+    )
+
+
+async def _feed_and_wait(
+    process: asyncio.subprocess.Process, input_text: str | None
+) -> int:
+    """Write ``input_text`` to stdin, if given, and wait for the process."""
+    if input_text is not None:
+        await _write_stdin(process, input_text)
+    return await process.wait()
+
+
+async def _write_stdin(process: asyncio.subprocess.Process, text: str) -> None:
+    """Write ``text`` to the process's stdin and close it."""
+    if process.stdin is None:
+        msg = "The process was not started with a stdin pipe."
+        raise ValueError(msg)
+    try:
+        process.stdin.write(text.encode("utf-8"))
+        await process.stdin.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        logger.debug("Process exited before reading its input.")
+    finally:
+        process.stdin.close()
+
+
 async def _read_stream(
     stream: asyncio.StreamReader | None,
-    chunks: list[bytes],
+    capture: _StreamCapture,
 ) -> None:
     """Read one process stream until EOF."""
     if stream is None:
         return
-    while True:
-        chunk = await stream.read(4096)
-        if not chunk:
-            return
-        chunks.append(chunk)
+    try:
+        while True:
+            chunk = await stream.read(4096)
+            if not chunk:
+                return
+            await capture.feed(chunk)
+    finally:
+        capture.close_log()
+
+
+def _prune_logs(log_dir: Path, *, keep: int) -> None:
+    """Delete all but the ``keep`` most recent output logs in ``log_dir``."""
+    # Log names start with the epoch timestamp, so name order is age order.
+    logs = sorted(log_dir.glob("*.log"), reverse=True)
+    for stale in logs[keep:]:
+        stale.unlink(missing_ok=True)
 
 
 async def _terminate_process_group(process: asyncio.subprocess.Process) -> int | None:
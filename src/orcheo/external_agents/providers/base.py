@@ -46,6 +46,19 @@ class ExternalAgentProvider(Protocol):
     ) -> list[str]:
         """Build the non-interactive provider invocation command."""
 
+    def build_stdin_command(
+        self,
+        runtime: ResolvedRuntime,
+        *,
+        prompt: str,
+        system_prompt: str | None = None,
+    ) -> tuple[list[str], str] | None:
+        """Return a prompt-independent command and the stdin text to send it.
+
+        ``None`` means the CLI cannot read its task from stdin, so its
+        processes cannot be pre-started in a warm pool.
+        """
+
     def render_login_instructions(self, runtime: ResolvedRuntime) -> list[str]:
         """Return exact operator commands needed to authenticate the CLI."""
 
@@ -104,6 +117,17 @@ class NpmCliProvider:
         """Return the provider executable path inside ``install_prefix``."""
         return install_prefix / "bin" / self.executable_name
 
+    def build_stdin_command(
+        self,
+        runtime: ResolvedRuntime,
+        *,
+        prompt: str,
+        system_prompt: str | None = None,
+    ) -> tuple[list[str], str] | None:
+        """Return ``None``; providers opt in to stdin prompts explicitly."""
+        del runtime, prompt, system_prompt
+        return None
+
     def build_environment(
         self,
         environ: Mapping[str, str] | None = None,
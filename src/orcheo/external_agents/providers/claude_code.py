@@ -98,6 +98,25 @@ class ClaudeCodeProvider(NpmCliProvider):
             command.extend(["--append-system-prompt", system_prompt])
         return command
 
+    def build_stdin_command(
+        self,
+        runtime: ResolvedRuntime,
+        *,
+        prompt: str,
+        system_prompt: str | None = None,
+    ) -> tuple[list[str], str] | None:
+        """Build a print-mode command that reads the prompt from stdin."""
+        command = [
+            str(runtime.executable_path),
+            "--dangerously-skip-permissions",
+            "--print",
+            "--output-format",
+            "text",
+        ]
+        if system_prompt:
+            command.extend(["--append-system-prompt", system_prompt])
+        return command, prompt
+
     def render_login_instructions(self, runtime: ResolvedRuntime) -> list[str]:
         """Render manual Claude Code login commands for setup-needed failures."""
         return [
@@ -89,11 +89,7 @@ class CodexProvider(NpmCliProvider):
         system_prompt: str | None = None,
     ) -> list[str]:
         """Build a non-interactive Codex CLI invocation."""
-        combined_prompt = prompt
-        if system_prompt:
-            combined_prompt = (
-                f"System instructions:\n{system_prompt.strip()}\n\nTask:\n{prompt}"
-            )
+        combined_prompt = _combine_prompt(prompt, system_prompt)
         # These bypass flags are only for managed container workers where the
         # container and validated worktree provide the security boundary.
         return [
@@ -104,6 +100,23 @@ class CodexProvider(NpmCliProvider):
             combined_prompt,
         ]
 
+    def build_stdin_command(
+        self,
+        runtime: ResolvedRuntime,
+        *,
+        prompt: str,
+        system_prompt: str | None = None,
+    ) -> tuple[list[str], str] | None:
+        """Build a Codex exec command that reads the prompt from stdin."""
+        command = [
+            str(runtime.executable_path),
+            "exec",
+            *CODEX_CONTAINER_BYPASS_FLAGS,
+            "--skip-git-repo-check",
+            "-",
+        ]
+        return command, _combine_prompt(prompt, system_prompt)
+
     def execution_audit_metadata(
         self,
         runtime: ResolvedRuntime,
@@ -140,3 +153,10 @@ class CodexProvider(NpmCliProvider):
     def oauth_login_command(self, runtime: ResolvedRuntime) -> list[str]:
         """Return the device-auth login command for remote or containerized workers."""
         return [str(runtime.executable_path), "login", "--device-auth"]
+
+
+def _combine_prompt(prompt: str, system_prompt: str | None) -> str:
+    """Prefix ``prompt`` with system instructions when provided."""
+    if not system_prompt:
+        return prompt
+    return f"System instructions:\n{system_prompt.strip()}\n\nTask:\n{prompt}"
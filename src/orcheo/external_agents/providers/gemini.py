@@ -232,11 +232,7 @@ class GeminiProvider(NpmCliProvider):
         system_prompt: str | None = None,
     ) -> list[str]:
         """Build a non-interactive Gemini CLI invocation."""
-        combined_prompt = prompt
-        if system_prompt:
-            combined_prompt = (
-                f"System instructions:\n{system_prompt.strip()}\n\nTask:\n{prompt}"
-            )
+        combined_prompt = _combine_prompt(prompt, system_prompt)
         return [
             str(runtime.executable_path),
             "--prompt",
@@ -247,6 +243,23 @@ class GeminiProvider(NpmCliProvider):
             "text",
         ]
 
+    def build_stdin_command(
+        self,
+        runtime: ResolvedRuntime,
+        *,
+        prompt: str,
+        system_prompt: str | None = None,
+    ) -> tuple[list[str], str] | None:
+        """Build a non-interactive Gemini command fed the prompt on stdin."""
+        command = [
+            str(runtime.executable_path),
+            "--approval-mode",
+            "yolo",
+            "--output-format",
+            "text",
+        ]
+        return command, _combine_prompt(prompt, system_prompt)
+
     def render_login_instructions(self, runtime: ResolvedRuntime) -> list[str]:
         """Render manual Gemini login commands for setup-needed failures."""
         return [
@@ -258,3 +271,10 @@ class GeminiProvider(NpmCliProvider):
     def oauth_login_command(self, runtime: ResolvedRuntime) -> list[str]:
         """Return the interactive Google login command for Gemini CLI."""
         return [str(runtime.executable_path), "/auth", "signin"]
+
+
+def _combine_prompt(prompt: str, system_prompt: str | None) -> str:
+    """Prefix ``prompt`` with system instructions when provided."""
+    if not system_prompt:
+        return prompt
+    return f"System instructions:\n{system_prompt.strip()}\n\nTask:\n{prompt}"
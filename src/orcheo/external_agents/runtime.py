@@ -1,17 +1,23 @@
 """Shared runtime manager for external agent CLI providers."""
 
 from __future__ import annotations
+import asyncio
 import json
 import os
 import shutil
 import tempfile
+import threading
 import uuid
 from collections.abc import Iterator, Mapping
 from contextlib import contextmanager
 from contextvars import ContextVar, Token
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from orcheo.external_agents.manifest import RuntimeManifestStore, provider_lock
+from orcheo.external_agents.manifest import (
+    RuntimeManifestStore,
+    async_provider_lock,
+    provider_lock,
+)
 from orcheo.external_agents.models import (
     ResolvedRuntime,
     RuntimeInstallError,
@@ -32,12 +38,44 @@ from orcheo.external_agents.providers import DEFAULT_PROVIDERS, ExternalAgentPro
 
 
 DEFAULT_MAINTENANCE_INTERVAL = timedelta(days=7)
+DEFAULT_LOCK_TIMEOUT_SECONDS = 900.0
 _ACTIVE_ENVIRONMENT_OVERRIDES: ContextVar[dict[str, str] | None] = ContextVar(
     "external_agent_environment_overrides",
     default=None,
 )
 
 
+_ResolutionKey = tuple[Path, str]
+_ManifestStamp = tuple[int, int, int]
+
+
+class _ResolutionCache:
+    """Process-wide resolved runtimes and in-flight resolutions.
+
+    Runtime managers are created per node run, so resolved runtimes are
+    remembered here and validated against the manifest stamp instead of
+    re-reading the manifest under the provider lock on every run.
+    """
+
+    def __init__(self) -> None:
+        self.entries: dict[
+            _ResolutionKey,
+            tuple[ExternalAgentProvider, _ManifestStamp, RuntimeResolution],
+        ] = {}
+        self.inflight: dict[
+            _ResolutionKey,
+            tuple[asyncio.AbstractEventLoop, asyncio.Task[RuntimeResolution]],
+        ] = {}
+        self.lock = threading.Lock()
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+_resolution_cache = _ResolutionCache()
+
+
 @contextmanager
 def scoped_external_agent_environment(
     overrides: Mapping[str, str],
@@ -62,6 +100,7 @@ class ExternalAgentRuntimeManager:
         providers: Mapping[str, ExternalAgentProvider] | None = None,
         environ: Mapping[str, str] | None = None,
         maintenance_interval: timedelta = DEFAULT_MAINTENANCE_INTERVAL,
+        lock_timeout: float | None = DEFAULT_LOCK_TIMEOUT_SECONDS,
     ) -> None:
         """Initialize the runtime manager with a managed runtime root."""
         self.runtime_root = ensure_runtime_root(runtime_root)
@@ -73,6 +112,7 @@ class ExternalAgentRuntimeManager:
         if environ is not None:
             self.environ.update(environ)
         self.maintenance_interval = maintenance_interval
+        self.lock_timeout = lock_timeout
         self.manifest_store = RuntimeManifestStore(self.runtime_root)
 
     def get_provider(self, provider_name: str) -> ExternalAgentProvider:
@@ -146,26 +186,92 @@ class ExternalAgentRuntimeManager:
         return self._runtime_from_manifest(provider, manifest), manifest
 
     async def resolve_runtime(self, provider_name: str) -> RuntimeResolution:
-        """Resolve a pinned runtime, installing the provider if absent."""
+        """Resolve a pinned runtime, installing the provider if absent.
+
+        Resolutions are served from an in-process cache while the manifest is
+        unchanged. Otherwise the provider lock is awaited without blocking the
+        event loop, and concurrent callers on the same loop share a single
+        resolution (and therefore a single install).
+        """
         provider = self.get_provider(provider_name)
-        with provider_lock(self.runtime_root, provider_name):
-            manifest = self.manifest_store.load(provider_name)
+        key = (self.runtime_root, provider_name)
+        cached = self._cached_resolution(key, provider)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        with _resolution_cache.lock:
+            inflight = _resolution_cache.inflight.get(key)
+            if inflight is not None and inflight[0] is loop:
+                task = inflight[1]
+            else:
+                task = loop.create_task(self._resolve_runtime_locked(provider))
+                _resolution_cache.inflight[key] = (loop, task)
+                task.add_done_callback(
+                    lambda done: _discard_inflight_resolution(key, done)
+                )
+        resolution = await asyncio.shield(task)
+        return resolution.model_copy(
+            update={"maintenance_due": self.maintenance_due(resolution.manifest)}
+        )
+
+    def _cached_resolution(
+        self,
+        key: _ResolutionKey,
+        provider: ExternalAgentProvider,
+    ) -> RuntimeResolution | None:
+        """Return the cached resolution when its manifest is unchanged."""
+        with _resolution_cache.lock:
+            entry = _resolution_cache.entries.get(key)
+        if entry is None:
+            return None
+        cached_provider, stamp, resolution = entry
+        if (
+            cached_provider is not provider
+            or self.manifest_store.stamp(provider.name) != stamp
+            or not resolution.runtime.executable_path.exists()
+        ):
+            return None
+        return resolution.model_copy(
+            update={"maintenance_due": self.maintenance_due(resolution.manifest)}
+        )
+
+    async def _resolve_runtime_locked(
+        self,
+        provider: ExternalAgentProvider,
+    ) -> RuntimeResolution:
+        """Resolve the runtime under the provider lock and cache the result."""
+        async with async_provider_lock(
+            self.runtime_root, provider.name, timeout=self.lock_timeout
+        ):
+            manifest = self.manifest_store.load(provider.name)
             runtime = self._runtime_from_manifest(provider, manifest)
             if runtime is None:
                 runtime, manifest = await self._install_latest_locked(
                     provider, manifest
                 )
             assert manifest is not None
-            return RuntimeResolution(
+            resolution = RuntimeResolution(
                 runtime=runtime,
                 manifest=manifest,
                 maintenance_due=self.maintenance_due(manifest),
             )
+            stamp = self.manifest_store.stamp(provider.name)
+            if stamp is not None:  # pragma: no branch - manifest saved on install
+                with _resolution_cache.lock:
+                    _resolution_cache.entries[(self.runtime_root, provider.name)] = (
+                        provider,
+                        stamp,
+                        resolution,
+                    )
+            return resolution
 
     async def run_maintenance(self, provider_name: str) -> RuntimeResolution:
         """Check for a newer latest runtime and safely activate it if verified."""
         provider = self.get_provider(provider_name)
-        with provider_lock(self.runtime_root, provider_name):
+        async with async_provider_lock(
+            self.runtime_root, provider_name, timeout=self.lock_timeout
+        ):
             manifest = self.manifest_store.load(provider_name)
             if manifest is None:
                 runtime, manifest = await self._install_latest_locked(provider, None)
@@ -418,6 +524,19 @@ class ExternalAgentRuntimeManager:
         env_path.chmod(0o600)
 
 
+def _discard_inflight_resolution(
+    key: _ResolutionKey,
+    task: asyncio.Task[RuntimeResolution],
+) -> None:
+    """Forget a finished in-flight resolution unless it was already replaced."""
+    if not task.cancelled():
+        task.exception()  # mark retrieved when every waiter was cancelled
+    with _resolution_cache.lock:
+        inflight = _resolution_cache.inflight.get(key)
+        if inflight is not None and inflight[1] is task:
+            del _resolution_cache.inflight[key]
+
+
 def _safe_version_directory_name(version: str) -> str:
     """Return a filesystem-safe version directory name."""
     return version.replace("/", "_").replace(" ", "_")
@@ -0,0 +1,217 @@
+"""Warm pools of pre-started external agent CLI processes.
+
+Starting a coding-agent CLI (Node.js boot, auth files, MCP configuration)
+dominates short tasks. Providers that can read their prompt from stdin expose
+a prompt-independent command through ``build_stdin_command``; the pool keeps
+processes for that command started and blocked on stdin, so a task only has
+to write its prompt.
+
+Processes are one-shot: each serves exactly one task and exits, and the pool
+starts a replacement in the background. Idle processes are terminated after
+``idle_timeout`` seconds. Pools are bound to the event loop that owns their
+subprocesses.
+"""
+
+from __future__ import annotations
+import asyncio
+import hashlib
+import json
+import logging
+import time
+import weakref
+from collections.abc import Coroutine, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from orcheo.external_agents.process import _terminate_process_group, spawn_process
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDLE_TIMEOUT_SECONDS = 300.0
+
+
+@dataclass(frozen=True, slots=True)
+class WarmProcessProfile:
+    """Everything a warm process was started with."""
+
+    command: tuple[str, ...]
+    cwd: Path
+    env_fingerprint: str
+
+    @classmethod
+    def create(
+        cls,
+        command: list[str],
+        *,
+        cwd: Path,
+        env: Mapping[str, str],
+    ) -> WarmProcessProfile:
+        """Return the profile for ``command`` run in ``cwd`` with ``env``."""
+        encoded = json.dumps(sorted(env.items()), separators=(",", ":"))
+        return cls(
+            command=tuple(command),
+            cwd=cwd,
+            env_fingerprint=hashlib.sha256(encoded.encode("utf-8")).hexdigest(),
+        )
+
+
+@dataclass(slots=True)
+class _ProfileState:
+    idle: list[tuple[float, asyncio.subprocess.Process]] = field(default_factory=list)
+    spawning: int = 0
+
+
+class WarmProcessPool:
+    """Keep pre-started processes per profile ready to receive a prompt."""
+
+    def __init__(self, *, idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS) -> None:
+        """Create an empty pool reaping processes idle for ``idle_timeout``."""
+        self.idle_timeout = idle_timeout
+        self._profiles: dict[WarmProcessProfile, _ProfileState] = {}
+        self._tasks: set[asyncio.Task[object]] = set()
+        self._reaper: asyncio.TimerHandle | None = None
+        self._closed = False
+
+    async def acquire(
+        self,
+        command: list[str],
+        *,
+        cwd: Path,
+        env: Mapping[str, str],
+        size: int,
+    ) -> asyncio.subprocess.Process | None:
+        """Return a warm process for the profile, or ``None`` on a miss.
+
+        Either way the pool is topped up to ``size`` warm processes in the
+        background, so the next task for the same profile starts warm.
+        """
+        self.reap()
+        if self._closed:
+            return None
+        profile = WarmProcessProfile.create(command, cwd=cwd, env=env)
+        state = self._profiles.setdefault(profile, _ProfileState())
+        process: asyncio.subprocess.Process | None = None
+        while state.idle and process is None:
+            _, candidate = state.idle.pop()
+            if candidate.returncode is None:
+                process = candidate
+            else:
+                self._track(candidate.wait())
+        missing = size - len(state.idle) - state.spawning
+        for _ in range(max(missing, 0)):
+            state.spawning += 1
+            self._track(self._spawn(profile, state, dict(env)))
+        return process
+
+    def reap(self) -> None:
+        """Terminate processes idle for longer than ``idle_timeout``."""
+        cutoff = time.monotonic() - self.idle_timeout
+        for profile, state in list(self._profiles.items()):
+            keep: list[tuple[float, asyncio.subprocess.Process]] = []
+            for started_at, process in state.idle:
+                if started_at >= cutoff and process.returncode is None:
+                    keep.append((started_at, process))
+                else:
+                    self._discard(process)
+            state.idle = keep
+            if not keep and not state.spawning:
+                del self._profiles[profile]
+
+    def idle_count(self) -> int:
+        """Return the number of warm processes waiting for a task."""
+        return sum(len(state.idle) for state in self._profiles.values())
+
+    async def aclose(self) -> None:
+        """Stop spawning and terminate every warm process."""
+        self._closed = True
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        processes = [
+            process for state in self._profiles.values() for _, process in state.idle
+        ]
+        self._profiles.clear()
+        await asyncio.gather(
+            *(_terminate_process_group(process) for process in processes),
+            return_exceptions=True,
+        )
+
+    async def _spawn(
+        self,
+        profile: WarmProcessProfile,
+        state: _ProfileState,
+        env: dict[str, str],
+    ) -> None:
+        try:
+            process = await spawn_process(
+                list(profile.command), cwd=profile.cwd, env=env, stdin=True
+            )
+        except OSError:
+            logger.warning(
+                "Failed to pre-start external agent process %s.",
+                profile.command[0],
+                exc_info=True,
+            )
+            return
+        finally:
+            state.spawning -= 1
+        if self._closed:
+            await _terminate_process_group(process)
+            return
+        state.idle.append((time.monotonic(), process))
+        self._profiles.setdefault(profile, state)
+        self._schedule_reap()
+
+    def _schedule_reap(self) -> None:
+        if self._reaper is None:
+            loop = asyncio.get_running_loop()
+            self._reaper = loop.call_later(self.idle_timeout, self._run_reaper)
+
+    def _run_reaper(self) -> None:
+        self._reaper = None
+        self.reap()
+        if self._profiles:
+            self._schedule_reap()
+
+    def _discard(self, process: asyncio.subprocess.Process) -> None:
+        self._track(_terminate_process_group(process))
+
+    def _track(self, coroutine: Coroutine[Any, Any, object]) -> None:
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+_pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, WarmProcessPool] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_warm_process_pool() -> WarmProcessPool:
+    """Return the warm process pool bound to the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = _pools[loop] = WarmProcessPool()
+    return pool
+
+
+async def close_warm_process_pools() -> None:
+    """Terminate the warm processes owned by the running event loop."""
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.aclose()
+
+
+__all__ = [
+    "DEFAULT_IDLE_TIMEOUT_SECONDS",
+    "WarmProcessPool",
+    "WarmProcessProfile",
+    "close_warm_process_pools",
+    "get_warm_process_pool",
+]
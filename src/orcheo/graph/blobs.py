@@ -0,0 +1,577 @@
+"""Content-addressed offloading of large node outputs from workflow state.
+
+When a blob store is configured, :class:`~orcheo.nodes.base.TaskNode` replaces
+result values whose JSON encoding exceeds the offload threshold with small
+reference dictionaries::
+
+    {"__orcheo_blob__": "<sha256>", "size": 1843221, "type": "list"}
+
+Only the reference is kept in ``State.results`` and therefore in checkpoints.
+Template resolution, node and edge execution load the referenced values on
+access; run history, run outputs and streamed updates are resolved before they
+leave the executing process.
+
+The store is selected through the environment:
+
+* ``ORCHEO_BLOB_STORE_BACKEND`` - ``none`` (default), ``filesystem``,
+  ``sqlite`` or ``postgres``. Filesystem and SQLite stores are local to one
+  host; deployments whose API and workers run on several hosts need the
+  shared ``postgres`` store.
+* ``ORCHEO_BLOB_STORE_PATH`` - directory or SQLite file (defaults to
+  ``~/.orcheo/blobs`` or ``~/.orcheo/blobs.sqlite``).
+* ``ORCHEO_BLOB_STORE_DSN`` - PostgreSQL DSN of the ``postgres`` store
+  (defaults to ``ORCHEO_POSTGRES_DSN``).
+* ``ORCHEO_BLOB_OFFLOAD_THRESHOLD`` - minimum encoded size in bytes
+  (default 64 KiB).
+* ``ORCHEO_BLOB_RETENTION_DAYS`` - blobs not written for this many days are
+  removed by :func:`prune_blob_store` (default 30, ``0`` keeps them forever).
+"""
+
+from __future__ import annotations
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Protocol, runtime_checkable
+
+
+BLOB_REF_KEY = "__orcheo_blob__"
+DEFAULT_OFFLOAD_THRESHOLD = 64 * 1024
+DEFAULT_RETENTION_DAYS = 30.0
+
+
+class BlobNotFoundError(LookupError):
+    """Raised when a blob reference cannot be loaded."""
+
+
+@runtime_checkable
+class BlobStore(Protocol):
+    """Content-addressed storage for offloaded payloads."""
+
+    def put(self, data: bytes) -> str:
+        """Store ``data`` and return its SHA-256 hex digest."""
+
+    def get(self, digest: str) -> bytes:
+        """Return the bytes stored under ``digest``."""
+
+    def prune(self, older_than: float) -> int:
+        """Delete blobs last written before the ``older_than`` UNIX time.
+
+        Returns the number of blobs removed.
+        """
+
+
+class InMemoryBlobStore:
+    """Process-local blob store, mainly for tests and single-process runs."""
+
+    def __init__(self) -> None:
+        """Create an empty store."""
+        self._blobs: dict[str, bytes] = {}
+        self._stored_at: dict[str, float] = {}
+
+    def put(self, data: bytes) -> str:
+        """Store ``data`` and return its SHA-256 hex digest."""
+        digest = hashlib.sha256(data).hexdigest()
+        self._blobs.setdefault(digest, data)
+        self._stored_at[digest] = time.time()
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """Return the bytes stored under ``digest``."""
+        try:
+            return self._blobs[digest]
+        except KeyError:
+            raise BlobNotFoundError(digest) from None
+
+    def prune(self, older_than: float) -> int:
+        """Delete blobs last written before ``older_than``."""
+        expired = [
+            digest
+            for digest, stored_at in self._stored_at.items()
+            if stored_at < older_than
+        ]
+        for digest in expired:
+            del self._blobs[digest], self._stored_at[digest]
+        return len(expired)
+
+
+class FilesystemBlobStore:
+    """Store blobs as files named by digest below ``directory``.
+
+    The directory is only visible to processes on the same host.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Create a store rooted at ``directory``."""
+        self.directory = Path(directory).expanduser()
+
+    def _path(self, digest: str) -> Path:
+        if len(digest) != 64 or not all(c in "0123456789abcdef" for c in digest):
+            raise BlobNotFoundError(digest)
+        return self.directory / digest[:2] / digest
+
+    def put(self, data: bytes) -> str:
+        """Store ``data`` and return its SHA-256 hex digest."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        try:
+            # Refresh the mtime so retention counts from the latest write.
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        else:
+            return digest
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """Return the bytes stored under ``digest``."""
+        try:
+            return self._path(digest).read_bytes()
+        except FileNotFoundError:
+            raise BlobNotFoundError(digest) from None
+
+    def prune(self, older_than: float) -> int:
+        """Delete blob files (and stale temporary files) older than ``older_than``."""
+        removed = 0
+        for path in self.directory.glob("??/*"):
+            try:
+                if path.stat().st_mtime >= older_than:
+                    continue
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            if path.suffix != ".tmp":
+                removed += 1
+        return removed
+
+
+class SQLiteBlobStore:
+    """Store blobs in a single SQLite table keyed by digest.
+
+    The database file is only visible to processes on the same host.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Open (and create when missing) the SQLite database at ``path``."""
+        self._path = Path(path).expanduser()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self._path, check_same_thread=False, timeout=30.0
+        )
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS blobs (digest TEXT PRIMARY KEY, "
+                "data BLOB NOT NULL, stored_at REAL NOT NULL DEFAULT 0)"
+            )
+
+    def put(self, data: bytes) -> str:
+        """Store ``data`` and return its SHA-256 hex digest."""
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO blobs (digest, data, stored_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (digest) DO UPDATE SET stored_at = excluded.stored_at",
+                (digest, data, time.time()),
+            )
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """Return the bytes stored under ``digest``."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM blobs WHERE digest = ?", (digest,)
+            ).fetchone()
+        if row is None:
+            raise BlobNotFoundError(digest)
+        return bytes(row[0])
+
+    def prune(self, older_than: float) -> int:
+        """Delete blobs last written before ``older_than``."""
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "DELETE FROM blobs WHERE stored_at < ?", (older_than,)
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._connection.close()
+
+
+POSTGRES_BLOB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS orcheo_blobs (
+    digest TEXT PRIMARY KEY,
+    data BYTEA NOT NULL,
+    stored_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS idx_orcheo_blobs_stored_at ON orcheo_blobs(stored_at);
+"""
+
+
+class PostgresBlobStore:
+    """Store blobs in a PostgreSQL table shared by every process.
+
+    This is the store to use when the API and workers run in several
+    processes or on several hosts: a blob written by one of them can be
+    loaded by all the others.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        *,
+        pool_min_size: int = 1,
+        pool_max_size: int = 4,
+    ) -> None:
+        """Open a connection pool on ``dsn``; the table is created on first use."""
+        from psycopg_pool import ConnectionPool
+
+        self._pool = ConnectionPool(
+            dsn,
+            min_size=pool_min_size,
+            max_size=pool_max_size,
+            open=True,
+            kwargs={"autocommit": True},
+        )
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    @contextmanager
+    def _connection(self) -> Iterator[Any]:
+        if not self._initialized:
+            with self._init_lock, self._pool.connection() as conn:
+                if not self._initialized:
+                    for stmt in POSTGRES_BLOB_SCHEMA.strip().split(";"):
+                        if stmt.strip():
+                            conn.execute(stmt)
+                    self._initialized = True
+        with self._pool.connection() as conn:
+            yield conn
+
+    def put(self, data: bytes) -> str:
+        """Store ``data`` and return its SHA-256 hex digest."""
+        digest = hashlib.sha256(data).hexdigest()
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT INTO orcheo_blobs (digest, data) VALUES (%s, %s) "
+                "ON CONFLICT (digest) DO UPDATE SET stored_at = now()",
+                (digest, data),
+            )
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """Return the bytes stored under ``digest``."""
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT data FROM orcheo_blobs WHERE digest = %s", (digest,)
+            ).fetchone()
+        if row is None:
+            raise BlobNotFoundError(digest)
+        return bytes(row[0])
+
+    def prune(self, older_than: float) -> int:
+        """Delete blobs last written before ``older_than``."""
+        with self._connection() as conn:
+            cursor = conn.execute(
+                "DELETE FROM orcheo_blobs WHERE stored_at < to_timestamp(%s)",
+                (older_than,),
+            )
+        return int(cursor.rowcount)
+
+    def close(self) -> None:
+        """Close the connection pool."""
+        self._pool.close()
+
+
+class _BlobSettings:
+    """Process-wide blob store selection, resolved lazily from the environment."""
+
+    def __init__(self) -> None:
+        self.loaded = False
+        self.store: BlobStore | None = None
+        self.threshold = DEFAULT_OFFLOAD_THRESHOLD
+        self.retention_days = DEFAULT_RETENTION_DAYS
+        self.lock = threading.Lock()
+
+
+_settings = _BlobSettings()
+
+
+def blob_store_from_env() -> BlobStore | None:
+    """Return the blob store selected by ``ORCHEO_BLOB_STORE_BACKEND``."""
+    backend = os.getenv("ORCHEO_BLOB_STORE_BACKEND", "none").strip().lower()
+    path = os.getenv("ORCHEO_BLOB_STORE_PATH", "").strip()
+    if backend == "filesystem":
+        return FilesystemBlobStore(path or "~/.orcheo/blobs")
+    if backend == "sqlite":
+        return SQLiteBlobStore(path or "~/.orcheo/blobs.sqlite")
+    if backend == "postgres":
+        dsn = os.getenv("ORCHEO_BLOB_STORE_DSN") or os.getenv("ORCHEO_POSTGRES_DSN")
+        if not dsn:
+            msg = (
+                "ORCHEO_BLOB_STORE_BACKEND=postgres requires ORCHEO_BLOB_STORE_DSN "
+                "or ORCHEO_POSTGRES_DSN to be set."
+            )
+            raise ValueError(msg)
+        return PostgresBlobStore(dsn)
+    return None
+
+
+def configure_blob_store(
+    store: BlobStore | None,
+    *,
+    threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+    retention_days: float = DEFAULT_RETENTION_DAYS,
+) -> None:
+    """Install ``store`` as the process-wide blob store (``None`` disables)."""
+    with _settings.lock:
+        _settings.store = store
+        _settings.threshold = threshold
+        _settings.retention_days = retention_days
+        _settings.loaded = True
+
+
+def get_blob_store() -> BlobStore | None:
+    """Return the configured blob store, reading the environment on first use."""
+    if not _settings.loaded:
+        with _settings.lock:
+            if not _settings.loaded:
+                _settings.store = blob_store_from_env()
+                raw = os.getenv("ORCHEO_BLOB_OFFLOAD_THRESHOLD", "").strip()
+                _settings.threshold = int(raw) if raw else DEFAULT_OFFLOAD_THRESHOLD
+                raw = os.getenv("ORCHEO_BLOB_RETENTION_DAYS", "").strip()
+                _settings.retention_days = float(raw) if raw else DEFAULT_RETENTION_DAYS
+                _settings.loaded = True
+    return _settings.store
+
+
+def prune_blob_store() -> int:
+    """Delete blobs not written within the configured retention window.
+
+    Blobs are content addressed and shared between runs, so a blob only
+    expires once no run has produced it for ``ORCHEO_BLOB_RETENTION_DAYS``.
+    Returns the number of blobs removed.
+    """
+    store = get_blob_store()
+    if store is None or _settings.retention_days <= 0:
+        return 0
+    return store.prune(time.time() - _settings.retention_days * 86400)
+
+
+def is_blob_ref(value: Any) -> bool:
+    """Return whether ``value`` is a blob reference dictionary."""
+    return isinstance(value, Mapping) and BLOB_REF_KEY in value
+
+
+def _encode(value: Any) -> bytes | None:
+    try:
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+    except (TypeError, ValueError):
+        return None
+
+
+def offload_value(value: Any, store: BlobStore, *, threshold: int) -> Any:
+    """Return a blob reference for ``value`` when it encodes above ``threshold``.
+
+    Values that are small, already references, or not JSON serialisable are
+    returned unchanged.
+    """
+    if not isinstance(value, str | list | dict) or is_blob_ref(value):
+        return value
+    if isinstance(value, str) and len(value) * 4 < threshold:
+        return value
+    data = _encode(value)
+    if data is None or len(data) < threshold:
+        return value
+    return {
+        BLOB_REF_KEY: store.put(data),
+        "size": len(data),
+        "type": type(value).__name__,
+    }
+
+
+def offload_result(result: Any) -> Any:
+    """Offload the large values of a node result to the configured store.
+
+    Mapping results are offloaded per key so small fields (counts, status
+    codes, ids) stay inline and cheap to template.
+    """
+    store = get_blob_store()
+    if store is None:
+        return result
+    threshold = _settings.threshold
+    if isinstance(result, Mapping) and not is_blob_ref(result):
+        offloaded = {
+            key: offload_value(value, store, threshold=threshold)
+            for key, value in result.items()
+        }
+        if all(offloaded[key] is value for key, value in result.items()):
+            return result
+        return offloaded
+    return offload_value(result, store, threshold=threshold)
+
+
+async def aoffload_result(result: Any) -> Any:
+    """Offload ``result`` like :func:`offload_result` without blocking the loop.
+
+    Encoding and the store write run in a worker thread; results are returned
+    unchanged when no blob store is configured.
+    """
+    if get_blob_store() is None:
+        return result
+    return await asyncio.to_thread(offload_result, result)
+
+
+def load_blob(reference: Mapping[str, Any], store: BlobStore | None = None) -> Any:
+    """Load and decode the value behind ``reference``."""
+    store = store or get_blob_store()
+    if store is None:
+        msg = f"No blob store configured to load {reference.get(BLOB_REF_KEY)!r}"
+        raise BlobNotFoundError(msg)
+    return json.loads(store.get(str(reference[BLOB_REF_KEY])))
+
+
+def resolve_blob_refs(value: Any, store: BlobStore | None = None) -> Any:
+    """Return ``value`` with every nested blob reference loaded."""
+    if is_blob_ref(value):
+        return load_blob(value, store)
+    if isinstance(value, Mapping):
+        return {key: resolve_blob_refs(item, store) for key, item in value.items()}
+    if isinstance(value, list):
+        return [resolve_blob_refs(item, store) for item in value]
+    return value
+
+
+def _contains_refs(value: Any) -> bool:
+    if is_blob_ref(value):
+        return True
+    if isinstance(value, Mapping):
+        return any(_contains_refs(item) for item in value.values())
+    if isinstance(value, list):
+        return any(_contains_refs(item) for item in value)
+    return False
+
+
+async def aresolve_blob_refs(value: Any) -> Any:
+    """Resolve ``value`` like :func:`resolve_blob_refs` without blocking the loop.
+
+    Values without references are returned unchanged; loads run in a worker
+    thread.
+    """
+    if get_blob_store() is None or not _contains_refs(value):
+        return value
+    return await asyncio.to_thread(resolve_blob_refs, value)
+
+
+def _has_refs(values: Iterator[Any], depth: int) -> bool:
+    for value in values:
+        if is_blob_ref(value):
+            return True
+        if (
+            depth > 1
+            and isinstance(value, dict)
+            and _has_refs(iter(value.values()), depth - 1)
+        ):
+            return True
+    return False
+
+
+class BlobResolvingDict(dict[str, Any]):
+    """Dict view that loads blob references (and wraps nested dicts) on access.
+
+    Loaded values are memoised in the view, never in the underlying state.
+    """
+
+    def __init__(self, data: Mapping[str, Any], store: BlobStore) -> None:
+        """Wrap ``data`` so its references are loaded from ``store``."""
+        super().__init__(data)
+        self._store = store
+
+    def _load(self, key: str, value: Any) -> Any:
+        if is_blob_ref(value):
+            value = load_blob(value, self._store)
+        elif isinstance(value, dict) and not isinstance(value, BlobResolvingDict):
+            if not _has_refs(iter(value.values()), 1):
+                return value
+            value = BlobResolvingDict(value, self._store)
+        else:
+            return value
+        dict.__setitem__(self, key, value)
+        return value
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the value for ``key``, loading blob references."""
+        return self._load(key, super().__getitem__(key))
+
+    def get(self, key: str, default: Any = None) -> Any:  # type: ignore[override]
+        """Return the value for ``key`` or ``default``, loading references."""
+        if not dict.__contains__(self, key):
+            return default
+        return self[key]
+
+    def values(self) -> list[Any]:  # type: ignore[override]
+        """Return the loaded values."""
+        return [self[key] for key in self]
+
+    def items(self) -> list[tuple[str, Any]]:  # type: ignore[override]
+        """Return ``(key, value)`` pairs with references loaded."""
+        return [(key, self[key]) for key in self]
+
+
+def with_resolved_blobs(state: Any) -> Any:
+    """Return ``state`` with ``results`` wrapped when it holds blob references."""
+    store = get_blob_store()
+    if store is None or not isinstance(state, Mapping):
+        return state
+    results = state.get("results")
+    if (
+        not isinstance(results, dict)
+        or isinstance(results, BlobResolvingDict)
+        or not _has_refs(iter(results.values()), 2)
+    ):
+        return state
+    return {**state, "results": BlobResolvingDict(results, store)}
+
+
+__all__ = [
+    "BLOB_REF_KEY",
+    "DEFAULT_OFFLOAD_THRESHOLD",
+    "DEFAULT_RETENTION_DAYS",
+    "BlobNotFoundError",
+    "BlobResolvingDict",
+    "BlobStore",
+    "FilesystemBlobStore",
+    "InMemoryBlobStore",
+    "PostgresBlobStore",
+    "SQLiteBlobStore",
+    "aoffload_result",
+    "aresolve_blob_refs",
+    "blob_store_from_env",
+    "configure_blob_store",
+    "get_blob_store",
+    "is_blob_ref",
+    "load_blob",
+    "offload_result",
+    "offload_value",
+    "prune_blob_store",
+    "resolve_blob_refs",
+    "with_resolved_blobs",
+]
@@ -15,5 +15,14 @@ class State(MessagesState):
 
 
 def dict_reducer(left: dict[str, Any], right: dict[str, Any]) -> dict[str, Any]:
-    """Reducer for dictionaries."""
+    """Reducer for dictionaries.
+
+    Returns a new shallow mapping so earlier snapshots (which LangGraph may
+    still be checkpointing or streaming) are never mutated. Values are shared,
+    not copied, and updates that change nothing return ``left`` itself.
+    """
+    if not right:
+        return left
+    if all(key in left and left[key] is value for key, value in right.items()):
+        return left
     return {**left, **right}
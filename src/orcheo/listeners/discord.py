@@ -4,7 +4,7 @@ from __future__ import annotations
 import asyncio
 import json
 import sys
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from contextlib import AbstractAsyncContextManager
 from datetime import datetime
 from typing import Any, Literal, Protocol
@@ -67,12 +67,12 @@ class DiscordListenerRepository(Protocol):
     ) -> ListenerCursor:
         """Persist the latest Discord resume cursor."""
 
-    async def dispatch_listener_event(
+    async def dispatch_listener_events(
         self,
         subscription_id: UUID,
-        payload: ListenerDispatchPayload,
-    ) -> object | None:
-        """Dispatch a normalized Discord event into the workflow runtime."""
+        payloads: Sequence[ListenerDispatchPayload],
+    ) -> Sequence[object]:
+        """Dispatch normalized Discord events into the workflow runtime."""
 
 
 class DiscordGatewayHttpClient(Protocol):
@@ -435,9 +435,9 @@ class DiscordGatewayAdapter:
             bot_user_id=self._bot_user_id,
         )
         if normalized is not None:
-            await self._repository.dispatch_listener_event(
+            await self._repository.dispatch_listener_events(
                 self.subscription.id,
-                normalized,
+                [normalized],
             )
             self._last_event_at = _utcnow()
         await self._repository.save_listener_cursor(cursor)
@@ -85,6 +85,11 @@ class ListenerSubscription(TimestampedAuditModel):
     last_event_at: datetime | None = None
     last_error: str | None = None
 
+    @property
+    def dedupe_window(self) -> timedelta:
+        """Return how long dispatched dedupe keys suppress duplicates."""
+        return timedelta(seconds=int(self.config.get("dedupe_window_seconds", 300)))
+
 
 class ListenerCursor(OrcheoBaseModel):
     """Persisted resume state for a listener subscription."""
@@ -4,7 +4,7 @@ from __future__ import annotations
 import asyncio
 import json
 import sys
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from contextlib import AbstractAsyncContextManager
 from datetime import datetime, timedelta
 from typing import Any, Literal, Protocol
@@ -70,12 +70,12 @@ class QQListenerRepository(Protocol):
     ) -> ListenerCursor:
         """Persist the latest QQ resume cursor."""
 
-    async def dispatch_listener_event(
+    async def dispatch_listener_events(
         self,
         subscription_id: UUID,
-        payload: ListenerDispatchPayload,
-    ) -> object | None:
-        """Dispatch a normalized QQ event into the workflow runtime."""
+        payloads: Sequence[ListenerDispatchPayload],
+    ) -> Sequence[object]:
+        """Dispatch normalized QQ events into the workflow runtime."""
 
 
 class QQAccessTokenHttpClient(Protocol):
@@ -598,9 +598,9 @@ class QQGatewayAdapter:
 
         normalized = normalize_qq_event(self.subscription, event_type, data)
         if normalized is not None:
-            await self._repository.dispatch_listener_event(
+            await self._repository.dispatch_listener_events(
                 self.subscription.id,
-                normalized,
+                [normalized],
             )
             self._last_event_at = _utcnow()
         await self._repository.save_listener_cursor(cursor)
@@ -3,8 +3,9 @@
 from __future__ import annotations
 import asyncio
 import logging
-from collections.abc import Callable
-from typing import Protocol
+from collections.abc import Callable, Sequence
+from datetime import datetime, timedelta
+from typing import Protocol, runtime_checkable
 from uuid import UUID
 from orcheo.listeners import (
     ListenerHealthSnapshot,
@@ -12,10 +13,18 @@ from orcheo.listeners import (
     ListenerSubscriptionStatus,
 )
 from orcheo.runtime.credentials import CredentialReferenceNotFoundError
+from orcheo.tracing.metrics import (
+    LISTENER_ADAPTER_FAILURES,
+    LISTENER_ADAPTERS_ACTIVE,
+    LISTENER_RECONCILE_SECONDS,
+)
 
 
 logger = logging.getLogger(__name__)
 
+CHANGE_FEED_OVERLAP = timedelta(seconds=30)
+"""How far behind the watermark the change feed re-reads to absorb clock skew."""
+
 
 class ListenerAdapter(Protocol):
     """Runtime adapter contract managed by the listener supervisor."""
@@ -68,6 +77,40 @@ class ListenerRepository(Protocol):
         """Update the operational status for a listener subscription."""
 
 
+@runtime_checkable
+class IncrementalListenerRepository(ListenerRepository, Protocol):
+    """Repository operations enabling incremental supervisor reconciles.
+
+    Runtimes renew the leases they hold and claim free subscriptions in batch,
+    and follow an ``updated_at`` change feed instead of re-listing every
+    subscription on each reconcile.
+    """
+
+    async def list_listener_subscriptions(
+        self,
+        *,
+        updated_since: datetime | None = None,
+    ) -> list[ListenerSubscription]:
+        """Return subscriptions modified after ``updated_since`` (all if ``None``)."""
+
+    async def claim_listener_subscriptions(
+        self,
+        *,
+        runtime_id: str,
+        lease_seconds: int,
+    ) -> list[ListenerSubscription]:
+        """Claim every active subscription that is unassigned or lease-expired."""
+
+    async def renew_listener_subscription_leases(
+        self,
+        subscription_ids: Sequence[UUID],
+        *,
+        runtime_id: str,
+        lease_seconds: int,
+    ) -> list[UUID]:
+        """Extend leases still held by ``runtime_id`` and return their ids."""
+
+
 class ListenerSupervisor:
     """Claim subscriptions, manage adapter lifecycles, and expose health."""
 
@@ -90,55 +133,30 @@ class ListenerSupervisor:
         self._adapters: dict[UUID, ListenerAdapter] = {}
         self._build_failures: dict[UUID, ListenerHealthSnapshot] = {}
         self._stop_events: dict[UUID, asyncio.Event] = {}
+        self._blocked: dict[UUID, ListenerSubscription] = {}
+        self._watermark: datetime | None = None
 
+    @LISTENER_RECONCILE_SECONDS.time()
     async def run_once(self) -> None:
         """Reconcile active subscriptions with the currently running adapters."""
-        subscriptions = await self._repository.list_listener_subscriptions()
         active_ids: set[UUID] = set()
-        for subscription in subscriptions:
-            claimed, recovered_adapter = await self._prepare_subscription(subscription)
+        if isinstance(self._repository, IncrementalListenerRepository):
+            claims = await self._reconcile_incrementally(self._repository, active_ids)
+        else:
+            claims = [
+                await self._prepare_subscription(subscription)
+                for subscription in (
+                    await self._repository.list_listener_subscriptions()
+                )
+            ]
+        for claimed, recovered_adapter in claims:
             if claimed is None:
                 continue
             active_ids.add(claimed.id)
             if claimed.id in self._tasks:
                 self._build_failures.pop(claimed.id, None)
                 continue
-            stop_event = asyncio.Event()
-            try:
-                adapter = recovered_adapter or self._adapter_factory(claimed)
-            except CredentialReferenceNotFoundError as exc:
-                logger.warning(
-                    "Blocking listener subscription %s until credentials are "
-                    "configured: %s",
-                    claimed.id,
-                    exc,
-                )
-                await self._repository.update_listener_subscription_status(
-                    claimed.id,
-                    status=ListenerSubscriptionStatus.BLOCKED,
-                    actor=self._runtime_id,
-                    last_error=str(exc),
-                )
-                self._build_failures.pop(claimed.id, None)
-                continue
-            except Exception as exc:
-                logger.exception(
-                    "Failed to build listener adapter for subscription %s",
-                    claimed.id,
-                )
-                self._record_build_failure(claimed, exc)
-                await self._repository.release_listener_subscription(
-                    claimed.id,
-                    runtime_id=self._runtime_id,
-                )
-                continue
-            task = asyncio.create_task(
-                self._run_adapter(claimed.id, adapter, stop_event)
-            )
-            self._stop_events[claimed.id] = stop_event
-            self._adapters[claimed.id] = adapter
-            self._tasks[claimed.id] = task
-            self._build_failures.pop(claimed.id, None)
+            await self._start_adapter(claimed, recovered_adapter)
 
         stale_ids = set(self._tasks) - active_ids
         for subscription_id in stale_ids:
@@ -146,6 +164,100 @@ class ListenerSupervisor:
         for subscription_id in set(self._build_failures) - active_ids:
             self._build_failures.pop(subscription_id, None)
 
+    async def _reconcile_incrementally(
+        self,
+        repository: IncrementalListenerRepository,
+        active_ids: set[UUID],
+    ) -> list[tuple[ListenerSubscription | None, ListenerAdapter | None]]:
+        """Renew held leases, claim free subscriptions and retry blocked ones.
+
+        Leases that can no longer be renewed are left out of ``active_ids`` so
+        their adapters are stopped by the caller.
+        """
+        if self._tasks:
+            active_ids.update(
+                await repository.renew_listener_subscription_leases(
+                    list(self._tasks),
+                    runtime_id=self._runtime_id,
+                    lease_seconds=self._lease_seconds,
+                )
+            )
+        await self._follow_change_feed(repository)
+        claims: list[tuple[ListenerSubscription | None, ListenerAdapter | None]] = [
+            (subscription, None)
+            for subscription in await repository.claim_listener_subscriptions(
+                runtime_id=self._runtime_id,
+                lease_seconds=self._lease_seconds,
+            )
+        ]
+        for subscription in list(self._blocked.values()):
+            claimed, adapter = await self._recover_blocked_subscription(subscription)
+            if adapter is not None:
+                self._blocked.pop(subscription.id, None)
+            claims.append((claimed, adapter))
+        return claims
+
+    async def _follow_change_feed(
+        self,
+        repository: IncrementalListenerRepository,
+    ) -> None:
+        """Track blocked subscriptions from changes since the last reconcile."""
+        changes = await repository.list_listener_subscriptions(
+            updated_since=(
+                self._watermark - CHANGE_FEED_OVERLAP
+                if self._watermark is not None
+                else None
+            )
+        )
+        for subscription in changes:
+            if subscription.status == ListenerSubscriptionStatus.BLOCKED:
+                self._blocked[subscription.id] = subscription
+            else:
+                self._blocked.pop(subscription.id, None)
+            if self._watermark is None or subscription.updated_at > self._watermark:
+                self._watermark = subscription.updated_at
+
+    async def _start_adapter(
+        self,
+        claimed: ListenerSubscription,
+        recovered_adapter: ListenerAdapter | None,
+    ) -> None:
+        """Build and launch the adapter for a newly claimed subscription."""
+        stop_event = asyncio.Event()
+        try:
+            adapter = recovered_adapter or self._adapter_factory(claimed)
+        except CredentialReferenceNotFoundError as exc:
+            logger.warning(
+                "Blocking listener subscription %s until credentials are "
+                "configured: %s",
+                claimed.id,
+                exc,
+            )
+            await self._repository.update_listener_subscription_status(
+                claimed.id,
+                status=ListenerSubscriptionStatus.BLOCKED,
+                actor=self._runtime_id,
+                last_error=str(exc),
+            )
+            self._build_failures.pop(claimed.id, None)
+            return
+        except Exception as exc:
+            logger.exception(
+                "Failed to build listener adapter for subscription %s",
+                claimed.id,
+            )
+            self._record_build_failure(claimed, exc)
+            await self._repository.release_listener_subscription(
+                claimed.id,
+                runtime_id=self._runtime_id,
+            )
+            return
+        task = asyncio.create_task(self._run_adapter(claimed.id, adapter, stop_event))
+        self._stop_events[claimed.id] = stop_event
+        self._adapters[claimed.id] = adapter
+        self._tasks[claimed.id] = task
+        self._build_failures.pop(claimed.id, None)
+
     async def _prepare_subscription(
         self,
         subscription: ListenerSubscription,
@@ -209,6 +321,7 @@ class ListenerSupervisor:
         exc: Exception,
     ) -> None:
         """Record a build failure snapshot for one subscription."""
+        LISTENER_ADAPTER_FAILURES.inc()
         previous_failure = self._build_failures.get(subscription.id)
         self._build_failures[subscription.id] = ListenerHealthSnapshot(
             subscription_id=subscription.id,
@@ -256,9 +369,11 @@ class ListenerSupervisor:
         adapter: ListenerAdapter,
         stop_event: asyncio.Event,
     ) -> None:
+        LISTENER_ADAPTERS_ACTIVE.inc()
         try:
             await adapter.run(stop_event)
         finally:
+            LISTENER_ADAPTERS_ACTIVE.dec()
             await self._repository.release_listener_subscription(
                 subscription_id,
                 runtime_id=self._runtime_id,
@@ -277,4 +392,8 @@ class ListenerSupervisor:
         await task
 
 
-__all__ = ["ListenerAdapter", "ListenerSupervisor"]
+__all__ = [
+    "IncrementalListenerRepository",
+    "ListenerAdapter",
+    "ListenerSupervisor",
+]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 import asyncio
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from datetime import datetime
 from typing import Any, Literal, Protocol
 import httpx
@@ -51,12 +51,12 @@ class TelegramListenerRepository(Protocol):
     ) -> ListenerCursor:
         """Persist the latest Telegram polling cursor."""
 
-    async def dispatch_listener_event(
+    async def dispatch_listener_events(
         self,
         subscription_id: object,
-        payload: ListenerDispatchPayload,
-    ) -> object | None:
-        """Dispatch a normalized listener event into the workflow runtime."""
+        payloads: Sequence[ListenerDispatchPayload],
+    ) -> Sequence[object]:
+        """Dispatch normalized listener events into the workflow runtime."""
 
 
 class DefaultTelegramPollingClient:
@@ -165,16 +165,18 @@ class TelegramPollingAdapter:
         )
         self._last_polled_at = _utcnow()
         next_offset = offset
+        batch: list[ListenerDispatchPayload] = []
         for update in updates:
             normalized = normalize_telegram_update(self.subscription, update)
             update_id = update.get("update_id")
             if isinstance(update_id, int):
                 next_offset = update_id + 1
-            if normalized is None:
-                continue
-            await self._repository.dispatch_listener_event(
+            if normalized is not None:
+                batch.append(normalized)
+        if batch:
+            await self._repository.dispatch_listener_events(
                 self.subscription.id,
-                normalized,
+                batch,
             )
             self._last_event_at = _utcnow()
         if next_offset is not None:
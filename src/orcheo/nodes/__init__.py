@@ -1,93 +1,200 @@
-"""Node registry and metadata definitions for Orcheo."""
+"""Node registry and metadata definitions for Orcheo.
 
-from orcheo.nodes.agentensor import AgentensorNode
-from orcheo.nodes.ai import AgentNode, AgentReplyExtractorNode, LLMNode
-from orcheo.nodes.browser import (
-    BrowserActionNode,
-    BrowserCloseNode,
-    BrowserExtractNode,
-    BrowserNavigateNode,
-    BrowserScriptNode,
-    BrowserWaitNode,
-)
-from orcheo.nodes.claude_code import ClaudeCodeNode
-from orcheo.nodes.codex import CodexNode
-from orcheo.nodes.communication import (
-    DiscordWebhookNode,
-    EmailNode,
-    MessageDiscord,
-    MessageDiscordNode,
-    MessageQQ,
-    MessageQQNode,
-)
-from orcheo.nodes.conversational_search import (
-    ChunkEmbeddingNode,
-    ChunkingStrategyNode,
-    DocumentLoaderNode,
-    InMemoryVectorStore,
-    MetadataExtractorNode,
-    PineconeVectorStore,
-    TextEmbeddingNode,
-    VectorStoreUpsertNode,
-)
-from orcheo.nodes.data import (
-    DataTransformNode,
-    HttpRequestNode,
-    JsonProcessingNode,
-    MergeNode,
-)
-from orcheo.nodes.debug import DebugNode
-from orcheo.nodes.deep_agent import DeepAgentNode
-from orcheo.nodes.gemini import GeminiNode
-from orcheo.nodes.javascript_sandbox import JavaScriptSandboxNode
-from orcheo.nodes.lark import LarkSendMessageNode, LarkTenantAccessTokenNode
-from orcheo.nodes.linkedin import LinkedInPostNode
-from orcheo.nodes.listeners import (
-    DiscordBotListenerNode,
-    QQBotListenerNode,
-    TelegramBotListenerNode,
-)
-from orcheo.nodes.logic import (
-    DelayNode,
-    ForLoopNode,
-    SetVariableNode,
-)
-from orcheo.nodes.mongodb import (
-    MongoDBAggregateNode,
-    MongoDBEnsureSearchIndexNode,
-    MongoDBEnsureVectorIndexNode,
-    MongoDBFindNode,
-    MongoDBHybridSearchNode,
-    MongoDBInsertManyNode,
-    MongoDBNode,
-    MongoDBUpdateManyNode,
-    MongoDBUpsertManyNode,
-)
+Node classes are imported lazily: importing this package only declares the
+built-in nodes listed in :mod:`orcheo.nodes.manifest` with the registry, and
+each node module is loaded on first attribute access or registry lookup.
+"""
+
+from __future__ import annotations
+import importlib
+from typing import TYPE_CHECKING, Any
+from orcheo.nodes.manifest import BUILTIN_NODES
 from orcheo.nodes.registry import NodeMetadata, NodeRegistry, registry
-from orcheo.nodes.slack import SlackEventsParserNode, SlackNode
-from orcheo.nodes.storage import (
-    GraphStoreAppendMessageNode,
-    PostgresNode,
-    SQLiteNode,
-    get_graph_store,
-)
-from orcheo.nodes.sub_workflow import SubWorkflowNode
-from orcheo.nodes.telegram import (
-    MessageTelegram,
-    MessageTelegramNode,
-    TelegramEventsParserNode,
-)
-from orcheo.nodes.triggers import (
-    CronTriggerNode,
-    HttpPollingTriggerNode,
-    ManualTriggerNode,
-    WebhookTriggerNode,
-)
-from orcheo.nodes.wecom import (
-    WeComAccessTokenNode,
-    WeComEventsParserNode,
-    WeComSendMessageNode,
-)
+
+
+if TYPE_CHECKING:  # pragma: no cover - import for typing only
+    from orcheo.nodes.agentensor import AgentensorNode
+    from orcheo.nodes.ai import AgentNode, AgentReplyExtractorNode, LLMNode
+    from orcheo.nodes.browser import (
+        BrowserActionNode,
+        BrowserCloseNode,
+        BrowserExtractNode,
+        BrowserNavigateNode,
+        BrowserScriptNode,
+        BrowserWaitNode,
+    )
+    from orcheo.nodes.claude_code import ClaudeCodeNode
+    from orcheo.nodes.codex import CodexNode
+    from orcheo.nodes.communication import (
+        DiscordWebhookNode,
+        EmailNode,
+        MessageDiscord,
+        MessageDiscordNode,
+        MessageQQ,
+        MessageQQNode,
+    )
+    from orcheo.nodes.conversational_search import (
+        ChunkEmbeddingNode,
+        ChunkingStrategyNode,
+        DocumentLoaderNode,
+        InMemoryVectorStore,
+        MetadataExtractorNode,
+        PineconeVectorStore,
+        TextEmbeddingNode,
+        VectorStoreUpsertNode,
+    )
+    from orcheo.nodes.data import (
+        DataTransformNode,
+        HttpRequestNode,
+        JsonProcessingNode,
+        MergeNode,
+    )
+    from orcheo.nodes.debug import DebugNode
+    from orcheo.nodes.deep_agent import DeepAgentNode
+    from orcheo.nodes.gemini import GeminiNode
+    from orcheo.nodes.javascript_sandbox import JavaScriptSandboxNode
+    from orcheo.nodes.lark import LarkSendMessageNode, LarkTenantAccessTokenNode
+    from orcheo.nodes.linkedin import LinkedInPostNode
+    from orcheo.nodes.listeners import (
+        DiscordBotListenerNode,
+        QQBotListenerNode,
+        TelegramBotListenerNode,
+    )
+    from orcheo.nodes.logic import (
+        DelayNode,
+        ForLoopNode,
+        ParallelMapNode,
+        SetVariableNode,
+    )
+    from orcheo.nodes.mongodb import (
+        MongoDBAggregateNode,
+        MongoDBEnsureSearchIndexNode,
+        MongoDBEnsureVectorIndexNode,
+        MongoDBFindNode,
+        MongoDBHybridSearchNode,
+        MongoDBInsertManyNode,
+        MongoDBNode,
+        MongoDBUpdateManyNode,
+        MongoDBUpsertManyNode,
+    )
+    from orcheo.nodes.slack import SlackEventsParserNode, SlackNode
+    from orcheo.nodes.storage import (
+        GraphStoreAppendMessageNode,
+        PostgresNode,
+        SQLiteNode,
+        get_graph_store,
+    )
+    from orcheo.nodes.sub_workflow import SubWorkflowNode
+    from orcheo.nodes.telegram import (
+        MessageTelegram,
+        MessageTelegramNode,
+        TelegramEventsParserNode,
+    )
+    from orcheo.nodes.triggers import (
+        CronTriggerNode,
+        HttpPollingTriggerNode,
+        ManualTriggerNode,
+        WebhookTriggerNode,
+    )
+    from orcheo.nodes.wecom import (
+        WeComAccessTokenNode,
+        WeComEventsParserNode,
+        WeComSendMessageNode,
+    )
+
+
+_LAZY_EXPORTS: dict[str, str] = {
+    "AgentensorNode": "orcheo.nodes.agentensor",
+    "AgentNode": "orcheo.nodes.ai",
+    "AgentReplyExtractorNode": "orcheo.nodes.ai",
+    "LLMNode": "orcheo.nodes.ai",
+    "BrowserActionNode": "orcheo.nodes.browser",
+    "BrowserCloseNode": "orcheo.nodes.browser",
+    "BrowserExtractNode": "orcheo.nodes.browser",
+    "BrowserNavigateNode": "orcheo.nodes.browser",
+    "BrowserScriptNode": "orcheo.nodes.browser",
+    "BrowserWaitNode": "orcheo.nodes.browser",
+    "ClaudeCodeNode": "orcheo.nodes.claude_code",
+    "CodexNode": "orcheo.nodes.codex",
+    "DiscordWebhookNode": "orcheo.nodes.communication",
+    "EmailNode": "orcheo.nodes.communication",
+    "MessageDiscord": "orcheo.nodes.communication",
+    "MessageDiscordNode": "orcheo.nodes.communication",
+    "MessageQQ": "orcheo.nodes.communication",
+    "MessageQQNode": "orcheo.nodes.communication",
+    "ChunkEmbeddingNode": "orcheo.nodes.conversational_search",
+    "ChunkingStrategyNode": "orcheo.nodes.conversational_search",
+    "DocumentLoaderNode": "orcheo.nodes.conversational_search",
+    "InMemoryVectorStore": "orcheo.nodes.conversational_search",
+    "MetadataExtractorNode": "orcheo.nodes.conversational_search",
+    "PineconeVectorStore": "orcheo.nodes.conversational_search",
+    "TextEmbeddingNode": "orcheo.nodes.conversational_search",
+    "VectorStoreUpsertNode": "orcheo.nodes.conversational_search",
+    "DataTransformNode": "orcheo.nodes.data",
+    "HttpRequestNode": "orcheo.nodes.data",
+    "JsonProcessingNode": "orcheo.nodes.data",
+    "MergeNode": "orcheo.nodes.data",
+    "DebugNode": "orcheo.nodes.debug",
+    "DeepAgentNode": "orcheo.nodes.deep_agent",
+    "GeminiNode": "orcheo.nodes.gemini",
+    "JavaScriptSandboxNode": "orcheo.nodes.javascript_sandbox",
+    "LarkSendMessageNode": "orcheo.nodes.lark",
+    "LarkTenantAccessTokenNode": "orcheo.nodes.lark",
+    "LinkedInPostNode": "orcheo.nodes.linkedin",
+    "DiscordBotListenerNode": "orcheo.nodes.listeners",
+    "QQBotListenerNode": "orcheo.nodes.listeners",
+    "TelegramBotListenerNode": "orcheo.nodes.listeners",
+    "DelayNode": "orcheo.nodes.logic",
+    "ForLoopNode": "orcheo.nodes.logic",
+    "ParallelMapNode": "orcheo.nodes.logic",
+    "SetVariableNode": "orcheo.nodes.logic",
+    "MongoDBAggregateNode": "orcheo.nodes.mongodb",
+    "MongoDBEnsureSearchIndexNode": "orcheo.nodes.mongodb",
+    "MongoDBEnsureVectorIndexNode": "orcheo.nodes.mongodb",
+    "MongoDBFindNode": "orcheo.nodes.mongodb",
+    "MongoDBHybridSearchNode": "orcheo.nodes.mongodb",
+    "MongoDBInsertManyNode": "orcheo.nodes.mongodb",
+    "MongoDBNode": "orcheo.nodes.mongodb",
+    "MongoDBUpdateManyNode": "orcheo.nodes.mongodb",
+    "MongoDBUpsertManyNode": "orcheo.nodes.mongodb",
+    "SlackEventsParserNode": "orcheo.nodes.slack",
+    "SlackNode": "orcheo.nodes.slack",
+    "GraphStoreAppendMessageNode": "orcheo.nodes.storage",
+    "PostgresNode": "orcheo.nodes.storage",
+    "SQLiteNode": "orcheo.nodes.storage",
+    "get_graph_store": "orcheo.nodes.storage",
+    "SubWorkflowNode": "orcheo.nodes.sub_workflow",
+    "MessageTelegram": "orcheo.nodes.telegram",
+    "MessageTelegramNode": "orcheo.nodes.telegram",
+    "TelegramEventsParserNode": "orcheo.nodes.telegram",
+    "CronTriggerNode": "orcheo.nodes.triggers",
+    "HttpPollingTriggerNode": "orcheo.nodes.triggers",
+    "ManualTriggerNode": "orcheo.nodes.triggers",
+    "WebhookTriggerNode": "orcheo.nodes.triggers",
+    "WeComAccessTokenNode": "orcheo.nodes.wecom",
+    "WeComEventsParserNode": "orcheo.nodes.wecom",
+    "WeComSendMessageNode": "orcheo.nodes.wecom",
+}
+
+
+def _declare_builtin_nodes() -> None:
+    for module, entries in BUILTIN_NODES.items():
+        for metadata in entries:
+            registry.declare(module, metadata)
+
+
+_declare_builtin_nodes()
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported node classes and helpers on first access."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
 
 
 __all__ = [
@@ -114,6 +221,7 @@ __all__ = [
     "SetVariableNode",
     "DelayNode",
     "ForLoopNode",
+    "ParallelMapNode",
     "MongoDBNode",
     "MongoDBAggregateNode",
     "MongoDBFindNode",
@@ -1,12 +1,15 @@
 """Tools for AI agents."""
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import tool
 from orcheo.graph.state import State
 from orcheo.nodes.agent_tools.context import get_active_tool_config
 from orcheo.nodes.agent_tools.registry import ToolMetadata, tool_registry
-from orcheo.nodes.mongodb import MongoDBFindNode, MongoDBNode
+
+
+if TYPE_CHECKING:  # pragma: no cover - import for typing only
+    from orcheo.nodes.mongodb import MongoDBNode
 
 
 @tool_registry.register(
@@ -23,7 +26,7 @@ def greet_user(username: str) -> str:
 
 
 async def _run_mongodb_node(
-    node: MongoDBNode, config: RunnableConfig | None = None
+    node: "MongoDBNode", config: RunnableConfig | None = None
 ) -> dict[str, Any]:
     if config is None:  # pragma: no branch
         config = get_active_tool_config()
@@ -127,6 +130,8 @@ async def mongodb_update_one(
     tool_config = get_active_tool_config()
     database, collection = _resolve_mongodb_target(database, collection, tool_config)
 
+    from orcheo.nodes.mongodb import MongoDBNode
+
     node = MongoDBNode(
         name="mongodb_update_one",
         operation="update_one",
@@ -176,6 +181,8 @@ async def mongodb_find(
     tool_config = get_active_tool_config()
     database, collection = _resolve_mongodb_target(database, collection, tool_config)
 
+    from orcheo.nodes.mongodb import MongoDBFindNode
+
     node = MongoDBFindNode(
         name="mongodb_find",
         database=database,
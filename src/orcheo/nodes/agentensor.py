@@ -5,6 +5,7 @@ import asyncio
 import inspect
 import json
 import logging
+import time
 from collections.abc import Awaitable, Callable, Mapping, Sequence
 from dataclasses import dataclass
 from typing import Any, Literal, cast
@@ -17,6 +18,7 @@ from agentensor.loss import LLMTensorJudge
 from agentensor.optim import Optimizer
 from agentensor.tensor import TextTensor
 from agentensor.train import GraphTrainer
+from orcheo.agentensor.cache import EvaluationCache, fingerprint
 from orcheo.agentensor.checkpoints import (
     AgentensorCheckpoint,
     AgentensorCheckpointStore,
@@ -136,6 +138,19 @@ class _EvaluatorAdapter(
         )
 
 
+@dataclass
+class _EvaluationRun:
+    """Shared resources for a single streamed evaluation run."""
+
+    trainer: GraphTrainer
+    evaluators: list[tuple[EvaluatorDefinition, Any]]
+    case_semaphore: asyncio.Semaphore
+    evaluator_semaphore: asyncio.Semaphore
+    cache: EvaluationCache | None
+    prompt_version: str
+    base_state: State
+
+
 @registry.register(
     NodeMetadata(
         name="AgentensorNode",
@@ -168,6 +183,18 @@ class AgentensorNode(TaskNode):
         ge=1,
         description="Optional cap on the number of cases to run.",
     )
+    max_evaluator_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum number of evaluator calls running at the same time.",
+    )
+    cache_dir: str | None = Field(
+        default=None,
+        description=(
+            "Optional directory caching case outputs and evaluator results so "
+            "re-runs skip unchanged work."
+        ),
+    )
     compiled_graph: Any | None = Field(
         default=None,
         exclude=True,
@@ -241,19 +268,17 @@ class AgentensorNode(TaskNode):
     ) -> dict[str, Any]:
         assert self.dataset is not None
         compiled_graph = self._require_compiled_graph()
-        dataset = self._build_pydantic_dataset()
         runtime_prompts = build_text_tensors(self.prompts)
+        max_concurrency = min(self.optimizer.max_concurrency, self._max_concurrency_cap)
         trainer = GraphTrainer(
             graph=compiled_graph,
-            dataset=dataset,
+            dataset=Dataset(cases=[]),
             optimizer=None,
             epochs=1,
             runtime_prompts=runtime_prompts,
             base_state=state if isinstance(state, Mapping) else {},
             graph_config=config,
-            max_concurrency=min(
-                self.optimizer.max_concurrency, self._max_concurrency_cap
-            ),
+            max_concurrency=max_concurrency,
             case_timeout=self.optimizer.case_timeout_seconds,
             script_format=bool(
                 self.graph_config
@@ -261,9 +286,58 @@ class AgentensorNode(TaskNode):
                 and self.graph_config.get("format") == LANGGRAPH_SCRIPT_FORMAT
             ),
         )
+        cases = list(self.dataset.cases)
+        if self.max_cases is not None:
+            cases = cases[: self.max_cases]
+        run = _EvaluationRun(
+            trainer=trainer,
+            evaluators=self._resolve_evaluators(),
+            case_semaphore=asyncio.Semaphore(max_concurrency),
+            evaluator_semaphore=asyncio.Semaphore(self.max_evaluator_concurrency),
+            cache=EvaluationCache(self.cache_dir) if self.cache_dir else None,
+            prompt_version=fingerprint(
+                {
+                    "workflow_id": self.workflow_id,
+                    "graph_config": self.graph_config,
+                    "prompts": {
+                        name: prompt.model_dump(mode="json")
+                        for name, prompt in self.prompts.items()
+                    },
+                }
+            ),
+            base_state=state,
+        )
+
+        aggregated: dict[str, list[float]] = {
+            definition.id: [] for definition in self.evaluators
+        }
+        case_results: list[dict[str, Any]] = []
+        tasks = [
+            asyncio.create_task(self._evaluate_streamed_case(run, index, case))
+            for index, case in enumerate(cases)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                case_result = await next_done
+                case_results.append(case_result)
+                evaluations = case_result["evaluations"]
+                for evaluator_id in aggregated:
+                    outcome = evaluations.get(evaluator_id)
+                    aggregated[evaluator_id].append(
+                        0.0 if outcome is None else outcome["score"]
+                    )
+                await self._emit_progress(
+                    {
+                        "node": self.name,
+                        "event": "evaluation_progress",
+                        "payload": case_result,
+                    }
+                )
+        finally:
+            for task in tasks:
+                task.cancel()
+        case_results.sort(key=lambda item: item["case_index"])
 
-        report = await asyncio.to_thread(trainer.evaluate, "train", self.max_cases)
-        aggregated, case_results = await self._collect_evaluation_results(report)
         summary = self._summarize_metrics(aggregated)
         summary_payload = {
             "node": self.name,
@@ -282,6 +356,94 @@ class AgentensorNode(TaskNode):
             "results": case_results,
         }
 
+    async def _evaluate_streamed_case(
+        self,
+        run: _EvaluationRun,
+        index: int,
+        case: EvaluationCase,
+    ) -> dict[str, Any]:
+        merged_inputs = self._merge_inputs(run.base_state, case)
+        case_key = fingerprint(
+            {
+                "inputs": merged_inputs,
+                "expected_output": case.expected_output,
+                "metadata": case.metadata,
+            }
+        )
+        cached_output = (
+            run.cache.get_output(case_key, run.prompt_version) if run.cache else None
+        )
+        cached = cached_output is not None
+        if cached_output is not None:
+            output_payload, duration_ms = cached_output
+        else:
+            try:
+                async with run.case_semaphore:
+                    started = time.perf_counter()
+                    tensor = await run.trainer.forward(case.inputs)
+                    duration_ms = (time.perf_counter() - started) * 1000.0
+            except Exception as exc:
+                return {
+                    "case_index": index,
+                    "error": str(exc) or type(exc).__name__,
+                    "duration_ms": 0.0,
+                    "evaluations": {},
+                }
+            output_payload = tensor.metadata.get("payload", tensor.text)
+            if run.cache is not None:
+                run.cache.set_output(
+                    case_key, run.prompt_version, output_payload, duration_ms
+                )
+
+        context = EvaluationContext(
+            inputs=case.inputs,
+            output=output_payload,
+            expected_output=case.expected_output,
+            metadata=case.metadata,
+            duration_ms=duration_ms,
+        )
+        evaluations: dict[str, dict[str, Any]] = {}
+        pending: list[tuple[EvaluatorDefinition, Any]] = []
+        for definition, evaluator in run.evaluators:
+            outcome = (
+                run.cache.get_outcome(
+                    case_key, run.prompt_version, fingerprint(definition.model_dump())
+                )
+                if run.cache
+                else None
+            )
+            if outcome is None:
+                pending.append((definition, evaluator))
+            else:
+                evaluations[definition.id] = outcome
+        fresh = await self._evaluate_case(
+            pending,
+            context,
+            aggregated={},
+            semaphore=run.evaluator_semaphore,
+        )
+        if run.cache is not None:
+            for definition, _ in pending:
+                run.cache.set_outcome(
+                    case_key,
+                    run.prompt_version,
+                    fingerprint(definition.model_dump()),
+                    fresh[definition.id],
+                )
+        evaluations.update(fresh)
+        return {
+            "case_index": index,
+            "inputs": case.inputs,
+            "output": output_payload,
+            "evaluations": {
+                definition.id: evaluations[definition.id]
+                for definition, _ in run.evaluators
+            },
+            "metadata": case.metadata or {},
+            "duration_ms": duration_ms,
+            "cached": cached and not pending,
+        }
+
     async def _run_training(
         self,
         state: State,
@@ -436,66 +598,6 @@ class AgentensorNode(TaskNode):
         ]
         return Dataset(cases=converted_cases, evaluators=evaluators)
 
-    async def _collect_evaluation_results(
-        self, report: EvaluationReport
-    ) -> tuple[dict[str, list[float]], list[dict[str, Any]]]:
-        aggregated: dict[str, list[float]] = {
-            definition.id: [] for definition in self.evaluators
-        }
-        case_results: list[dict[str, Any]] = []
-        for index, case in enumerate(report.cases):
-            evaluations: dict[str, dict[str, Any]] = {}
-            for eval_name, evaluation in case.assertions.items():
-                passed = bool(evaluation.value)
-                evaluations[eval_name] = {
-                    "score": 1.0 if passed else 0.0,
-                    "passed": passed,
-                    "reason": evaluation.reason,
-                }
-                aggregated.setdefault(eval_name, []).append(1.0 if passed else 0.0)
-            output_payload = case.output
-            if isinstance(output_payload, TextTensor):  # pragma: no branch
-                output_payload = output_payload.metadata.get(
-                    "payload", output_payload.text
-                )
-            duration_ms = case.task_duration * 1000.0
-            case_result = {
-                "case_index": index,
-                "inputs": case.inputs,
-                "output": output_payload,
-                "evaluations": evaluations,
-                "metadata": case.metadata or {},
-                "duration_ms": duration_ms,
-            }
-            case_results.append(case_result)
-            await self._emit_progress(
-                {
-                    "node": self.name,
-                    "event": "evaluation_progress",
-                    "payload": case_result,
-                }
-            )
-
-        for failure in report.failures:
-            case_result = {
-                "case_index": len(case_results),
-                "error": failure.error_message,
-                "duration_ms": 0.0,
-                "evaluations": {},
-            }
-            case_results.append(case_result)
-            for evaluator_id in aggregated:
-                aggregated[evaluator_id].append(0.0)
-            await self._emit_progress(
-                {
-                    "node": self.name,
-                    "event": "evaluation_progress",
-                    "payload": case_result,
-                }
-            )
-
-        return aggregated, case_results
-
     def _sync_trained_prompts(self, runtime_prompts: Mapping[str, TextTensor]) -> None:
         for name, tensor in runtime_prompts.items():
             prompt = self.prompts.get(name)
@@ -571,10 +673,21 @@ class AgentensorNode(TaskNode):
         context: EvaluationContext,
         *,
         aggregated: dict[str, list[float]],
+        semaphore: asyncio.Semaphore | None = None,
     ) -> dict[str, dict[str, Any]]:
+        async def _bounded(
+            definition: EvaluatorDefinition, evaluator: Any
+        ) -> dict[str, Any]:
+            if semaphore is None:
+                return await self._run_evaluator(definition, evaluator, context)
+            async with semaphore:
+                return await self._run_evaluator(definition, evaluator, context)
+
+        outcomes = await asyncio.gather(
+            *(_bounded(definition, evaluator) for definition, evaluator in evaluators)
+        )
         evaluations: dict[str, dict[str, Any]] = {}
-        for definition, evaluator in evaluators:
-            outcome = await self._run_evaluator(definition, evaluator, context)
+        for (definition, _), outcome in zip(evaluators, outcomes, strict=True):
             evaluations[definition.id] = outcome
             aggregated.setdefault(definition.id, []).append(outcome["score"])
         return evaluations
@@ -586,12 +699,22 @@ class AgentensorNode(TaskNode):
         context: EvaluationContext,
     ) -> dict[str, Any]:
         try:
-            if hasattr(evaluator, "evaluate"):
+            if isinstance(evaluator, LLMTensorJudge):
+                adapter = _EvaluatorAdapter(definition=definition, evaluator=evaluator)
+                judge_context = _TensorEvaluatorContext(
+                    inputs=context.inputs,
+                    output=context.output,
+                    expected_output=context.expected_output,
+                    metadata=context.metadata,
+                    duration=context.duration_ms / 1000.0,
+                )
+                candidate = adapter.evaluate(cast(Any, judge_context))
+            elif hasattr(evaluator, "evaluate"):
                 candidate = evaluator.evaluate(context)
             else:
                 candidate = evaluator(context)
             result = await candidate if inspect.iscoroutine(candidate) else candidate
-        except Exception as exc:  # pragma: no cover - defensive logging
+        except Exception as exc:
             logger.exception(
                 "Evaluator %s failed while scoring case.", definition.id, exc_info=exc
             )
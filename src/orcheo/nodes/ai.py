@@ -316,7 +316,7 @@ class AgentNode(AINode):
         for key, value in self.__dict__.items():
             if key in self._DEFERRED_DECODE_FIELDS:
                 continue
-            decoded = self._decode_value(value, state)
+            decoded = self._decode_field(key, value, state)
             if decoded is not value:
                 updates[key] = decoded
         return updates
@@ -331,7 +331,7 @@ class AgentNode(AINode):
         for key, value in self.__dict__.items():
             if key in self._DEFERRED_DECODE_FIELDS:
                 continue
-            self.__dict__[key] = self._decode_value(value, state)
+            self.__dict__[key] = self._decode_field(key, value, state)
         self.__dict__.update(self._runtime_run_updates(config))
 
     @field_serializer("system_prompt", when_used="json")
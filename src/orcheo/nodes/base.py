@@ -1,12 +1,21 @@
 """Base node implementation for Orcheo."""
 
+import asyncio
 import logging
 import re
 from abc import abstractmethod
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Mapping, Sequence
+from functools import lru_cache
 from typing import Any, ClassVar, Self, cast
 from langchain_core.runnables import RunnableConfig
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
+from orcheo.graph.blobs import (
+    BlobResolvingDict,
+    aoffload_result,
+    is_blob_ref,
+    load_blob,
+    with_resolved_blobs,
+)
 from orcheo.graph.state import State
 from orcheo.nodes.registry import NodeMetadata, registry
 from orcheo.runtime.credentials import (
@@ -25,6 +34,218 @@ from orcheo.tracing.model_metadata import (
 logger = logging.getLogger(__name__)
 _SINGLE_TEMPLATE_PATTERN = re.compile(r"^\s*\{\{\s*([^{}]+?)\s*\}\}\s*$")
 _TEMPLATE_PATTERN = re.compile(r"\{\{\s*([^{}]+?)\s*\}\}")
+_SCALAR_TYPES = frozenset({str, int, float, bool})
+
+
+class _ResolutionPlan:
+    """Resolution steps for the parts of a value that hold templates.
+
+    Plans are compiled once per field value and replayed on every run, so
+    values without templates or credential placeholders are never walked.
+    """
+
+    __slots__ = ()
+
+    def apply(self, runnable: "BaseRunnable", value: Any, state: State) -> Any:
+        """Return ``value`` resolved against ``state``."""
+        raise NotImplementedError  # pragma: no cover
+
+
+class _CredentialPlan(_ResolutionPlan):
+    __slots__ = ("reference",)
+
+    def __init__(self, reference: CredentialReference) -> None:
+        self.reference = reference
+
+    def apply(self, runnable: "BaseRunnable", value: Any, state: State) -> Any:
+        return runnable._resolve_credential_reference(self.reference)
+
+
+class _SingleTemplatePlan(_ResolutionPlan):
+    """A string consisting of one ``{{ path }}`` template; keeps native types."""
+
+    __slots__ = ("path",)
+
+    def __init__(self, path: tuple[str, ...]) -> None:
+        self.path = path
+
+    def apply(self, runnable: "BaseRunnable", value: Any, state: State) -> Any:
+        resolved, is_resolved = runnable._resolve_state_template_parts(
+            self.path, value, state
+        )
+        if not is_resolved:
+            return value
+        return runnable._resolve_nested_credential_string(resolved)
+
+
+class _InterpolationPlan(_ResolutionPlan):
+    """A string mixing literal text with ``(path, template)`` segments."""
+
+    __slots__ = ("segments",)
+
+    def __init__(self, segments: tuple[str | tuple[tuple[str, ...], str], ...]) -> None:
+        self.segments = segments
+
+    def apply(self, runnable: "BaseRunnable", value: Any, state: State) -> Any:
+        parts: list[str] = []
+        changed = False
+        for segment in self.segments:
+            if isinstance(segment, str):
+                parts.append(segment)
+                continue
+            path, template = segment
+            resolved, is_resolved = runnable._resolve_state_template_parts(
+                path, template, state
+            )
+            if is_resolved:
+                resolved = runnable._resolve_nested_credential_string(resolved)
+            if not is_resolved or not isinstance(resolved, str | int | float | bool):
+                parts.append(template)
+                continue
+            parts.append(str(resolved))
+            changed = True
+        return "".join(parts) if changed else value
+
+
+class _ContainerPlan(_ResolutionPlan):
+    """Plans for the children of a dict, list or model that hold templates."""
+
+    __slots__ = ("children",)
+
+    def __init__(self, children: tuple[tuple[Any, _ResolutionPlan], ...]) -> None:
+        self.children = children
+
+    def _changed(
+        self, runnable: "BaseRunnable", value: Any, state: State
+    ) -> dict[Any, Any]:
+        changed: dict[Any, Any] = {}
+        for key, plan in self.children:
+            try:
+                original = self._child(value, key)
+            except (KeyError, IndexError, AttributeError):
+                continue
+            decoded = plan.apply(runnable, original, state)
+            if decoded is not original:
+                changed[key] = decoded
+        return changed
+
+    @staticmethod
+    def _child(value: Any, key: Any) -> Any:
+        return value[key]
+
+
+class _DictPlan(_ContainerPlan):
+    __slots__ = ()
+
+    def apply(self, runnable: "BaseRunnable", value: Any, state: State) -> Any:
+        changed = self._changed(runnable, value, state)
+        return {**value, **changed} if changed else value
+
+
+class _ListPlan(_ContainerPlan):
+    __slots__ = ()
+
+    def apply(self, runnable: "BaseRunnable", value: Any, state: State) -> Any:
+        changed = self._changed(runnable, value, state)
+        if not changed:
+            return value
+        decoded = list(value)
+        for index, item in changed.items():
+            decoded[index] = item
+        return decoded
+
+
+class _ModelPlan(_ContainerPlan):
+    __slots__ = ()
+
+    @staticmethod
+    def _child(value: Any, key: Any) -> Any:
+        return getattr(value, key)
+
+    def apply(self, runnable: "BaseRunnable", value: Any, state: State) -> Any:
+        changed = self._changed(runnable, value, state)
+        return value.model_copy(update=changed) if changed else value
+
+
+def _split_path(path: str) -> tuple[str, ...]:
+    return tuple(path.strip().split("."))
+
+
+@lru_cache(maxsize=4096)
+def _compile_string_plan(value: str) -> _ResolutionPlan | None:
+    """Return the plan for a string, or ``None`` when it needs no resolution."""
+    reference = parse_credential_reference(value)
+    if reference is not None:
+        return _CredentialPlan(reference)
+    if "{{" not in value or "}}" not in value:
+        return None
+    single_template_match = _SINGLE_TEMPLATE_PATTERN.fullmatch(value)
+    if single_template_match is not None:
+        return _SingleTemplatePlan(_split_path(single_template_match.group(1)))
+    segments: list[str | tuple[tuple[str, ...], str]] = []
+    position = 0
+    for match in _TEMPLATE_PATTERN.finditer(value):
+        if match.start() > position:
+            segments.append(value[position : match.start()])
+        segments.append((_split_path(match.group(1)), match.group(0)))
+        position = match.end()
+    if position == 0:
+        return None
+    if position < len(value):
+        segments.append(value[position:])
+    return _InterpolationPlan(tuple(segments))
+
+
+def _compile_plan(value: Any) -> _ResolutionPlan | None:
+    """Return the resolution plan for ``value`` (``None`` if nothing resolves)."""
+    if isinstance(value, CredentialReference):
+        return _CredentialPlan(value)
+    if isinstance(value, str):
+        return _compile_string_plan(value)
+    children: tuple[tuple[Any, _ResolutionPlan], ...]
+    if isinstance(value, BaseModel):
+        children = _compile_children(
+            (name, getattr(value, name)) for name in value.__class__.model_fields
+        )
+        return _ModelPlan(children) if children else None
+    if isinstance(value, dict):
+        children = _compile_children(value.items())
+        return _DictPlan(children) if children else None
+    if isinstance(value, list):
+        children = _compile_children(enumerate(value))
+        return _ListPlan(children) if children else None
+    return None
+
+
+def _compile_children(
+    items: Iterable[tuple[Any, Any]],
+) -> tuple[tuple[Any, _ResolutionPlan], ...]:
+    compiled: list[tuple[Any, _ResolutionPlan]] = []
+    for key, item in items:
+        plan = _compile_plan(item)
+        if plan is not None:
+            compiled.append((key, plan))
+    return tuple(compiled)
+
+
+class _PlanCache:
+    """Field resolution plans keyed by the field value they were compiled for.
+
+    The cache is derived data: it never affects model equality and is replaced
+    rather than mutated, so copies made by ``model_copy`` do not share updates.
+    """
+
+    __slots__ = ("entries",)
+
+    def __init__(
+        self, entries: dict[str, tuple[Any, _ResolutionPlan | None]] | None = None
+    ) -> None:
+        self.entries = entries or {}
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _PlanCache)
+
+    __hash__ = object.__hash__
 
 
 class BaseRunnable(BaseModel):
@@ -40,6 +261,8 @@ class BaseRunnable(BaseModel):
     name: str
     """Unique name of the runnable."""
 
+    _resolution_plans: _PlanCache = PrivateAttr(default_factory=_PlanCache)
+
     def _decode_value(
         self,
         value: Any,
@@ -50,54 +273,15 @@ class BaseRunnable(BaseModel):
         Identity-preserving: returns the *same* object when no resolution
         is needed, enabling cheap ``is`` checks for copy-on-write callers.
         """
-        if isinstance(value, CredentialReference):
-            return self._resolve_credential_reference(value)
-        if isinstance(value, str):
-            return self._decode_string_value(value, state)
-        if isinstance(value, BaseModel):
-            return self._decode_model_value(value, state)
-        if isinstance(value, dict):
-            return self._decode_dict_value(value, state)
-        if isinstance(value, list):
-            return self._decode_list_value(value, state)
-        return value
-
-    def _decode_model_value(self, value: BaseModel, state: State) -> BaseModel:
-        """Decode a nested Pydantic model, returning the same object if unchanged."""
-        changed: dict[str, Any] = {}
-        for field_name in value.__class__.model_fields:
-            original = getattr(value, field_name)
-            decoded = self._decode_value(original, state)
-            if decoded is not original:
-                changed[field_name] = decoded
-        return value.model_copy(update=changed) if changed else value
-
-    def _decode_dict_value(self, value: dict[str, Any], state: State) -> dict[str, Any]:
-        """Decode a dict, returning the same object if no values changed."""
-        new_dict: dict[str, Any] = {}
-        any_changed = False
-        for k, v in value.items():
-            decoded = self._decode_value(v, state)
-            new_dict[k] = decoded
-            if decoded is not v:
-                any_changed = True
-        return new_dict if any_changed else value
-
-    def _decode_list_value(self, value: list[Any], state: State) -> list[Any]:
-        """Decode a list, returning the same object if no items changed."""
-        new_list: list[Any] = []
-        any_changed = False
-        for item in value:
-            decoded = self._decode_value(item, state)
-            new_list.append(decoded)
-            if decoded is not item:
-                any_changed = True
-        return new_list if any_changed else value
+        plan = _compile_plan(value)
+        if plan is None:
+            return value
+        return plan.apply(self, value, state)
 
     def _decoded_updates(self, state: State) -> dict[str, Any]:
         """Return decoded field values without mutating the runnable."""
         return {
-            key: self._decode_value(value, state)
+            key: self._decode_field(key, value, state)
             for key, value in self.__dict__.items()
         }
 
@@ -116,37 +300,29 @@ class BaseRunnable(BaseModel):
         state: State,
     ) -> Any:
         """Return decoded value for placeholders or state templates."""
-        reference = parse_credential_reference(value)
-        if reference is not None:
-            return self._resolve_credential_reference(reference)
-        if "{{" not in value or "}}" not in value:
+        plan = _compile_string_plan(value)
+        if plan is None:
             return value
+        return plan.apply(self, value, state)
 
-        single_template_match = _SINGLE_TEMPLATE_PATTERN.fullmatch(value)
-        if single_template_match is not None:
-            resolved, is_resolved = self._resolve_state_template_path(
-                single_template_match.group(1).strip(),
-                value,
-                state,
-            )
-            if not is_resolved:
-                return value
-            return self._resolve_nested_credential_string(resolved)
-
-        def _replace(match: re.Match[str]) -> str:
-            template = match.group(0)
-            resolved, is_resolved = self._resolve_state_template_path(
-                match.group(1).strip(),
-                template,
-                state,
-            )
-            if is_resolved:
-                resolved = self._resolve_nested_credential_string(resolved)
-            if not is_resolved or not isinstance(resolved, str | int | float | bool):
-                return template
-            return str(resolved)
+    def _decode_field(self, key: str, value: Any, state: State) -> Any:
+        """Decode field ``key`` by replaying its cached resolution plan.
 
-        return _TEMPLATE_PATTERN.sub(_replace, value)
+        The plan is compiled on first use and reused for as long as the field
+        holds the same object, so per-run decoding only visits the paths that
+        contain templates or credential placeholders. Reassigning the field
+        recompiles it; nested values should not be mutated in place.
+        """
+        cache = self._resolution_plans
+        entry = cache.entries.get(key)
+        if entry is not None and entry[0] is value:
+            plan = entry[1]
+        else:
+            plan = _compile_plan(value)
+            self._resolution_plans = _PlanCache({**cache.entries, key: (value, plan)})
+        if plan is None:
+            return value
+        return plan.apply(self, value, state)
 
     def _resolve_state_template_path(
         self,
@@ -158,9 +334,21 @@ class BaseRunnable(BaseModel):
 
         Returns the resolved value and whether resolution succeeded.
         """
-        path_parts = path_str.split(".")
+        return self._resolve_state_template_parts(
+            tuple(path_str.split(".")), template_text, state
+        )
+
+    def _resolve_state_template_parts(
+        self,
+        path_parts: Sequence[str],
+        template_text: str,
+        state: State,
+    ) -> tuple[Any, bool]:
+        """Resolve pre-split ``path_parts`` against workflow ``state``."""
         result: Any = state
         for index, part in enumerate(path_parts):
+            if is_blob_ref(result):
+                result = load_blob(result)
             if isinstance(result, dict) and part in result:
                 result = result.get(part)
                 continue
@@ -179,11 +367,13 @@ class BaseRunnable(BaseModel):
                 part,
             )
             return None, False
+        if is_blob_ref(result):
+            result = load_blob(result)
         return result, True
 
     @staticmethod
     def _fallback_to_results(
-        path_parts: list[str],
+        path_parts: Sequence[str],
         index: int,
         state: State,
     ) -> Any | None:
@@ -225,7 +415,7 @@ class BaseRunnable(BaseModel):
         """
         updates: dict[str, Any] = {}
         for key, value in self.__dict__.items():
-            decoded = self._decode_value(value, state)
+            decoded = self._decode_field(key, value, state)
             if decoded is not value:
                 updates[key] = decoded
         return updates
@@ -247,6 +437,23 @@ class BaseRunnable(BaseModel):
             return self
         return cast(Self, self.model_copy(update=changed))
 
+    async def aresolved_for_run(
+        self,
+        state: State,
+        *,
+        config: Mapping[str, Any] | None = None,
+    ) -> Self:
+        """Return :meth:`resolved_for_run` without blocking on blob loads.
+
+        Resolution runs in a worker thread when ``state`` carries offloaded
+        results (see :func:`~orcheo.graph.blobs.with_resolved_blobs`), since
+        templates that reach them read the blob store.
+        """
+        results = state.get("results") if isinstance(state, Mapping) else None
+        if not isinstance(results, BlobResolvingDict):
+            return self.resolved_for_run(state, config=config)
+        return await asyncio.to_thread(self.resolved_for_run, state, config=config)
+
     def _runtime_run_updates(
         self,
         config: Mapping[str, Any] | None,
@@ -292,7 +499,13 @@ class BaseNode(BaseRunnable):
         pass  # pragma: no cover
 
     def _serialize_result(self, value: Any) -> Any:
-        """Convert Pydantic models inside outputs into serializable primitives."""
+        """Convert Pydantic models inside outputs into serializable primitives.
+
+        Plain JSON values are returned as-is; containers are only copied when
+        one of their items had to be converted.
+        """
+        if value is None or type(value) in _SCALAR_TYPES:
+            return value
         if isinstance(value, BaseModel):
             computed_fields = getattr(
                 value.__class__, "__pydantic_computed_fields__", {}
@@ -306,15 +519,45 @@ class BaseNode(BaseRunnable):
                     dumped.pop(key)
             return self._serialize_result(dumped)
         if isinstance(value, Mapping):
-            return {key: self._serialize_result(val) for key, val in value.items()}
+            return self._serialize_mapping(value)
         if isinstance(value, tuple):
             return tuple(self._serialize_result(item) for item in value)
         if isinstance(value, Sequence) and not isinstance(
             value, str | bytes | bytearray
         ):
-            return [self._serialize_result(item) for item in value]
+            return self._serialize_sequence(value)
         return value
 
+    def _serialize_mapping(self, value: Mapping[Any, Any]) -> dict[Any, Any]:
+        """Serialize a mapping, returning plain dicts unchanged when possible."""
+        if type(value) is not dict:
+            return {key: self._serialize_result(val) for key, val in value.items()}
+        copied: dict[Any, Any] | None = None
+        for key, item in value.items():
+            if item is None or type(item) in _SCALAR_TYPES:
+                continue
+            serialized = self._serialize_result(item)
+            if serialized is not item:
+                if copied is None:
+                    copied = dict(value)
+                copied[key] = serialized
+        return value if copied is None else copied
+
+    def _serialize_sequence(self, value: Sequence[Any]) -> list[Any]:
+        """Serialize a sequence, returning plain lists unchanged when possible."""
+        if type(value) is not list:
+            return [self._serialize_result(item) for item in value]
+        copied: list[Any] | None = None
+        for index, item in enumerate(value):
+            if item is None or type(item) in _SCALAR_TYPES:
+                continue
+            serialized = self._serialize_result(item)
+            if serialized is not item:
+                if copied is None:
+                    copied = list(value)
+                copied[index] = serialized
+        return value if copied is None else copied
+
     def _set_trace_metadata_for_run(self, metadata: Mapping[str, Any] | None) -> None:
         """Store trace metadata to attach to this node's next emitted payload."""
         if not metadata:
@@ -392,7 +635,8 @@ class AINode(BaseNode):
 
     async def __call__(self, state: State, config: RunnableConfig) -> dict[str, Any]:
         """Execute the node and wrap the result in a messages key."""
-        runnable = self.resolved_for_run(state, config=config)
+        state = with_resolved_blobs(state)
+        runnable = await self.aresolved_for_run(state, config=config)
         runnable._clear_trace_metadata_for_run()
         try:
             result = await runnable.run(state, config)
@@ -412,15 +656,20 @@ class TaskNode(BaseNode):
     """Base class for all nodes that need to define their own run method."""
 
     async def __call__(self, state: State, config: RunnableConfig) -> dict[str, Any]:
-        """Execute the node and wrap the result in a outputs key."""
-        runnable = self.resolved_for_run(state, config=config)
+        """Execute the node and wrap the result in a outputs key.
+
+        Large result values are offloaded to the configured blob store (see
+        :mod:`orcheo.graph.blobs`) and kept in state as references.
+        """
+        state = with_resolved_blobs(state)
+        runnable = await self.aresolved_for_run(state, config=config)
         runnable._clear_trace_metadata_for_run()
         try:
             result = await runnable.run(state, config)
         except Exception:
             runnable._clear_trace_metadata_for_run()
             raise
-        serialized_result = runnable._serialize_result(result)
+        serialized_result = await aoffload_result(runnable._serialize_result(result))
         output: dict[str, Any] = {"results": {self.name: serialized_result}}
         return cast(dict[str, Any], runnable._attach_trace_metadata(output))
 
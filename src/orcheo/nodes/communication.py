@@ -6,7 +6,6 @@ import smtplib
 from collections.abc import Mapping
 from email.message import EmailMessage
 from typing import Any
-import httpx
 from langchain_core.messages import BaseMessage
 from langchain_core.runnables import RunnableConfig
 from pydantic import Field
@@ -14,6 +13,7 @@ from orcheo.graph.state import State
 from orcheo.listeners.qq import DefaultQQAccessTokenProvider
 from orcheo.nodes.base import TaskNode
 from orcheo.nodes.registry import NodeMetadata, registry
+from orcheo.runtime.http_clients import get_http_client
 
 
 @registry.register(
@@ -134,9 +134,9 @@ class DiscordWebhookNode(TaskNode):
         if self.embeds is not None:
             payload["embeds"] = self.embeds
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(self.webhook_url, json=payload)
-            response.raise_for_status()
+        client = get_http_client(timeout=self.timeout)
+        response = await client.post(self.webhook_url, json=payload)
+        response.raise_for_status()
 
         return {
             "status_code": response.status_code,
@@ -193,20 +193,17 @@ class MessageDiscordNode(TaskNode):
         if self.reply_to_message_id is not None:
             payload["message_reference"] = {"message_id": self.reply_to_message_id}
 
-        async with httpx.AsyncClient(
-            base_url="https://discord.com/api/v10",
-            timeout=self.timeout,
+        client = get_http_client(timeout=self.timeout)
+        response = await client.post(
+            f"https://discord.com/api/v10/channels/{self.channel_id}/messages",
+            json=payload,
             headers={
                 "Authorization": f"Bot {self.token}",
                 "Content-Type": "application/json",
             },
-        ) as client:
-            response = await client.post(
-                f"/channels/{self.channel_id}/messages",
-                json=payload,
-            )
-            response.raise_for_status()
-            body = response.json()
+        )
+        response.raise_for_status()
+        body = response.json()
 
         message_id = body.get("id") if isinstance(body, dict) else None
         channel_id = body.get("channel_id") if isinstance(body, dict) else None
@@ -297,17 +294,17 @@ class MessageQQNode(TaskNode):
             msg = "QQ openid, group_openid, or channel_id is required"
             raise ValueError(msg)
 
-        async with httpx.AsyncClient(
-            base_url=base_url,
-            timeout=self.timeout,
+        client = get_http_client(timeout=self.timeout)
+        response = await client.post(
+            f"{base_url}{endpoint}",
+            json=payload,
             headers={
                 "Authorization": f"QQBot {access_token}",
                 "Content-Type": "application/json",
             },
-        ) as client:
-            response = await client.post(endpoint, json=payload)
-            response.raise_for_status()
-            body = response.json()
+        )
+        response.raise_for_status()
+        body = response.json()
 
         message_id = body.get("id") if isinstance(body, dict) else None
         return {
@@ -2,6 +2,8 @@
 
 # ruff: noqa: F401
 
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any
 from orcheo.nodes.conversational_search.conversation import (
     AnswerCachingNode,
     BaseMemoryStore,
@@ -70,23 +72,54 @@ from orcheo.nodes.conversational_search.vector_store import (
     InMemoryVectorStore,
     PineconeVectorStore,
 )
-from orcheo.nodes.evaluation import (  # pragma: no cover
-    ABTestingNode,
-    AnalyticsExportNode,
-    AnswerQualityEvaluationNode,
-    DataAugmentationNode,
-    DatasetNode,
-    FailureAnalysisNode,
-    FeedbackIngestionNode,
-    LLMJudgeNode,
-    MemoryPrivacyNode,
-    PolicyComplianceNode,
-    RetrievalEvaluationNode,
-    TurnAnnotationNode,
-    UserFeedbackCollectionNode,
+
+
+if TYPE_CHECKING:  # pragma: no cover - import for typing only
+    from orcheo.nodes.evaluation import (
+        ABTestingNode,
+        AnalyticsExportNode,
+        AnswerQualityEvaluationNode,
+        DataAugmentationNode,
+        DatasetNode,
+        FailureAnalysisNode,
+        FeedbackIngestionNode,
+        LLMJudgeNode,
+        MemoryPrivacyNode,
+        PolicyComplianceNode,
+        RetrievalEvaluationNode,
+        TurnAnnotationNode,
+        UserFeedbackCollectionNode,
+    )
+
+
+_EVALUATION_EXPORTS = frozenset(
+    {
+        "ABTestingNode",
+        "AnalyticsExportNode",
+        "AnswerQualityEvaluationNode",
+        "DataAugmentationNode",
+        "DatasetNode",
+        "FailureAnalysisNode",
+        "FeedbackIngestionNode",
+        "LLMJudgeNode",
+        "MemoryPrivacyNode",
+        "PolicyComplianceNode",
+        "RetrievalEvaluationNode",
+        "TurnAnnotationNode",
+        "UserFeedbackCollectionNode",
+    }
 )
 
 
+def __getattr__(name: str) -> Any:
+    """Re-export evaluation nodes lazily; they import this package themselves."""
+    if name in _EVALUATION_EXPORTS:
+        from orcheo.nodes import evaluation
+
+        return getattr(evaluation, name)
+    raise AttributeError(name)
+
+
 __all__ = [
     "ABTestingNode",
     "AnalyticsExportNode",
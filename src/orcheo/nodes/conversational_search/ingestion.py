@@ -26,6 +26,7 @@ from orcheo.nodes.conversational_search.vector_store import (
     InMemoryVectorStore,
 )
 from orcheo.nodes.registry import NodeMetadata, registry
+from orcheo.runtime.http_clients import get_http_client
 from orcheo.tracing.model_metadata import (
     build_ai_trace_metadata,
     infer_model_name_from_instance,
@@ -428,13 +429,10 @@ class WebDocumentLoaderNode(TaskNode):
             raise ValueError(msg)
 
         documents: list[Document] = []
-        async with httpx.AsyncClient(
-            timeout=float(self.timeout),
-            follow_redirects=self.follow_redirects,
-        ) as client:
-            for index, web_input in enumerate(payloads):
-                document = await self._fetch_document(client, web_input, index)
-                documents.append(document)
+        client = get_http_client(timeout=float(self.timeout))
+        for index, web_input in enumerate(payloads):
+            document = await self._fetch_document(client, web_input, index)
+            documents.append(document)
 
         serialized_documents = [document.model_dump() for document in documents]
         return {"documents": serialized_documents}
@@ -472,7 +470,9 @@ class WebDocumentLoaderNode(TaskNode):
     ) -> Document:
         """Fetch a single URL and convert it to a Document."""
         try:
-            response = await client.get(web_input.url)
+            response = await client.get(
+                web_input.url, follow_redirects=self.follow_redirects
+            )
             response.raise_for_status()
         except httpx.HTTPError as exc:
             msg = f"Failed to fetch URL {web_input.url}: {exc!s}"
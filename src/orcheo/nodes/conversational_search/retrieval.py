@@ -25,6 +25,7 @@ from orcheo.runtime.credentials import (
     get_active_credential_resolver,
     parse_credential_reference,
 )
+from orcheo.runtime.http_clients import get_http_client
 from orcheo.tracing.model_metadata import (
     build_ai_trace_metadata,
     infer_model_name_from_instance,
@@ -540,10 +541,10 @@ class WebSearchNode(TaskNode):
 
         payload = self._build_payload(query.strip(), api_key)
 
+        client = get_http_client(timeout=self.timeout)
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(self.api_url, json=payload)
-                response.raise_for_status()
+            response = await client.post(self.api_url, json=payload)
+            response.raise_for_status()
         except httpx.HTTPError as exc:
             msg = f"Web search request failed: {exc!s}"
             raise ValueError(msg) from exc
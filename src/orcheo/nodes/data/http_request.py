@@ -1,8 +1,15 @@
 """Implementation of :class:`HttpRequestNode`."""
 
 from __future__ import annotations
+import asyncio
+import base64
+import hashlib
 import json
+import os
+import tempfile
+from collections.abc import AsyncIterator
 from datetime import timedelta
+from pathlib import Path
 from typing import Any, Literal
 import httpx
 from langchain_core.runnables import RunnableConfig
@@ -10,6 +17,7 @@ from pydantic import Field
 from orcheo.graph.state import State
 from orcheo.nodes.base import TaskNode
 from orcheo.nodes.registry import NodeMetadata, registry
+from orcheo.runtime.http_clients import get_http_client
 
 
 HttpMethod = Literal[
@@ -21,6 +29,9 @@ HttpMethod = Literal[
     "HEAD",
     "OPTIONS",
 ]
+HttpOutput = Literal["auto", "json", "text", "bytes", "file", "ndjson", "lines"]
+
+MAX_RETAINED_BODIES = 100
 
 
 @registry.register(
@@ -31,7 +42,22 @@ HttpMethod = Literal[
     )
 )
 class HttpRequestNode(TaskNode):
-    """Node that performs HTTP requests using httpx."""
+    """Node that performs HTTP requests using httpx.
+
+    The response body is streamed. ``output`` selects the single
+    representation kept in the result (``auto`` keeps both the text and the
+    parsed JSON): ``bytes`` returns base64 content, ``file`` writes the body to
+    ``output_dir`` and returns a ``file`` reference, and ``ndjson``/``lines``
+    return the body lines as ``items``. ``max_bytes`` stops reading after that
+    many bytes and marks the result ``truncated``; ``spill_threshold`` moves
+    larger bodies to a file reference instead of keeping them in state.
+
+    File references point at the local filesystem of the process that ran the
+    node, so they are only readable by nodes executing on the same host. The
+    default directory (``$TMPDIR/orcheo-http``) keeps the
+    ``MAX_RETAINED_BODIES`` most recent bodies; set ``output_dir`` to keep
+    files elsewhere and manage their retention yourself.
+    """
 
     method: HttpMethod = Field(default="GET", description="HTTP method to execute")
     url: str = Field(description="Fully-qualified request URL")
@@ -62,6 +88,33 @@ class HttpRequestNode(TaskNode):
         default=False, description="Raise an error when the response is not 2xx"
     )
 
+    output: HttpOutput = Field(
+        default="auto",
+        description=(
+            "Response representation kept in the result: auto (text and parsed "
+            "JSON), json, text, bytes (base64), file, ndjson or lines"
+        ),
+    )
+    max_bytes: int | None = Field(
+        default=None,
+        ge=0,
+        description="Stop reading the response body after this many bytes",
+    )
+    spill_threshold: int | None = Field(
+        default=None,
+        ge=0,
+        description=(
+            "Write bodies larger than this many bytes to a file and return a "
+            "reference instead of the content"
+        ),
+    )
+    output_dir: str | None = Field(
+        default=None,
+        description=(
+            "Host-local directory for file outputs; defaults to a pruned temp directory"
+        ),
+    )
+
     async def run(self, state: State, config: RunnableConfig) -> dict[str, Any]:
         """Execute the configured HTTP request."""
         request_kwargs: dict[str, Any] = {
@@ -70,7 +123,6 @@ class HttpRequestNode(TaskNode):
             "params": self.params,
             "headers": self.headers,
             "timeout": self.timeout,
-            "follow_redirects": self.follow_redirects,
         }
 
         if self.json_body is not None:
@@ -80,22 +132,129 @@ class HttpRequestNode(TaskNode):
         if self.data is not None:
             request_kwargs["data"] = self.data
 
+        client = get_http_client()
+        request = client.build_request(**request_kwargs)
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.request(**request_kwargs)
+            response = await client.send(
+                request, stream=True, follow_redirects=self.follow_redirects
+            )
         except httpx.HTTPError as exc:  # pragma: no cover - network failure guard
             msg = f"HTTP request failed: {exc!s}"
             raise ValueError(msg) from exc
 
-        if self.raise_for_status:
-            response.raise_for_status()
+        try:
+            if self.raise_for_status:
+                response.raise_for_status()
+            body = _CappedBody(response, self.max_bytes)
+            try:
+                if self.output in ("ndjson", "lines"):
+                    payload = await self._read_lines(body)
+                else:
+                    payload = await self._read_body(response, body)
+            except httpx.HTTPError as exc:
+                msg = f"HTTP request failed: {exc!s}"
+                raise ValueError(msg) from exc
+        finally:
+            await response.aclose()
+
+        return {
+            **self._response_metadata(response),
+            **payload,
+            "size": body.size,
+            "truncated": body.truncated,
+        }
+
+    async def _read_body(
+        self, response: httpx.Response, body: _CappedBody
+    ) -> dict[str, Any]:
+        """Buffer the body in memory or spill it to a file when configured.
+
+        File I/O runs in a worker thread so slow disks do not stall the loop.
+        """
+        buffer = bytearray()
+        sink = (
+            await asyncio.to_thread(self._open_sink) if self.output == "file" else None
+        )
+        try:
+            async for chunk in body.chunks():
+                if (
+                    sink is None
+                    and self.spill_threshold is not None
+                    and len(buffer) + len(chunk) > self.spill_threshold
+                ):
+                    sink = await asyncio.to_thread(self._open_sink)
+                    await asyncio.to_thread(sink.write, bytes(buffer))
+                    buffer.clear()
+                if sink is None:
+                    buffer.extend(chunk)
+                else:
+                    await asyncio.to_thread(sink.write, chunk)
+        except BaseException:
+            if sink is not None:
+                sink.discard()
+            raise
+
+        if sink is not None:
+            reference = await asyncio.to_thread(
+                sink.close, response.headers.get("content-type")
+            )
+            if not self.output_dir:
+                await asyncio.to_thread(
+                    _prune_bodies, sink.path.parent, keep=MAX_RETAINED_BODIES
+                )
+            return {"file": reference}
+        return self._format_content(bytes(buffer), response.encoding or "utf-8")
+
+    def _format_content(self, content: bytes, encoding: str) -> dict[str, Any]:
+        """Return the configured representation of a buffered body."""
+        if self.output == "bytes":
+            return {
+                "content": base64.b64encode(content).decode("ascii"),
+                "content_encoding": "base64",
+            }
+        if self.output == "json":
+            return {"json": _parse_json(content)}
+        text = content.decode(encoding, errors="replace")
+        if self.output == "text":
+            return {"content": text}
+        return {"content": text, "json": _parse_json(content)}
 
-        parsed_json: Any | None
+    async def _read_lines(self, body: _CappedBody) -> dict[str, Any]:
+        """Collect non-empty body lines, decoding each as JSON for ``ndjson``."""
+        items: list[Any] = []
+        # Only the new chunk is split; the unfinished line is carried over.
+        pending = bytearray()
+        async for chunk in body.chunks():
+            *complete, rest = chunk.split(b"\n")
+            if complete:
+                complete[0] = bytes(pending) + complete[0]
+                pending.clear()
+            pending += rest
+            items.extend(self._parse_line(line) for line in complete if line.strip())
+        # A truncated body ends mid-line; drop the partial record.
+        if pending.strip() and not body.truncated:
+            items.append(self._parse_line(pending))
+        return {"items": items}
+
+    def _parse_line(self, line: bytes) -> Any:
+        text = line.decode("utf-8", errors="replace").strip()
+        if self.output == "lines":
+            return text
         try:
-            parsed_json = response.json()
-        except json.JSONDecodeError:
-            parsed_json = None
+            return json.loads(text)
+        except json.JSONDecodeError as exc:
+            msg = f"Invalid NDJSON line in response: {text[:80]!r}"
+            raise ValueError(msg) from exc
+
+    def _open_sink(self) -> _FileSink:
+        directory = (
+            Path(self.output_dir).expanduser()
+            if self.output_dir
+            else Path(tempfile.gettempdir()) / "orcheo-http"
+        )
+        return _FileSink(directory, prefix=f"{self.name}-")
 
+    def _response_metadata(self, response: httpx.Response) -> dict[str, Any]:
         elapsed: float | None = None
         elapsed_source: Any | None
         try:
@@ -116,7 +275,77 @@ class HttpRequestNode(TaskNode):
             "reason": response.reason_phrase,
             "url": response_url,
             "headers": dict(response.headers),
-            "content": response.text,
-            "json": parsed_json,
             "elapsed": elapsed,
         }
+
+
+class _CappedBody:
+    """Iterate a streamed response body, stopping after ``limit`` bytes."""
+
+    def __init__(self, response: httpx.Response, limit: int | None) -> None:
+        self._response = response
+        self._limit = limit
+        self.size = 0
+        self.truncated = False
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        async for raw in self._response.aiter_bytes():
+            chunk = raw
+            if self._limit is not None and self.size + len(raw) > self._limit:
+                chunk = raw[: self._limit - self.size]
+                self.truncated = True
+            self.size += len(chunk)
+            if chunk:
+                yield chunk
+            if self.truncated:
+                return
+
+
+class _FileSink:
+    """Write a response body to a temporary file inside ``directory``."""
+
+    def __init__(self, directory: Path, *, prefix: str) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(dir=directory, prefix=prefix, suffix=".body")
+        self.path = Path(name)
+        self._handle = os.fdopen(fd, "wb")
+        self._digest = hashlib.sha256()
+        self._size = 0
+
+    def write(self, chunk: bytes) -> None:
+        self._digest.update(chunk)
+        self._handle.write(chunk)
+        self._size += len(chunk)
+
+    def close(self, content_type: str | None) -> dict[str, Any]:
+        self._handle.close()
+        return {
+            "path": str(self.path),
+            "size": self._size,
+            "sha256": self._digest.hexdigest(),
+            "content_type": content_type,
+        }
+
+    def discard(self) -> None:
+        self._handle.close()
+        self.path.unlink(missing_ok=True)
+
+
+def _prune_bodies(directory: Path, *, keep: int) -> None:
+    """Delete all but the ``keep`` most recently written bodies in ``directory``."""
+    bodies: list[tuple[float, Path]] = []
+    for path in directory.glob("*.body"):
+        try:
+            bodies.append((path.stat().st_mtime, path))
+        except FileNotFoundError:
+            continue
+    bodies.sort(reverse=True)
+    for _, stale in bodies[keep:]:
+        stale.unlink(missing_ok=True)
+
+
+def _parse_json(content: bytes) -> Any | None:
+    try:
+        return json.loads(content)
+    except ValueError:
+        return None
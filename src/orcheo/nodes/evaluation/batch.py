@@ -2,21 +2,152 @@
 
 from __future__ import annotations
 import asyncio
+import hashlib
+import json
 import logging
+import math
+import random
+import time
 from collections import deque
-from collections.abc import Mapping, Sequence
+from collections.abc import (
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 from langchain_core.runnables import Runnable, RunnableConfig
 from langgraph.graph import StateGraph
-from pydantic import ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from pydantic.json_schema import SkipJsonSchema
 from orcheo.graph.state import State
+from orcheo.nodes.agent_tools.context import get_active_tool_progress_callback
 from orcheo.nodes.base import TaskNode
 from orcheo.nodes.registry import NodeMetadata, registry
 
 
 logger = logging.getLogger(__name__)
 
+_LATENCY_SAMPLE_SIZE = 10_000
+
+
+@dataclass
+class _LatencySample:
+    """Bounded reservoir of latency observations in milliseconds."""
+
+    capacity: int = _LATENCY_SAMPLE_SIZE
+    count: int = 0
+    maximum: float = 0.0
+    values: list[float] = field(default_factory=list)
+    _rng: random.Random = field(default_factory=lambda: random.Random(0))
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.maximum = max(self.maximum, value)
+        if len(self.values) < self.capacity:
+            self.values.append(value)
+            return
+        slot = self._rng.randrange(self.count)
+        if slot < self.capacity:
+            self.values[slot] = value
+
+    def summary(self) -> dict[str, float | int]:
+        ordered = sorted(self.values)
+        return {
+            "count": self.count,
+            "p50_ms": _percentile(ordered, 50),
+            "p90_ms": _percentile(ordered, 90),
+            "p99_ms": _percentile(ordered, 99),
+            "max_ms": self.maximum,
+        }
+
+
+async def _gather_or_cancel[T](aws: Iterable[Awaitable[T]]) -> list[T]:
+    """Gather ``aws`` in order, cancelling the rest as soon as one fails."""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def _digest(value: Any) -> str:
+    encoded = json.dumps(value, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def _percentile(ordered: Sequence[float], percentile: float) -> float:
+    """Return the nearest-rank percentile of pre-sorted values."""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(percentile / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@dataclass
+class _BatchStats:
+    """Throughput and latency counters for a batch evaluation run."""
+
+    started: float = field(default_factory=time.perf_counter)
+    resumed_conversations: int = 0
+    conversation_latency: _LatencySample = field(default_factory=_LatencySample)
+    turn_latency: _LatencySample = field(default_factory=_LatencySample)
+
+    def summary(self) -> dict[str, Any]:
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        processed = self.conversation_latency.count
+        turns = self.turn_latency.count
+        return {
+            "elapsed_seconds": elapsed,
+            "conversations_processed": processed,
+            "conversations_resumed": self.resumed_conversations,
+            "conversations_per_second": processed / elapsed,
+            "turns_per_second": turns / elapsed,
+            "conversation_latency": self.conversation_latency.summary(),
+            "turn_latency": self.turn_latency.summary(),
+        }
+
+
+@dataclass
+class _OrderedResults:
+    """Fold conversation results into the batch output in conversation order.
+
+    Results that finish out of order wait in a buffer only until every earlier
+    conversation is folded in, so apart from the output itself memory stays
+    bounded by the conversations in flight.
+    """
+
+    include_details: bool
+    predictions: list[str] = field(default_factory=list)
+    references: list[str] = field(default_factory=list)
+    per_conversation: dict[str, dict[str, Any]] = field(default_factory=dict)
+    _next_index: int = 0
+    _buffer: dict[int, dict[str, Any]] = field(default_factory=dict)
+
+    def add(self, index: int, conv_result: Mapping[str, Any]) -> None:
+        self._buffer[index] = dict(conv_result)
+        while self._next_index in self._buffer:
+            self._fold(self._buffer.pop(self._next_index))
+            self._next_index += 1
+
+    def _fold(self, conv_result: Mapping[str, Any]) -> None:
+        conv_predictions = conv_result["predictions"]
+        conv_references = conv_result["references"]
+        self.predictions.extend(conv_predictions)
+        self.references.extend(conv_references)
+        conv_summary: dict[str, Any] = {"num_turns": conv_result["num_turns"]}
+        if self.include_details:
+            conv_summary["predictions"] = conv_predictions
+            conv_summary["references"] = conv_references
+        self.per_conversation[conv_result["conversation_id"]] = conv_summary
+
 
 @registry.register(
     NodeMetadata(
@@ -62,6 +193,24 @@ class ConversationalBatchEvalNode(TaskNode):
             "conversation turn while building pipeline history."
         ),
     )
+    max_turn_concurrency: int | str | None = Field(
+        default=1,
+        description=(
+            "Maximum number of turns of one conversation sent through the "
+            "pipeline concurrently. Turn inputs only depend on earlier user "
+            "utterances, so turns can be pipelined when the pipeline keeps no "
+            "per-conversation state."
+        ),
+    )
+    checkpoint_path: str | None = Field(
+        default=None,
+        description=(
+            "Optional JSON Lines file recording each completed conversation so "
+            "an interrupted batch resumes where it stopped. Entries are keyed by "
+            "the conversation content and the pipeline configuration, so edited "
+            "cases or pipelines are evaluated again."
+        ),
+    )
     include_per_conversation_details: bool = Field(
         default=True,
         description=(
@@ -116,6 +265,21 @@ class ConversationalBatchEvalNode(TaskNode):
                 raise ValueError(msg) from exc
         return value
 
+    @field_validator("max_turn_concurrency", mode="before")
+    @classmethod
+    def _validate_max_turn_concurrency(cls, value: Any) -> Any:
+        if value is None:
+            return value
+        if isinstance(value, str):
+            if cls._is_template(value):
+                return value
+            try:
+                value = int(value)
+            except ValueError as exc:
+                msg = "max_turn_concurrency must be an integer"
+                raise ValueError(msg) from exc
+        return value
+
     @field_validator("history_window_size", mode="before")
     @classmethod
     def _validate_history_window_size(cls, value: Any) -> Any:
@@ -165,6 +329,21 @@ class ConversationalBatchEvalNode(TaskNode):
             raise ValueError(msg)
         return value
 
+    def _resolve_max_turn_concurrency(self) -> int:
+        value = self.max_turn_concurrency
+        if value is None:
+            return 1
+        if isinstance(value, str):
+            try:
+                value = int(value)
+            except ValueError as exc:
+                msg = "max_turn_concurrency must resolve to an integer"
+                raise ValueError(msg) from exc
+        if value < 1:
+            msg = "max_turn_concurrency must be >= 1"
+            raise ValueError(msg)
+        return value
+
     def _resolve_history_window_size(self) -> int | None:
         value = self.history_window_size
         if value is None:
@@ -194,63 +373,169 @@ class ConversationalBatchEvalNode(TaskNode):
 
         history_window_size = self._resolve_history_window_size()
         max_concurrency = self._resolve_max_concurrency()
-        conversation_results: list[dict[str, Any]]
-        if max_concurrency == 1:
-            conversation_results = []
-            for conv in conversations:
-                conversation_results.append(
-                    await self._process_conversation(
-                        conv,
-                        history_window_size,
-                        state,
-                        config,
+        max_turn_concurrency = self._resolve_max_turn_concurrency()
+        stats = _BatchStats()
+        checkpoint = await asyncio.to_thread(self._load_checkpoint)
+        fingerprint = self._config_fingerprint() if self.checkpoint_path else ""
+        output = _OrderedResults(self.include_per_conversation_details)
+        progress_callback = get_active_tool_progress_callback()
+        checkpoint_lock = asyncio.Lock()
+
+        def _pending() -> Iterator[tuple[int, dict[str, Any]]]:
+            # Lazily, so restored results are folded in as workers reach them.
+            for index, conv in enumerate(conversations):
+                key = self._checkpoint_key(index, conv, fingerprint)
+                restored = checkpoint.pop(key, None)
+                if restored is None:
+                    yield index, conv
+                else:
+                    output.add(index, restored)
+                    stats.resumed_conversations += 1
+
+        async def _record(index: int, conv_result: dict[str, Any]) -> None:
+            output.add(index, conv_result)
+            stats.conversation_latency.add(conv_result["latency_ms"])
+            if self.checkpoint_path is not None:
+                async with checkpoint_lock:
+                    await asyncio.to_thread(
+                        self._append_checkpoint,
+                        self._checkpoint_key(index, conversations[index], fingerprint),
+                        conv_result,
                     )
+            if progress_callback is not None:
+                await progress_callback(
+                    {
+                        self.name: {
+                            "event": "conversation_complete",
+                            "index": index,
+                            **conv_result,
+                        }
+                    }
                 )
-        else:
-            semaphore = asyncio.Semaphore(max_concurrency)
-
-            async def _process_with_limit(conv: dict[str, Any]) -> dict[str, Any]:
-                async with semaphore:
-                    return await self._process_conversation(
-                        conv,
-                        history_window_size,
-                        state,
-                        config,
-                    )
-
-            tasks = [
-                asyncio.create_task(_process_with_limit(conv)) for conv in conversations
-            ]
-            conversation_results = await asyncio.gather(*tasks)
-
-        predictions: list[str] = []
-        references: list[str] = []
-        per_conversation: dict[str, dict[str, Any]] = {}
-
-        for conv_result in conversation_results:
-            conv_id = conv_result["conversation_id"]
-            conv_predictions = conv_result["predictions"]
-            conv_references = conv_result["references"]
-            predictions.extend(conv_predictions)
-            references.extend(conv_references)
 
-            conv_summary: dict[str, Any] = {"num_turns": conv_result["num_turns"]}
-            if self.include_per_conversation_details:
-                conv_summary["predictions"] = conv_predictions
-                conv_summary["references"] = conv_references
-            per_conversation[conv_id] = conv_summary
+        await self._run_conversations(
+            _pending(),
+            max_concurrency,
+            history_window_size,
+            max_turn_concurrency,
+            stats,
+            state,
+            config,
+            _record,
+        )
 
         # Write to state["inputs"] so downstream metric nodes can read them.
-        inputs["predictions"] = predictions
-        inputs["references"] = references
+        inputs["predictions"] = output.predictions
+        inputs["references"] = output.references
 
         return {
-            "predictions": predictions,
-            "references": references,
-            "per_conversation": per_conversation,
-            "total_turns": len(predictions),
+            "predictions": output.predictions,
+            "references": output.references,
+            "per_conversation": output.per_conversation,
+            "total_turns": len(output.predictions),
             "total_conversations": len(conversations),
+            "stats": stats.summary(),
+        }
+
+    async def _run_conversations(
+        self,
+        pending: Iterator[tuple[int, dict[str, Any]]],
+        max_concurrency: int,
+        history_window_size: int | None,
+        max_turn_concurrency: int,
+        stats: _BatchStats,
+        state: State,
+        config: RunnableConfig,
+        on_result: Callable[[int, dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        """Drain ``pending`` with ``max_concurrency`` workers, streaming results.
+
+        Workers pull conversations lazily from the shared iterator, so only the
+        in-flight conversations hold pipeline state at any time.
+        """
+
+        async def _worker() -> None:
+            for index, conv in pending:
+                started = time.perf_counter()
+                conv_result = await self._process_conversation(
+                    conv,
+                    history_window_size,
+                    state,
+                    config,
+                    max_turn_concurrency=max_turn_concurrency,
+                    stats=stats,
+                )
+                conv_result["latency_ms"] = (time.perf_counter() - started) * 1000.0
+                await on_result(index, conv_result)
+
+        await _gather_or_cancel(_worker() for _ in range(max_concurrency))
+
+    def _config_fingerprint(self) -> str:
+        """Return a digest of the settings and pipeline that shape results."""
+        pipeline: dict[str, Any] | None = None
+        if self.pipeline is not None:
+            nodes: dict[str, Any] = {}
+            for name, spec in self.pipeline.nodes.items():
+                runnable = spec.runnable
+                target = getattr(runnable, "afunc", None) or getattr(
+                    runnable, "func", runnable
+                )
+                nodes[name] = (
+                    target.model_dump()
+                    if isinstance(target, BaseModel)
+                    else type(target).__qualname__
+                )
+            pipeline = {
+                "nodes": nodes,
+                "edges": sorted(self.pipeline.edges),
+                "branches": sorted(
+                    (source, sorted(branches))
+                    for source, branches in self.pipeline.branches.items()
+                ),
+            }
+        settings = {
+            "prediction_field": self.prediction_field,
+            "gold_field": self.gold_field,
+            "history_window_size": self._resolve_history_window_size(),
+            "include_per_conversation_details": self.include_per_conversation_details,
+            "pipeline": pipeline,
         }
+        return _digest(settings)
+
+    @staticmethod
+    def _checkpoint_key(
+        index: int, conversation: Mapping[str, Any], fingerprint: str
+    ) -> str:
+        conversation_id = conversation.get("conversation_id", "unknown")
+        return f"{index}:{conversation_id}:{_digest([fingerprint, conversation])}"
+
+    def _load_checkpoint(self) -> dict[str, dict[str, Any]]:
+        """Return completed conversation results recorded by an earlier run."""
+        if self.checkpoint_path is None:
+            return {}
+        path = Path(self.checkpoint_path)
+        if not path.exists():
+            return {}
+        restored: dict[str, dict[str, Any]] = {}
+        with path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave a truncated final line behind.
+                    continue
+                if isinstance(entry, dict) and isinstance(entry.get("result"), dict):
+                    restored[str(entry.get("key"))] = entry["result"]
+        return restored
+
+    def _append_checkpoint(self, key: str, conv_result: Mapping[str, Any]) -> None:
+        if self.checkpoint_path is None:
+            return
+        path = Path(self.checkpoint_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps({"key": key, "result": conv_result})
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
 
     async def _process_conversation(
         self,
@@ -258,32 +543,51 @@ class ConversationalBatchEvalNode(TaskNode):
         history_window_size: int | None,
         parent_state: State,
         config: RunnableConfig,
+        *,
+        max_turn_concurrency: int = 1,
+        stats: _BatchStats | None = None,
     ) -> dict[str, Any]:
         conv_id = str(conversation.get("conversation_id", "unknown"))
         turns_raw = conversation.get("turns", [])
         turns = turns_raw if isinstance(turns_raw, list) else []
 
-        conv_predictions: list[str] = []
-        conv_references: list[str] = []
-
         history: deque[str] | list[str]
         if history_window_size is None:
             history = []
         else:
             history = deque(maxlen=history_window_size)
 
+        turn_limit = asyncio.Semaphore(max_turn_concurrency)
+
+        async def _timed_turn(turn: dict[str, Any], snapshot: list[str]) -> str:
+            async with turn_limit:
+                started = time.perf_counter()
+                prediction = await self._process_turn(
+                    turn, snapshot, parent_state, config
+                )
+            if stats is not None:
+                stats.turn_latency.add((time.perf_counter() - started) * 1000.0)
+            return prediction
+
+        turn_jobs: list[Awaitable[str]] = []
+        conv_predictions: list[str] = []
+        conv_references: list[str] = []
         for turn in turns:
             if not isinstance(turn, dict):
                 continue
-            gold = str(turn.get(self.gold_field, ""))
-            prediction = await self._process_turn(turn, history, parent_state, config)
-
-            conv_predictions.append(prediction)
-            conv_references.append(gold)
+            conv_references.append(str(turn.get(self.gold_field, "")))
+            job = _timed_turn(turn, list(history))
+            if max_turn_concurrency == 1:
+                conv_predictions.append(await job)
+            else:
+                turn_jobs.append(job)
 
             user_utterance = turn.get("raw_question", turn.get("user_utterance", ""))
             history.append(str(user_utterance))
 
+        if turn_jobs:
+            conv_predictions = await _gather_or_cancel(turn_jobs)
+
         return {
             "conversation_id": conv_id,
             "predictions": conv_predictions,
@@ -0,0 +1,228 @@
+"""Local dataset cache and streaming JSON loaders for evaluation nodes."""
+
+from __future__ import annotations
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+import httpx
+from orcheo.runtime.http_clients import get_http_client
+
+
+logger = logging.getLogger(__name__)
+
+_SNAPSHOT_VERSION = 1
+_JSONL_SUFFIXES = (".jsonl", ".ndjson")
+
+
+def is_url(path: str) -> bool:
+    """Return whether ``path`` refers to an HTTP(S) resource."""
+    return path.startswith(("http://", "https://"))
+
+
+def is_jsonl(path: str) -> bool:
+    """Return whether ``path`` names a JSON Lines file."""
+    return path.split("?", 1)[0].lower().endswith(_JSONL_SUFFIXES)
+
+
+def read_json_file(path: Path, *, jsonl: bool, limit: int | None = None) -> Any:
+    """Read JSON or JSON Lines from ``path``, stopping after ``limit`` records."""
+    with path.open("r", encoding="utf-8") as handle:
+        if not jsonl:
+            return json.load(handle)
+        return _read_json_lines(handle, limit)
+
+
+def _read_json_lines(lines: Iterable[str], limit: int | None) -> list[Any]:
+    records: list[Any] = []
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        records.append(json.loads(stripped))
+        if limit is not None and len(records) >= limit:
+            break
+    return records
+
+
+def _sha256(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def _atomic_write(path: Path, chunks: Iterable[str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            for chunk in chunks:
+                handle.write(chunk)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+class DatasetCache:
+    """Content-addressed cache for downloaded datasets and parsed snapshots.
+
+    Downloads are stored under ``blobs/`` named by the SHA-256 of their content
+    and revalidated with ``ETag``/``Last-Modified`` conditional requests. Parsed
+    and validated records are stored as JSON Lines snapshots keyed by the source
+    fingerprint, so later runs read only the records they need.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Create a cache rooted at ``directory``."""
+        self.directory = Path(directory).expanduser()
+
+    async def materialize(self, path: str, *, timeout: float) -> Path:
+        """Return a local file for ``path``, downloading URLs into the cache."""
+        if is_url(path):
+            return await self.fetch(path, timeout=timeout)
+        return Path(path)
+
+    async def fetch(self, url: str, *, timeout: float) -> Path:
+        """Download ``url`` into the blob store unless the cached copy is fresh."""
+        index_path = self.directory / "urls" / f"{_sha256(url)}.json"
+        entry = await asyncio.to_thread(self._read_index, index_path)
+        cached_blob = self._valid_blob(entry)
+        headers: dict[str, str] = {}
+        if cached_blob is not None and entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            client = get_http_client(timeout=timeout)
+            async with client.stream(
+                "GET", url, headers=headers, follow_redirects=True
+            ) as response:
+                if response.status_code == 304 and cached_blob is not None:
+                    return cached_blob
+                response.raise_for_status()
+                blob = await self._store_stream(response)
+                new_entry = {
+                    "url": url,
+                    "sha256": blob.name,
+                    "size": blob.stat().st_size,
+                    "etag": response.headers.get("etag"),
+                    "last_modified": response.headers.get("last-modified"),
+                }
+        except httpx.HTTPError:
+            if cached_blob is None:
+                raise
+            logger.warning("Using cached dataset for %s after download failure", url)
+            return cached_blob
+
+        await asyncio.to_thread(
+            _atomic_write, index_path, [json.dumps(new_entry, sort_keys=True)]
+        )
+        return blob
+
+    def source_key(self, path: Path) -> str:
+        """Return a fingerprint identifying the content of ``path``."""
+        blobs = (self.directory / "blobs").resolve()
+        resolved = path.resolve()
+        if resolved.parent == blobs:
+            return resolved.name
+        stat = resolved.stat()
+        return _sha256(f"{resolved}:{stat.st_size}:{stat.st_mtime_ns}")
+
+    def read_snapshot(
+        self, source_key: str, kind: str, limit: int | None = None
+    ) -> list[dict[str, Any]] | None:
+        """Return up to ``limit`` snapshot records or ``None`` when absent."""
+        path = self._snapshot_path(source_key, kind)
+        try:
+            return read_json_file(path, jsonl=True, limit=limit)
+        except (OSError, ValueError):
+            return None
+
+    def write_snapshot(
+        self, source_key: str, kind: str, records: Iterable[dict[str, Any]]
+    ) -> None:
+        """Persist validated records as a JSON Lines snapshot."""
+        path = self._snapshot_path(source_key, kind)
+        _atomic_write(
+            path,
+            (json.dumps(record, separators=(",", ":")) + "\n" for record in records),
+        )
+
+    def _snapshot_path(self, source_key: str, kind: str) -> Path:
+        name = f"{kind}-v{_SNAPSHOT_VERSION}-{source_key}.jsonl"
+        return self.directory / "snapshots" / name
+
+    def _valid_blob(self, entry: dict[str, Any] | None) -> Path | None:
+        if entry is None:
+            return None
+        blob = self.directory / "blobs" / str(entry.get("sha256", ""))
+        try:
+            if blob.stat().st_size == entry.get("size"):
+                return blob
+        except OSError:
+            return None
+        return None
+
+    @staticmethod
+    def _read_index(path: Path) -> dict[str, Any] | None:
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        return payload if isinstance(payload, dict) else None
+
+    async def _store_stream(self, response: httpx.Response) -> Path:
+        blobs = self.directory / "blobs"
+        blobs.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        fd, tmp_name = tempfile.mkstemp(dir=blobs, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                async for chunk in response.aiter_bytes():
+                    digest.update(chunk)
+                    handle.write(chunk)
+            target = blobs / digest.hexdigest()
+            os.replace(tmp_name, target)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return target
+
+
+async def load_json_source(
+    path: str,
+    *,
+    http_timeout: float,
+    cache: DatasetCache | None = None,
+    limit: int | None = None,
+) -> Any:
+    """Load JSON or JSON Lines from a local path or URL without blocking the loop.
+
+    ``limit`` stops JSON Lines parsing early; it has no effect on JSON documents.
+    """
+    jsonl = is_jsonl(path)
+    if cache is None and is_url(path):
+        client = get_http_client(timeout=http_timeout)
+        response = await client.get(path, follow_redirects=True)
+        response.raise_for_status()
+        if jsonl:
+            return _read_json_lines(response.text.splitlines(), limit)
+        return response.json()
+    local = await cache.materialize(path, timeout=http_timeout) if cache else Path(path)
+    return await asyncio.to_thread(read_json_file, local, jsonl=jsonl, limit=limit)
+
+
+__all__ = [
+    "DatasetCache",
+    "is_jsonl",
+    "is_url",
+    "load_json_source",
+    "read_json_file",
+]
@@ -1,16 +1,22 @@
 """Dataset loading nodes for evaluation workflows."""
 
 from __future__ import annotations
-import json
+import asyncio
 import logging
 from pathlib import Path
 from typing import Any
-import httpx
 from langchain_core.runnables import RunnableConfig
 from pydantic import BaseModel, Field, field_validator
 from orcheo.graph.state import State
 from orcheo.nodes.base import TaskNode
 from orcheo.nodes.conversational_search.models import Document
+from orcheo.nodes.evaluation.dataset_cache import (
+    DatasetCache,
+    is_jsonl,
+    is_url,
+    load_json_source,
+    read_json_file,
+)
 from orcheo.nodes.registry import NodeMetadata, registry
 
 
@@ -56,6 +62,13 @@ class DatasetNode(TaskNode):
     limit: int | None = Field(
         default=None, ge=1, description="Optional dataset cap when loading from files."
     )
+    cache_dir: str | None = Field(
+        default=None,
+        description=(
+            "Optional directory caching downloaded datasets and pre-validated "
+            "snapshots between runs."
+        ),
+    )
 
     async def run(self, state: State, config: RunnableConfig) -> dict[str, Any]:
         """Return a dataset filtered by split and limited when requested."""
@@ -271,20 +284,48 @@ class DatasetNode(TaskNode):
 
         return dataset, references, keyword_corpus
 
-    async def _load_json(self, path: str | None) -> Any:
+    async def _load_json(self, path: str | None, *, limit: int | None = None) -> Any:
         if path is None:
             msg = "JSON path must be provided."
             raise ValueError(msg)
-        if self._is_url(path):
-            async with httpx.AsyncClient(timeout=self.http_timeout) as client:
-                response = await client.get(path, follow_redirects=True)
-                response.raise_for_status()
-                return response.json()
-        with Path(path).open("r", encoding="utf-8") as file:
-            return json.load(file)
+        return await load_json_source(
+            path,
+            http_timeout=self.http_timeout,
+            cache=self._dataset_cache(),
+            limit=limit,
+        )
+
+    def _dataset_cache(self) -> DatasetCache | None:
+        return DatasetCache(self.cache_dir) if self.cache_dir else None
+
+    async def _load_snapshot_records(
+        self,
+        path: str,
+        limit: int | None,
+        parse: Any,
+    ) -> list[dict[str, Any]] | None:
+        """Return cached or freshly parsed records for ``path`` when caching.
+
+        ``parse`` converts the raw payload into validated record dictionaries; its
+        output is stored as a compact snapshot so later runs skip parsing and
+        validation and only read ``limit`` records.
+        """
+        cache = self._dataset_cache()
+        if cache is None:
+            return None
+        local = await cache.materialize(path, timeout=self.http_timeout)
+        kind = type(self).__name__
+        source_key = await asyncio.to_thread(cache.source_key, local)
+        records = await asyncio.to_thread(cache.read_snapshot, source_key, kind, limit)
+        if records is not None:
+            return records
+        raw = await asyncio.to_thread(read_json_file, local, jsonl=is_jsonl(path))
+        parsed: list[dict[str, Any]] = await asyncio.to_thread(parse, raw)
+        await asyncio.to_thread(cache.write_snapshot, source_key, kind, parsed)
+        return parsed[:limit] if limit is not None else parsed
 
     def _is_url(self, path: str) -> bool:
-        return path.startswith(("http://", "https://"))
+        return is_url(path)
 
     def _build_keyword_corpus(self) -> list[dict[str, str]]:
         if self.docs_path is None:
@@ -334,6 +375,10 @@ class MultiDoc2DialCorpusLoaderNode(TaskNode):
         ge=0.0,
         description="Timeout in seconds for URL-based corpus loading.",
     )
+    cache_dir: str | None = Field(
+        default=None,
+        description="Optional directory caching downloaded corpora between runs.",
+    )
 
     @field_validator("max_documents", mode="before")
     @classmethod
@@ -393,13 +438,11 @@ class MultiDoc2DialCorpusLoaderNode(TaskNode):
         }
 
     async def _load_json(self, path: str) -> Any:
-        if self._is_url(path):
-            async with httpx.AsyncClient(timeout=self.http_timeout) as client:
-                response = await client.get(path, follow_redirects=True)
-                response.raise_for_status()
-                return response.json()
-        with Path(path).open("r", encoding="utf-8") as file:
-            return json.load(file)
+        return await load_json_source(
+            path,
+            http_timeout=self.http_timeout,
+            cache=DatasetCache(self.cache_dir) if self.cache_dir else None,
+        )
 
     def _parse_corpus(
         self,
@@ -438,7 +481,7 @@ class MultiDoc2DialCorpusLoaderNode(TaskNode):
         return f"{source}#doc_id={document_id}"
 
     def _is_url(self, path: str) -> bool:
-        return path.startswith(("http://", "https://"))
+        return is_url(path)
 
     def _iter_raw_documents(
         self, doc_data: dict[str, Any]
@@ -586,30 +629,38 @@ class QReCCDatasetNode(DatasetNode):
         inputs = state.get("inputs") or {}
         state["inputs"] = inputs
 
+        max_conversations = self._resolve_max_conversations()
         raw_data = inputs.get("qrecc_data")
+        conv_dicts: list[dict[str, Any]] | None = None
         if raw_data is None and self.data_path:
-            raw_data = await self._load_json(self.data_path)
-
-        if not isinstance(raw_data, list):
-            msg = "QReCCDatasetNode expects qrecc_data list"
-            raise ValueError(msg)
+            conv_dicts = await self._load_snapshot_records(
+                self.data_path, max_conversations, self._parse_records
+            )
+            if conv_dicts is None:
+                raw_data = await self._load_json(self.data_path)
 
-        conversations = self._parse_conversations(raw_data)
-        max_conversations = self._resolve_max_conversations()
-        if max_conversations is not None:
-            conversations = conversations[:max_conversations]
+        if conv_dicts is None:
+            conv_dicts = await asyncio.to_thread(self._parse_records, raw_data)
+            if max_conversations is not None:
+                conv_dicts = conv_dicts[:max_conversations]
 
-        conv_dicts = [conv.model_dump() for conv in conversations]
-        total_turns = sum(len(c.turns) for c in conversations)
+        total_turns = sum(len(c["turns"]) for c in conv_dicts)
 
         inputs["conversations"] = conv_dicts
 
         return {
             "conversations": conv_dicts,
-            "total_conversations": len(conversations),
+            "total_conversations": len(conv_dicts),
             "total_turns": total_turns,
         }
 
+    def _parse_records(self, raw_data: Any) -> list[dict[str, Any]]:
+        """Validate raw QReCC records and return conversation dictionaries."""
+        if not isinstance(raw_data, list):
+            msg = "QReCCDatasetNode expects qrecc_data list"
+            raise ValueError(msg)
+        return [conv.model_dump() for conv in self._parse_conversations(raw_data)]
+
     def _parse_conversations(
         self, raw_data: list[dict[str, Any]]
     ) -> list[QreccConversation]:
@@ -706,31 +757,45 @@ class MultiDoc2DialDatasetNode(DatasetNode):
         inputs = state.get("inputs") or {}
         state["inputs"] = inputs
 
+        max_conversations = self._resolve_max_conversations()
         raw_data = inputs.get("md2d_data")
+        conv_dicts: list[dict[str, Any]] | None = None
         if raw_data is None and self.data_path:
-            raw_data = await self._load_json(self.data_path)
-
-        normalized_data = self._normalize_dataset_payload(raw_data)
-        if normalized_data is None:
-            msg = "MultiDoc2DialDatasetNode expects md2d_data list"
-            raise ValueError(msg)
+            conv_dicts = await self._load_snapshot_records(
+                self.data_path, max_conversations, self._parse_records
+            )
+            if conv_dicts is None:
+                raw_data = await self._load_json(
+                    self.data_path, limit=max_conversations
+                )
 
-        conversations = self._parse_conversations(normalized_data)
-        max_conversations = self._resolve_max_conversations()
-        if max_conversations is not None:
-            conversations = conversations[:max_conversations]
+        if conv_dicts is None:
+            if isinstance(raw_data, list) and max_conversations is not None:
+                raw_data = raw_data[:max_conversations]
+            conv_dicts = await asyncio.to_thread(self._parse_records, raw_data)
+            if max_conversations is not None:
+                conv_dicts = conv_dicts[:max_conversations]
 
-        conv_dicts = [conv.model_dump() for conv in conversations]
-        total_turns = sum(len(c.turns) for c in conversations)
+        total_turns = sum(len(c["turns"]) for c in conv_dicts)
 
         inputs["conversations"] = conv_dicts
 
         return {
             "conversations": conv_dicts,
-            "total_conversations": len(conversations),
+            "total_conversations": len(conv_dicts),
             "total_turns": total_turns,
         }
 
+    def _parse_records(self, raw_data: Any) -> list[dict[str, Any]]:
+        """Validate raw MultiDoc2Dial data and return conversation dictionaries."""
+        normalized_data = self._normalize_dataset_payload(raw_data)
+        if normalized_data is None:
+            msg = "MultiDoc2DialDatasetNode expects md2d_data list"
+            raise ValueError(msg)
+        return [
+            conv.model_dump() for conv in self._parse_conversations(normalized_data)
+        ]
+
     def _normalize_dataset_payload(self, raw_data: Any) -> list[dict[str, Any]] | None:
         """Normalize official and pre-processed MultiDoc2Dial payloads."""
         if isinstance(raw_data, list):
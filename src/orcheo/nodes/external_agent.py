@@ -2,18 +2,30 @@
 
 from __future__ import annotations
 import logging
+import time
 from collections.abc import Mapping
+from pathlib import Path
 from typing import Any, ClassVar
 from langchain_core.runnables import RunnableConfig
 from pydantic import Field
 from orcheo.external_agents import (
     ExternalAgentRuntimeManager,
+    ProcessExecutionResult,
+    ProviderLockUnavailableError,
     RuntimeInstallError,
     RuntimeVerificationError,
     WorkingDirectoryValidationError,
     execute_process,
+    get_warm_process_pool,
 )
+from orcheo.external_agents.models import ResolvedRuntime
+from orcheo.external_agents.paths import LOGS_DIR_NAME
+from orcheo.external_agents.providers import ExternalAgentProvider
 from orcheo.graph.state import State
+from orcheo.nodes.agent_tools.context import (
+    ToolProgressCallback,
+    get_active_tool_progress_callback,
+)
 from orcheo.nodes.base import TaskNode
 from orcheo.runtime.credentials import (
     CredentialReferenceNotFoundError,
@@ -24,6 +36,50 @@ from orcheo.runtime.credentials import (
 logger = logging.getLogger(__name__)
 
 
+class _OutputProgress:
+    """Batch external agent output lines into node progress updates."""
+
+    def __init__(
+        self,
+        node_name: str,
+        provider_name: str,
+        callback: ToolProgressCallback,
+        *,
+        interval_seconds: float = 0.5,
+        max_lines: int = 50,
+    ) -> None:
+        self._node_name = node_name
+        self._provider_name = provider_name
+        self._callback = callback
+        self._interval_seconds = interval_seconds
+        self._max_lines = max_lines
+        self._lines: dict[str, list[str]] = {"stdout": [], "stderr": []}
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    async def __call__(self, stream: str, line: str) -> None:
+        self._lines[stream].append(line)
+        self._pending += 1
+        if (
+            self._pending >= self._max_lines
+            or time.monotonic() - self._last_flush >= self._interval_seconds
+        ):
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        update: dict[str, Any] = {
+            "status": "running",
+            "provider": self._provider_name,
+        }
+        update.update({name: lines for name, lines in self._lines.items() if lines})
+        self._lines = {"stdout": [], "stderr": []}
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        await self._callback({self._node_name: update})
+
+
 class ExternalAgentNode(TaskNode):
     """Base task node for provider-managed external coding agents."""
 
@@ -57,6 +113,31 @@ class ExternalAgentNode(TaskNode):
         ge=1,
         description="Maximum execution time before the agent process tree is stopped.",
     )
+    stream_output: bool = Field(
+        default=True,
+        description=(
+            "Forward output lines as progress updates while the agent runs when "
+            "the execution streams progress."
+        ),
+    )
+    max_output_bytes: int = Field(
+        default=64 * 1024,
+        ge=1024,
+        description=(
+            "Trailing bytes of stdout and stderr kept in the result. Longer output "
+            "is written in full to a log file referenced from the result."
+        ),
+    )
+    warm_pool_size: int = Field(
+        default=0,
+        ge=0,
+        le=8,
+        description=(
+            "Number of agent processes kept started and waiting for a prompt "
+            "between runs with the same runtime, working directory and "
+            "environment. Only used by providers that accept the prompt on stdin."
+        ),
+    )
 
     def _resolve_prompt(self, state: State) -> str:
         """Resolve the task prompt from the node config or workflow inputs."""
@@ -99,7 +180,7 @@ class ExternalAgentNode(TaskNode):
         updates: dict[str, Any] = {}
         for key, value in self.__dict__.items():
             try:
-                decoded = self._decode_value(value, state)
+                decoded = self._decode_field(key, value, state)
             except (
                 CredentialReferenceNotFoundError,
                 CredentialResolverUnavailableError,
@@ -115,6 +196,70 @@ class ExternalAgentNode(TaskNode):
         """Return provider-specific auth values for the current node run."""
         return {}
 
+    def _build_command(
+        self,
+        provider: ExternalAgentProvider,
+        runtime: ResolvedRuntime,
+        prompt: str,
+    ) -> tuple[list[str], str | None]:
+        """Return the agent command and the text to write to its stdin."""
+        if self.warm_pool_size > 0:
+            stdin_command = provider.build_stdin_command(
+                runtime, prompt=prompt, system_prompt=self.system_prompt
+            )
+            if stdin_command is not None:
+                return stdin_command
+        command = provider.build_command(
+            runtime, prompt=prompt, system_prompt=self.system_prompt
+        )
+        return command, None
+
+    async def _execute_command(
+        self,
+        command: list[str],
+        *,
+        working_directory: Path,
+        env: Mapping[str, str],
+        log_dir: Path,
+        input_text: str | None = None,
+    ) -> ProcessExecutionResult:
+        """Run the agent CLI, streaming output lines as progress when enabled.
+
+        Commands fed through stdin are taken from the warm process pool.
+        """
+        process = None
+        if input_text is not None:
+            process = await get_warm_process_pool().acquire(
+                command, cwd=working_directory, env=env, size=self.warm_pool_size
+            )
+        progress_callback = get_active_tool_progress_callback()
+        output_progress = (
+            _OutputProgress(self.name, self.provider_name, progress_callback)
+            if self.stream_output and progress_callback is not None
+            else None
+        )
+        result = await execute_process(
+            command,
+            cwd=working_directory,
+            env=env,
+            timeout_seconds=self.timeout_seconds,
+            on_output=output_progress,
+            max_output_bytes=self.max_output_bytes,
+            log_dir=log_dir,
+            input_text=input_text,
+            process=process,
+        )
+        if output_progress is not None:
+            try:
+                await output_progress.flush()
+            except Exception:
+                logger.warning(
+                    "Failed to forward final output for node %s.",
+                    self.name,
+                    exc_info=True,
+                )
+        return result
+
     async def run(self, state: State, config: RunnableConfig) -> dict[str, Any]:
         """Resolve the provider runtime, validate setup, and run the CLI."""
         del config
@@ -171,6 +316,20 @@ class ExternalAgentNode(TaskNode):
                 "reason": "runtime_verification_failed",
                 "message": str(exc),
             }
+        except ProviderLockUnavailableError as exc:
+            return {
+                "status": "failed",
+                "provider": self.provider_name,
+                "resolved_version": None,
+                "command": [],
+                "command_path": None,
+                "working_directory": str(working_directory),
+                "exit_code": None,
+                "stdout": "",
+                "stderr": "",
+                "reason": "runtime_lock_timeout",
+                "message": str(exc),
+            }
 
         provider = manager.get_provider(self.provider_name)
         runtime = resolution.runtime
@@ -204,11 +363,7 @@ class ExternalAgentNode(TaskNode):
             }
 
         manager.mark_auth_success(self.provider_name)
-        command = provider.build_command(
-            runtime,
-            prompt=prompt,
-            system_prompt=self.system_prompt,
-        )
+        command, input_text = self._build_command(provider, runtime, prompt)
         audit_metadata = provider.execution_audit_metadata(
             runtime,
             command=command,
@@ -219,11 +374,12 @@ class ExternalAgentNode(TaskNode):
                 "External agent execution requested provider bypass flags.",
                 extra={"node_name": self.name, **audit_metadata},
             )
-        result = await execute_process(
+        result = await self._execute_command(
             command,
-            cwd=working_directory,
+            working_directory=working_directory,
             env=provider.build_environment(provider_environ),
-            timeout_seconds=self.timeout_seconds,
+            log_dir=resolution.manifest.provider_root / LOGS_DIR_NAME,
+            input_text=input_text,
         )
         self._set_trace_metadata_for_run(
             {
@@ -260,7 +416,16 @@ class ExternalAgentNode(TaskNode):
             "exit_code": result.exit_code,
             "stdout": result.stdout,
             "stderr": result.stderr,
+            "stdout_truncated": result.stdout_truncated,
+            "stderr_truncated": result.stderr_truncated,
+            "stdout_log_path": _optional_path(result.stdout_log_path),
+            "stderr_log_path": _optional_path(result.stderr_log_path),
             "reason": reason,
             "message": message,
             "maintenance_due": resolution.maintenance_due,
         }
+
+
+def _optional_path(path: Path | None) -> str | None:
+    """Return ``path`` as a string, preserving ``None``."""
+    return str(path) if path is not None else None
@@ -1,7 +1,12 @@
 """JavaScript sandbox node backed by py-mini-racer."""
 
 from __future__ import annotations
+import asyncio
+import hashlib
 import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Any
 from langchain_core.runnables import RunnableConfig
 from pydantic import Field
@@ -10,10 +15,328 @@ from orcheo.nodes.base import TaskNode
 from orcheo.nodes.registry import NodeMetadata, registry
 
 
+_BOOTSTRAP_SCRIPT = """
+(function (global) {
+  var ownKeys = Reflect.ownKeys;
+  var getDescriptor = Reflect.getOwnPropertyDescriptor;
+  var defineProperty = Reflect.defineProperty;
+  var deleteProperty = Reflect.deleteProperty;
+  var getPrototypeOf = Reflect.getPrototypeOf;
+  var setPrototypeOf = Reflect.setPrototypeOf;
+  var isExtensible = Reflect.isExtensible;
+  var createObject = Object.create;
+  var indirectEval = global.eval;
+  var scripts = createObject(null);
+
+  var api = Object.freeze({
+    compile: function (key, source) {
+      scripts[key] = source;
+    },
+    evict: function (key) {
+      delete scripts[key];
+    },
+    run: function (key, contextJson, capture) {
+      var logs = [];
+      global.console = {
+        log: capture
+          ? function () {
+              logs.push(
+                Array.prototype.map.call(arguments, function (arg) {
+                  return String(arg);
+                }).join(' ')
+              );
+            }
+          : function () {}
+      };
+      var context = JSON.parse(contextJson);
+      Object.keys(context).forEach(function (name) {
+        global[name] = context[name];
+      });
+      var value = indirectEval(scripts[key]);
+      var encoded = null;
+      var raw = false;
+      try {
+        encoded = JSON.stringify(value);
+      } catch (error) {
+        raw = true;
+        global.__ORCHEO_RESULT__ = value;
+      }
+      return JSON.stringify({
+        result: encoded === undefined ? null : encoded,
+        raw: raw,
+        console: logs
+      });
+    },
+    reset: function () {
+      return restore();
+    }
+  });
+  defineProperty(global, '__orcheo__', { value: api });
+
+  // Snapshot every intrinsic reachable from the global object (and the
+  // iterator/generator prototypes that are not) so a run cannot leave
+  // modified builtins or prototypes behind for the next run.
+  var snapshot = [];
+  var visited = new WeakSet([api]);
+  var pending = [
+    global,
+    function* () {},
+    async function () {},
+    async function* () {},
+    [][Symbol.iterator](),
+    ''[Symbol.iterator](),
+    new Map()[Symbol.iterator](),
+    new Set()[Symbol.iterator](),
+    /a/[Symbol.matchAll]('')
+  ];
+  function visit(value) {
+    if (
+      value !== null &&
+      (typeof value === 'object' || typeof value === 'function') &&
+      !visited.has(value)
+    ) {
+      visited.add(value);
+      pending.push(value);
+    }
+  }
+  while (pending.length) {
+    var target = pending.pop();
+    visited.add(target);
+    var keys = ownKeys(target);
+    var known = createObject(null);
+    var descriptors = [];
+    for (var i = 0; i < keys.length; i++) {
+      var current = getDescriptor(target, keys[i]);
+      var saved = createObject(null);
+      saved.configurable = current.configurable;
+      saved.enumerable = current.enumerable;
+      if ('value' in current) {
+        saved.value = current.value;
+        saved.writable = current.writable;
+        visit(current.value);
+      } else {
+        saved.get = current.get;
+        saved.set = current.set;
+        visit(current.get);
+        visit(current.set);
+      }
+      known[keys[i]] = true;
+      descriptors.push([keys[i], saved]);
+    }
+    var prototype = getPrototypeOf(target);
+    visit(prototype);
+    snapshot.push([target, known, descriptors, prototype, isExtensible(target)]);
+  }
+
+  function restore() {
+    var clean = true;
+    for (var i = 0; i < snapshot.length; i++) {
+      var entry = snapshot[i];
+      var target = entry[0];
+      var known = entry[1];
+      var descriptors = entry[2];
+      if (entry[4] && !isExtensible(target)) {
+        clean = false;
+      }
+      var keys = ownKeys(target);
+      for (var j = 0; j < keys.length; j++) {
+        if (known[keys[j]] !== true && !deleteProperty(target, keys[j])) {
+          clean = false;
+        }
+      }
+      for (var k = 0; k < descriptors.length; k++) {
+        if (!defineProperty(target, descriptors[k][0], descriptors[k][1])) {
+          clean = false;
+        }
+      }
+      if (getPrototypeOf(target) !== entry[3] && !setPrototypeOf(target, entry[3])) {
+        clean = false;
+      }
+    }
+    return clean;
+  }
+})(this);
+"""
+
+
+def _script_key(script: str, result_variable: str) -> str:
+    """Return the cache key identifying a compiled script."""
+    digest = hashlib.sha256()
+    digest.update(result_variable.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(script.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _compile_source(key: str, script: str, result_variable: str) -> str:
+    """Store ``script`` in the isolate's script cache for global evaluation.
+
+    The script runs at global scope through an indirect ``eval``, like a
+    top-level script; the appended expression makes ``result_variable`` the
+    completion value so ``let``/``const`` results are visible too.
+    """
+    result_expression = (
+        f"(typeof {result_variable} === 'undefined' ? null : {result_variable})"
+    )
+    source = f"{script}\n;{result_expression};"
+    return f"__orcheo__.compile({json.dumps(key)}, {json.dumps(source)});"
+
+
+@dataclass
+class _PooledIsolate:
+    """V8 isolate with its per-isolate compiled script cache."""
+
+    runtime: Any
+    compiled: OrderedDict[str, None] = field(default_factory=OrderedDict)
+    runs: int = 0
+
+
+@dataclass(frozen=True)
+class JavaScriptExecution:
+    """Outcome of a single sandboxed script execution."""
+
+    result: Any
+    console: list[str]
+
+
+class JavaScriptIsolatePool:
+    """Thread-safe pool of reusable py-mini-racer isolates.
+
+    Isolates are bootstrapped once and reused across runs. Bootstrapping
+    snapshots the global object and every builtin reachable from it; before an
+    isolate returns to the pool, globals a run introduced are removed and
+    builtins, prototypes and their properties are restored from the snapshot.
+    Isolates whose restore fails, or that hit a timeout or memory limit, are
+    discarded instead of being reused. Scripts are shipped once per isolate and
+    looked up by hash afterwards.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_idle: int = 4,
+        max_compiled_scripts: int = 128,
+        max_runs_per_isolate: int = 1000,
+    ) -> None:
+        """Configure pool sizing and recycling limits."""
+        self.max_idle = max_idle
+        self.max_compiled_scripts = max_compiled_scripts
+        self.max_runs_per_isolate = max_runs_per_isolate
+        self._idle: list[_PooledIsolate] = []
+        self._lock = threading.Lock()
+
+    @property
+    def idle_count(self) -> int:
+        """Return the number of isolates waiting for reuse."""
+        with self._lock:
+            return len(self._idle)
+
+    def clear(self) -> None:
+        """Drop every idle isolate."""
+        with self._lock:
+            self._idle.clear()
+
+    def execute(
+        self,
+        script: str,
+        *,
+        context: dict[str, Any],
+        result_variable: str = "result",
+        capture_console: bool = True,
+        timeout: float | None = None,
+        max_memory: int | None = None,
+    ) -> JavaScriptExecution:
+        """Run ``script`` in a pooled isolate and return its result."""
+        from py_mini_racer import py_mini_racer
+
+        isolate = self._acquire()
+        limits = {
+            "timeout": None if timeout is None else max(1, int(timeout * 1000)),
+            "max_memory": max_memory,
+        }
+        discard = False
+        try:
+            key = _script_key(script, result_variable)
+            self._ensure_compiled(isolate, key, script, result_variable, limits)
+            payload_json = isolate.runtime.eval(
+                "__orcheo__.run("
+                f"{json.dumps(key)}, "
+                f"{json.dumps(json.dumps(context))}, "
+                f"{'true' if capture_console else 'false'})",
+                **limits,
+            )
+            payload = json.loads(payload_json)
+            if payload["raw"]:
+                result_value = isolate.runtime.eval("__ORCHEO_RESULT__")
+            elif payload["result"] is None:
+                result_value = None
+            else:
+                result_value = json.loads(payload["result"])
+            console_output = payload["console"] if capture_console else []
+            return JavaScriptExecution(result=result_value, console=console_output)
+        except (py_mini_racer.JSTimeoutException, py_mini_racer.JSOOMException):
+            discard = True
+            raise
+        finally:
+            self._release(isolate, discard=discard)
+
+    def _ensure_compiled(
+        self,
+        isolate: _PooledIsolate,
+        key: str,
+        script: str,
+        result_variable: str,
+        limits: dict[str, Any],
+    ) -> None:
+        """Compile ``script`` into ``isolate`` unless it is already cached."""
+        if key in isolate.compiled:
+            isolate.compiled.move_to_end(key)
+            return
+        isolate.runtime.eval(_compile_source(key, script, result_variable), **limits)
+        isolate.compiled[key] = None
+        while len(isolate.compiled) > self.max_compiled_scripts:
+            evicted, _ = isolate.compiled.popitem(last=False)
+            isolate.runtime.eval(f"__orcheo__.evict({json.dumps(evicted)});")
+
+    def _acquire(self) -> _PooledIsolate:
+        """Return an idle isolate or bootstrap a new one."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        from py_mini_racer import py_mini_racer
+
+        runtime = py_mini_racer.MiniRacer()
+        runtime.eval(_BOOTSTRAP_SCRIPT)
+        return _PooledIsolate(runtime=runtime)
+
+    def _release(self, isolate: _PooledIsolate, *, discard: bool) -> None:
+        """Reset ``isolate`` and return it to the pool when still reusable."""
+        isolate.runs += 1
+        if discard or isolate.runs >= self.max_runs_per_isolate:
+            return
+        try:
+            restored = isolate.runtime.eval("__orcheo__.reset();")
+        except Exception:
+            return
+        if restored is not True:
+            return
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(isolate)
+
+
+_default_pool = JavaScriptIsolatePool()
+
+
+def get_isolate_pool() -> JavaScriptIsolatePool:
+    """Return the process-wide isolate pool used by sandbox nodes."""
+    return _default_pool
+
+
 @registry.register(
     NodeMetadata(
         name="JavaScriptSandboxNode",
-        description="Execute JavaScript using js2py sandboxing.",
+        description="Execute JavaScript in a pooled V8 sandbox.",
         category="utility",
     )
 )
@@ -33,63 +356,40 @@ class JavaScriptSandboxNode(TaskNode):
         default=True,
         description="Capture console.log output for debugging",
     )
+    timeout: float | None = Field(
+        default=30.0,
+        gt=0.0,
+        description="Optional execution timeout in seconds",
+    )
+    max_memory_mb: int | None = Field(
+        default=None,
+        ge=1,
+        description="Optional V8 heap limit in megabytes for the execution",
+    )
 
     async def run(self, state: State, config: RunnableConfig) -> dict[str, Any]:
         """Execute JavaScript and return the evaluated result."""
-        from py_mini_racer import py_mini_racer
-
-        runtime = py_mini_racer.MiniRacer()
-
-        if self.capture_console:
-            runtime.eval(
-                "\n".join(
-                    [
-                        "var __ORCHEO_CONSOLE__ = [];",
-                        "var console = {",
-                        "  log: function() {",
-                        "    __ORCHEO_CONSOLE__.push(",
-                        "      Array.prototype.map.call(",
-                        "        arguments,",
-                        "        function(arg) { return String(arg); }",
-                        "      ).join(' ')",
-                        "    );",
-                        "  }",
-                        "};",
-                    ]
-                )
-            )
-        else:
-            runtime.eval("var console = { log: function() {} };")
-
-        for key, value in self.context.items():
-            encoded = json.dumps(value)
-            if key.isidentifier():
-                runtime.eval(f"var {key} = {encoded};")
-            else:
-                runtime.eval(f"this[{json.dumps(key)}] = {encoded};")
-
-        runtime.eval(self.script)
-
-        result_name = self.result_variable
-        result_expression = (
-            f"(typeof {result_name} === 'undefined' ? null : {result_name})"
+        max_memory = (
+            None if self.max_memory_mb is None else self.max_memory_mb * 1024 * 1024
+        )
+        execution = await asyncio.to_thread(
+            get_isolate_pool().execute,
+            self.script,
+            context=self.context,
+            result_variable=self.result_variable,
+            capture_console=self.capture_console,
+            timeout=self.timeout,
+            max_memory=max_memory,
         )
-        try:
-            result_json = runtime.eval(f"JSON.stringify({result_expression})")
-        except py_mini_racer.JSEvalException:
-            result_value = runtime.eval(result_expression)
-        else:
-            result_value = None if result_json is None else json.loads(result_json)
-
-        console_output: list[str] = []
-        if self.capture_console:
-            console_json = runtime.eval("JSON.stringify(__ORCHEO_CONSOLE__)")
-            console_output = [] if console_json is None else json.loads(console_json)
-
         return {
-            "result": result_value,
-            "console": console_output,
+            "result": execution.result,
+            "console": execution.console,
         }
 
 
-__all__ = ["JavaScriptSandboxNode"]
+__all__ = [
+    "JavaScriptExecution",
+    "JavaScriptIsolatePool",
+    "JavaScriptSandboxNode",
+    "get_isolate_pool",
+]
@@ -4,12 +4,12 @@ from __future__ import annotations
 import json
 import logging
 from typing import Any
-import httpx
 from langchain_core.runnables import RunnableConfig
 from pydantic import Field
 from orcheo.graph.state import State
 from orcheo.nodes.base import TaskNode
 from orcheo.nodes.registry import NodeMetadata, registry
+from orcheo.runtime.http_clients import get_http_client
 
 
 logger = logging.getLogger(__name__)
@@ -71,10 +71,10 @@ async def _request_tenant_access_token(
         "app_id": app_id,
         "app_secret": app_secret,
     }
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.post(LARK_TENANT_ACCESS_TOKEN_URL, json=payload)
-        response.raise_for_status()
-        return response.json()
+    client = get_http_client(timeout=timeout)
+    response = await client.post(LARK_TENANT_ACCESS_TOKEN_URL, json=payload)
+    response.raise_for_status()
+    return response.json()
 
 
 @registry.register(
@@ -215,15 +215,15 @@ class LarkSendMessageNode(TaskNode):
                 "msg_type": "text",
             }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                url,
-                params=params,
-                headers=headers,
-                json=payload,
-            )
-            response.raise_for_status()
-            data = response.json()
+        client = get_http_client(timeout=self.timeout)
+        response = await client.post(
+            url,
+            params=params,
+            headers=headers,
+            json=payload,
+        )
+        response.raise_for_status()
+        data = response.json()
 
         code = data.get("code", 0)
         if code != 0:
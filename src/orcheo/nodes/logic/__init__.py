@@ -17,6 +17,7 @@ compatibility with older workflow definitions.
 Condition-related utilities have also moved to orcheo.edges.conditions.
 """
 
+from orcheo.nodes.logic.parallel_map import ParallelMapNode
 from orcheo.nodes.logic.utilities import (
     DelayNode,
     ForLoopNode,
@@ -29,5 +30,6 @@ __all__ = [
     "SetVariableNode",
     "DelayNode",
     "ForLoopNode",
+    "ParallelMapNode",
     "_build_nested",
 ]
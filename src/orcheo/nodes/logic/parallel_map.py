@@ -0,0 +1,193 @@
+"""Parallel map node fanning list items out to an inline sub-workflow."""
+
+from __future__ import annotations
+import asyncio
+from collections.abc import Mapping
+from typing import Any, ClassVar, Literal
+from langchain_core.runnables import RunnableConfig
+from pydantic import Field
+from orcheo.graph.state import State
+from orcheo.nodes.base import TaskNode
+from orcheo.nodes.registry import NodeMetadata, registry
+from orcheo.nodes.sub_workflow import build_step_node
+
+
+ErrorPolicy = Literal["raise", "continue", "skip"]
+
+
+@registry.register(
+    NodeMetadata(
+        name="ParallelMapNode",
+        description="Run steps for every list item with bounded concurrency",
+        category="utility",
+    )
+)
+class ParallelMapNode(TaskNode):
+    """Apply an inline sub-workflow to every item of a list concurrently.
+
+    Each item runs the configured ``steps`` (node configurations, as for
+    :class:`~orcheo.nodes.sub_workflow.SubWorkflowNode`) with at most
+    ``max_concurrency`` items in flight. Steps see the current item as
+    ``{{<name>.item}}`` and its position as ``{{<name>.index}}``. Outputs are
+    collected in item order from ``result_step`` (the last step by default).
+    ``items`` must resolve to a list; anything else, including a template
+    that did not resolve, raises :class:`ValueError`.
+
+    ``error_policy`` decides what happens when an item fails: ``raise`` cancels
+    the remaining items and re-raises, ``continue`` records ``None`` plus an
+    entry in ``errors``, and ``skip`` drops the item from ``outputs``.
+
+    With ``chunk_size`` set, each invocation processes one chunk and reports
+    ``done``; loop the node back onto itself through an
+    :class:`~orcheo.edges.branching.IfElseEdge` (as with :class:`ForLoopNode`)
+    so progress is checkpointed after every chunk::
+
+        graph.add_node("enrich", ParallelMapNode(
+            name="enrich",
+            items="{{find_subscribers.data}}",
+            steps=[{"type": "HttpRequestNode", "url": "{{enrich.item.url}}"}],
+            max_concurrency=16,
+            chunk_size=100,
+        ))
+        graph.add_conditional_edges("enrich", router, {"true": "enrich", ...})
+    """
+
+    _DEFERRED_DECODE_FIELDS: ClassVar[frozenset[str]] = frozenset({"steps"})
+
+    items: list[Any] | str = Field(
+        description="List to map over (may be a template string)",
+    )
+    steps: list[Mapping[str, Any]] = Field(
+        default_factory=list,
+        description="Node configurations executed for every item",
+    )
+    max_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum number of items processed at the same time",
+    )
+    error_policy: ErrorPolicy = Field(
+        default="raise",
+        description="How item failures are handled: raise, continue or skip",
+    )
+    result_step: str | None = Field(
+        default=None,
+        description="Optional name of the step whose result is collected",
+    )
+    chunk_size: int | None = Field(
+        default=None,
+        ge=1,
+        description="Items processed per invocation; all items when unset",
+    )
+
+    def _compute_run_updates(self, state: State) -> dict[str, Any]:
+        """Leave step templates unresolved until each item runs."""
+        updates: dict[str, Any] = {}
+        for key, value in self.__dict__.items():
+            if key in self._DEFERRED_DECODE_FIELDS:
+                continue
+            decoded = self._decode_field(key, value, state)
+            if decoded is not value:
+                updates[key] = decoded
+        return updates
+
+    async def run(self, state: State, config: RunnableConfig) -> dict[str, Any]:
+        """Process the next chunk of items and return the accumulated outputs."""
+        items = self._resolved_items()
+        total = len(items)
+        start, outputs, errors = self._resume(state, total)
+        stop = total if self.chunk_size is None else min(total, start + self.chunk_size)
+
+        chunk_outputs: dict[int, Any] = {}
+        chunk_errors: dict[int, str] = {}
+        positions = iter(range(start, stop))
+
+        async def worker() -> None:
+            for index in positions:
+                try:
+                    chunk_outputs[index] = await self._run_item(
+                        state, config, items[index], index
+                    )
+                except Exception as exc:
+                    if self.error_policy == "raise":
+                        raise
+                    chunk_errors[index] = str(exc)
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(self.max_concurrency, stop - start))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+
+        for index in range(start, stop):
+            if index in chunk_errors:
+                errors.append({"index": index, "error": chunk_errors[index]})
+                if self.error_policy == "skip":
+                    continue
+            outputs.append(chunk_outputs.get(index))
+
+        return {
+            "done": stop >= total,
+            "index": stop,
+            "total": total,
+            "outputs": outputs,
+            "errors": errors,
+        }
+
+    def _resolved_items(self) -> list[Any]:
+        """Return ``items``, rejecting values that did not resolve to a list."""
+        if not isinstance(self.items, list):
+            msg = (
+                f"ParallelMapNode {self.name!r} expects items to resolve to a list, "
+                f"got {type(self.items).__name__}: {str(self.items)[:80]!r}"
+            )
+            raise ValueError(msg)
+        return self.items
+
+    def _resume(
+        self, state: State, total: int
+    ) -> tuple[int, list[Any], list[dict[str, Any]]]:
+        """Return the start index and outputs left by an unfinished invocation."""
+        results = state.get("results")
+        previous = results.get(self.name) if isinstance(results, Mapping) else None
+        if (
+            not isinstance(previous, Mapping)
+            or previous.get("done", True)
+            or previous.get("total") != total
+        ):
+            return 0, [], []
+        return (
+            int(previous.get("index") or 0),
+            list(previous.get("outputs") or []),
+            list(previous.get("errors") or []),
+        )
+
+    async def _run_item(
+        self,
+        state: State,
+        config: RunnableConfig,
+        item: Any,
+        index: int,
+    ) -> Any:
+        """Run the configured steps for a single item."""
+        results = dict(state.get("results") or {})
+        results[self.name] = {"item": item, "index": index}
+        sub_state = State({**state, "results": results})
+        last_result: Any = None
+        for step in self.steps:
+            node = build_step_node(step)
+            output = await node(sub_state, config)
+            last_result = output["results"][node.name]
+            results[node.name] = last_result
+        if self.result_step is not None:
+            return results.get(self.result_step)
+        return last_result
+
+
+__all__ = ["ParallelMapNode"]
@@ -0,0 +1,759 @@
+"""Lightweight manifest of the built-in nodes and the modules defining them.
+
+Importing :mod:`orcheo.nodes` declares these entries with the registry instead
+of importing every node module (and their browser, database and LLM client
+dependencies). Listing the catalog only reads this manifest; a node module is
+imported the first time one of its nodes is looked up.
+
+Each entry must match the :class:`NodeMetadata` its module registers.
+"""
+
+from orcheo.nodes.registry import NodeMetadata
+
+
+BUILTIN_NODES: dict[str, tuple[NodeMetadata, ...]] = {
+    "orcheo.nodes.agentensor": (
+        NodeMetadata(
+            name="AgentensorNode",
+            description=(
+                "Evaluate or train agent prompts using Agentensor datasets and "
+                "evaluators."
+            ),
+            category="agentensor",
+        ),
+    ),
+    "orcheo.nodes.ai": (
+        NodeMetadata(
+            name="AgentNode",
+            description="Execute an AI agent with tools",
+            category="ai",
+        ),
+        NodeMetadata(
+            name="AgentReplyExtractorNode",
+            description="Extract the final assistant reply from agent messages",
+            category="ai",
+        ),
+        NodeMetadata(
+            name="LLMNode",
+            description="Execute a text-only LLM call",
+            category="ai",
+        ),
+    ),
+    "orcheo.nodes.base": (
+        NodeMetadata(
+            name="NoOpTaskNode",
+            description=(
+                "A no-op node for developers to use as a template for custom nodes. Do "
+                "not use this node directly, but inherit from this with your own `run` "
+                "method."
+            ),
+            category="base",
+        ),
+    ),
+    "orcheo.nodes.browser": (
+        NodeMetadata(
+            name="BrowserNavigateNode",
+            description="Open a URL in a shared Playwright browser session.",
+            category="browser",
+        ),
+        NodeMetadata(
+            name="BrowserActionNode",
+            description=(
+                "Perform a user-style action against the active Playwright page."
+            ),
+            category="browser",
+        ),
+        NodeMetadata(
+            name="BrowserExtractNode",
+            description=(
+                "Extract page or element content from the active Playwright page."
+            ),
+            category="browser",
+        ),
+        NodeMetadata(
+            name="BrowserWaitNode",
+            description="Wait for a condition on the active Playwright page.",
+            category="browser",
+        ),
+        NodeMetadata(
+            name="BrowserScriptNode",
+            description="Evaluate JavaScript in the active Playwright page context.",
+            category="browser",
+        ),
+        NodeMetadata(
+            name="BrowserCloseNode",
+            description="Close an active Playwright browser session.",
+            category="browser",
+        ),
+    ),
+    "orcheo.nodes.claude_code": (
+        NodeMetadata(
+            name="ClaudeCodeNode",
+            description="Execute Claude Code as a non-interactive coding-agent step.",
+            category="ai",
+        ),
+    ),
+    "orcheo.nodes.codex": (
+        NodeMetadata(
+            name="CodexNode",
+            description="Execute Codex as a non-interactive coding-agent step.",
+            category="ai",
+        ),
+    ),
+    "orcheo.nodes.communication": (
+        NodeMetadata(
+            name="EmailNode",
+            description="Send an email via SMTP with optional TLS and authentication.",
+            category="communication",
+        ),
+        NodeMetadata(
+            name="DiscordWebhookNode",
+            description="Send messages to Discord via incoming webhooks.",
+            category="communication",
+        ),
+        NodeMetadata(
+            name="MessageDiscordNode",
+            description="Send a message to a Discord channel using a bot token.",
+            category="messaging",
+        ),
+        NodeMetadata(
+            name="MessageQQNode",
+            description="Send a message to QQ using AppID and client secret.",
+            category="messaging",
+        ),
+    ),
+    "orcheo.nodes.conversational_search.conversation": (
+        NodeMetadata(
+            name="ConversationStateNode",
+            description="Load and persist conversation history for a session.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="SessionManagementNode",
+            description="Manage conversation sessions with capacity controls.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="AnswerCachingNode",
+            description="Cache answers by query with TTL-based eviction.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="ConversationCompressorNode",
+            description=(
+                "Summarize and budget a conversation history for downstream use."
+            ),
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="TopicShiftDetectorNode",
+            description=(
+                "Detect whether a new query diverges from recent conversation context."
+            ),
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="QueryClarificationNode",
+            description="Generate clarifying prompts when ambiguity is detected.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="MemorySummarizerNode",
+            description="Persist a compact conversation summary into the memory store.",
+            category="conversational_search",
+        ),
+    ),
+    "orcheo.nodes.conversational_search.generation": (
+        NodeMetadata(
+            name="GroundedGeneratorNode",
+            description="Generate grounded answers with citations and retry semantics.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="StreamingGeneratorNode",
+            description="Generate responses and stream token chunks with backpressure.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="HallucinationGuardNode",
+            description="Validate generator output for citations and completeness.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="CitationsFormatterNode",
+            description="Format citation metadata into human-readable strings.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="SearchResultFormatterNode",
+            description="Format SearchResult entries into markdown for tool responses.",
+            category="conversational_search",
+        ),
+    ),
+    "orcheo.nodes.conversational_search.ingestion": (
+        NodeMetadata(
+            name="DocumentLoaderNode",
+            description=(
+                "Normalize raw document payloads into validated Document objects."
+            ),
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="WebDocumentLoaderNode",
+            description=(
+                "Fetch web pages and convert them to normalized Document objects."
+            ),
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="ChunkingStrategyNode",
+            description="Split documents into overlapping chunks for indexing.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="MetadataExtractorNode",
+            description="Attach structured metadata to normalized documents.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="ChunkEmbeddingNode",
+            description=(
+                "Generate vector records for document chunks via configurable embedding"
+                " functions."
+            ),
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="TextEmbeddingNode",
+            description=(
+                "Embed one or more text inputs using a configurable embedding model."
+            ),
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="VectorStoreUpsertNode",
+            description=(
+                "Persist vector records produced by an embedding node into storage."
+            ),
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="IncrementalIndexerNode",
+            description=(
+                "Index or update chunks incrementally with retry and backpressure "
+                "controls."
+            ),
+            category="conversational_search",
+        ),
+    ),
+    "orcheo.nodes.conversational_search.query_processing": (
+        NodeMetadata(
+            name="QueryRewriteNode",
+            description=(
+                "Rewrite or expand a query using recent conversation context to improve"
+                " recall."
+            ),
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="CoreferenceResolverNode",
+            description="Resolve simple pronouns using prior conversation turns.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="QueryClassifierNode",
+            description="Classify a query intent to support routing decisions.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="ContextCompressorNode",
+            description=(
+                "Summarize retrieved context using an AI model so downstream nodes can "
+                "consume a condensed evidence block."
+            ),
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="MultiHopPlannerNode",
+            description="Derive sequential sub-queries for multi-hop answering.",
+            category="conversational_search",
+        ),
+    ),
+    "orcheo.nodes.conversational_search.retrieval": (
+        NodeMetadata(
+            name="DenseSearchNode",
+            description=(
+                "Perform embedding-based retrieval via a configured vector store."
+            ),
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="SparseSearchNode",
+            description="Perform sparse keyword retrieval using BM25 scoring.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="WebSearchNode",
+            description="Perform live web search via the Tavily API.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="HybridFusionNode",
+            description=(
+                "Fuse results from multiple retrievers using RRF or weighted sum."
+            ),
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="ReRankerNode",
+            description=(
+                "Apply secondary scoring to retrieval results for better ranking."
+            ),
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="SourceRouterNode",
+            description="Route fused results into per-source buckets with filtering.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="SearchResultAdapterNode",
+            description=(
+                "Normalize arbitrary retrieval payloads into SearchResult items."
+            ),
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="PineconeRerankNode",
+            description=(
+                "Rerank retrieval results via Pinecone inference for tighter ordering."
+            ),
+            category="conversational_search",
+        ),
+    ),
+    "orcheo.nodes.data.http_request": (
+        NodeMetadata(
+            name="HttpRequestNode",
+            description="Perform an HTTP request and return the response payload.",
+            category="data",
+        ),
+    ),
+    "orcheo.nodes.data.json_processing": (
+        NodeMetadata(
+            name="JsonProcessingNode",
+            description="Parse, stringify, or extract data from JSON payloads.",
+            category="data",
+        ),
+    ),
+    "orcheo.nodes.data.merge": (
+        NodeMetadata(
+            name="MergeNode",
+            description="Merge multiple payloads into a single aggregate structure.",
+            category="data",
+        ),
+    ),
+    "orcheo.nodes.data.transform": (
+        NodeMetadata(
+            name="DataTransformNode",
+            description=(
+                "Map values from an input payload into a transformed structure."
+            ),
+            category="data",
+        ),
+    ),
+    "orcheo.nodes.debug": (
+        NodeMetadata(
+            name="DebugNode",
+            description="Capture state snapshots and emit debug information.",
+            category="utility",
+        ),
+    ),
+    "orcheo.nodes.deep_agent": (
+        NodeMetadata(
+            name="DeepAgentNode",
+            description=(
+                "Execute an autonomous deep-research agent with configurable iteration "
+                "depth for multi-step tool use and synthesis"
+            ),
+            category="ai",
+        ),
+    ),
+    "orcheo.nodes.evaluation.analytics": (
+        NodeMetadata(
+            name="AnalyticsExportNode",
+            description="Aggregate evaluation metrics and feedback for export.",
+            category="conversational_search",
+        ),
+    ),
+    "orcheo.nodes.evaluation.batch": (
+        NodeMetadata(
+            name="ConversationalBatchEvalNode",
+            description=(
+                "Iterate conversations and turns through a pipeline, collecting "
+                "predictions paired with gold labels"
+            ),
+            category="evaluation",
+        ),
+    ),
+    "orcheo.nodes.evaluation.compliance": (
+        NodeMetadata(
+            name="PolicyComplianceNode",
+            description="Apply policy checks and emit audit details.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="MemoryPrivacyNode",
+            description="Enforce redaction and retention for conversation history.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="TurnAnnotationNode",
+            description="Annotate conversation turns with heuristics.",
+            category="conversational_search",
+        ),
+    ),
+    "orcheo.nodes.evaluation.datasets": (
+        NodeMetadata(
+            name="DatasetNode",
+            description="Load and filter golden datasets for evaluation workflows.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="MultiDoc2DialCorpusLoaderNode",
+            description=(
+                "Load MultiDoc2Dial corpus documents from a local path or URL and "
+                "normalize them for indexing."
+            ),
+            category="evaluation",
+        ),
+        NodeMetadata(
+            name="QReCCDatasetNode",
+            description="Load QReCC conversations with gold rewrites for evaluation",
+            category="evaluation",
+        ),
+        NodeMetadata(
+            name="MultiDoc2DialDatasetNode",
+            description=(
+                "Load MultiDoc2Dial conversations with gold responses for evaluation"
+            ),
+            category="evaluation",
+        ),
+    ),
+    "orcheo.nodes.evaluation.feedback": (
+        NodeMetadata(
+            name="UserFeedbackCollectionNode",
+            description="Normalize and validate explicit user feedback.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="FeedbackIngestionNode",
+            description="Persist feedback entries with deduplication.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="DataAugmentationNode",
+            description="Generate synthetic variants of dataset entries.",
+            category="conversational_search",
+        ),
+    ),
+    "orcheo.nodes.evaluation.judges": (
+        NodeMetadata(
+            name="LLMJudgeNode",
+            description="Apply lightweight, AI model judging heuristics.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="FailureAnalysisNode",
+            description="Categorize evaluation failures for triage.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="ABTestingNode",
+            description="Rank variants and gate rollouts using evaluation metrics.",
+            category="conversational_search",
+        ),
+    ),
+    "orcheo.nodes.evaluation.metrics": (
+        NodeMetadata(
+            name="RetrievalEvaluationNode",
+            description="Compute retrieval quality metrics for search results.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="AnswerQualityEvaluationNode",
+            description="Score generated answers against reference answers.",
+            category="conversational_search",
+        ),
+        NodeMetadata(
+            name="RougeMetricsNode",
+            description="Compute ROUGE scores between predicted and reference texts",
+            category="evaluation",
+        ),
+        NodeMetadata(
+            name="BleuMetricsNode",
+            description="Compute SacreBLEU between predicted and reference texts",
+            category="evaluation",
+        ),
+        NodeMetadata(
+            name="SemanticSimilarityMetricsNode",
+            description=(
+                "Compute embedding cosine similarity between predicted and reference "
+                "texts"
+            ),
+            category="evaluation",
+        ),
+        NodeMetadata(
+            name="TokenF1MetricsNode",
+            description="Compute token-level F1 between predicted and reference texts",
+            category="evaluation",
+        ),
+    ),
+    "orcheo.nodes.gemini": (
+        NodeMetadata(
+            name="GeminiNode",
+            description="Execute Gemini CLI as a non-interactive coding-agent step.",
+            category="ai",
+        ),
+    ),
+    "orcheo.nodes.integrations.databases.mongodb.base": (
+        NodeMetadata(
+            name="MongoDBNode",
+            description="MongoDB node",
+            category="mongodb",
+        ),
+        NodeMetadata(
+            name="MongoDBAggregateNode",
+            description="MongoDB aggregate wrapper",
+            category="mongodb",
+        ),
+        NodeMetadata(
+            name="MongoDBFindNode",
+            description="MongoDB find wrapper with sort and limit support",
+            category="mongodb",
+        ),
+        NodeMetadata(
+            name="MongoDBUpdateManyNode",
+            description="MongoDB update_many wrapper",
+            category="mongodb",
+        ),
+        NodeMetadata(
+            name="MongoDBInsertManyNode",
+            description="Insert documents into MongoDB with optional vectors",
+            category="mongodb",
+        ),
+        NodeMetadata(
+            name="MongoDBUpsertManyNode",
+            description="Bulk-upsert upstream records into MongoDB using keyed filters",
+            category="mongodb",
+        ),
+    ),
+    "orcheo.nodes.integrations.databases.mongodb.search": (
+        NodeMetadata(
+            name="MongoDBEnsureSearchIndexNode",
+            description="Ensure a MongoDB Atlas Search index exists.",
+            category="mongodb",
+        ),
+        NodeMetadata(
+            name="MongoDBEnsureVectorIndexNode",
+            description="Ensure a MongoDB Atlas vector search index exists.",
+            category="mongodb",
+        ),
+        NodeMetadata(
+            name="MongoDBHybridSearchNode",
+            description=(
+                "Execute a hybrid search over text and vector indexes asynchronously."
+            ),
+            category="mongodb",
+        ),
+    ),
+    "orcheo.nodes.javascript_sandbox": (
+        NodeMetadata(
+            name="JavaScriptSandboxNode",
+            description="Execute JavaScript in a pooled V8 sandbox.",
+            category="utility",
+        ),
+    ),
+    "orcheo.nodes.lark": (
+        NodeMetadata(
+            name="LarkTenantAccessTokenNode",
+            description="Fetch a tenant access token from the Lark auth API",
+            category="lark",
+        ),
+        NodeMetadata(
+            name="LarkSendMessageNode",
+            description="Send messages to Lark chats or reply to inbound Lark messages",
+            category="lark",
+        ),
+    ),
+    "orcheo.nodes.linkedin": (
+        NodeMetadata(
+            name="LinkedInPostNode",
+            description="Create a LinkedIn post using vault-backed access credentials.",
+            category="linkedin",
+        ),
+    ),
+    "orcheo.nodes.listeners": (
+        NodeMetadata(
+            name="TelegramBotListenerNode",
+            description="Receive Telegram bot updates through managed long polling.",
+            category="trigger",
+        ),
+        NodeMetadata(
+            name="DiscordBotListenerNode",
+            description="Receive Discord bot messages through the Gateway.",
+            category="trigger",
+        ),
+        NodeMetadata(
+            name="QQBotListenerNode",
+            description="Receive QQ bot messages through the managed Gateway.",
+            category="trigger",
+        ),
+    ),
+    "orcheo.nodes.logic.parallel_map": (
+        NodeMetadata(
+            name="ParallelMapNode",
+            description="Run steps for every list item with bounded concurrency",
+            category="utility",
+        ),
+    ),
+    "orcheo.nodes.logic.utilities": (
+        NodeMetadata(
+            name="SetVariableNode",
+            description="Store variables for downstream nodes",
+            category="utility",
+        ),
+        NodeMetadata(
+            name="DelayNode",
+            description="Pause execution for a fixed duration",
+            category="utility",
+        ),
+        NodeMetadata(
+            name="ForLoopNode",
+            description="Iterate over a list, exposing one item per invocation",
+            category="utility",
+        ),
+    ),
+    "orcheo.nodes.slack": (
+        NodeMetadata(
+            name="SlackNode",
+            description="Slack node",
+            category="slack",
+        ),
+        NodeMetadata(
+            name="SlackEventsParserNode",
+            description="Validate and parse Slack Events API payloads",
+            category="slack",
+        ),
+    ),
+    "orcheo.nodes.storage": (
+        NodeMetadata(
+            name="PostgresNode",
+            description="Execute SQL against a PostgreSQL database using psycopg.",
+            category="storage",
+        ),
+        NodeMetadata(
+            name="SQLiteNode",
+            description="Execute SQL statements against a SQLite database.",
+            category="storage",
+        ),
+        NodeMetadata(
+            name="GraphStoreAppendMessageNode",
+            description=(
+                "Append a message to a versioned chat history item in the LangGraph "
+                "graph store."
+            ),
+            category="storage",
+        ),
+    ),
+    "orcheo.nodes.sub_workflow": (
+        NodeMetadata(
+            name="SubWorkflowNode",
+            description="Execute a mini workflow inline using the node registry.",
+            category="utility",
+        ),
+    ),
+    "orcheo.nodes.telegram": (
+        NodeMetadata(
+            name="MessageTelegramNode",
+            description="Send message to Telegram",
+            category="messaging",
+        ),
+        NodeMetadata(
+            name="TelegramEventsParserNode",
+            description="Validate and parse Telegram Bot webhook updates",
+            category="telegram",
+        ),
+    ),
+    "orcheo.nodes.triggers": (
+        NodeMetadata(
+            name="WebhookTriggerNode",
+            description="Configure an HTTP webhook trigger.",
+            category="trigger",
+        ),
+        NodeMetadata(
+            name="CronTriggerNode",
+            description="Configure a cron-based schedule trigger.",
+            category="trigger",
+        ),
+        NodeMetadata(
+            name="ManualTriggerNode",
+            description="Trigger workflows manually from the dashboard.",
+            category="trigger",
+        ),
+        NodeMetadata(
+            name="HttpPollingTriggerNode",
+            description="Poll an HTTP endpoint on an interval to trigger runs.",
+            category="trigger",
+        ),
+    ),
+    "orcheo.nodes.wecom": (
+        NodeMetadata(
+            name="WeComEventsParserNode",
+            description="Validate WeCom signatures and parse callback payloads",
+            category="wecom",
+        ),
+        NodeMetadata(
+            name="WeComAIBotEventsParserNode",
+            description="Validate WeCom AI bot signatures and parse callbacks",
+            category="wecom",
+        ),
+        NodeMetadata(
+            name="WeComAIBotPassiveReplyNode",
+            description="Encrypt and return passive AI bot replies",
+            category="wecom",
+        ),
+        NodeMetadata(
+            name="WeComAIBotResponseNode",
+            description="Send active replies to WeCom AI bot response_url",
+            category="wecom",
+        ),
+        NodeMetadata(
+            name="WeComAccessTokenNode",
+            description="Fetch and cache WeCom access token",
+            category="wecom",
+        ),
+        NodeMetadata(
+            name="WeComSendMessageNode",
+            description="Send messages to WeCom chat",
+            category="wecom",
+        ),
+        NodeMetadata(
+            name="WeComGroupPushNode",
+            description="Send messages to WeCom group via webhook",
+            category="wecom",
+        ),
+        NodeMetadata(
+            name="WeComCustomerServiceSyncNode",
+            description="Sync messages from WeCom Customer Service (微信客服)",
+            category="wecom",
+        ),
+        NodeMetadata(
+            name="WeComCustomerServiceSendNode",
+            description="Send messages via WeCom Customer Service (微信客服)",
+            category="wecom",
+        ),
+    ),
+}
+
+
+__all__ = ["BUILTIN_NODES"]
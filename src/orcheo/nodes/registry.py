@@ -1,5 +1,6 @@
 """Registry implementation for Orcheo nodes."""
 
+import importlib
 from collections.abc import Callable
 from pydantic import BaseModel
 
@@ -28,6 +29,7 @@ class NodeRegistry:
         """Initialize an empty node registry."""
         self._nodes: dict[str, Callable] = {}
         self._metadata: dict[str, NodeMetadata] = {}
+        self._modules: dict[str, str] = {}
 
     def register(self, metadata: NodeMetadata) -> Callable[[Callable], Callable]:
         """Register a new node with its metadata.
@@ -42,10 +44,26 @@ class NodeRegistry:
         def decorator(func: Callable) -> Callable:
             self._nodes[metadata.name] = func
             self._metadata[metadata.name] = metadata
+            self._modules.pop(metadata.name, None)
             return func
 
         return decorator
 
+    def declare(self, module: str, metadata: NodeMetadata) -> None:
+        """Declare a node implemented in ``module`` without importing it.
+
+        The metadata is available immediately; ``module`` is imported by the
+        first :meth:`get_node` call for the node, which registers it.
+
+        Args:
+            module: Dotted path of the module registering the node
+            metadata: Node metadata matching the module's registration
+        """
+        if metadata.name in self._nodes:
+            return
+        self._metadata[metadata.name] = metadata
+        self._modules[metadata.name] = module
+
     def get_node(self, name: str) -> Callable | None:
         """Get a node implementation by name.
 
@@ -55,6 +73,10 @@ class NodeRegistry:
         Returns:
             Node implementation function or None if not found
         """
+        module = self._modules.get(name)
+        if module is not None and name not in self._nodes:
+            importlib.import_module(module)
+            self._modules.pop(name, None)
         return self._nodes.get(name)
 
     def get_metadata(self, name: str) -> NodeMetadata | None:
@@ -66,7 +88,11 @@ class NodeRegistry:
         return sorted(self._metadata.values(), key=lambda item: item.name.lower())
 
     def get_metadata_by_callable(self, obj: Callable) -> NodeMetadata | None:
-        """Return metadata associated with a registered callable."""
+        """Return metadata associated with a registered callable.
+
+        Only imported nodes are considered; a declared node's class cannot be
+        in use before its module has been imported.
+        """
         for name, registered in self._nodes.items():
             if registered is obj:
                 return self._metadata.get(name)
@@ -78,6 +104,7 @@ class NodeRegistry:
         """Remove one registered node and its metadata if present."""
         self._nodes.pop(name, None)
         self._metadata.pop(name, None)
+        self._modules.pop(name, None)
 
 
 # Global registry instance
@@ -12,6 +12,7 @@ from pydantic import Field, field_validator
 from orcheo.graph.state import State
 from orcheo.nodes.base import TaskNode
 from orcheo.nodes.registry import NodeMetadata, registry
+from orcheo.runtime.http_clients import get_http_client
 
 
 RSS_REQUEST_HEADERS = {
@@ -187,7 +188,12 @@ class RSSNode(TaskNode):
     ) -> tuple[list[dict[str, Any]], dict[str, str] | None]:
         """Fetch a single source, returning (documents, error_or_None)."""
         try:
-            response = await client.get(url, timeout=self.timeout)
+            response = await client.get(
+                url,
+                timeout=self.timeout,
+                headers=RSS_REQUEST_HEADERS,
+                follow_redirects=True,
+            )
             response.raise_for_status()
             body = response.text
         except httpx.HTTPError as exc:
@@ -223,19 +229,16 @@ class RSSNode(TaskNode):
         documents: list[dict[str, Any]] = []
         errors: list[dict[str, str]] = []
 
-        async with httpx.AsyncClient(
-            follow_redirects=True,
-            headers=RSS_REQUEST_HEADERS,
-        ) as client:
-            # Re-flatten because resolved_for_run() uses model_copy(update=…)
-            # which bypasses Pydantic field validators, so self.sources may
-            # be a bare string, tuple, set, or nested list after templating.
-            flat_sources = self._flatten_sources(self.sources)
-            for url in flat_sources:
-                docs, error = await self._fetch_source(client, url, now_iso)
-                documents.extend(docs)
-                if error is not None:
-                    errors.append(error)
+        client = get_http_client()
+        # Re-flatten because resolved_for_run() uses model_copy(update=…)
+        # which bypasses Pydantic field validators, so self.sources may
+        # be a bare string, tuple, set, or nested list after templating.
+        flat_sources = self._flatten_sources(self.sources)
+        for url in flat_sources:
+            docs, error = await self._fetch_source(client, url, now_iso)
+            documents.extend(docs)
+            if error is not None:
+                errors.append(error)
 
         return {
             "documents": documents,
@@ -12,6 +12,7 @@ from pydantic import BaseModel, Field, field_validator
 from orcheo.graph.state import State
 from orcheo.nodes.base import TaskNode
 from orcheo.nodes.registry import NodeMetadata, registry
+from orcheo.runtime.http_clients import get_http_client
 
 
 _SLACK_API_BASE_URL = "https://slack.com/api"
@@ -99,26 +100,24 @@ class SlackNode(TaskNode):
         self, endpoint: str, params: dict[str, Any] | None = None
     ) -> dict[str, Any]:
         """Issue a GET request to Slack Web API and return parsed JSON."""
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"{_SLACK_API_BASE_URL}/{endpoint}",
-                headers=self._headers(),
-                params=params,
-            )
-            response.raise_for_status()
+        response = await get_http_client(timeout=10.0).get(
+            f"{_SLACK_API_BASE_URL}/{endpoint}",
+            headers=self._headers(),
+            params=params,
+        )
+        response.raise_for_status()
         return response.json()
 
     async def _post_json(
         self, endpoint: str, payload: dict[str, Any]
     ) -> dict[str, Any]:
         """Issue a POST request to Slack Web API and return parsed JSON."""
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                f"{_SLACK_API_BASE_URL}/{endpoint}",
-                headers=self._headers(),
-                json=payload,
-            )
-            response.raise_for_status()
+        response = await get_http_client(timeout=10.0).post(
+            f"{_SLACK_API_BASE_URL}/{endpoint}",
+            headers=self._headers(),
+            json=payload,
+        )
+        response.raise_for_status()
         return response.json()
 
     async def _post_message(self) -> dict[str, Any]:
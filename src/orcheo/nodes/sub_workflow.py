@@ -7,11 +7,32 @@ from typing import Any
 from langchain_core.runnables import RunnableConfig
 from pydantic import Field
 from orcheo.graph.state import State
-from orcheo.nodes.base import TaskNode
+from orcheo.nodes.base import AINode, TaskNode
 from orcheo.nodes.registry import NodeMetadata, registry
 from orcheo.nodes.state_utils import normalise_state_snapshot
 
 
+def build_step_node(step: Mapping[str, Any]) -> AINode | TaskNode:
+    """Instantiate the registered node described by a step configuration.
+
+    Raises:
+        ValueError: If the step has no ``type`` or the type is not registered.
+    """
+    node_type = step.get("type")
+    if not isinstance(node_type, str) or not node_type:
+        msg = f"Each step must define a non-empty type: {step!r}"
+        raise ValueError(msg)
+
+    node_class = registry.get_node(node_type)
+    if node_class is None:
+        msg = f"Unknown node type {node_type!r} in sub-workflow"
+        raise ValueError(msg)
+
+    params = {key: value for key, value in step.items() if key != "type"}
+    params["name"] = str(params.get("name") or node_type)
+    return node_class(**params)
+
+
 @registry.register(
     NodeMetadata(
         name="SubWorkflowNode",
@@ -58,21 +79,8 @@ class SubWorkflowNode(TaskNode):
         result_lookup: dict[str, Any] = {}
 
         for step in self.steps:
-            node_type = step.get("type")
-            if not isinstance(node_type, str) or not node_type:
-                msg = f"Each step must define a non-empty type: {step!r}"
-                raise ValueError(msg)
-
-            node_class = registry.get_node(node_type)
-            if node_class is None:
-                msg = f"Unknown node type {node_type!r} in sub-workflow"
-                raise ValueError(msg)
-
-            params = {key: value for key, value in step.items() if key != "type"}
-            node_name = str(params.get("name") or step.get("name") or node_type)
-            params.setdefault("name", node_name)
-
-            node_instance = node_class(**params)
+            node_instance = build_step_node(step)
+            node_name = node_instance.name
             output = await node_instance(sub_state, config)
             node_payload = output["results"][node_name]
             sub_state["results"][node_name] = node_payload
@@ -99,4 +107,4 @@ class SubWorkflowNode(TaskNode):
         return payload
 
 
-__all__ = ["SubWorkflowNode"]
+__all__ = ["SubWorkflowNode", "build_step_node"]
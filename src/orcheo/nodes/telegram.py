@@ -7,6 +7,7 @@ from langchain_core.messages import BaseMessage, HumanMessage
 from langchain_core.runnables import RunnableConfig
 from pydantic import BaseModel, Field
 from telegram import Bot
+from orcheo.graph.blobs import with_resolved_blobs
 from orcheo.graph.state import State
 from orcheo.nodes.base import TaskNode
 from orcheo.nodes.registry import NodeMetadata, registry
@@ -299,7 +300,8 @@ class TelegramEventsParserNode(TaskNode):
 
     async def __call__(self, state: State, config: RunnableConfig) -> dict[str, Any]:
         """Execute the node and inject user text as a HumanMessage into state."""
-        runnable = self.resolved_for_run(state, config=config)
+        state = with_resolved_blobs(state)
+        runnable = await self.aresolved_for_run(state, config=config)
         result = await runnable.run(state, config)
         serialized = runnable._serialize_result(result)
         output: dict[str, Any] = {"results": {self.name: serialized}}
@@ -23,9 +23,12 @@ from xml.etree import ElementTree
 import httpx
 from langchain_core.runnables import RunnableConfig
 from pydantic import Field
+from orcheo.graph.blobs import with_resolved_blobs
 from orcheo.graph.state import State
 from orcheo.nodes.base import TaskNode
 from orcheo.nodes.registry import NodeMetadata, registry
+from orcheo.runtime.http_clients import get_http_client
+from orcheo.runtime.runnable_config import is_immediate_response_check
 
 
 if TYPE_CHECKING:
@@ -230,9 +233,7 @@ class WeComEventsParserNode(TaskNode):
 
     def is_immediate_response_check(self, config: RunnableConfig) -> bool:
         """Check if this is a synchronous immediate-response check execution."""
-        configurable = config.get("configurable", {})
-        thread_id = configurable.get("thread_id", "")
-        return thread_id.startswith("immediate-response-check")
+        return is_immediate_response_check(config)
 
     def success_response(self) -> dict[str, Any]:
         """Return a success immediate_response dict."""
@@ -517,14 +518,17 @@ class WeComEventsParserNode(TaskNode):
 
     async def __call__(self, state: State, config: RunnableConfig) -> dict[str, Any]:
         """Execute the node and merge agent messages into state."""
-        runnable = self.resolved_for_run(state, config=config)
+        state = with_resolved_blobs(state)
+        runnable = await self.aresolved_for_run(state, config=config)
         result = await runnable.run(state, config)
         serialized = runnable._serialize_result(result)
-        output: dict[str, Any] = {"results": {self.name: serialized}}
+        agent_messages = None
         if isinstance(serialized, dict):  # pragma: no branch
+            serialized = dict(serialized)
             agent_messages = serialized.pop("agent_messages", None)
-            if isinstance(agent_messages, list):
-                output["messages"] = agent_messages
+        output: dict[str, Any] = {"results": {self.name: serialized}}
+        if isinstance(agent_messages, list):
+            output["messages"] = agent_messages
         return output
 
 
@@ -608,9 +612,7 @@ class WeComAIBotEventsParserNode(TaskNode):
 
     def is_immediate_response_check(self, config: RunnableConfig) -> bool:
         """Check if this is a synchronous immediate-response check execution."""
-        configurable = config.get("configurable", {})
-        thread_id = configurable.get("thread_id", "")
-        return thread_id.startswith("immediate-response-check")
+        return is_immediate_response_check(config)
 
     def success_response(self) -> dict[str, Any]:
         """Return a success immediate_response dict."""
@@ -937,25 +939,25 @@ class WeComAIBotResponseNode(TaskNode):
 
         Returns a result dict with is_error and response data or error info.
         """
+        client = get_http_client(timeout=self.timeout)
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(response_url, json=payload)
-                response.raise_for_status()
-                try:
-                    data = response.json()
-                except ValueError:
-                    logger.warning(
-                        "WeCom AI bot response_url returned invalid JSON",
-                        extra={
-                            "event": "wecom_aibot_active_reply",
-                            "status": "failed",
-                        },
-                    )
-                    return {
-                        "is_error": True,
-                        "error": "Invalid JSON response",
-                        "status_code": response.status_code,
-                    }
+            response = await client.post(response_url, json=payload)
+            response.raise_for_status()
+            try:
+                data = response.json()
+            except ValueError:
+                logger.warning(
+                    "WeCom AI bot response_url returned invalid JSON",
+                    extra={
+                        "event": "wecom_aibot_active_reply",
+                        "status": "failed",
+                    },
+                )
+                return {
+                    "is_error": True,
+                    "error": "Invalid JSON response",
+                    "status_code": response.status_code,
+                }
         except httpx.TimeoutException:
             logger.warning(
                 "WeCom AI bot response_url request timed out",
@@ -1086,13 +1088,10 @@ class WeComAccessTokenNode(TaskNode):
         url = "https://qyapi.weixin.qq.com/cgi-bin/gettoken"
         params = {"corpid": self.corp_id, "corpsecret": self.app_secret}
 
-        client = httpx.AsyncClient(timeout=self.timeout)
-        try:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-        finally:
-            await client.aclose()
+        client = get_http_client(timeout=self.timeout)
+        response = await client.get(url, params=params)
+        response.raise_for_status()
+        data = response.json()
 
         if data.get("errcode", 0) != 0:
             msg = f"WeCom token error: {data.get('errmsg', 'Unknown error')}"
@@ -1197,13 +1196,10 @@ class WeComSendMessageNode(TaskNode):
         else:
             payload["text"] = {"content": self.message}
 
-        client = httpx.AsyncClient(timeout=self.timeout)
-        try:
-            response = await client.post(url, params=params, json=payload)
-            response.raise_for_status()
-            data = response.json()
-        finally:
-            await client.aclose()
+        client = get_http_client(timeout=self.timeout)
+        response = await client.post(url, params=params, json=payload)
+        response.raise_for_status()
+        data = response.json()
 
         errcode = data.get("errcode", 0)
         if errcode != 0:
@@ -1311,13 +1307,10 @@ class WeComGroupPushNode(TaskNode):
         else:
             payload["text"] = {"content": self.content}
 
-        client = httpx.AsyncClient(timeout=self.timeout)
-        try:
-            response = await client.post(url, json=payload)
-            response.raise_for_status()
-            data = response.json()
-        finally:
-            await client.aclose()
+        client = get_http_client(timeout=self.timeout)
+        response = await client.post(url, json=payload)
+        response.raise_for_status()
+        data = response.json()
 
         errcode = data.get("errcode", 0)
         if errcode != 0:
@@ -1914,7 +1907,7 @@ class WeComCustomerServiceSyncNode(TaskNode):
             base_payload["token"] = kf_token
 
         redis_client = _create_cs_redis_client()
-        client = httpx.AsyncClient(timeout=self.timeout)
+        client = get_http_client(timeout=self.timeout)
         try:
             sync_result = await _pull_cs_pages(
                 client, redis_client, url, params, base_payload, self.cursor
@@ -1955,19 +1948,21 @@ class WeComCustomerServiceSyncNode(TaskNode):
                 "should_process": should_process,
             }
         finally:
-            await client.aclose()
             await _close_cs_redis_client(redis_client)
 
     async def __call__(self, state: State, config: RunnableConfig) -> dict[str, Any]:
         """Execute the node and merge agent messages into state."""
-        runnable = self.resolved_for_run(state, config=config)
+        state = with_resolved_blobs(state)
+        runnable = await self.aresolved_for_run(state, config=config)
         result = await runnable.run(state, config)
         serialized = runnable._serialize_result(result)
-        output: dict[str, Any] = {"results": {self.name: serialized}}
+        agent_messages = None
         if isinstance(serialized, dict):  # pragma: no branch
+            serialized = dict(serialized)
             agent_messages = serialized.pop("agent_messages", None)
-            if isinstance(agent_messages, list):
-                output["messages"] = agent_messages
+        output: dict[str, Any] = {"results": {self.name: serialized}}
+        if isinstance(agent_messages, list):
+            output["messages"] = agent_messages
         return output
 
 
@@ -2043,13 +2038,10 @@ class WeComCustomerServiceSendNode(TaskNode):
         url = "https://qyapi.weixin.qq.com/cgi-bin/kf/send_msg"
         params: dict[str, str] = {"access_token": access_token}
 
-        client = httpx.AsyncClient(timeout=self.timeout)
-        try:
-            response = await client.post(url, params=params, json=payload)
-            response.raise_for_status()
-            data = response.json()
-        finally:
-            await client.aclose()
+        client = get_http_client(timeout=self.timeout)
+        response = await client.post(url, params=params, json=payload)
+        response.raise_for_status()
+        data = response.json()
 
         errcode = data.get("errcode", 0)
         errmsg = data.get("errmsg", "Unknown error")
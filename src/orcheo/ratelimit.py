@@ -0,0 +1,255 @@
+"""Rate limiting primitives shared by webhook triggers and authentication.
+
+Limits are enforced with the generic cell rate algorithm (GCRA), which keeps a
+single "theoretical arrival time" per key instead of a log of timestamps. The
+in-process backend bounds the number of tracked keys with LRU eviction, while
+the Redis backend shares limits between replicas. ``acquire`` is a coroutine so
+the Redis round trips never block the event loop.
+"""
+
+from __future__ import annotations
+import asyncio
+import logging
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Protocol, runtime_checkable
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_KEYS = 10_000
+DEFAULT_KEY_PREFIX = "orcheo:ratelimit:"
+_NANOSECONDS = 1_000_000_000
+
+Clock = Callable[[], int]
+
+
+@dataclass(slots=True, frozen=True)
+class RateLimitDecision:
+    """Outcome of a single rate limit check."""
+
+    allowed: bool
+    retry_after: float = 0.0
+
+
+@runtime_checkable
+class RateLimitBackend(Protocol):
+    """Storage for per-key rate limit state."""
+
+    async def acquire(
+        self,
+        key: str,
+        *,
+        limit: int,
+        period_seconds: float,
+        now: float | None = None,
+    ) -> RateLimitDecision:
+        """Consume one request for ``key`` if ``limit`` per period allows it.
+
+        ``now`` overrides the current time as seconds since the epoch.
+        """
+
+    def reset(self, key_prefix: str = "") -> None:
+        """Forget the state of every key starting with ``key_prefix``."""
+
+
+def _gcra(
+    tat: int | None, *, now: int, limit: int, period: int
+) -> tuple[RateLimitDecision, int | None]:
+    """Apply GCRA to one request using integer nanosecond timestamps.
+
+    ``tat`` is the key's theoretical arrival time. Up to ``limit`` requests may
+    arrive back to back, after which capacity refills evenly over ``period``.
+    Returns the decision and the arrival time to store, or ``None`` on denial.
+    """
+    interval = max(period // max(limit, 1), 1)
+    new_tat = max(tat or now, now) + interval
+    allow_at = new_tat - period
+    if allow_at > now:
+        return RateLimitDecision(False, (allow_at - now) / _NANOSECONDS), None
+    return RateLimitDecision(True), new_tat
+
+
+def _resolve_now(clock: Clock, now: float | None) -> int:
+    return clock() if now is None else int(now * _NANOSECONDS)
+
+
+class InMemoryRateLimitBackend:
+    """Process-local GCRA state with LRU eviction of idle keys."""
+
+    def __init__(
+        self, *, max_keys: int = DEFAULT_MAX_KEYS, clock: Clock = time.time_ns
+    ) -> None:
+        """Bound tracked keys to ``max_keys`` and read time from ``clock``."""
+        self._max_keys = max(int(max_keys), 1)
+        self._clock = clock
+        self._tats: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def acquire(
+        self,
+        key: str,
+        *,
+        limit: int,
+        period_seconds: float,
+        now: float | None = None,
+    ) -> RateLimitDecision:
+        """Consume one request for ``key`` if ``limit`` per period allows it."""
+        current = _resolve_now(self._clock, now)
+        period = int(period_seconds * _NANOSECONDS)
+        with self._lock:
+            decision, new_tat = _gcra(
+                self._tats.get(key), now=current, limit=limit, period=period
+            )
+            if new_tat is not None:
+                self._tats[key] = new_tat
+            if key in self._tats:
+                self._tats.move_to_end(key)
+            self._evict(current)
+        return decision
+
+    def reset(self, key_prefix: str = "") -> None:
+        """Forget the state of every key starting with ``key_prefix``."""
+        with self._lock:
+            if not key_prefix:
+                self._tats.clear()
+                return
+            for key in [key for key in self._tats if key.startswith(key_prefix)]:
+                del self._tats[key]
+
+    def _evict(self, now: int) -> None:
+        # Keys whose arrival time has passed carry no state worth keeping, so
+        # idle keys are dropped from the LRU end first; the capacity bound then
+        # evicts the least recently used keys even if they are still limited.
+        while self._tats:
+            oldest_key, oldest_tat = next(iter(self._tats.items()))
+            if oldest_tat > now and len(self._tats) <= self._max_keys:
+                return
+            del self._tats[oldest_key]
+
+
+class RedisRateLimitBackend:
+    """GCRA state stored in Redis so limits hold across replicas.
+
+    Each key is updated with an optimistic ``WATCH``/``MULTI`` transaction,
+    run in a worker thread so the event loop keeps serving requests, and
+    expires once its arrival time passes. When Redis is unreachable requests
+    are allowed rather than failing closed.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        prefix: str = DEFAULT_KEY_PREFIX,
+        clock: Clock = time.time_ns,
+    ) -> None:
+        """Store state through ``client`` under keys starting with ``prefix``."""
+        self._client = client
+        self._prefix = prefix
+        self._clock = clock
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> RedisRateLimitBackend:
+        """Build a backend connected to the Redis server at ``url``."""
+        import redis
+
+        return cls(redis.Redis.from_url(url), **kwargs)
+
+    async def acquire(
+        self,
+        key: str,
+        *,
+        limit: int,
+        period_seconds: float,
+        now: float | None = None,
+    ) -> RateLimitDecision:
+        """Consume one request for ``key`` if ``limit`` per period allows it."""
+        current = _resolve_now(self._clock, now)
+        period = int(period_seconds * _NANOSECONDS)
+        try:
+            return await asyncio.to_thread(
+                self._acquire, self._prefix + key, current, limit, period
+            )
+        except Exception:
+            logger.warning(
+                "Rate limit backend unavailable; allowing request for %s",
+                key,
+                exc_info=True,
+            )
+            return RateLimitDecision(True)
+
+    def reset(self, key_prefix: str = "") -> None:
+        """Forget the state of every key starting with ``key_prefix``."""
+        keys = list(self._client.scan_iter(match=f"{self._prefix}{key_prefix}*"))
+        if keys:
+            self._client.delete(*keys)
+
+    def _acquire(
+        self, name: str, now: int, limit: int, period: int
+    ) -> RateLimitDecision:
+        from redis.exceptions import WatchError
+
+        with self._client.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(name)
+                    raw = pipe.get(name)
+                    decision, new_tat = _gcra(
+                        int(raw) if raw is not None else None,
+                        now=now,
+                        limit=limit,
+                        period=period,
+                    )
+                    if new_tat is None:
+                        return decision
+                    ttl_ms = max(math.ceil((new_tat - now) / 1_000_000), 1)
+                    pipe.multi()
+                    pipe.set(name, new_tat, px=ttl_ms)
+                    pipe.execute()
+                    return decision
+                except WatchError:
+                    continue
+
+
+_redis_backends: dict[str, RedisRateLimitBackend] = {}
+_redis_backends_lock = threading.Lock()
+
+
+def create_rate_limit_backend() -> RateLimitBackend:
+    """Return the rate limit backend selected through the environment.
+
+    ``ORCHEO_RATE_LIMIT_BACKEND=redis`` shares limits between replicas through
+    ``ORCHEO_RATE_LIMIT_REDIS_URL`` (falling back to ``REDIS_URL``). Otherwise
+    each caller receives its own in-process backend.
+    """
+    backend = os.getenv("ORCHEO_RATE_LIMIT_BACKEND", "memory").strip().lower()
+    if backend != "redis":
+        return InMemoryRateLimitBackend()
+    url = (
+        os.getenv("ORCHEO_RATE_LIMIT_REDIS_URL")
+        or os.getenv("REDIS_URL")
+        or "redis://localhost:6379/0"
+    )
+    with _redis_backends_lock:
+        shared = _redis_backends.get(url)
+        if shared is None:
+            shared = RedisRateLimitBackend.from_url(url)
+            _redis_backends[url] = shared
+    return shared
+
+
+__all__ = [
+    "DEFAULT_KEY_PREFIX",
+    "DEFAULT_MAX_KEYS",
+    "InMemoryRateLimitBackend",
+    "RateLimitBackend",
+    "RateLimitDecision",
+    "RedisRateLimitBackend",
+    "create_rate_limit_backend",
+]
@@ -1,5 +1,7 @@
 """Runtime utilities for workflow execution."""
 
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any
 from .credentials import (
     CredentialReference,
     CredentialReferenceNotFoundError,
@@ -13,7 +15,19 @@ from .credentials import (
     get_active_credential_resolver,
     parse_credential_reference,
 )
-from .state_builder import build_initial_state
+
+
+if TYPE_CHECKING:  # pragma: no cover - import for typing only
+    from .state_builder import build_initial_state
+
+
+def __getattr__(name: str) -> Any:
+    """Import graph-dependent helpers lazily to keep this package low-level."""
+    if name == "build_initial_state":
+        from .state_builder import build_initial_state as _build_initial_state
+
+        return _build_initial_state
+    raise AttributeError(name)
 
 
 __all__ = [
@@ -0,0 +1,402 @@
+"""Process-wide pooled HTTP clients shared by integration nodes.
+
+Nodes obtain clients through :func:`get_http_client` instead of opening a new
+``httpx.AsyncClient`` per call, so TCP/TLS connections (and HTTP/2 sessions
+when ``h2`` is installed) are reused across nodes and runs. Clients are keyed
+by the running event loop and a :class:`HttpClientProfile` (proxy, TLS
+verification and default timeout); per-request options such as headers or
+``follow_redirects`` are passed to the request methods instead. Clients
+without an explicit proxy honour ``HTTP_PROXY``/``HTTPS_PROXY``/``ALL_PROXY``
+and ``NO_PROXY`` like a default ``httpx.AsyncClient``.
+
+Shared clients never store cookies: a ``Set-Cookie`` received by one
+workflow must not be replayed on requests made by another. Cookies passed
+explicitly to a request are still sent with it.
+
+Shared clients must not be closed by callers. The API server and workers
+release them on shutdown through :func:`close_http_clients`.
+"""
+
+from __future__ import annotations
+import asyncio
+import importlib.util
+import socket
+import threading
+import time
+import weakref
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from http.cookiejar import Cookie, CookieJar, CookiePolicy
+from ipaddress import ip_address
+from typing import Any
+import httpcore
+import httpx
+from httpx._utils import get_environment_proxies
+from orcheo.tracing.metrics import HTTP_CLIENT_REQUEST_SECONDS
+
+
+DEFAULT_TIMEOUT = 30.0
+
+
+@dataclass(frozen=True, slots=True)
+class HttpClientProfile:
+    """Connection settings that require a dedicated client."""
+
+    proxy: str | None = None
+    verify: bool = True
+    timeout: float | None = DEFAULT_TIMEOUT
+
+
+class _RejectCookiesPolicy(CookiePolicy):
+    """Cookie policy that neither stores nor returns cookies."""
+
+    netscape = True
+    rfc2965 = False
+    hide_cookie2 = True
+
+    def set_ok(self, cookie: Cookie, request: Any) -> bool:
+        return False
+
+    def return_ok(self, cookie: Cookie, request: Any) -> bool:
+        return False
+
+    def domain_return_ok(self, domain: str, request: Any) -> bool:
+        return False
+
+    def path_return_ok(self, path: str, request: Any) -> bool:
+        return False
+
+
+class _DnsCache:
+    """Cache resolved address lists for ``ttl`` seconds, shared across loops.
+
+    ``getaddrinfo`` does not report record TTLs, so ``ttl`` is kept short.
+    Every lookup rotates the cached list, so hosts published with several
+    records (round-robin DNS) still spread connections across them.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self._ttl = ttl
+        self._entries: dict[tuple[str, int], tuple[float, list[str]]] = {}
+        self._lock = threading.Lock()
+
+    async def resolve(self, host: str, port: int) -> list[str]:
+        try:
+            ip_address(host)
+        except ValueError:
+            pass
+        else:
+            return [host]
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get((host, port))
+            if cached is not None and cached[0] > now:
+                addresses = cached[1]
+                # Rotate in place so the next caller starts at the next record.
+                addresses.append(addresses.pop(0))
+                return list(addresses)
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            host, port, type=socket.SOCK_STREAM
+        )
+        addresses = list(dict.fromkeys(str(info[4][0]) for info in infos))
+        with self._lock:
+            self._entries[(host, port)] = (now + self._ttl, list(addresses))
+        return addresses
+
+    def forget(self, host: str, port: int) -> None:
+        with self._lock:
+            self._entries.pop((host, port), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class _CachingNetworkBackend(httpcore.AsyncNetworkBackend):
+    """Resolve hostnames through :class:`_DnsCache` before connecting.
+
+    TLS still uses the original hostname for SNI and certificate checks since
+    httpcore passes it to ``start_tls`` separately.
+    """
+
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, cache: _DnsCache) -> None:
+        self._backend = backend
+        self._cache = cache
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[Any] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        addresses = await self._cache.resolve(host, port)
+        for attempt, address in enumerate(addresses, start=1):
+            try:
+                return await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except httpcore.ConnectError:
+                if attempt == len(addresses):
+                    self._cache.forget(host, port)
+                    raise
+        raise httpcore.ConnectError(f"No addresses resolved for {host}")
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Iterable[Any] | None = None,
+    ) -> httpcore.AsyncNetworkStream:  # pragma: no cover - unused by profiles
+        return await self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class _SlotLease:
+    """Idempotent handle on one acquired per-host slot."""
+
+    def __init__(self, slot: asyncio.Semaphore) -> None:
+        self._slot: asyncio.Semaphore | None = slot
+
+    def release(self) -> None:
+        slot, self._slot = self._slot, None
+        if slot is not None:
+            slot.release()
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response stream that frees a per-host slot once the body is done.
+
+    The slot is released when the body has been read, when iteration stops
+    early, when the stream is closed and, as a last resort, when a response
+    that was never closed is garbage collected.
+    """
+
+    def __init__(self, stream: httpx.AsyncByteStream, lease: _SlotLease) -> None:
+        self._stream = stream
+        self._lease = lease
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._stream:
+                yield chunk
+        finally:
+            self._lease.release()
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._lease.release()
+
+
+class _HostLimitedTransport(httpx.AsyncBaseTransport):
+    """Bound concurrent requests per host and record per-host latency.
+
+    Waiting for a slot counts against the request's ``pool`` timeout and
+    fails with :class:`httpx.PoolTimeout` like waiting for a pooled
+    connection does.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        per_host: int,
+        slots: dict[str, asyncio.Semaphore] | None = None,
+    ) -> None:
+        self._transport = transport
+        self._per_host = per_host
+        self._slots = {} if slots is None else slots
+
+    async def _acquire(self, request: httpx.Request) -> _SlotLease:
+        host = request.url.host
+        slot = self._slots.get(host)
+        if slot is None:
+            slot = self._slots[host] = asyncio.Semaphore(self._per_host)
+        timeouts = request.extensions.get("timeout") or {}
+        try:
+            await asyncio.wait_for(slot.acquire(), timeouts.get("pool"))
+        except TimeoutError:
+            msg = f"Timed out waiting for a connection slot to {host}"
+            raise httpx.PoolTimeout(msg, request=request) from None
+        return _SlotLease(slot)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        lease = await self._acquire(request)
+        started = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            lease.release()
+            HTTP_CLIENT_REQUEST_SECONDS.observe(
+                time.perf_counter() - started, host=host, outcome="error"
+            )
+            raise
+        HTTP_CLIENT_REQUEST_SECONDS.observe(
+            time.perf_counter() - started,
+            host=host,
+            outcome=f"{response.status_code // 100}xx",
+        )
+        stream = response.stream
+        if isinstance(stream, httpx.AsyncByteStream):
+            response.stream = _ReleasingStream(stream, lease)
+            weakref.finalize(response, lease.release)
+        else:  # pragma: no cover - transports always return async streams
+            lease.release()
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class HttpClientManager:
+    """Create and cache pooled ``httpx.AsyncClient`` instances per profile."""
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        max_connections_per_host: int = 20,
+        dns_cache_ttl: float = 30.0,
+        http2: bool | None = None,
+    ) -> None:
+        """Configure pool limits shared by every client the manager creates.
+
+        ``http2`` defaults to enabled when the optional ``h2`` package is
+        installed.
+        """
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._per_host = max_connections_per_host
+        self._http2 = (
+            importlib.util.find_spec("h2") is not None if http2 is None else http2
+        )
+        self._dns_cache = _DnsCache(dns_cache_ttl)
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[HttpClientProfile, httpx.AsyncClient]
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get_client(
+        self,
+        *,
+        proxy: str | None = None,
+        verify: bool = True,
+        timeout: float | None = DEFAULT_TIMEOUT,
+    ) -> httpx.AsyncClient:
+        """Return the shared client for this event loop and profile."""
+        loop = asyncio.get_running_loop()
+        profile = HttpClientProfile(proxy=proxy, verify=verify, timeout=timeout)
+        with self._lock:
+            clients = self._clients.get(loop)
+            if clients is None:
+                for stale in [item for item in self._clients if item.is_closed()]:
+                    del self._clients[stale]
+                clients = self._clients[loop] = {}
+            client = clients.get(profile)
+            if client is None or client.is_closed:
+                client = clients[profile] = self._create_client(profile)
+        return client
+
+    def _create_client(self, profile: HttpClientProfile) -> httpx.AsyncClient:
+        slots: dict[str, asyncio.Semaphore] = {}
+        mounts: dict[str, httpx.AsyncBaseTransport | None] = {}
+        if profile.proxy is None:
+            # An explicit transport makes httpx ignore the proxy environment
+            # variables, so mount the proxies they configure ourselves.
+            for pattern, proxy in get_environment_proxies().items():
+                mounts[pattern] = (
+                    None
+                    if proxy is None
+                    else _HostLimitedTransport(
+                        self._create_transport(profile, proxy), self._per_host, slots
+                    )
+                )
+        return httpx.AsyncClient(
+            transport=_HostLimitedTransport(
+                self._create_transport(profile, profile.proxy), self._per_host, slots
+            ),
+            mounts=mounts,
+            timeout=profile.timeout,
+            cookies=CookieJar(policy=_RejectCookiesPolicy()),
+        )
+
+    def _create_transport(
+        self, profile: HttpClientProfile, proxy: str | None
+    ) -> httpx.AsyncHTTPTransport:
+        transport = httpx.AsyncHTTPTransport(
+            verify=profile.verify,
+            http2=self._http2,
+            limits=self._limits,
+            proxy=proxy,
+        )
+        pool = getattr(transport, "_pool", None)
+        # Proxies resolve target hosts themselves; cache lookups for direct
+        # connections only.
+        if proxy is None and isinstance(pool, httpcore.AsyncConnectionPool):
+            pool._network_backend = _CachingNetworkBackend(
+                pool._network_backend, self._dns_cache
+            )
+        return transport
+
+    async def aclose(self) -> None:
+        """Close the clients bound to the running loop and forget the rest.
+
+        Clients created on other event loops cannot be closed from here; they
+        are dropped so their connections are released with their loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._clients.pop(loop, {})
+            self._clients.clear()
+        self._dns_cache.clear()
+        for client in clients.values():
+            await client.aclose()
+
+
+_manager = HttpClientManager()
+
+
+def get_http_client_manager() -> HttpClientManager:
+    """Return the process-wide HTTP client manager."""
+    return _manager
+
+
+def get_http_client(
+    *,
+    proxy: str | None = None,
+    verify: bool = True,
+    timeout: float | None = DEFAULT_TIMEOUT,
+) -> httpx.AsyncClient:
+    """Return a shared pooled client; callers must not close it."""
+    return _manager.get_client(proxy=proxy, verify=verify, timeout=timeout)
+
+
+async def close_http_clients() -> None:
+    """Close the shared clients owned by the running event loop."""
+    await _manager.aclose()
+
+
+__all__ = [
+    "DEFAULT_TIMEOUT",
+    "HttpClientManager",
+    "HttpClientProfile",
+    "close_http_clients",
+    "get_http_client",
+    "get_http_client_manager",
+]
@@ -13,6 +13,15 @@ from orcheo.agentensor.prompts import TrainablePrompt, TrainablePrompts
 _MAX_RECURSION_LIMIT = 250
 _MAX_CONCURRENCY = 32
 
+# ``configurable`` flag set while a webhook executes inline to produce its
+# immediate HTTP response; the remainder of the run resumes in a worker.
+IMMEDIATE_RESPONSE_CHECK_KEY = "immediate_response_check"
+_IMMEDIATE_RESPONSE_THREAD_PREFIX = "immediate-response-check"
+
+# Checkpoint metadata flag marking a run that a webhook started inline and
+# handed off to a worker; only such runs resume from their checkpoint.
+WEBHOOK_HANDOFF_METADATA_KEY = "orcheo_webhook_handoff"
+
 
 def _ensure_json_serialisable(value: Any, *, field_name: str) -> Any:
     """Raise a validation error when the value cannot be JSON-serialised."""
@@ -242,8 +251,22 @@ def _merge_prompts_field(
     merged["prompts"] = merged_prompts
 
 
+def is_immediate_response_check(config: Mapping[str, Any]) -> bool:
+    """Return whether ``config`` belongs to an inline immediate-response pass."""
+    configurable = config.get("configurable") or {}
+    if configurable.get(IMMEDIATE_RESPONSE_CHECK_KEY):
+        return True
+    thread_id = configurable.get("thread_id", "")
+    return isinstance(thread_id, str) and thread_id.startswith(
+        _IMMEDIATE_RESPONSE_THREAD_PREFIX
+    )
+
+
 __all__ = [
+    "IMMEDIATE_RESPONSE_CHECK_KEY",
     "RunnableConfigModel",
+    "WEBHOOK_HANDOFF_METADATA_KEY",
+    "is_immediate_response_check",
     "merge_runnable_configs",
     "parse_runnable_config",
 ]
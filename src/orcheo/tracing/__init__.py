@@ -1,6 +1,15 @@
 """Tracing helpers for Orcheo runtime components."""
 
 from __future__ import annotations
+from orcheo.tracing.instrumentation import WorkflowInstrumentation
+from orcheo.tracing.metrics import (
+    CONTENT_TYPE_LATEST,
+    MetricsRegistry,
+    render_metrics,
+    start_metrics_server,
+    track_connection_pool,
+    track_trigger_dispatch,
+)
 from orcheo.tracing.provider import configure_tracing, get_tracer
 from orcheo.tracing.workflow import (
     WorkflowSpanContext,
@@ -13,6 +22,9 @@ from orcheo.tracing.workflow import (
 
 
 __all__ = [
+    "CONTENT_TYPE_LATEST",
+    "MetricsRegistry",
+    "WorkflowInstrumentation",
     "WorkflowSpanContext",
     "configure_tracing",
     "get_tracer",
@@ -20,5 +32,9 @@ __all__ = [
     "record_workflow_completion",
     "record_workflow_failure",
     "record_workflow_step",
+    "render_metrics",
+    "start_metrics_server",
+    "track_connection_pool",
+    "track_trigger_dispatch",
     "workflow_span",
 ]
@@ -0,0 +1,454 @@
+"""LangChain callback instrumentation producing timed workflow node spans."""
+
+from __future__ import annotations
+import inspect
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+from langchain_core.runnables import RunnableConfig
+from langgraph.errors import GraphBubbleUp
+from opentelemetry import metrics, trace
+from opentelemetry.trace import Span, Status, StatusCode, Tracer
+from orcheo.tracing.metrics import NODE_DURATION_SECONDS
+
+
+_meter = metrics.get_meter(__name__)
+NODE_DURATION_HISTOGRAM = _meter.create_histogram(
+    "orcheo.node.duration",
+    unit="ms",
+    description="Wall-clock execution time of workflow nodes.",
+)
+NODE_QUEUE_DELAY_HISTOGRAM = _meter.create_histogram(
+    "orcheo.node.queue_delay",
+    unit="ms",
+    description="Time between a node becoming runnable and starting to execute.",
+)
+
+_NANOS_PER_MILLI = 1_000_000
+
+
+@dataclass(slots=True)
+class _NodeRun:
+    """Bookkeeping for a node span between its start and end callbacks."""
+
+    name: str
+    node_type: str
+    span: Span
+    step: int | None
+    started_ns: int
+    ended_ns: int | None = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    llm_calls: int = 0
+    tool_calls: int = 0
+
+
+@dataclass(slots=True)
+class _ChildRun:
+    """An LLM or tool span nested beneath a node span."""
+
+    span: Span
+    node: _NodeRun | None
+    kind: str
+
+
+@dataclass(slots=True)
+class _RunTree:
+    """Parent links for every callback run, used to find the owning node."""
+
+    parents: dict[UUID, UUID | None] = field(default_factory=dict)
+    nodes: dict[UUID, _NodeRun] = field(default_factory=dict)
+
+    def owning_node(self, run_id: UUID | None) -> _NodeRun | None:
+        seen = 0
+        while run_id is not None and seen < 256:
+            node = self.nodes.get(run_id)
+            if node is not None:
+                return node
+            run_id = self.parents.get(run_id)
+            seen += 1
+        return None
+
+
+class WorkflowInstrumentation(BaseCallbackHandler):
+    """Open node spans when LangGraph starts a node and close them when it ends.
+
+    Spans carry true wall-clock start and end times, the queueing delay since
+    the previous superstep finished, and child spans for LLM and tool calls
+    with token counts rolled up onto the node. Durations and queueing delays
+    are also recorded in the ``orcheo.node.*`` histograms. Passing the
+    compiled ``graph`` labels Prometheus node durations by node class rather
+    than by the user-chosen node name, which keeps their cardinality bounded.
+
+    Finished node spans stay open until :func:`record_workflow_step` attaches
+    the node's update payload, or until :meth:`close` ends them.
+    """
+
+    run_inline = True
+
+    def __init__(
+        self,
+        tracer: Tracer,
+        *,
+        parent: Span | None = None,
+        graph: Any | None = None,
+    ) -> None:
+        """Create node spans with ``tracer`` beneath ``parent``."""
+        self._tracer = tracer
+        self._node_types = _graph_node_types(graph)
+        parent_span = parent or trace.get_current_span()
+        self._context = trace.set_span_in_context(parent_span)
+        self._lock = threading.Lock()
+        self._tree = _RunTree()
+        self._children: dict[UUID, _ChildRun] = {}
+        self._finished: defaultdict[str, deque[_NodeRun]] = defaultdict(deque)
+        self._step_ended_ns: dict[int, int] = {}
+        self._created_ns = time.time_ns()
+
+    def attach(self, config: RunnableConfig) -> RunnableConfig:
+        """Return a copy of ``config`` that reports callbacks to this handler."""
+        callbacks = config.get("callbacks")
+        existing = list(callbacks) if isinstance(callbacks, Sequence) else []
+        return {**config, "callbacks": [*existing, self]}
+
+    def take_finished(self, node_name: str) -> tuple[Span, int] | None:
+        """Pop the oldest finished span for ``node_name`` and its end time."""
+        with self._lock:
+            pending = self._finished.get(node_name)
+            if not pending:
+                return None
+            node = pending.popleft()
+        return node.span, node.ended_ns or time.time_ns()
+
+    def close(self) -> None:
+        """End every span that is still open."""
+        with self._lock:
+            leftovers = [run for runs in self._finished.values() for run in runs]
+            self._finished.clear()
+            active = list(self._tree.nodes.values())
+            children = list(self._children.values())
+            self._tree = _RunTree()
+            self._children.clear()
+        now = time.time_ns()
+        for child in children:
+            child.span.end(end_time=now)
+        for node in active:
+            node.span.set_status(Status(StatusCode.ERROR, "node did not finish"))
+            node.span.end(end_time=now)
+        for node in leftovers:
+            node.span.end(end_time=node.ended_ns or now)
+
+    # Chain callbacks -----------------------------------------------------
+
+    def on_chain_start(
+        self,
+        serialized: dict[str, Any] | None,
+        inputs: Any,
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Open a span when the starting chain is a LangGraph node."""
+        started_ns = time.time_ns()
+        node_name = (metadata or {}).get("langgraph_node")
+        with self._lock:
+            self._tree.parents[run_id] = parent_run_id
+            if node_name is None or kwargs.get("name") != node_name:
+                return
+            step = _coerce_int((metadata or {}).get("langgraph_step"))
+            parent = self._tree.owning_node(parent_run_id)
+            ready_ns = self._step_ready_ns(step)
+        context = trace.set_span_in_context(parent.span) if parent else self._context
+        node_type = self._node_types.get(str(node_name), "unknown")
+        attributes: dict[str, Any] = {
+            "orcheo.node.id": str(node_name),
+            "orcheo.node.display_name": str(node_name),
+            "orcheo.node.type": node_type,
+        }
+        if step is not None:
+            attributes["orcheo.node.step"] = step
+        queue_delay_ms = max(started_ns - ready_ns, 0) / _NANOS_PER_MILLI
+        attributes["orcheo.node.queue_delay_ms"] = queue_delay_ms
+        span = self._tracer.start_span(
+            str(node_name),
+            context=context,
+            attributes=attributes,
+            start_time=started_ns,
+        )
+        NODE_QUEUE_DELAY_HISTOGRAM.record(
+            queue_delay_ms, {"orcheo.node.name": str(node_name)}
+        )
+        with self._lock:
+            self._tree.nodes[run_id] = _NodeRun(
+                name=str(node_name),
+                node_type=node_type,
+                span=span,
+                step=step,
+                started_ns=started_ns,
+            )
+
+    def on_chain_end(
+        self,
+        outputs: Any,
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        """Record the end of a node span."""
+        self._finish_node(run_id, error=None)
+
+    def on_chain_error(
+        self,
+        error: BaseException,
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        """Record the end of a node span that raised ``error``."""
+        self._finish_node(run_id, error=error)
+
+    # LLM callbacks -------------------------------------------------------
+
+    def on_llm_start(
+        self,
+        serialized: dict[str, Any] | None,
+        prompts: list[str],
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Open an LLM span beneath the owning node."""
+        self._start_child(
+            "llm", run_id, parent_run_id, _run_name(serialized, kwargs, "llm")
+        )
+
+    def on_chat_model_start(
+        self,
+        serialized: dict[str, Any] | None,
+        messages: list[list[Any]],
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Open a chat model span beneath the owning node."""
+        self._start_child(
+            "llm", run_id, parent_run_id, _run_name(serialized, kwargs, "chat_model")
+        )
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        """Close an LLM span, recording token usage on it and its node."""
+        input_tokens, output_tokens = _llm_token_usage(response)
+        with self._lock:
+            child = self._children.pop(run_id, None)
+            self._tree.parents.pop(run_id, None)
+            if child is None:
+                return
+            if child.node is not None:
+                child.node.input_tokens += input_tokens
+                child.node.output_tokens += output_tokens
+        child.span.set_attribute("orcheo.token.input", input_tokens)
+        child.span.set_attribute("orcheo.token.output", output_tokens)
+        child.span.set_status(Status(StatusCode.OK))
+        child.span.end()
+
+    def on_llm_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        """Close an LLM span that raised ``error``."""
+        self._fail_child(run_id, error)
+
+    # Tool callbacks ------------------------------------------------------
+
+    def on_tool_start(
+        self,
+        serialized: dict[str, Any] | None,
+        input_str: str,
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Open a tool span beneath the owning node."""
+        self._start_child(
+            "tool", run_id, parent_run_id, _run_name(serialized, kwargs, "tool")
+        )
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        """Close a tool span."""
+        with self._lock:
+            child = self._children.pop(run_id, None)
+            self._tree.parents.pop(run_id, None)
+        if child is None:
+            return
+        child.span.set_status(Status(StatusCode.OK))
+        child.span.end()
+
+    def on_tool_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        """Close a tool span that raised ``error``."""
+        self._fail_child(run_id, error)
+
+    # Internals -----------------------------------------------------------
+
+    def _step_ready_ns(self, step: int | None) -> int:
+        if step is None:
+            return self._created_ns
+        earlier = [ended for s, ended in self._step_ended_ns.items() if s < step]
+        return max(earlier, default=self._created_ns)
+
+    def _finish_node(self, run_id: UUID, *, error: BaseException | None) -> None:
+        ended_ns = time.time_ns()
+        with self._lock:
+            self._tree.parents.pop(run_id, None)
+            node = self._tree.nodes.pop(run_id, None)
+            if node is None:
+                return
+            node.ended_ns = ended_ns
+            if node.step is not None:
+                self._step_ended_ns[node.step] = max(
+                    self._step_ended_ns.get(node.step, 0), ended_ns
+                )
+        duration_ms = (ended_ns - node.started_ns) / _NANOS_PER_MILLI
+        span = node.span
+        span.set_attribute("orcheo.node.duration_ms", duration_ms)
+        if node.llm_calls:
+            span.set_attribute("orcheo.node.llm_calls", node.llm_calls)
+            span.set_attribute("orcheo.token.input", node.input_tokens)
+            span.set_attribute("orcheo.token.output", node.output_tokens)
+        if node.tool_calls:
+            span.set_attribute("orcheo.node.tool_calls", node.tool_calls)
+        status = "success"
+        if isinstance(error, GraphBubbleUp):
+            status = "interrupted"
+            span.add_event("node.interrupted", {"type": type(error).__name__})
+        elif error is not None:
+            status = "error"
+            span.record_exception(error)
+            span.set_status(Status(StatusCode.ERROR, str(error)))
+        NODE_DURATION_HISTOGRAM.record(
+            duration_ms, {"orcheo.node.name": node.name, "orcheo.node.status": status}
+        )
+        NODE_DURATION_SECONDS.observe(
+            duration_ms / 1000, node_type=node.node_type, status=status
+        )
+        if status == "success":
+            with self._lock:
+                self._finished[node.name].append(node)
+            return
+        span.end(end_time=ended_ns)
+
+    def _start_child(
+        self, kind: str, run_id: UUID, parent_run_id: UUID | None, name: str
+    ) -> None:
+        started_ns = time.time_ns()
+        with self._lock:
+            self._tree.parents[run_id] = parent_run_id
+            node = self._tree.owning_node(parent_run_id)
+            if node is not None:
+                if kind == "llm":
+                    node.llm_calls += 1
+                else:
+                    node.tool_calls += 1
+        context = trace.set_span_in_context(node.span) if node else self._context
+        span = self._tracer.start_span(
+            name,
+            context=context,
+            attributes={"orcheo.span.kind": kind},
+            start_time=started_ns,
+        )
+        with self._lock:
+            self._children[run_id] = _ChildRun(span=span, node=node, kind=kind)
+
+    def _fail_child(self, run_id: UUID, error: BaseException) -> None:
+        with self._lock:
+            child = self._children.pop(run_id, None)
+            self._tree.parents.pop(run_id, None)
+        if child is None:
+            return
+        child.span.record_exception(error)
+        child.span.set_status(Status(StatusCode.ERROR, str(error)))
+        child.span.end()
+
+
+def _run_name(
+    serialized: Mapping[str, Any] | None, kwargs: Mapping[str, Any], default: str
+) -> str:
+    name = kwargs.get("name")
+    if isinstance(name, str) and name:
+        return name
+    if serialized:
+        candidate = serialized.get("name")
+        if isinstance(candidate, str) and candidate:
+            return candidate
+        identifier = serialized.get("id")
+        if isinstance(identifier, Sequence) and identifier:
+            return str(identifier[-1])
+    return default
+
+
+def _graph_node_types(graph: Any) -> dict[str, str]:
+    """Map each node name of a compiled LangGraph ``graph`` to its class name."""
+    specs = getattr(getattr(graph, "builder", None), "nodes", None)
+    if not isinstance(specs, Mapping):
+        return {}
+    return {
+        str(name): _node_type(getattr(spec, "runnable", None))
+        for name, spec in specs.items()
+    }
+
+
+def _node_type(runnable: Any) -> str:
+    """Return a bounded type label for the callable behind a graph node."""
+    target = getattr(runnable, "afunc", None) or getattr(runnable, "func", None)
+    if target is None:
+        target = runnable
+    if target is None or inspect.isfunction(target) or inspect.ismethod(target):
+        return "function"
+    return type(target).__name__
+
+
+def _llm_token_usage(response: LLMResult) -> tuple[int, int]:
+    """Return ``(input, output)`` token counts reported by an LLM response."""
+    input_tokens = 0
+    output_tokens = 0
+    for generations in response.generations:
+        for generation in generations:
+            message = getattr(generation, "message", None)
+            usage = getattr(message, "usage_metadata", None)
+            if isinstance(usage, Mapping):
+                input_tokens += _coerce_int(usage.get("input_tokens")) or 0
+                output_tokens += _coerce_int(usage.get("output_tokens")) or 0
+    if input_tokens or output_tokens:
+        return input_tokens, output_tokens
+    llm_output = response.llm_output or {}
+    usage = llm_output.get("token_usage") or llm_output.get("usage")
+    if isinstance(usage, Mapping):
+        prompt = usage.get("prompt_tokens", usage.get("input_tokens"))
+        completion = usage.get("completion_tokens", usage.get("output_tokens"))
+        return _coerce_int(prompt) or 0, _coerce_int(completion) or 0
+    return 0, 0
+
+
+def _coerce_int(value: Any) -> int | None:
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+__all__ = [
+    "NODE_DURATION_HISTOGRAM",
+    "NODE_QUEUE_DELAY_HISTOGRAM",
+    "WorkflowInstrumentation",
+]
@@ -0,0 +1,687 @@
+"""Prometheus-compatible runtime metrics for Orcheo services.
+
+The registry keeps counters, gauges and histograms in process memory and
+renders them in the Prometheus text exposition format, so the API can serve
+them from ``/metrics`` and each worker process from a small HTTP server without
+pulling in a client library. Gauges that reflect external state (connection
+pools, broker queues) are refreshed by collectors right before rendering.
+"""
+
+from __future__ import annotations
+import asyncio
+import functools
+import inspect
+import logging
+import math
+import threading
+import time
+import weakref
+from collections.abc import (
+    Awaitable,
+    Callable,
+    Coroutine,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import Any, ClassVar, ParamSpec, TypeVar, cast
+
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+)
+
+LabelKey = tuple[str, ...]
+Sample = tuple[str, dict[str, str], float]
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_sample(name: str, labels: dict[str, str], value: float) -> str:
+    if not labels:
+        return f"{name} {_format_value(value)}"
+    rendered = ",".join(
+        f'{key}="{_escape_label(label)}"' for key, label in labels.items()
+    )
+    return f"{name}{{{rendered}}} {_format_value(value)}"
+
+
+class _Metric:
+    """Shared label handling for all metric types."""
+
+    kind: ClassVar[str]
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, Any]) -> LabelKey:
+        if set(labels) != set(self.labelnames):
+            msg = (
+                f"Metric {self.name} expects labels {list(self.labelnames)}, "
+                f"got {sorted(labels)}"
+            )
+            raise ValueError(msg)
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: LabelKey) -> dict[str, str]:
+        return dict(zip(self.labelnames, key, strict=True))
+
+    def samples(self) -> list[Sample]:
+        """Return the exposition samples currently recorded for the metric."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Drop every recorded label combination."""
+        raise NotImplementedError
+
+    def render(self) -> Iterator[str]:
+        """Yield the exposition lines for the metric."""
+        yield f"# HELP {self.name} {_escape_help(self.documentation)}"
+        yield f"# TYPE {self.name} {self.kind}"
+        for name, labels, value in self.samples():
+            yield _format_sample(name, labels, value)
+
+
+class Counter(_Metric):
+    """Monotonically increasing value, such as a number of dispatched runs."""
+
+    kind = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        """Create an empty counter."""
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increase the counter for ``labels`` by ``amount``."""
+        if amount < 0:
+            msg = "Counters can only be incremented by non-negative amounts."
+            raise ValueError(msg)
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        """Return the current value for ``labels``."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> list[Sample]:
+        """Return the exposition samples currently recorded for the metric."""
+        with self._lock:
+            return [
+                (self.name, self._labels(key), value)
+                for key, value in self._values.items()
+            ]
+
+    def clear(self) -> None:
+        """Drop every recorded label combination."""
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, such as in-flight runs."""
+
+    kind = "gauge"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        """Create an empty gauge."""
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelKey, float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the gauge for ``labels`` to ``value``."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increase the gauge for ``labels`` by ``amount``."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        """Decrease the gauge for ``labels`` by ``amount``."""
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: Any) -> float:
+        """Return the current value for ``labels``."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> list[Sample]:
+        """Return the exposition samples currently recorded for the metric."""
+        with self._lock:
+            return [
+                (self.name, self._labels(key), value)
+                for key, value in self._values.items()
+            ]
+
+    def clear(self) -> None:
+        """Drop every recorded label combination."""
+        with self._lock:
+            self._values.clear()
+
+
+class _HistogramState:
+    __slots__ = ("buckets", "count", "sum")
+
+    def __init__(self, size: int) -> None:
+        self.buckets = [0] * size
+        self.count = 0
+        self.sum = 0.0
+
+
+class Histogram(_Metric):
+    """Distribution of observed values, such as latencies in seconds."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Create an empty histogram with the given upper bucket bounds."""
+        super().__init__(name, documentation, labelnames)
+        bounds = sorted(float(bound) for bound in buckets if not math.isinf(bound))
+        if not bounds:
+            msg = "Histograms require at least one finite bucket."
+            raise ValueError(msg)
+        self.buckets = tuple(bounds)
+        self._states: dict[LabelKey, _HistogramState] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record ``value`` for ``labels``."""
+        key = self._key(labels)
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = self._states[key] = _HistogramState(len(self.buckets))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state.buckets[index] += 1
+                    break
+            state.count += 1
+            state.sum += value
+
+    def time(self, **labels: Any) -> _Timer:
+        """Return a context manager or decorator that observes elapsed seconds."""
+        self._key(labels)
+        return _Timer(self, labels)
+
+    def count(self, **labels: Any) -> int:
+        """Return how many values were observed for ``labels``."""
+        with self._lock:
+            state = self._states.get(self._key(labels))
+            return state.count if state is not None else 0
+
+    def samples(self) -> list[Sample]:
+        """Return the exposition samples currently recorded for the metric."""
+        samples: list[Sample] = []
+        with self._lock:
+            for key, state in self._states.items():
+                labels = self._labels(key)
+                cumulative = 0
+                for bound, hits in zip(self.buckets, state.buckets, strict=True):
+                    cumulative += hits
+                    samples.append(
+                        (
+                            f"{self.name}_bucket",
+                            {**labels, "le": _format_value(bound)},
+                            cumulative,
+                        )
+                    )
+                samples.append(
+                    (f"{self.name}_bucket", {**labels, "le": "+Inf"}, state.count)
+                )
+                samples.append((f"{self.name}_sum", labels, state.sum))
+                samples.append((f"{self.name}_count", labels, state.count))
+        return samples
+
+    def clear(self) -> None:
+        """Drop every recorded label combination."""
+        with self._lock:
+            self._states.clear()
+
+
+class _Timer:
+    """Observe elapsed wall-clock seconds into a histogram."""
+
+    def __init__(self, histogram: Histogram, labels: dict[str, Any]) -> None:
+        self._histogram = histogram
+        self._labels = labels
+        self._started: float | None = None
+
+    def __enter__(self) -> _Timer:
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._started is not None:
+            self._observe(self._started)
+
+    def _observe(self, started: float) -> None:
+        self._histogram.observe(time.perf_counter() - started, **self._labels)
+
+    def __call__(self, func: Callable[P, R]) -> Callable[P, R]:
+        """Time every call of ``func``, awaiting coroutine functions."""
+        if inspect.iscoroutinefunction(func):
+            async_func = cast(Callable[P, Awaitable[Any]], func)
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                started = time.perf_counter()
+                try:
+                    return await async_func(*args, **kwargs)
+                finally:
+                    self._observe(started)
+
+            return cast(Callable[P, R], async_wrapper)
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._observe(started)
+
+        return wrapper
+
+
+MetricT = TypeVar("MetricT", bound=_Metric)
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together for a single scrape target."""
+
+    def __init__(self) -> None:
+        """Create an empty registry."""
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """Return the counter called ``name``, registering it on first use."""
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        """Return the gauge called ``name``, registering it on first use."""
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Return the histogram called ``name``, registering it on first use."""
+        return self._register(
+            Histogram, name, documentation, labelnames, buckets=buckets
+        )
+
+    def _register(
+        self,
+        metric_type: type[MetricT],
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        **kwargs: Any,
+    ) -> MetricT:
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is None:
+                metric = metric_type(name, documentation, labelnames, **kwargs)
+                self._metrics[name] = metric
+                return metric
+        if type(existing) is not metric_type or existing.labelnames != tuple(
+            labelnames
+        ):
+            msg = f"Metric {name} is already registered with a different shape."
+            raise ValueError(msg)
+        return cast(MetricT, existing)
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Run ``collector`` before every render to refresh derived gauges."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def get(self, name: str) -> _Metric | None:
+        """Return the metric registered as ``name`` if any."""
+        with self._lock:
+            return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        with self._lock:
+            collectors = list(self._collectors)
+            metrics = list(self._metrics.values())
+        for collector in collectors:
+            try:
+                collector()
+            except Exception:
+                logger.warning("Metrics collector %r failed", collector, exc_info=True)
+        lines = [line for metric in metrics for line in metric.render()]
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+REGISTRY = MetricsRegistry()
+
+RUN_DURATION_SECONDS = REGISTRY.histogram(
+    "orcheo_run_duration_seconds",
+    "Wall-clock duration of workflow runs.",
+    ("source", "status"),
+)
+RUNS_IN_PROGRESS = REGISTRY.gauge(
+    "orcheo_runs_in_progress",
+    "Workflow runs currently executing in this process.",
+    ("source",),
+)
+GRAPH_BUILD_SECONDS = REGISTRY.histogram(
+    "orcheo_graph_build_duration_seconds",
+    "Time spent building and compiling workflow graphs before execution.",
+    ("source",),
+)
+NODE_DURATION_SECONDS = REGISTRY.histogram(
+    "orcheo_node_duration_seconds",
+    "Execution time of workflow nodes by implementation class.",
+    ("node_type", "status"),
+)
+HISTORY_OPERATION_SECONDS = REGISTRY.histogram(
+    "orcheo_history_operation_duration_seconds",
+    "Latency of run history store writes.",
+    ("store", "operation"),
+)
+DB_POOL_CONNECTIONS = REGISTRY.gauge(
+    "orcheo_db_pool_connections",
+    "Database connection pool usage by state.",
+    ("pool", "state"),
+)
+LISTENER_ADAPTERS_ACTIVE = REGISTRY.gauge(
+    "orcheo_listener_adapters_active",
+    "Listener adapters currently running under a supervisor.",
+)
+LISTENER_RECONCILE_SECONDS = REGISTRY.histogram(
+    "orcheo_listener_reconcile_duration_seconds",
+    "Time spent reconciling listener subscriptions with running adapters.",
+)
+LISTENER_ADAPTER_FAILURES = REGISTRY.counter(
+    "orcheo_listener_adapter_failures_total",
+    "Listener adapters that could not be built.",
+)
+TRIGGER_DISPATCH_SECONDS = REGISTRY.histogram(
+    "orcheo_trigger_dispatch_duration_seconds",
+    "Latency of trigger dispatches that enqueue workflow runs.",
+    ("trigger", "outcome"),
+)
+TRIGGER_RUNS_TOTAL = REGISTRY.counter(
+    "orcheo_trigger_runs_total",
+    "Workflow runs enqueued by trigger dispatchers.",
+    ("trigger",),
+)
+TASK_DURATION_SECONDS = REGISTRY.histogram(
+    "orcheo_task_duration_seconds",
+    "Duration of worker tasks.",
+    ("task", "status"),
+)
+QUEUE_DEPTH = REGISTRY.gauge(
+    "orcheo_queue_depth",
+    "Messages waiting in broker queues.",
+    ("queue",),
+)
+HTTP_CLIENT_REQUEST_SECONDS = REGISTRY.histogram(
+    "orcheo_http_client_request_duration_seconds",
+    "Time until response headers for outbound HTTP requests, per host.",
+    ("host", "outcome"),
+)
+
+
+_tracked_pools: weakref.WeakKeyDictionary[Any, str] = weakref.WeakKeyDictionary()
+_tracked_pools_lock = threading.Lock()
+_POOL_STATS = {
+    "pool_max": "max",
+    "pool_size": "size",
+    "pool_available": "available",
+    "requests_waiting": "waiting",
+}
+
+
+def track_connection_pool(name: str, pool: Any) -> None:
+    """Report ``pool`` utilization under ``name`` until it is garbage collected.
+
+    Pools must expose psycopg's ``get_stats()``; pools sharing a name are summed.
+    """
+    try:
+        with _tracked_pools_lock:
+            _tracked_pools[pool] = name
+    except TypeError:
+        logger.debug("Connection pool %r cannot be tracked", pool)
+
+
+def _collect_pool_stats() -> None:
+    with _tracked_pools_lock:
+        pools = list(_tracked_pools.items())
+    totals: dict[tuple[str, str], float] = {}
+    for pool, name in pools:
+        stats = pool.get_stats()
+        for stat, state in _POOL_STATS.items():
+            key = (name, state)
+            totals[key] = totals.get(key, 0.0) + float(stats.get(stat, 0))
+    DB_POOL_CONNECTIONS.clear()
+    for (name, state), value in totals.items():
+        DB_POOL_CONNECTIONS.set(value, pool=name, state=state)
+
+
+REGISTRY.add_collector(_collect_pool_stats)
+
+
+@dataclass(slots=True)
+class RunOutcome:
+    """Status reported for a run tracked with :func:`track_run`."""
+
+    status: str | None = None
+
+
+@contextmanager
+def track_run(source: str) -> Iterator[RunOutcome]:
+    """Count the enclosed run as in progress and observe its duration.
+
+    The run is reported as ``succeeded`` unless the block sets
+    ``outcome.status`` or raises, which reports ``failed`` or ``cancelled``.
+    """
+    outcome = RunOutcome()
+    RUNS_IN_PROGRESS.inc(source=source)
+    started = time.perf_counter()
+    try:
+        yield outcome
+    except asyncio.CancelledError:
+        outcome.status = "cancelled"
+        raise
+    except BaseException:
+        outcome.status = "failed"
+        raise
+    finally:
+        RUNS_IN_PROGRESS.dec(source=source)
+        RUN_DURATION_SECONDS.observe(
+            time.perf_counter() - started,
+            source=source,
+            status=outcome.status or "succeeded",
+        )
+
+
+def track_trigger_dispatch(
+    trigger: str,
+) -> Callable[
+    [Callable[P, Coroutine[Any, Any, R]]], Callable[P, Coroutine[Any, Any, R]]
+]:
+    """Time an async trigger dispatcher and count the runs it enqueues.
+
+    The wrapped coroutine may return a single run or a list of runs.
+    """
+
+    def decorator(
+        func: Callable[P, Coroutine[Any, Any, R]],
+    ) -> Callable[P, Coroutine[Any, Any, R]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                result = await func(*args, **kwargs)
+                outcome = "success"
+            finally:
+                TRIGGER_DISPATCH_SECONDS.observe(
+                    time.perf_counter() - started, trigger=trigger, outcome=outcome
+                )
+            count = len(result) if isinstance(result, list) else 1
+            if count:
+                TRIGGER_RUNS_TOTAL.inc(count, trigger=trigger)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def render_metrics(registry: MetricsRegistry | None = None) -> str:
+    """Render ``registry`` (the process-wide registry by default)."""
+    return (registry or REGISTRY).render()
+
+
+def start_metrics_server(
+    port: int,
+    *,
+    host: str = "0.0.0.0",
+    registry: MetricsRegistry | None = None,
+    max_port_offset: int = 0,
+) -> ThreadingHTTPServer:
+    """Serve ``registry`` over HTTP from a daemon thread.
+
+    When ``port`` is taken the next ``max_port_offset`` ports are tried in turn,
+    which lets every process of a prefork worker expose its own metrics.
+    """
+    target = registry or REGISTRY
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 - http.server naming
+            if self.path.split("?", 1)[0] not in {"/", "/metrics"}:
+                self.send_error(404)
+                return
+            body = target.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE_LATEST)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            return
+
+    last_error: OSError | None = None
+    for candidate in range(port, port + max(max_port_offset, 0) + 1):
+        try:
+            server = ThreadingHTTPServer((host, candidate), _Handler)
+        except OSError as exc:
+            last_error = exc
+            continue
+        server.daemon_threads = True
+        thread = threading.Thread(
+            target=server.serve_forever, name="orcheo-metrics", daemon=True
+        )
+        thread.start()
+        return server
+    assert last_error is not None
+    raise last_error
+
+
+__all__ = [
+    "CONTENT_TYPE_LATEST",
+    "DB_POOL_CONNECTIONS",
+    "DEFAULT_BUCKETS",
+    "GRAPH_BUILD_SECONDS",
+    "HISTORY_OPERATION_SECONDS",
+    "LISTENER_ADAPTERS_ACTIVE",
+    "LISTENER_ADAPTER_FAILURES",
+    "LISTENER_RECONCILE_SECONDS",
+    "NODE_DURATION_SECONDS",
+    "QUEUE_DEPTH",
+    "REGISTRY",
+    "RUNS_IN_PROGRESS",
+    "RUN_DURATION_SECONDS",
+    "TASK_DURATION_SECONDS",
+    "TRIGGER_DISPATCH_SECONDS",
+    "TRIGGER_RUNS_TOTAL",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "RunOutcome",
+    "render_metrics",
+    "start_metrics_server",
+    "track_connection_pool",
+    "track_run",
+    "track_trigger_dispatch",
+]
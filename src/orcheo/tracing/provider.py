@@ -4,7 +4,9 @@ from __future__ import annotations
 import logging
 import threading
 from typing import Any
-from opentelemetry import trace
+from opentelemetry import metrics, trace
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import (
@@ -12,7 +14,7 @@ from opentelemetry.sdk.trace.export import (
     ConsoleSpanExporter,
     SpanExporter,
 )
-from opentelemetry.sdk.trace.sampling import TraceIdRatioBased
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF, TraceIdRatioBased
 from opentelemetry.trace import Tracer
 from orcheo.config import get_settings
 
@@ -24,6 +26,13 @@ try:  # pragma: no cover - import guard
 except Exception:  # pragma: no cover - optional dependency safety
     OTLPSpanExporter = None  # type: ignore[misc, assignment]
 
+try:  # pragma: no cover - import guard
+    from opentelemetry.exporter.otlp.proto.http.metric_exporter import (
+        OTLPMetricExporter,
+    )
+except Exception:  # pragma: no cover - optional dependency safety
+    OTLPMetricExporter = None  # type: ignore[misc, assignment]
+
 
 logger = logging.getLogger(__name__)
 _lock = threading.Lock()
@@ -46,18 +55,20 @@ def configure_tracing(*, force: bool = False) -> None:
             }
         )
 
-        provider = TracerProvider(
-            sampler=TraceIdRatioBased(sample_ratio),
-            resource=resource,
-        )
-
         exporter = _build_exporter(exporter_name, settings)
+        # Without an exporter every span would be built only to be discarded,
+        # so nothing is sampled; trace identifiers are still generated.
+        sampler = (
+            TraceIdRatioBased(sample_ratio) if exporter is not None else ALWAYS_OFF
+        )
+        provider = TracerProvider(sampler=sampler, resource=resource)
         if exporter is not None:
             provider.add_span_processor(BatchSpanProcessor(exporter))
         else:
             logger.debug("Tracing exporter '%s' disabled or unavailable", exporter_name)
 
         trace.set_tracer_provider(provider)
+        _configure_metrics(exporter_name, resource)
         _configured = True
 
 
@@ -68,6 +79,20 @@ def get_tracer(name: str) -> Tracer:
     return trace.get_tracer(name)
 
 
+def _configure_metrics(exporter_name: str, resource: Resource) -> None:
+    """Export node latency histograms over OTLP alongside spans.
+
+    The metric exporter honours the standard ``OTEL_EXPORTER_OTLP_*``
+    environment variables for its endpoint.
+    """
+    if exporter_name != "otlp" or OTLPMetricExporter is None:
+        return
+    reader = PeriodicExportingMetricReader(OTLPMetricExporter())
+    metrics.set_meter_provider(
+        MeterProvider(resource=resource, metric_readers=[reader])
+    )
+
+
 def _build_exporter(exporter_name: str, settings: Any) -> SpanExporter | None:
     """Instantiate the configured span exporter if available."""
     if exporter_name in {"", "none", "disabled"}:
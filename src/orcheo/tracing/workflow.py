@@ -2,19 +2,23 @@
 
 from __future__ import annotations
 import re
-from collections.abc import Iterable, Iterator, Mapping, Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import partial
 from typing import Any
+from opentelemetry import trace
 from opentelemetry.trace import Span, Status, StatusCode, Tracer
 from orcheo.config import get_settings
 from orcheo.runtime.runnable_config import RunnableConfigModel
+from orcheo.tracing.instrumentation import WorkflowInstrumentation
 from orcheo.tracing.model_metadata import extract_ai_trace_attributes
 
 
 _DEFAULT_MAX_PREVIEW_LENGTH = 512
 _DEFAULT_HIGH_USAGE_THRESHOLD = 1000
+_DEFAULT_MAX_EVENTS_PER_SPAN = 64
 _SENSITIVE_PATTERNS: tuple[re.Pattern[str], ...] = (
     re.compile(r"(?i)\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}\b"),
     re.compile(r"\b\d{3}[-.\s]?\d{2}[-.\s]?\d{4}\b"),
@@ -38,6 +42,59 @@ class WorkflowSpanContext:
         return f"{self.span.get_span_context().trace_id:032x}"
 
 
+@dataclass(frozen=True, slots=True)
+class _TracingLimits:
+    """Tracing settings resolved once per settings snapshot."""
+
+    preview_max_length: int
+    high_token_threshold: int
+    max_events_per_span: int = _DEFAULT_MAX_EVENTS_PER_SPAN
+
+
+_limits_cache: tuple[Any, _TracingLimits] | None = None
+
+
+def _tracing_limits() -> _TracingLimits:
+    """Return tracing limits, re-reading them only when settings reload."""
+    global _limits_cache  # noqa: PLW0603
+    settings = get_settings()
+    cached = _limits_cache
+    if cached is not None and cached[0] is settings:
+        return cached[1]
+    limits = _TracingLimits(
+        preview_max_length=_preview_max_length(settings),
+        high_token_threshold=_token_usage_threshold(settings),
+    )
+    _limits_cache = (settings, limits)
+    return limits
+
+
+class _SpanEvents:
+    """Add events to a span up to a fixed budget, building them lazily."""
+
+    __slots__ = ("_span", "_remaining", "_dropped", "limits")
+
+    def __init__(self, span: Span, limits: _TracingLimits) -> None:
+        self._span = span
+        self._remaining = limits.max_events_per_span
+        self._dropped = 0
+        self.limits = limits
+
+    def add(self, name: str, build: Callable[[], Mapping[str, Any]]) -> None:
+        if self._remaining <= 0:
+            self._dropped += 1
+            return
+        self._remaining -= 1
+        self._span.add_event(name, dict(build()))
+
+    def preview(self, value: Any) -> str:
+        return _preview_text(value, max_length=self.limits.preview_max_length)
+
+    def finish(self) -> None:
+        if self._dropped:
+            self._span.set_attribute("orcheo.span.events_dropped", self._dropped)
+
+
 @contextmanager
 def workflow_span(
     tracer: Tracer,
@@ -89,21 +146,64 @@ def workflow_span(
         yield WorkflowSpanContext(span=span, started_at=started_at)
 
 
-def record_workflow_step(tracer: Tracer, step: Mapping[str, Any]) -> None:
-    """Emit child spans that represent node executions within a step payload."""
+def record_workflow_step(
+    tracer: Tracer,
+    step: Mapping[str, Any],
+    *,
+    instrumentation: WorkflowInstrumentation | None = None,
+) -> None:
+    """Emit child spans that represent node executions within a step payload.
+
+    When ``instrumentation`` timed the node, its span is completed with the
+    payload details instead of starting a new, zero-length span. Attributes
+    and events are only built for spans that are being recorded, so unsampled
+    traces skip previews and redaction entirely.
+    """
+    if instrumentation is None and not _parent_sampled():
+        return
+    limits: _TracingLimits | None = None
     for node_name, payload in step.items():
         if not isinstance(payload, Mapping):
             continue
-        attributes = _node_attributes(node_name, payload)
-        span_name = attributes.get("orcheo.node.display_name", node_name)
-        with tracer.start_as_current_span(
-            str(span_name),
-            attributes=attributes,
-        ) as span:
-            _apply_token_metrics(span, payload)
-            _apply_artifact_attributes(span, payload)
-            _apply_message_events(span, payload)
-            _apply_status(span, payload)
+        finished = (
+            instrumentation.take_finished(node_name)
+            if instrumentation is not None
+            else None
+        )
+        if finished is not None:
+            span, ended_ns = finished
+            if span.is_recording():
+                limits = limits or _tracing_limits()
+                attributes = _node_attributes(node_name, payload)
+                attributes.pop("orcheo.node.latency_ms", None)
+                span.set_attributes(attributes)
+                _apply_payload(span, payload, limits)
+            span.end(end_time=ended_ns)
+            continue
+        span_name = payload.get("display_name", node_name)
+        with tracer.start_as_current_span(str(span_name)) as span:
+            if not span.is_recording():
+                continue
+            limits = limits or _tracing_limits()
+            span.set_attributes(_node_attributes(node_name, payload))
+            _apply_payload(span, payload, limits)
+
+
+def _parent_sampled() -> bool:
+    """Return False when the active trace was already dropped by the sampler."""
+    context = trace.get_current_span().get_span_context()
+    return not context.is_valid or context.trace_flags.sampled
+
+
+def _apply_payload(
+    span: Span, payload: Mapping[str, Any], limits: _TracingLimits
+) -> None:
+    events = _SpanEvents(span, limits)
+    _apply_token_metrics(span, payload, events)
+    _apply_artifact_attributes(span, payload)
+    _apply_message_events(span, payload, events)
+    _apply_status(span, payload, events)
+    events.finish()
 
 
 def record_workflow_completion(span: Span, *, status: str = "completed") -> None:
@@ -150,17 +250,20 @@ def _node_attributes(node_name: str, payload: Mapping[str, Any]) -> dict[str, An
     return attributes
 
 
-def _apply_token_metrics(span: Span, payload: Mapping[str, Any]) -> None:
+def _apply_token_metrics(
+    span: Span, payload: Mapping[str, Any], events: _SpanEvents | None = None
+) -> None:
+    events = events or _SpanEvents(span, _tracing_limits())
     input_tokens, output_tokens = _extract_token_usage(payload)
     if input_tokens is not None:
         span.set_attribute("orcheo.token.input", input_tokens)
     if output_tokens is not None:
         span.set_attribute("orcheo.token.output", output_tokens)
-    threshold = _token_usage_threshold()
+    threshold = events.limits.high_token_threshold
     if (input_tokens or 0) > threshold or (output_tokens or 0) > threshold:
-        span.add_event(
+        events.add(
             "token.chunk",
-            {
+            lambda: {
                 "input": input_tokens or 0,
                 "output": output_tokens or 0,
                 "reason": "high_usage",
@@ -181,33 +284,37 @@ def _apply_artifact_attributes(span: Span, payload: Mapping[str, Any]) -> None:
     span.set_attribute("orcheo.artifact.ids", artifact_ids)
 
 
-def _apply_message_events(span: Span, payload: Mapping[str, Any]) -> None:
+def _apply_message_events(
+    span: Span, payload: Mapping[str, Any], events: _SpanEvents | None = None
+) -> None:
+    events = events or _SpanEvents(span, _tracing_limits())
     for key in ("prompts", "prompt"):
         if key in payload:
-            _add_text_events(span, "prompt", payload[key])
+            _add_text_events(events, "prompt", payload[key])
     for key in ("responses", "response"):
         if key in payload:
-            _add_text_events(span, "response", payload[key])
+            _add_text_events(events, "response", payload[key])
     if "messages" in payload:
         messages = payload["messages"]
         if isinstance(messages, Sequence):
             for message in messages:
-                if isinstance(message, Mapping):
-                    role = str(message.get("role", "unknown"))
-                    preview = _preview_text(message.get("content"))
-                else:
-                    role = "message"
-                    preview = _preview_text(message)
-                span.add_event(
-                    "message",
-                    {
-                        "role": role,
-                        "preview": preview,
-                    },
-                )
-
-
-def _apply_status(span: Span, payload: Mapping[str, Any]) -> None:
+                events.add("message", partial(_message_event, events, message))
+
+
+def _message_event(events: _SpanEvents, message: Any) -> dict[str, Any]:
+    if isinstance(message, Mapping):
+        role = str(message.get("role", "unknown"))
+        preview = events.preview(message.get("content"))
+    else:
+        role = "message"
+        preview = events.preview(message)
+    return {"role": role, "preview": preview}
+
+
+def _apply_status(
+    span: Span, payload: Mapping[str, Any], events: _SpanEvents | None = None
+) -> None:
+    events = events or _SpanEvents(span, _tracing_limits())
     status = _coalesce_status(payload)
     if status is None:
         span.set_status(Status(StatusCode.OK))
@@ -224,7 +331,8 @@ def _apply_status(span: Span, payload: Mapping[str, Any]) -> None:
         if error_code:
             span.set_attribute("orcheo.error.code", str(error_code))
         if error_message:
-            span.add_event("error.detail", {"message": _preview_text(error_message)})
+            message = error_message
+            events.add("error.detail", lambda: {"message": events.preview(message)})
         span.set_status(Status(StatusCode.ERROR, error_message or "error"))
     else:
         span.set_status(Status(StatusCode.OK))
@@ -295,28 +403,34 @@ def _extract_token_count(
     return None
 
 
-def _add_text_events(span: Span, event_name: str, value: Any) -> None:
+def _add_text_events(events: _SpanEvents, event_name: str, value: Any) -> None:
     if isinstance(value, Mapping):
-        span.add_event(event_name, {k: _preview_text(v) for k, v in value.items()})
+        events.add(event_name, lambda: {k: events.preview(v) for k, v in value.items()})
         return
     if isinstance(value, Sequence) and not isinstance(value, str | bytes):
         for item in value:
-            span.add_event(event_name, {"preview": _preview_text(item)})
+            events.add(event_name, partial(_preview_attributes, events, item))
         return
-    span.add_event(event_name, {"preview": _preview_text(value)})
+    events.add(event_name, partial(_preview_attributes, events, value))
 
 
-def _preview_text(value: Any) -> str:
+def _preview_attributes(events: _SpanEvents, value: Any) -> dict[str, Any]:
+    return {"preview": events.preview(value)}
+
+
+def _preview_text(value: Any, *, max_length: int | None = None) -> str:
     text = "" if value is None else str(value)
+    if max_length is None:
+        max_length = _tracing_limits().preview_max_length
+    if not text:
+        return text
     sanitized = _sanitize_text(text)
-    max_length = _preview_max_length()
     if len(sanitized) <= max_length:
         return sanitized
     return sanitized[: max_length - 1] + "…"
 
 
-def _token_usage_threshold() -> int:
-    settings = get_settings()
+def _token_usage_threshold(settings: Any) -> int:
     value = settings.get("TRACING_HIGH_TOKEN_THRESHOLD", _DEFAULT_HIGH_USAGE_THRESHOLD)
     try:
         threshold = int(value)
@@ -325,8 +439,7 @@ def _token_usage_threshold() -> int:
     return threshold if threshold > 0 else _DEFAULT_HIGH_USAGE_THRESHOLD
 
 
-def _preview_max_length() -> int:
-    settings = get_settings()
+def _preview_max_length(settings: Any) -> int:
     value = settings.get("TRACING_PREVIEW_MAX_LENGTH", _DEFAULT_MAX_PREVIEW_LENGTH)
     try:
         length = int(value)
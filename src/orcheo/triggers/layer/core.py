@@ -4,6 +4,7 @@ from __future__ import annotations
 import logging
 from datetime import UTC, datetime
 from uuid import UUID
+from orcheo.ratelimit import RateLimitBackend, create_rate_limit_backend
 from orcheo.triggers.cron import CronTriggerState
 from orcheo.triggers.layer.cleanup import CleanupMixin
 from orcheo.triggers.layer.cron import CronTriggerMixin
@@ -29,11 +30,13 @@ class TriggerLayer(
         self,
         cleanup_config: StateCleanupConfig | None = None,
         health_guard: CredentialHealthGuard | None = None,
+        rate_limit_backend: RateLimitBackend | None = None,
     ) -> None:
         """Instantiate the trigger layer and initialize state stores."""
         self._logger = logging.getLogger(__name__)
         self._cleanup_config = cleanup_config or StateCleanupConfig()
         self._health_guard = health_guard
+        self._rate_limit_backend = rate_limit_backend or create_rate_limit_backend()
 
         self._webhook_states: dict[UUID, WebhookTriggerState] = {}
         self._cron_states: dict[UUID, CronTriggerState] = {}
@@ -4,6 +4,7 @@ from __future__ import annotations
 import logging
 from datetime import datetime
 from uuid import UUID
+from orcheo.ratelimit import RateLimitBackend
 from orcheo.triggers.cron import CronTriggerState
 from orcheo.triggers.layer.models import StateCleanupConfig
 from orcheo.triggers.retry import RetryPolicyConfig, RetryPolicyState
@@ -17,6 +18,7 @@ class TriggerLayerState:
     _logger: logging.Logger
     _cleanup_config: StateCleanupConfig
     _health_guard: CredentialHealthGuard | None
+    _rate_limit_backend: RateLimitBackend
     _webhook_states: dict[UUID, WebhookTriggerState]
     _cron_states: dict[UUID, CronTriggerState]
     _cron_run_index: dict[UUID, UUID]
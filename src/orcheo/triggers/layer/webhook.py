@@ -14,20 +14,45 @@ from orcheo.triggers.webhook import (
 class WebhookTriggerMixin(TriggerLayerState):
     """Provide webhook trigger orchestration helpers."""
 
+    def _webhook_state(self, workflow_id: UUID) -> WebhookTriggerState:
+        state = self._webhook_states.get(workflow_id)
+        if state is None:
+            state = WebhookTriggerState(
+                rate_limit_backend=self._rate_limit_backend,
+                rate_limit_key=f"webhook:{workflow_id}",
+            )
+            self._webhook_states[workflow_id] = state
+        return state
+
     def configure_webhook(
         self, workflow_id: UUID, config: WebhookTriggerConfig
     ) -> WebhookTriggerConfig:
-        """Persist webhook configuration for the workflow and return a copy."""
-        state = self._webhook_states.setdefault(workflow_id, WebhookTriggerState())
+        """Persist webhook configuration for the workflow and return a copy.
+
+        Rate limit state is preserved, so restoring stored configuration on
+        startup does not wipe limits shared with other replicas.
+        """
+        state = self._webhook_state(workflow_id)
+        state.update_config(config)
+        return state.config
+
+    async def update_webhook_config(
+        self, workflow_id: UUID, config: WebhookTriggerConfig
+    ) -> WebhookTriggerConfig:
+        """Apply a changed webhook configuration, resetting changed rate limits."""
+        state = self._webhook_state(workflow_id)
+        rate_limit_changed = config.rate_limit != state.config.rate_limit
         state.update_config(config)
+        if rate_limit_changed:
+            await state.reset_rate_limit()
         return state.config
 
     def get_webhook_config(self, workflow_id: UUID) -> WebhookTriggerConfig:
         """Return the stored webhook configuration, creating defaults if needed."""
-        state = self._webhook_states.setdefault(workflow_id, WebhookTriggerState())
+        state = self._webhook_state(workflow_id)
         return state.config
 
-    def prepare_webhook_dispatch(
+    async def prepare_webhook_dispatch(
         self, workflow_id: UUID, request: WebhookRequest
     ) -> TriggerDispatch:
         """Validate an inbound webhook request and return the dispatch payload."""
@@ -38,8 +63,8 @@ class WebhookTriggerMixin(TriggerLayerState):
 
         try:
             self._ensure_healthy(workflow_id)
-            state = self._webhook_states.setdefault(workflow_id, WebhookTriggerState())
-            state.validate(request)
+            state = self._webhook_state(workflow_id)
+            await state.validate(request)
 
             normalized_payload = state.serialize_payload(request.payload)
             normalized_headers = state.scrub_headers_for_storage(
@@ -1,6 +1,7 @@
 """Webhook trigger state management and validation logic."""
 
 from __future__ import annotations
+import asyncio
 import hashlib
 import hmac
 import json
@@ -8,6 +9,7 @@ from collections import deque
 from collections.abc import Mapping
 from datetime import UTC, datetime, timedelta
 from typing import Any
+from orcheo.ratelimit import InMemoryRateLimitBackend, RateLimitBackend
 from orcheo.triggers.webhook.config import WebhookTriggerConfig
 from orcheo.triggers.webhook.errors import (
     MethodNotAllowedError,
@@ -21,10 +23,21 @@ from orcheo.triggers.webhook.request import WebhookRequest
 class WebhookTriggerState:
     """Maintain webhook configuration and request validation state."""
 
-    def __init__(self, config: WebhookTriggerConfig | None = None) -> None:
-        """Initialize state with an optional configuration instance."""
+    def __init__(
+        self,
+        config: WebhookTriggerConfig | None = None,
+        *,
+        rate_limit_backend: RateLimitBackend | None = None,
+        rate_limit_key: str = "webhook",
+    ) -> None:
+        """Initialize state with an optional configuration instance.
+
+        ``rate_limit_backend`` may be shared between states (and replicas), in
+        which case ``rate_limit_key`` must identify this webhook uniquely.
+        """
         self._config = (config or WebhookTriggerConfig()).model_copy(deep=True)
-        self._recent_invocations: deque[datetime] = deque()
+        self._rate_limit_backend = rate_limit_backend or InMemoryRateLimitBackend()
+        self._rate_limit_key = rate_limit_key
         self._recent_signatures: deque[tuple[str, datetime]] = deque()
         self._signature_cache: set[str] = set()
 
@@ -34,19 +47,26 @@ class WebhookTriggerState:
         return self._config.model_copy(deep=True)
 
     def update_config(self, config: WebhookTriggerConfig) -> None:
-        """Replace the configuration and reset rate limiting state."""
+        """Replace the configuration and forget replay protection state.
+
+        Rate limit state is left untouched because the backend may be shared
+        with other replicas; use :meth:`reset_rate_limit` when limits change.
+        """
         self._config = config.model_copy(deep=True)
-        self._recent_invocations.clear()
         self._recent_signatures.clear()
         self._signature_cache.clear()
 
-    def validate(self, request: WebhookRequest) -> None:
+    async def reset_rate_limit(self) -> None:
+        """Forget the rate limit state recorded for this webhook."""
+        await asyncio.to_thread(self._rate_limit_backend.reset, self._rate_limit_key)
+
+    async def validate(self, request: WebhookRequest) -> None:
         """Validate the inbound request against the configured rules."""
         self._validate_method(request)
         self._validate_required_headers(request)
         self._validate_required_query_params(request)
         self._validate_authentication(request)
-        self._enforce_rate_limit()
+        await self._enforce_rate_limit()
 
     def serialize_payload(self, payload: Any) -> Any:
         """Normalize payloads for storage on workflow runs."""
@@ -209,21 +229,18 @@ class WebhookTriggerState:
                 message = f"Missing or invalid required query parameter: {key}"
                 raise WebhookValidationError(message, status_code=400)
 
-    def _enforce_rate_limit(self) -> None:
+    async def _enforce_rate_limit(self) -> None:
         config = self._config.rate_limit
         if config is None:
             return
 
-        now = datetime.now(tz=UTC)
-        window_start = now - timedelta(seconds=config.interval_seconds)
-
-        while self._recent_invocations and self._recent_invocations[0] < window_start:
-            self._recent_invocations.popleft()
-
-        if len(self._recent_invocations) >= config.limit:
+        decision = await self._rate_limit_backend.acquire(
+            self._rate_limit_key,
+            limit=config.limit,
+            period_seconds=config.interval_seconds,
+        )
+        if not decision.allowed:
             raise RateLimitExceededError(config.limit, config.interval_seconds)
 
-        self._recent_invocations.append(now)
-
 
 __all__ = ["WebhookTriggerState"]
@@ -1,6 +1,7 @@
 """Helper evaluators used by the Agentensor node unit tests."""
 
 from __future__ import annotations
+import asyncio
 from typing import Any
 
 
@@ -19,3 +20,20 @@ class EvaluateCallable:
 
     def evaluate(self, context: Any) -> dict[str, Any]:
         return {"value": 0.2, "reason": "evaluate-called"}
+
+
+EVALUATOR_CALLS: list[str] = []
+
+
+async def slow_pass(context: Any) -> dict[str, Any]:
+    """Record the call and pass after a short delay."""
+    EVALUATOR_CALLS.append("slow")
+    await asyncio.sleep(0.05)
+    return {"value": True, "reason": "slow"}
+
+
+async def fast_pass(context: Any) -> dict[str, Any]:
+    """Record the call and pass after a short delay."""
+    EVALUATOR_CALLS.append("fast")
+    await asyncio.sleep(0.05)
+    return {"value": True, "reason": "fast"}
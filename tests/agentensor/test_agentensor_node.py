@@ -25,7 +25,7 @@ from orcheo.graph.state import State
 from orcheo.nodes.agentensor import AgentensorNode, _EvaluatorAdapter, _TextPayload
 from orcheo.nodes.registry import registry
 from orcheo.runtime.runnable_config import RunnableConfigModel
-from tests.agentensor.helpers import EvaluateCallable, simple_result
+from tests.agentensor.helpers import EVALUATOR_CALLS, EvaluateCallable, simple_result
 
 
 @pytest.fixture(autouse=True)
@@ -905,6 +905,31 @@ async def test_evaluator_adapter_handles_llm_judge_branch() -> None:
     assert result.value is True
 
 
+@pytest.mark.asyncio
+async def test_run_evaluator_scores_failing_llm_judge_as_failed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class DummyJudge(LLMTensorJudge):
+        pass
+
+    async def failing_evaluate(self: _EvaluatorAdapter, ctx: Any) -> Any:
+        raise RuntimeError("judge unavailable")
+
+    monkeypatch.setattr(_EvaluatorAdapter, "evaluate", failing_evaluate)
+    node = AgentensorNode(name="judge")
+    context = EvaluationContext(
+        inputs={}, output={}, expected_output=None, metadata={}, duration_ms=0.0
+    )
+
+    outcome = await node._run_evaluator(
+        EvaluatorDefinition(id="judge", entrypoint="x:y"),
+        DummyJudge(rubric="test"),
+        context,
+    )
+
+    assert outcome == {"score": 0.0, "passed": False, "reason": "judge unavailable"}
+
+
 @pytest.mark.asyncio
 async def test_evaluator_adapter_handles_coroutine_and_text_tensor_outputs() -> None:
     async def async_eval(_: EvaluationContext) -> dict[str, Any]:
@@ -934,37 +959,6 @@ async def test_evaluator_adapter_handles_coroutine_and_text_tensor_outputs() ->
     assert result.value is False
 
 
-@pytest.mark.asyncio
-async def test_collect_evaluation_results_handles_tensor_and_failures() -> None:
-    node = AgentensorNode(name="collector")
-    node.prompts = {}
-    node.evaluators = [eval_definition]
-    node.progress_callback = AsyncMock()
-
-    case = SimpleNamespace(
-        assertions={eval_definition.id: SimpleNamespace(value=True, reason="ok")},
-        output=TextTensor(
-            text="tensor",
-            requires_grad=False,
-            model=SimpleNamespace(),
-            metadata={"payload": {"echo": "ok"}},
-        ),
-        task_duration=0.1,
-        inputs={"value": 1},
-        metadata={"case": 1},
-    )
-    report = SimpleNamespace(
-        cases=[case],
-        failures=[SimpleNamespace(error_message="boom")],
-    )
-
-    aggregated, results = await node._collect_evaluation_results(report)
-
-    assert aggregated[eval_definition.id] == [1.0, 0.0]
-    assert results[0]["output"] == {"echo": "ok"}
-    assert results[-1]["error"] == "boom"
-
-
 @pytest.mark.asyncio
 async def test_collect_training_results_records_failures() -> None:
     node = AgentensorNode(name="trainer")
@@ -1059,3 +1053,132 @@ def test_checkpoint_config_serializes_dynamic_text_tensor() -> None:
 
     assert payload["prompts"]["dynamic"]["type"] == "TextTensor"
     assert payload["prompts"]["dynamic"]["metadata"] == {"note": "fresh"}
+
+
+def _streaming_node(graph: Any, **kwargs: Any) -> AgentensorNode:
+    return AgentensorNode(
+        name="streaming",
+        dataset=EvaluationDataset(
+            id="stream",
+            cases=[EvaluationCase(inputs={"prompt": p}) for p in ("a", "b", "c")],
+        ),
+        evaluators=[
+            EvaluatorDefinition(
+                id="slow", entrypoint="tests.agentensor.helpers:slow_pass"
+            ),
+            EvaluatorDefinition(
+                id="fast", entrypoint="tests.agentensor.helpers:fast_pass"
+            ),
+        ],
+        compiled_graph=graph,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_evaluate_case_runs_evaluators_concurrently() -> None:
+    node = AgentensorNode(name="concurrent")
+    context = EvaluationContext(
+        inputs={}, output={}, expected_output=None, metadata={}, duration_ms=0.0
+    )
+    active = 0
+    peak = 0
+
+    async def tracked(_: EvaluationContext) -> dict[str, Any]:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return {"value": True}
+
+    evaluators = [
+        (EvaluatorDefinition(id=f"e{i}", entrypoint="x:y"), tracked) for i in range(4)
+    ]
+
+    aggregated: dict[str, list[float]] = {}
+    result = await node._evaluate_case(
+        evaluators, context, aggregated=aggregated, semaphore=asyncio.Semaphore(2)
+    )
+
+    assert peak == 2
+    assert list(result) == ["e0", "e1", "e2", "e3"]
+    assert aggregated == {f"e{i}": [1.0] for i in range(4)}
+
+
+@pytest.mark.asyncio
+async def test_evaluation_streams_progress_as_cases_finish() -> None:
+    class OrderedGraph:
+        async def ainvoke(self, state: State, config: RunnableConfig) -> Any:
+            prompt = state["inputs"]["prompt"]
+            await asyncio.sleep({"a": 0.2, "b": 0.0, "c": 0.1}[prompt])
+            if prompt == "c":
+                raise RuntimeError("graph failed")
+            return {"results": {"echo": prompt}}
+
+    events: list[dict[str, Any]] = []
+
+    async def progress(payload: dict[str, Any]) -> None:
+        events.append(payload)
+
+    node = _streaming_node(OrderedGraph(), progress_callback=progress)
+
+    result = await node.run({"inputs": {}}, {})
+
+    streamed = [
+        event["payload"]["case_index"]
+        for event in events
+        if event["event"] == "evaluation_progress"
+    ]
+    assert streamed == [1, 2, 0]
+    assert [item["case_index"] for item in result["results"]] == [0, 1, 2]
+    assert result["results"][2]["error"] == "graph failed"
+    assert result["summary"] == {"slow": pytest.approx(2 / 3), "fast": 2 / 3}
+
+
+@pytest.mark.asyncio
+async def test_evaluation_cache_skips_unchanged_work(tmp_path: Any) -> None:
+    calls: list[str] = []
+
+    class CountingGraph:
+        async def ainvoke(self, state: State, config: RunnableConfig) -> Any:
+            calls.append(state["inputs"]["prompt"])
+            return {"results": {"echo": state["inputs"]["prompt"]}}
+
+    EVALUATOR_CALLS.clear()
+    node = _streaming_node(CountingGraph(), cache_dir=str(tmp_path))
+    first = await node.run({"inputs": {}}, {})
+
+    assert sorted(calls) == ["a", "b", "c"]
+    assert len(EVALUATOR_CALLS) == 6
+    assert not any(item["cached"] for item in first["results"])
+
+    calls.clear()
+    EVALUATOR_CALLS.clear()
+    rerun = _streaming_node(CountingGraph(), cache_dir=str(tmp_path))
+    second = await rerun.run({"inputs": {}}, {})
+
+    assert calls == []
+    assert EVALUATOR_CALLS == []
+    assert all(item["cached"] for item in second["results"])
+    assert second["summary"] == first["summary"]
+
+    changed = _streaming_node(
+        CountingGraph(),
+        cache_dir=str(tmp_path),
+        prompts={"seed": TrainablePrompt(text="changed")},
+    )
+    await changed.run({"inputs": {}}, {})
+
+    assert sorted(calls) == ["a", "b", "c"]
+
+    calls.clear()
+    edited_graph = _streaming_node(
+        CountingGraph(),
+        cache_dir=str(tmp_path),
+        prompts={"seed": TrainablePrompt(text="changed")},
+        graph_config={"nodes": [{"name": "echo", "type": "EditedNode"}]},
+    )
+    await edited_graph.run({"inputs": {}}, {})
+
+    assert sorted(calls) == ["a", "b", "c"]
@@ -0,0 +1,33 @@
+"""Tests for the on-disk Agentensor evaluation cache."""
+
+from __future__ import annotations
+from pathlib import Path
+from orcheo.agentensor.cache import EvaluationCache, fingerprint
+
+
+def test_fingerprint_is_order_independent() -> None:
+    assert fingerprint({"a": 1, "b": [1, 2]}) == fingerprint({"b": [1, 2], "a": 1})
+    assert fingerprint({"a": 1}) != fingerprint({"a": 2})
+
+
+def test_cache_round_trips_outputs_and_outcomes(tmp_path: Path) -> None:
+    cache = EvaluationCache(tmp_path)
+
+    assert cache.get_output("case", "v1") is None
+    cache.set_output("case", "v1", {"echo": "ok"}, 12.5)
+    assert cache.get_output("case", "v1") == ({"echo": "ok"}, 12.5)
+    assert cache.get_output("case", "v2") is None
+
+    outcome = {"score": 1.0, "passed": True, "reason": "ok"}
+    assert cache.get_outcome("case", "v1", "judge") is None
+    cache.set_outcome("case", "v1", "judge", outcome)
+    assert EvaluationCache(tmp_path).get_outcome("case", "v1", "judge") == outcome
+
+
+def test_cache_skips_unserializable_payloads(tmp_path: Path) -> None:
+    cache = EvaluationCache(tmp_path)
+
+    cache.set_output("case", "v1", object(), 1.0)
+
+    assert cache.get_output("case", "v1") is None
+    assert not any(tmp_path.rglob("*.json"))
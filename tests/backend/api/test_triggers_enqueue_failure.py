@@ -7,7 +7,6 @@ import sys
 from datetime import UTC, datetime
 from typing import Any
 from unittest.mock import MagicMock, patch
-from uuid import uuid4
 import pytest
 from fastapi.testclient import TestClient
 
@@ -28,107 +27,6 @@ def build_graph():
 """.strip()
 
 
-class TestEnqueueRunFunction:
-    """Direct tests for the _enqueue_run_for_execution function."""
-
-    def test_enqueue_run_success_logs_info(self) -> None:
-        """Test that successful enqueue logs an info message."""
-        from orcheo.models.workflow import WorkflowRun, WorkflowRunStatus
-
-        run = WorkflowRun(
-            id=uuid4(),
-            workflow_version_id=uuid4(),
-            status=WorkflowRunStatus.PENDING,
-            triggered_by="test",
-        )
-
-        mock_execute_run = MagicMock()
-        mock_execute_run.delay = MagicMock()
-
-        # Mock the worker.tasks module at the point of import
-        mock_tasks_module = MagicMock()
-        mock_tasks_module.execute_run = mock_execute_run
-
-        with patch(
-            "orcheo_backend.app.repository_sqlite._triggers.logger"
-        ) as mock_logger:
-            # Patch the import mechanism to return our mock
-            original_import = builtins.__import__
-
-            def mock_import(name: str, *args: Any, **kwargs: Any) -> Any:
-                if name == "orcheo_backend.worker.tasks":
-                    return mock_tasks_module
-                return original_import(name, *args, **kwargs)
-
-            # Remove cached module to force re-import
-            saved_module = sys.modules.pop("orcheo_backend.worker.tasks", None)
-
-            try:
-                with patch.object(builtins, "__import__", side_effect=mock_import):
-                    # Import and call the function
-                    from orcheo_backend.app.repository_sqlite._triggers import (
-                        _enqueue_run_for_execution,
-                    )
-
-                    _enqueue_run_for_execution(run)
-
-                # Check that delay was called (indicating successful execution)
-                mock_execute_run.delay.assert_called_once_with(str(run.id))
-                # Check that info log was called
-                mock_logger.info.assert_called_once()
-                call_args = mock_logger.info.call_args[0]
-                assert "Enqueued run" in call_args[0]
-            finally:
-                # Restore the module
-                if saved_module is not None:
-                    sys.modules["orcheo_backend.worker.tasks"] = saved_module
-
-    def test_enqueue_run_exception_logs_warning(self) -> None:
-        """Test that exception during enqueue logs a warning."""
-        from orcheo.models.workflow import WorkflowRun, WorkflowRunStatus
-
-        run = WorkflowRun(
-            id=uuid4(),
-            workflow_version_id=uuid4(),
-            status=WorkflowRunStatus.PENDING,
-            triggered_by="test",
-        )
-
-        mock_execute_run = MagicMock()
-        mock_execute_run.delay = MagicMock(
-            side_effect=ConnectionError("Redis unavailable")
-        )
-
-        mock_tasks_module = MagicMock()
-        mock_tasks_module.execute_run = mock_execute_run
-
-        with patch(
-            "orcheo_backend.app.repository_sqlite._triggers.logger"
-        ) as mock_logger:
-            original_import = builtins.__import__
-
-            def mock_import(name: str, *args: Any, **kwargs: Any) -> Any:
-                if name == "orcheo_backend.worker.tasks":
-                    return mock_tasks_module
-                return original_import(name, *args, **kwargs)
-
-            saved_module = sys.modules.pop("orcheo_backend.worker.tasks", None)
-
-            try:
-                with patch.object(builtins, "__import__", side_effect=mock_import):
-                    from orcheo_backend.app.repository_sqlite._triggers import (
-                        _enqueue_run_for_execution,
-                    )
-
-                    _enqueue_run_for_execution(run)
-
-                # Verify warning was logged
-                mock_logger.warning.assert_called_once()
-            finally:
-                if saved_module is not None:
-                    sys.modules["orcheo_backend.worker.tasks"] = saved_module
-
-
 def test_enqueue_run_logs_warning_on_celery_failure(
     api_client: TestClient, monkeypatch: pytest.MonkeyPatch
 ) -> None:
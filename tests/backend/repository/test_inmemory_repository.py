@@ -314,8 +314,8 @@ async def test_inmemory_dispatch_listener_event_raises_when_version_missing() ->
 
 
 @pytest.mark.asyncio()
-async def test_inmemory_dispatch_listener_event_prunes_expired_dedupe() -> None:
-    """Dispatch drops expired dedupe records before inserting the new key."""
+async def test_inmemory_purge_expired_listener_dedupe() -> None:
+    """The dedupe sweeper removes expired records that dispatch leaves behind."""
     repository = InMemoryWorkflowRepository()
     workflow = await repository.create_workflow(
         name="Dispatch Prune Dedupe",
@@ -359,5 +359,8 @@ async def test_inmemory_dispatch_listener_event_prunes_expired_dedupe() -> None:
     )
 
     assert run is not None
+    assert "telegram:fresh" in repository._listener_dedupe[subscription.id]  # noqa: SLF001
+
+    assert await repository.purge_expired_listener_dedupe() == 1
     assert "expired" not in repository._listener_dedupe[subscription.id]  # noqa: SLF001
     assert "telegram:fresh" in repository._listener_dedupe[subscription.id]  # noqa: SLF001
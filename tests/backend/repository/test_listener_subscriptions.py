@@ -122,6 +122,68 @@ async def test_dispatch_listener_event_creates_listener_run(
     assert duplicate is None
 
 
+def _telegram_payload(key: str, subscription_bot: str) -> ListenerDispatchPayload:
+    return ListenerDispatchPayload(
+        platform="telegram",
+        event_type="message",
+        dedupe_key=key,
+        bot_identity=subscription_bot,
+        message=ListenerDispatchMessage(chat_id="123", text=key),
+    )
+
+
+@pytest.mark.asyncio()
+async def test_dispatch_listener_events_dedupes_batch(
+    repository: WorkflowRepository,
+) -> None:
+    workflow = await repository.create_workflow(
+        name="Batch Dispatch Flow",
+        slug=None,
+        description=None,
+        tags=None,
+        draft_access=WorkflowDraftAccess.PERSONAL,
+        actor="author",
+    )
+    await repository.create_version(
+        workflow.id,
+        graph=_listener_graph(
+            {
+                "node_name": "telegram_listener",
+                "platform": "telegram",
+                "token": "[[telegram_one]]",
+                "dedupe_window_seconds": 0,
+            }
+        ),
+        metadata={},
+        notes=None,
+        created_by="author",
+    )
+    subscription = (
+        await repository.list_listener_subscriptions(workflow_id=workflow.id)
+    )[0]
+    bot = subscription.bot_identity_key
+
+    runs = await repository.dispatch_listener_events(
+        subscription.id,
+        [_telegram_payload(key, bot) for key in ("tg:1", "tg:2", "tg:1")],
+    )
+
+    assert [run.input_payload["message"]["text"] for run in runs] == [
+        "tg:1",
+        "tg:2",
+    ]
+    assert len(await repository.list_runs_for_workflow(workflow.id)) == 2
+    assert await repository.dispatch_listener_events(subscription.id, []) == []
+
+    # A zero-second window expires immediately, so the key is accepted again
+    # even before the sweeper has removed the stale record.
+    again = await repository.dispatch_listener_events(
+        subscription.id, [_telegram_payload("tg:1", bot)]
+    )
+    assert len(again) == 1
+    assert await repository.purge_expired_listener_dedupe() == 2
+
+
 @pytest.mark.asyncio()
 async def test_listener_cursor_round_trip(repository: WorkflowRepository) -> None:
     workflow = await repository.create_workflow(
@@ -699,3 +761,78 @@ async def test_sync_listener_subscriptions_for_version(
     ]
     assert len(active_subs) == 1
     assert active_subs[0].node_name == "tg2"
+
+
+@pytest.mark.asyncio()
+async def test_claim_listener_subscriptions_batches_free_leases(
+    repository: WorkflowRepository,
+) -> None:
+    """Batch claims skip leased subscriptions and renewals keep updated_at."""
+    workflow = await repository.create_workflow(
+        name="Batch Claim",
+        slug=None,
+        description=None,
+        tags=None,
+        draft_access=WorkflowDraftAccess.PERSONAL,
+        actor="author",
+    )
+    await repository.create_version(
+        workflow.id,
+        graph=_listener_graph(
+            {"node_name": "tg_one", "platform": "telegram", "token": "[[one]]"},
+            {"node_name": "tg_two", "platform": "telegram", "token": "[[two]]"},
+        ),
+        metadata={},
+        notes=None,
+        created_by="author",
+    )
+    first, second = await repository.list_listener_subscriptions(
+        workflow_id=workflow.id
+    )
+    assert await repository.claim_listener_subscription(
+        first.id, runtime_id="rt-other", lease_seconds=60
+    )
+
+    claimed = await repository.claim_listener_subscriptions(
+        runtime_id="rt-1", lease_seconds=60
+    )
+    assert [subscription.id for subscription in claimed] == [second.id]
+    assert claimed[0].assigned_runtime == "rt-1"
+    assert (
+        await repository.claim_listener_subscriptions(
+            runtime_id="rt-2", lease_seconds=60
+        )
+        == []
+    )
+
+    watermark = claimed[0].updated_at
+    renewed = await repository.renew_listener_subscription_leases(
+        [first.id, second.id], runtime_id="rt-1", lease_seconds=120
+    )
+    assert renewed == [second.id]
+    stored = await repository.get_listener_subscription(second.id)
+    assert stored.lease_expires_at is not None
+    assert claimed[0].lease_expires_at is not None
+    assert stored.lease_expires_at > claimed[0].lease_expires_at
+    assert stored.updated_at == watermark
+    assert await repository.list_listener_subscriptions(updated_since=watermark) == []
+    assert (
+        await repository.renew_listener_subscription_leases(
+            [], runtime_id="rt-1", lease_seconds=60
+        )
+        == []
+    )
+
+    await repository.update_listener_subscription_status(
+        second.id,
+        status=ListenerSubscriptionStatus.PAUSED,
+        actor="author",
+    )
+    changes = await repository.list_listener_subscriptions(updated_since=watermark)
+    assert [subscription.id for subscription in changes] == [second.id]
+    assert (
+        await repository.renew_listener_subscription_leases(
+            [second.id], runtime_id="rt-1", lease_seconds=60
+        )
+        == []
+    )
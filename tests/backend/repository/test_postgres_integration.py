@@ -354,7 +354,7 @@ async def test_postgres_run_status_transition_chain(
                 "status": "pending",
             }
         },
-        {},
+        {"row": {"id": str(run_id)}},
         # mark_run_succeeded: get run, update
         {
             "row": {
@@ -610,7 +610,6 @@ async def test_postgres_manual_dispatch_request_handling(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test manual dispatch creates runs with correct configuration."""
-    from orcheo_backend.app.repository_postgres import _triggers
 
     workflow_id = uuid4()
     version_id = uuid4()
@@ -624,18 +623,11 @@ async def test_postgres_manual_dispatch_request_handling(
         {"row": {"payload": _version_payload(version_id, workflow_id, version=1)}},
         # get version for run creation
         {"row": {"payload": _version_payload(version_id, workflow_id, version=1)}},
-        # insert run
+        # insert run and outbox entry
         {},
     ]
     repo = make_repository(monkeypatch, responses)
 
-    # Monkeypatch the execute_run.delay to avoid Celery import issues
-    monkeypatch.setattr(
-        _triggers,
-        "_enqueue_run_for_execution",
-        lambda run: None,
-    )
-
     request = ManualDispatchRequest(
         workflow_id=workflow_id,
         actor="operator",
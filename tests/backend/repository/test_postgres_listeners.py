@@ -15,7 +15,7 @@ from orcheo.listeners import (
     ListenerSubscriptionStatus,
 )
 from orcheo_backend.app.repository import WorkflowNotFoundError
-from orcheo_backend.app.repository_postgres import PostgresWorkflowRepository, _triggers
+from orcheo_backend.app.repository_postgres import PostgresWorkflowRepository
 from orcheo_backend.app.repository_postgres import _base as pg_base
 
 
@@ -104,7 +104,6 @@ def make_repo(
 ) -> PostgresWorkflowRepository:
     monkeypatch.setattr(pg_base, "AsyncConnectionPool", object())
     monkeypatch.setattr(pg_base, "DictRowFactory", object())
-    monkeypatch.setattr(_triggers, "_enqueue_run_for_execution", lambda run: None)
     repo = PostgresWorkflowRepository("postgresql://test")
     repo._pool = FakePool(FakeConnection(responses))  # noqa: SLF001
     repo._initialized = initialized  # noqa: SLF001
@@ -245,6 +244,24 @@ async def test_list_listener_subscriptions_with_filter(
     assert result[0].workflow_id == wf_id
 
 
+@pytest.mark.asyncio
+async def test_list_listener_subscriptions_updated_since(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Combines the workflow and change-feed filters in one WHERE clause."""
+    wf_id = uuid4()
+    since = datetime.now(tz=UTC)
+    repo = make_repo(monkeypatch, [{"rows": []}])
+
+    assert (
+        await repo.list_listener_subscriptions(workflow_id=wf_id, updated_since=since)
+        == []
+    )
+    ((query, params),) = repo._pool._connection.queries  # noqa: SLF001
+    assert "WHERE workflow_id = %s AND updated_at > %s" in query
+    assert params == (str(wf_id), since)
+
+
 # ---------------------------------------------------------------------------
 # get_listener_subscription (lines 172-193)
 # ---------------------------------------------------------------------------
@@ -412,6 +429,75 @@ async def test_claim_subscription_conflict_on_db_update(
     assert result is None
 
 
+# ---------------------------------------------------------------------------
+# claim_listener_subscriptions / renew_listener_subscription_leases
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_claim_subscriptions_locks_and_updates_in_one_statement(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Free subscriptions are selected with SKIP LOCKED and written back at once."""
+    wf_id, ver_id = uuid4(), uuid4()
+    expired = (datetime.now(tz=UTC) - timedelta(seconds=5)).isoformat()
+    payloads = [
+        _subscription_payload(uuid4(), wf_id, ver_id),
+        _subscription_payload(
+            uuid4(), wf_id, ver_id, assigned_runtime="rt-1", lease_expires_at=expired
+        ),
+    ]
+    repo = make_repo(monkeypatch, [{"rows": [{"payload": p} for p in payloads]}, {}])
+
+    claimed = await repo.claim_listener_subscriptions(
+        runtime_id="rt-1", lease_seconds=60
+    )
+
+    assert [str(sub.id) for sub in claimed] == [p["id"] for p in payloads]
+    assert [len(sub.audit_log) for sub in claimed] == [1, 0]
+    queries = repo._pool._connection.queries  # noqa: SLF001
+    assert len(queries) == 2
+    assert "FOR UPDATE SKIP LOCKED" in queries[0][0]
+    assert "FROM (VALUES (%s, %s, %s), (%s, %s, %s))" in queries[1][0]
+
+
+@pytest.mark.asyncio
+async def test_claim_subscriptions_skips_update_when_nothing_is_free(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repo = make_repo(monkeypatch, [{"rows": []}])
+
+    assert (
+        await repo.claim_listener_subscriptions(runtime_id="rt-1", lease_seconds=60)
+        == []
+    )
+    assert len(repo._pool._connection.queries) == 1  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_renew_subscription_leases_updates_in_batch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    kept, lost = uuid4(), uuid4()
+    repo = make_repo(monkeypatch, [{"rows": [{"id": str(kept)}]}])
+
+    assert (
+        await repo.renew_listener_subscription_leases(
+            [], runtime_id="rt-1", lease_seconds=60
+        )
+        == []
+    )
+    renewed = await repo.renew_listener_subscription_leases(
+        [kept, lost], runtime_id="rt-1", lease_seconds=60
+    )
+
+    assert renewed == [kept]
+    ((query, params),) = repo._pool._connection.queries  # noqa: SLF001
+    assert "ANY(%s)" in query
+    assert "updated_at" not in query
+    assert params[2] == [str(kept), str(lost)]
+
+
 # ---------------------------------------------------------------------------
 # release_listener_subscription (lines 269-312)
 # ---------------------------------------------------------------------------
@@ -573,8 +659,8 @@ async def test_dispatch_listener_event_duplicate(
         monkeypatch,
         [
             {"row": {"payload": payload}},  # SELECT subscription
-            {},  # DELETE expired dedupe
-            {"row": {"1": 1}},  # SELECT dedupe → duplicate found
+            {"row": {"payload": _version_payload(ver_id, wf_id)}},  # SELECT version
+            [],  # INSERT dedupe ... RETURNING → key already recorded
         ],
     )
 
@@ -607,15 +693,10 @@ async def test_dispatch_listener_event_success(
         monkeypatch,
         [
             {"row": {"payload": sub_payload}},  # SELECT subscription
-            {},  # DELETE expired dedupe
-            {},  # SELECT dedupe → not a dup (fetchone = None)
-            {},  # INSERT listener_dedupe
-            {},  # UPDATE listener_subscriptions
-            # _get_version_locked (explicit call in dispatch_listener_event)
-            {"row": {"payload": ver_payload}},
-            # _create_run_locked → _get_version_locked (internal)
-            {"row": {"payload": ver_payload}},
+            {"row": {"payload": ver_payload}},  # SELECT version
+            [{"dedupe_key": "tg:99"}],  # INSERT dedupe ... RETURNING
             {},  # INSERT workflow_runs
+            {},  # UPDATE listener_subscriptions
         ],
     )
 
@@ -638,6 +719,81 @@ async def test_dispatch_listener_event_success(
     assert run.workflow_version_id == ver_id
 
 
+@pytest.mark.asyncio
+async def test_dispatch_listener_events_batches_dedupe_and_runs(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A batch issues one dedupe upsert and one multi-row run insert."""
+    sub_id = uuid4()
+    wf_id = uuid4()
+    ver_id = uuid4()
+    notified: list[bool] = []
+    repo = make_repo(
+        monkeypatch,
+        [
+            {"row": {"payload": _subscription_payload(sub_id, wf_id, ver_id)}},
+            {"row": {"payload": _version_payload(ver_id, wf_id)}},
+            [{"dedupe_key": "tg:1"}, {"dedupe_key": "tg:3"}],
+            {},  # INSERT workflow_runs + run_outbox
+            {},  # UPDATE listener_subscriptions
+        ],
+    )
+    repo.set_run_outbox_notifier(lambda: notified.append(True))
+
+    from orcheo.listeners import ListenerDispatchPayload
+
+    payloads = [
+        ListenerDispatchPayload(
+            platform="telegram",
+            event_type="message",
+            dedupe_key=f"tg:{index}",
+            bot_identity="telegram:tok",
+        )
+        for index in (1, 2, 1, 3)
+    ]
+    runs = await repo.dispatch_listener_events(sub_id, payloads)
+
+    queries = repo._pool._connection.queries  # noqa: SLF001
+    dedupe_query, dedupe_params = queries[2]
+    assert "ON CONFLICT (subscription_id, dedupe_key) DO UPDATE" in dedupe_query
+    assert "RETURNING dedupe_key" in dedupe_query
+    assert [dedupe_params[i] for i in (1, 5, 9)] == ["tg:1", "tg:2", "tg:3"]
+    run_query, run_params = queries[3]
+    assert run_query.startswith("WITH inserted AS (")
+    assert "INSERT INTO run_outbox" in run_query
+    assert len(run_params) == 18
+    assert [run.input_payload["listener"]["dedupe_key"] for run in runs] == [
+        "tg:1",
+        "tg:3",
+    ]
+    assert notified == [True]
+    assert not any("DELETE FROM listener_dedupe" in q for q, _ in queries)
+
+
+@pytest.mark.asyncio
+async def test_dispatch_listener_events_empty_batch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repo = make_repo(monkeypatch, [])
+
+    assert await repo.dispatch_listener_events(uuid4(), []) == []
+    assert repo._pool._connection.queries == []  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_purge_expired_listener_dedupe(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class DeleteCursor(FakeCursor):
+        rowcount = 4
+
+    repo = make_repo(monkeypatch, [DeleteCursor()])
+
+    assert await repo.purge_expired_listener_dedupe() == 4
+    query, _ = repo._pool._connection.queries[0]  # noqa: SLF001
+    assert query.startswith("DELETE FROM listener_dedupe WHERE expires_at <=")
+
+
 # ---------------------------------------------------------------------------
 # update_listener_subscription_status (lines 456-508)
 # ---------------------------------------------------------------------------
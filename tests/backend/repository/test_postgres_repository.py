@@ -955,7 +955,7 @@ async def test_postgres_repository_run_lifecycle_transitions(
     version_id = uuid4()
     run_id = uuid4()
 
-    # For mark_run_started: get run, update
+    # For mark_run_started: get run, guarded update
     responses: list[Any] = [
         {
             "row": {
@@ -965,12 +965,41 @@ async def test_postgres_repository_run_lifecycle_transitions(
                 "status": "pending",
             }
         },
-        {},
+        {"row": {"id": str(run_id)}},
     ]
     repo = make_repository(monkeypatch, responses)
 
     run = await repo.mark_run_started(run_id, actor="worker")
     assert run.status == WorkflowRunStatus.RUNNING
+    update, params = repo._pool._connection.queries[-1]
+    assert "WHERE id = %s AND status = %s" in update
+    assert params[-1] == "pending"
+
+
+@pytest.mark.asyncio
+async def test_postgres_repository_mark_run_started_loses_race(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A run started by another process between read and update is rejected."""
+    workflow_id = uuid4()
+    version_id = uuid4()
+    run_id = uuid4()
+
+    responses: list[Any] = [
+        {
+            "row": {
+                "payload": _run_payload(run_id, version_id, status="pending"),
+                "workflow_id": str(workflow_id),
+                "triggered_by": "manual",
+                "status": "pending",
+            }
+        },
+        {},
+    ]
+    repo = make_repository(monkeypatch, responses)
+
+    with pytest.raises(ValueError, match="no longer pending"):
+        await repo.mark_run_started(run_id, actor="worker")
 
 
 @pytest.mark.asyncio
@@ -6,9 +6,9 @@ implementation.
 
 from __future__ import annotations
 import json
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 from uuid import UUID, uuid4
 import pytest
 from orcheo.runtime.runnable_config import RunnableConfigModel
@@ -611,7 +611,7 @@ async def test_base_repository_close(
 async def test_triggers_handle_webhook_trigger(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """Test handling a webhook trigger creates and enqueues a run."""
+    """Test handling a webhook trigger creates a run and its outbox entry."""
     workflow_id = uuid4()
     version_id = uuid4()
 
@@ -624,32 +624,33 @@ async def test_triggers_handle_webhook_trigger(
         {"row": {"payload": workflow_payload}},  # _get_workflow_locked
         {"row": {"payload": version_payload}},  # _get_latest_version_locked
         {"row": {"payload": version_payload}},  # _get_version_locked (for validation)
-        {},  # INSERT run
+        {},  # INSERT run + run_outbox
     ]
 
     repo = make_repository(monkeypatch, responses)
+    notified: list[bool] = []
+    repo.set_run_outbox_notifier(lambda: notified.append(True))
 
     # Configure webhook trigger first
     config = WebhookTriggerConfig(allowed_methods={"POST"})
     repo._trigger_layer.configure_webhook(workflow_id, config)
 
-    # Mock _enqueue_run_for_execution to avoid Celery dependency
-    from unittest.mock import patch
-
-    with patch(
-        "orcheo_backend.app.repository_postgres._triggers._enqueue_run_for_execution"
-    ):
-        result = await repo.handle_webhook_trigger(
-            workflow_id,
-            method="POST",
-            headers={"content-type": "application/json"},
-            query_params={},
-            payload={"test": "data"},
-            source_ip="127.0.0.1",
-        )
+    result = await repo.handle_webhook_trigger(
+        workflow_id,
+        method="POST",
+        headers={"content-type": "application/json"},
+        query_params={},
+        payload={"test": "data"},
+        source_ip="127.0.0.1",
+    )
 
     assert result.workflow_version_id == version_id
     assert result.triggered_by == "webhook"
+    insert_query, insert_params = repo._pool._connection.queries[-1]
+    assert "INSERT INTO workflow_runs" in insert_query
+    assert "INSERT INTO run_outbox" in insert_query
+    assert insert_params[0] == str(result.id)
+    assert notified == [True]
 
 
 @pytest.mark.asyncio
@@ -1388,81 +1389,98 @@ async def test_runs_create_run_archived_workflow_raises(
 
 
 @pytest.mark.asyncio
-async def test_triggers_enqueue_run_for_execution_success(
+async def test_outbox_claim_leases_due_entries(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """Test _enqueue_run_for_execution successfully enqueues a run."""
-    import sys
-    from orcheo.models.workflow import WorkflowRun
-    from orcheo_backend.app.repository_postgres import _triggers
+    """claim_run_outbox leases due entries with SKIP LOCKED and bumps attempts."""
+    run_id = uuid4()
+    repo = make_repository(
+        monkeypatch, [{"rows": [{"run_id": str(run_id), "attempts": 2}]}]
+    )
 
-    enqueued_ids: list[str] = []
+    entries = await repo.claim_run_outbox(limit=10, lease_seconds=30)
 
-    class MockTask:
-        @staticmethod
-        def delay(run_id: str) -> None:
-            enqueued_ids.append(run_id)
+    query, params = repo._pool._connection.queries[-1]
+    assert "FOR UPDATE SKIP LOCKED" in query
+    assert "attempts = attempts + 1" in query
+    assert (params[0] - params[1]).total_seconds() == 30
+    assert params[2] == 10
+    assert [(entry.run_id, entry.attempts) for entry in entries] == [(run_id, 2)]
 
-    # Create a mock run
-    run_id = uuid4()
-    now = datetime.now(tz=UTC)
-    run = WorkflowRun(
-        id=run_id,
-        workflow_version_id=uuid4(),
-        triggered_by="manual",
-        input_payload={},
-        created_at=now,
-        updated_at=now,
-    )
 
-    # Patch the import inside the function by creating a mock module
-    mock_module = type(sys)("orcheo_backend.worker.tasks")
-    mock_module.execute_run = MockTask()  # type: ignore[attr-defined]
-    monkeypatch.setitem(sys.modules, "orcheo_backend.worker.tasks", mock_module)
+@pytest.mark.asyncio
+async def test_outbox_mark_published_and_reschedule(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Publishing acknowledges entries; failures reschedule each entry."""
+    first, second = uuid4(), uuid4()
+    retry_at = datetime(2025, 1, 1, tzinfo=UTC)
+    repo = make_repository(monkeypatch, [])
 
-    _triggers._enqueue_run_for_execution(run)
+    await repo.mark_run_outbox_published([])
+    await repo.reschedule_run_outbox({}, error="unused")
+    assert repo._pool._connection.queries == []
 
-    assert str(run_id) in enqueued_ids
+    await repo.mark_run_outbox_published([first, second])
+    await repo.reschedule_run_outbox({first: retry_at}, error="broker down")
+
+    (published, published_params), (retry, retry_params) = (
+        repo._pool._connection.queries
+    )
+    assert "SET published_at = %s" in published
+    assert published_params[1] == [str(first), str(second)]
+    assert "SET available_at = %s, last_error = %s" in retry
+    assert retry_params == (retry_at, "broker down", str(first))
 
 
 @pytest.mark.asyncio
-async def test_triggers_enqueue_run_for_execution_failure(
+async def test_outbox_release_makes_entry_due(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """Test _enqueue_run_for_execution handles import/enqueue failure gracefully."""
-    from orcheo.models.workflow import WorkflowRun
-    from orcheo_backend.app.repository_postgres import _triggers
-
-    # Create a mock run
+    """Releasing a held-back entry makes it due now and wakes the relay."""
     run_id = uuid4()
-    now = datetime.now(tz=UTC)
-    run = WorkflowRun(
-        id=run_id,
-        workflow_version_id=uuid4(),
-        triggered_by="manual",
-        input_payload={},
-        created_at=now,
-        updated_at=now,
-    )
+    repo = make_repository(monkeypatch, [{}])
+    notified: list[bool] = []
+    repo.set_run_outbox_notifier(lambda: notified.append(True))
 
-    # Make the import fail
-    import sys
+    await repo.release_run_outbox(run_id)
 
-    if "orcheo_backend.worker.tasks" in sys.modules:
-        monkeypatch.delitem(sys.modules, "orcheo_backend.worker.tasks")
+    ((query, params),) = repo._pool._connection.queries
+    assert "SET available_at = %s" in query
+    assert "published_at IS NULL" in query
+    assert params[1] == str(run_id)
+    assert notified == [True]
 
-    # Mock import to raise
-    original_import = __builtins__["__import__"]  # type: ignore[index]
 
-    def mock_import(name: str, *args: Any, **kwargs: Any) -> Any:
-        if "orcheo_backend.worker.tasks" in name:
-            raise ImportError("Celery not available")
-        return original_import(name, *args, **kwargs)
+@pytest.mark.asyncio
+async def test_outbox_requeue_stale_entries(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Stale published entries for pending runs are re-armed, others removed."""
+    cutoff = datetime(2025, 1, 1, tzinfo=UTC)
+    first, second = uuid4(), uuid4()
+    stale = [
+        {"run_id": str(first), "attempts": 1},
+        {"run_id": str(second), "attempts": 3},
+    ]
+    repo = make_repository(monkeypatch, [{}, {"rows": stale}, {}, {}])
 
-    monkeypatch.setattr("builtins.__import__", mock_import)
+    requeued = await repo.requeue_stale_run_outbox(
+        published_before=cutoff, retry_delay=lambda attempts: 60.0 * attempts
+    )
 
-    # Should not raise, just log warning
-    _triggers._enqueue_run_for_execution(run)
+    assert requeued == 2
+    (delete, delete_params), (select, select_params), *updates = (
+        repo._pool._connection.queries
+    )
+    assert delete.startswith("DELETE FROM run_outbox")
+    assert delete_params == ("pending",)
+    assert "FOR UPDATE OF o SKIP LOCKED" in select
+    assert select_params == ("pending", cutoff)
+    (first_update, first_params), (_, second_params) = updates
+    assert "SET published_at = NULL" in first_update
+    assert first_params[1] == str(first)
+    assert second_params[0] - first_params[0] == timedelta(seconds=120)
 
 
 @pytest.mark.asyncio
@@ -1470,7 +1488,6 @@ async def test_triggers_dispatch_due_cron_runs_with_naive_datetime(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test dispatch_due_cron_runs handles naive datetime by adding UTC."""
-    from unittest.mock import patch
 
     workflow_id = uuid4()
     version_id = uuid4()
@@ -1515,10 +1532,7 @@ async def test_triggers_dispatch_due_cron_runs_with_naive_datetime(
     naive_now = datetime.now() + timedelta(days=1)
     naive_now = naive_now.replace(tzinfo=None)
 
-    with patch(
-        "orcheo_backend.app.repository_postgres._triggers._enqueue_run_for_execution"
-    ):
-        await repo.dispatch_due_cron_runs(now=naive_now)
+    await repo.dispatch_due_cron_runs(now=naive_now)
 
     # Should have processed (the naive datetime is converted to UTC)
     # The result depends on whether the cron expression matches
@@ -1528,8 +1542,8 @@ async def test_triggers_dispatch_due_cron_runs_with_naive_datetime(
 async def test_triggers_dispatch_due_cron_runs_enqueues_runs(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """Test dispatch_due_cron_runs enqueues runs after lock is released."""
-    from unittest.mock import AsyncMock, patch
+    """dispatch_due_cron_runs records runs in the outbox and wakes the relay."""
+    from unittest.mock import AsyncMock
     from orcheo.models.workflow import WorkflowRun, WorkflowVersion
 
     workflow_id = uuid4()
@@ -1560,23 +1574,19 @@ async def test_triggers_dispatch_due_cron_runs_enqueues_runs(
     monkeypatch.setattr(repo, "_create_run_locked", AsyncMock(return_value=mock_run))
     monkeypatch.setattr(repo, "_refresh_cron_triggers", AsyncMock())
 
-    enqueued_runs: list[WorkflowRun] = []
-
-    def track_enqueue(run: WorkflowRun) -> None:
-        enqueued_runs.append(run)
+    notified: list[bool] = []
+    repo.set_run_outbox_notifier(lambda: notified.append(True))
 
     from datetime import timedelta
 
     future = datetime.now(tz=UTC) + timedelta(days=1)
 
-    with patch(
-        "orcheo_backend.app.repository_postgres._triggers._enqueue_run_for_execution",
-        side_effect=track_enqueue,
-    ):
-        runs = await repo.dispatch_due_cron_runs(now=future)
+    runs = await repo.dispatch_due_cron_runs(now=future)
 
-    # If runs were created, they should have been enqueued
-    assert len(enqueued_runs) == len(runs)
+    # Runs are written to the outbox and the relay is woken once
+    assert runs
+    assert repo._create_run_locked.call_args.kwargs["enqueue"] is True
+    assert notified == [True]
 
 
 @pytest.mark.asyncio
@@ -1613,10 +1623,7 @@ async def test_triggers_dispatch_due_cron_runs_updates_last_dispatched(
     monkeypatch.setattr(repo, "_create_run_locked", AsyncMock(return_value=mock_run))
     monkeypatch.setattr(repo, "_refresh_cron_triggers", AsyncMock())
 
-    with patch(
-        "orcheo_backend.app.repository_postgres._triggers._enqueue_run_for_execution"
-    ):
-        runs = await repo.dispatch_due_cron_runs(now=now)
+    runs = await repo.dispatch_due_cron_runs(now=now)
 
     assert runs
     assert runs[0].id == run_id
@@ -1738,14 +1745,15 @@ async def test_triggers_dispatch_manual_runs_success(
         runs=[{"workflow_version_id": version_id, "input_payload": {"test": 1}}],
     )
 
-    with patch(
-        "orcheo_backend.app.repository_postgres._triggers._enqueue_run_for_execution"
-    ) as mock_enqueue:
-        runs = await repo.dispatch_manual_runs(request)
+    notified: list[bool] = []
+    repo.set_run_outbox_notifier(lambda: notified.append(True))
+
+    runs = await repo.dispatch_manual_runs(request)
 
     assert len(runs) == 1
     assert runs[0].id == run_id
-    assert mock_enqueue.called
+    assert repo._create_run_locked.call_args.kwargs["enqueue"] is True
+    assert notified == [True]
 
 
 @pytest.mark.asyncio
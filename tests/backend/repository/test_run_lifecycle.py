@@ -6,6 +6,7 @@ from orcheo_backend.app.repository import (
     WorkflowNotFoundError,
     WorkflowRepository,
     WorkflowRunNotFoundError,
+    WorkflowRunSpec,
     WorkflowVersionNotFoundError,
 )
 
@@ -219,3 +220,51 @@ async def test_run_merges_version_runnable_config(
     )
     assert run_with_defaults.tags == ["stored"]
     assert run_with_defaults.metadata == {"env": "prod", "team": "ops"}
+
+
+@pytest.mark.asyncio()
+async def test_create_runs_is_all_or_nothing(repository: WorkflowRepository) -> None:
+    """Batch run creation stores every run or none of them."""
+
+    workflow = await repository.create_workflow(
+        name="Batch",
+        slug=None,
+        description=None,
+        tags=None,
+        draft_access=WorkflowDraftAccess.PERSONAL,
+        actor="owner",
+    )
+    version = await repository.create_version(
+        workflow.id, graph={}, metadata={}, notes=None, created_by="owner"
+    )
+    other = await repository.create_workflow(
+        name="Other",
+        slug=None,
+        description=None,
+        tags=None,
+        draft_access=WorkflowDraftAccess.PERSONAL,
+        actor="owner",
+    )
+    foreign = await repository.create_version(
+        other.id, graph={}, metadata={}, notes=None, created_by="owner"
+    )
+
+    with pytest.raises(WorkflowVersionNotFoundError):
+        await repository.create_runs(
+            workflow.id,
+            [
+                WorkflowRunSpec(version.id, "batch", {"index": 0}),
+                WorkflowRunSpec(foreign.id, "batch", {"index": 1}),
+            ],
+        )
+    assert await repository.list_runs_for_workflow(workflow.id) == []
+
+    runs = await repository.create_runs(
+        workflow.id,
+        [WorkflowRunSpec(version.id, "batch", {"index": index}) for index in range(3)],
+    )
+
+    assert [run.input_payload for run in runs] == [{"index": i} for i in range(3)]
+    stored = await repository.list_runs_for_workflow(workflow.id)
+    assert {run.id for run in stored} == {run.id for run in runs}
+    assert await repository.create_runs(workflow.id, []) == []
@@ -11,7 +11,6 @@ Covers:
 
 from __future__ import annotations
 from pathlib import Path
-from unittest.mock import patch
 from uuid import uuid4
 import pytest
 from orcheo.models.workflow import WorkflowDraftAccess
@@ -36,25 +35,22 @@ async def test_create_version_without_listener_mixin_skips_subscription_sync(
     tmp_path: Path,
 ) -> None:
     """create_version takes the 79->90 False branch when not ListenerRepositoryMixin."""
-    with patch(
-        "orcheo_backend.app.repository_sqlite._triggers._enqueue_run_for_execution"
-    ):
-        repo = _VersionOnlyRepo(tmp_path / "no_listener.sqlite")
-        workflow = await repo.create_workflow(
-            name="No Listener",
-            slug=None,
-            description=None,
-            tags=None,
-            draft_access=WorkflowDraftAccess.PERSONAL,
-            actor="tester",
-        )
-        version = await repo.create_version(
-            workflow.id,
-            graph={"nodes": [], "edges": []},
-            metadata={},
-            notes=None,
-            created_by="tester",
-        )
+    repo = _VersionOnlyRepo(tmp_path / "no_listener.sqlite")
+    workflow = await repo.create_workflow(
+        name="No Listener",
+        slug=None,
+        description=None,
+        tags=None,
+        draft_access=WorkflowDraftAccess.PERSONAL,
+        actor="tester",
+    )
+    version = await repo.create_version(
+        workflow.id,
+        graph={"nodes": [], "edges": []},
+        metadata={},
+        notes=None,
+        created_by="tester",
+    )
     assert version.version == 1
     assert version.workflow_id == workflow.id
 
@@ -68,27 +64,24 @@ async def test_update_workflow_name_only_hits_early_return(
 
     This covers line 37: ``if not should_disable: return``.
     """
-    with patch(
-        "orcheo_backend.app.repository_sqlite._triggers._enqueue_run_for_execution"
-    ):
-        repo = SqliteWorkflowRepository(tmp_path / "name_update.sqlite")
-        workflow = await repo.create_workflow(
-            name="Original",
-            slug=None,
-            description=None,
-            tags=None,
-            draft_access=WorkflowDraftAccess.PERSONAL,
-            actor="tester",
-        )
-        updated = await repo.update_workflow(
-            workflow.id,
-            name="Renamed",
-            handle=None,
-            description=None,
-            tags=None,
-            is_archived=None,
-            actor="tester",
-        )
+    repo = SqliteWorkflowRepository(tmp_path / "name_update.sqlite")
+    workflow = await repo.create_workflow(
+        name="Original",
+        slug=None,
+        description=None,
+        tags=None,
+        draft_access=WorkflowDraftAccess.PERSONAL,
+        actor="tester",
+    )
+    updated = await repo.update_workflow(
+        workflow.id,
+        name="Renamed",
+        handle=None,
+        description=None,
+        tags=None,
+        is_archived=None,
+        actor="tester",
+    )
     assert updated.name == "Renamed"
 
 
@@ -110,30 +103,27 @@ async def test_archive_workflow_with_sync_disable_hook_covers_non_awaitable_bran
     tmp_path: Path,
 ) -> None:
     """Covers line 43->exit: isawaitable(result) is False for a sync disable hook."""
-    with patch(
-        "orcheo_backend.app.repository_sqlite._triggers._enqueue_run_for_execution"
-    ):
-        repo = SqliteWorkflowRepository(tmp_path / "sync_hook.sqlite")
-        workflow = await repo.create_workflow(
-            name="Test",
-            slug=None,
-            description=None,
-            tags=None,
-            draft_access=WorkflowDraftAccess.PERSONAL,
-            actor="tester",
-        )
-
-        called: list[object] = []
-
-        def _sync_disable(workflow_id: object, *, actor: str, conn: object) -> None:
-            called.append(workflow_id)
-
-        # Replace the async method with a sync callable on the instance so that
-        # isawaitable(result) evaluates to False in
-        # _maybe_disable_listener_subscriptions.
-        repo._disable_listener_subscriptions_locked = _sync_disable  # type: ignore[method-assign]
-
-        archived = await repo.archive_workflow(workflow.id, actor="tester")
+    repo = SqliteWorkflowRepository(tmp_path / "sync_hook.sqlite")
+    workflow = await repo.create_workflow(
+        name="Test",
+        slug=None,
+        description=None,
+        tags=None,
+        draft_access=WorkflowDraftAccess.PERSONAL,
+        actor="tester",
+    )
+
+    called: list[object] = []
+
+    def _sync_disable(workflow_id: object, *, actor: str, conn: object) -> None:
+        called.append(workflow_id)
+
+    # Replace the async method with a sync callable on the instance so that
+    # isawaitable(result) evaluates to False in
+    # _maybe_disable_listener_subscriptions.
+    repo._disable_listener_subscriptions_locked = _sync_disable  # type: ignore[method-assign]
+
+    archived = await repo.archive_workflow(workflow.id, actor="tester")
 
     assert archived.is_archived
     assert workflow.id in called
@@ -2,7 +2,7 @@ from __future__ import annotations
 import asyncio
 import json
 import pathlib
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 import aiosqlite
 import pytest
@@ -597,6 +597,183 @@ async def test_sqlite_handle_webhook_trigger_success(
         await repository.reset()
 
 
+@pytest.mark.asyncio()
+async def test_sqlite_run_outbox_lifecycle(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    """Triggered runs land in the outbox and are leased, acked and re-armed."""
+
+    db_path = tmp_path_factory.mktemp("repo") / "outbox.sqlite"
+    repository = SqliteWorkflowRepository(db_path)
+    notified: list[bool] = []
+    repository.set_run_outbox_notifier(lambda: notified.append(True))
+
+    try:
+        workflow = await repository.create_workflow(
+            name="Outbox Flow",
+            slug=None,
+            description=None,
+            tags=None,
+            draft_access=WorkflowDraftAccess.PERSONAL,
+            actor="author",
+        )
+        await repository.create_version(
+            workflow.id,
+            graph={},
+            metadata={},
+            notes=None,
+            created_by="author",
+        )
+        runs = await repository.dispatch_manual_runs(
+            ManualDispatchRequest(
+                workflow_id=workflow.id,
+                actor="operator",
+                runs=[ManualDispatchItem(), ManualDispatchItem()],
+            )
+        )
+        assert notified == [True]
+
+        claimed = await repository.claim_run_outbox(limit=1, lease_seconds=60)
+        assert len(claimed) == 1
+        assert claimed[0].attempts == 1
+        remaining = await repository.claim_run_outbox(limit=10, lease_seconds=60)
+        assert {entry.run_id for entry in claimed + remaining} == {
+            run.id for run in runs
+        }
+        assert await repository.claim_run_outbox(limit=10, lease_seconds=60) == []
+
+        now = datetime.now(tz=UTC)
+        await repository.reschedule_run_outbox(
+            {remaining[0].run_id: now}, error="broker down"
+        )
+        retried = await repository.claim_run_outbox(limit=10, lease_seconds=60)
+        assert [(e.run_id, e.attempts) for e in retried] == [(remaining[0].run_id, 2)]
+
+        await repository.mark_run_outbox_published([run.id for run in runs])
+        await repository.mark_run_started(runs[0].id, actor="worker")
+        requeued = await repository.requeue_stale_run_outbox(
+            published_before=datetime.now(tz=UTC), retry_delay=lambda attempts: 0.0
+        )
+        assert requeued == 1
+        rearmed = await repository.claim_run_outbox(limit=10, lease_seconds=60)
+        assert [entry.run_id for entry in rearmed] == [runs[1].id]
+
+        # Repeatedly stuck entries are re-armed with a per-entry delay.
+        await repository.mark_run_outbox_published([runs[1].id])
+        delays: list[int] = []
+
+        def _delay(attempts: int) -> float:
+            delays.append(attempts)
+            return 3600.0
+
+        requeued = await repository.requeue_stale_run_outbox(
+            published_before=datetime.now(tz=UTC), retry_delay=_delay
+        )
+        assert requeued == 1
+        assert delays == [rearmed[0].attempts]
+        assert await repository.claim_run_outbox(limit=10, lease_seconds=60) == []
+    finally:
+        await repository.reset()
+
+
+@pytest.mark.asyncio()
+async def test_sqlite_only_one_repository_starts_a_run(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    """Repositories in different processes cannot both start the same run."""
+
+    db_path = tmp_path_factory.mktemp("repo") / "claim.sqlite"
+    first = SqliteWorkflowRepository(db_path)
+    second = SqliteWorkflowRepository(db_path)
+
+    try:
+        workflow = await first.create_workflow(
+            name="Claim Flow",
+            slug=None,
+            description=None,
+            tags=None,
+            draft_access=WorkflowDraftAccess.PERSONAL,
+            actor="author",
+        )
+        version = await first.create_version(
+            workflow.id,
+            graph={},
+            metadata={},
+            notes=None,
+            created_by="author",
+        )
+        run = await first.create_run(
+            workflow.id,
+            workflow_version_id=version.id,
+            triggered_by="manual",
+            input_payload={},
+        )
+        stale = await second.get_run(run.id)
+
+        async def _stale_read(run_id: object) -> object:
+            return stale.model_copy(deep=True)
+
+        second._get_run_locked = _stale_read  # type: ignore[method-assign]
+
+        await first.mark_run_started(run.id, actor="worker-a")
+        with pytest.raises(ValueError, match="no longer pending"):
+            await second.mark_run_started(run.id, actor="worker-b")
+        stored = await first.get_run(run.id)
+        assert stored.audit_log[-1].actor == "worker-a"
+    finally:
+        await first.reset()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_webhook_run_held_until_released(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    """Delayed webhook runs stay in the outbox until explicitly released."""
+
+    db_path = tmp_path_factory.mktemp("repo") / "handoff.sqlite"
+    repository = SqliteWorkflowRepository(db_path)
+    notified: list[bool] = []
+    repository.set_run_outbox_notifier(lambda: notified.append(True))
+
+    try:
+        workflow = await repository.create_workflow(
+            name="Handoff Flow",
+            slug=None,
+            description=None,
+            tags=None,
+            draft_access=WorkflowDraftAccess.PERSONAL,
+            actor="author",
+        )
+        await repository.create_version(
+            workflow.id,
+            graph={},
+            metadata={},
+            notes=None,
+            created_by="author",
+        )
+        await repository.configure_webhook_trigger(
+            workflow.id, WebhookTriggerConfig(allowed_methods={"POST"})
+        )
+        run = await repository.handle_webhook_trigger(
+            workflow.id,
+            method="POST",
+            headers={},
+            query_params={},
+            payload={},
+            source_ip=None,
+            enqueue_delay=timedelta(minutes=5),
+        )
+        assert notified == []
+        assert await repository.claim_run_outbox(limit=10, lease_seconds=60) == []
+
+        await repository.release_run_outbox(run.id)
+        assert notified == [True]
+        claimed = await repository.claim_run_outbox(limit=10, lease_seconds=60)
+        assert [entry.run_id for entry in claimed] == [run.id]
+    finally:
+        await repository.reset()
+
+
 @pytest.mark.asyncio()
 async def test_sqlite_ensure_initialized_concurrent_calls(
     tmp_path_factory: pytest.TempPathFactory,
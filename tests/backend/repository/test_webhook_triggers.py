@@ -109,3 +109,41 @@ async def test_handle_webhook_trigger_missing_resources(
             payload={},
             source_ip=None,
         )
+
+
+@pytest.mark.asyncio()
+async def test_handle_webhook_trigger_uses_preallocated_run_id(
+    repository: WorkflowRepository,
+) -> None:
+    """Webhook runs adopt the identifier allocated for an inline execution."""
+
+    workflow = await repository.create_workflow(
+        name="Webhook Handoff",
+        slug=None,
+        description=None,
+        tags=None,
+        draft_access=WorkflowDraftAccess.PERSONAL,
+        actor="tester",
+    )
+    await repository.create_version(
+        workflow.id,
+        graph={"nodes": []},
+        metadata={},
+        notes=None,
+        created_by="tester",
+    )
+    await repository.configure_webhook_trigger(workflow.id, WebhookTriggerConfig())
+    run_id = uuid4()
+
+    run = await repository.handle_webhook_trigger(
+        workflow.id,
+        method="POST",
+        headers={},
+        query_params={},
+        payload={},
+        source_ip=None,
+        run_id=run_id,
+    )
+
+    assert run.id == run_id
+    assert (await repository.get_run(run_id)).id == run_id
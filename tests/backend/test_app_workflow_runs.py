@@ -14,6 +14,7 @@ from orcheo.vault.oauth import (
 )
 from orcheo_backend.app import (
     create_workflow_run,
+    create_workflow_runs,
     get_workflow_run,
     list_workflow_runs,
 )
@@ -22,7 +23,10 @@ from orcheo_backend.app.repository import (
     WorkflowRunNotFoundError,
     WorkflowVersionNotFoundError,
 )
-from orcheo_backend.app.schemas.workflows import WorkflowRunCreateRequest
+from orcheo_backend.app.schemas.workflows import (
+    WorkflowRunBatchCreateRequest,
+    WorkflowRunCreateRequest,
+)
 
 
 def _health_error(workflow_id: UUID) -> CredentialHealthError:
@@ -289,3 +293,72 @@ async def test_get_workflow_run_not_found() -> None:
         await get_workflow_run(run_id, Repository())
 
     assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio()
+async def test_create_workflow_runs_returns_runs_in_order() -> None:
+    """Batch run endpoint creates every run in one call and keeps request order."""
+
+    workflow_id = uuid4()
+    version_id = uuid4()
+    batches: list[list] = []
+
+    class Repository:
+        async def resolve_workflow_ref(self, workflow_ref, *, include_archived=True):
+            del workflow_ref, include_archived
+            return workflow_id
+
+        async def create_runs(self, wf_id, runs, *, actor=None):
+            batches.append(list(runs))
+            return [
+                WorkflowRun(
+                    workflow_version_id=spec.workflow_version_id,
+                    triggered_by=spec.triggered_by,
+                    input_payload=spec.input_payload,
+                )
+                for spec in runs
+            ]
+
+    request = WorkflowRunBatchCreateRequest(
+        runs=[
+            WorkflowRunCreateRequest(
+                workflow_version_id=version_id,
+                triggered_by="pipeline",
+                input_payload={"index": index},
+            )
+            for index in range(3)
+        ]
+    )
+
+    result = await create_workflow_runs(str(workflow_id), request, Repository(), None)
+
+    assert [run.input_payload["index"] for run in result] == [0, 1, 2]
+    assert len(batches) == 1
+    assert len(batches[0]) == 3
+
+
+@pytest.mark.asyncio()
+async def test_create_workflow_runs_rejects_batch_with_missing_version() -> None:
+    """Batch run endpoint maps a rejected batch to a 404."""
+
+    workflow_id = uuid4()
+
+    class Repository:
+        async def resolve_workflow_ref(self, workflow_ref, *, include_archived=True):
+            del workflow_ref, include_archived
+            return workflow_id
+
+        async def create_runs(self, workflow_id, runs, *, actor=None):
+            raise WorkflowVersionNotFoundError(str(runs[0].workflow_version_id))
+
+        async def create_run(self, *args, **kwargs):  # pragma: no cover - guard
+            raise AssertionError("runs must be created as one batch")
+
+    request = WorkflowRunBatchCreateRequest(
+        runs=[WorkflowRunCreateRequest(workflow_version_id=uuid4(), triggered_by="p")]
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await create_workflow_runs(str(workflow_id), request, Repository(), None)
+
+    assert exc_info.value.status_code == 404
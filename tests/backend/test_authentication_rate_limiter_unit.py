@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 import pytest
+from orcheo.ratelimit import InMemoryRateLimitBackend
 from orcheo_backend.app.authentication import (
     AuthenticationError,
     AuthRateLimiter,
@@ -9,7 +10,8 @@ from orcheo_backend.app.authentication import (
 )
 
 
-def test_sliding_window_rate_limiter_disabled_when_limit_zero() -> None:
+@pytest.mark.asyncio
+async def test_sliding_window_rate_limiter_disabled_when_limit_zero() -> None:
     """Rate limiter does not enforce when limit is 0."""
 
     limiter = SlidingWindowRateLimiter(
@@ -18,10 +20,11 @@ def test_sliding_window_rate_limiter_disabled_when_limit_zero() -> None:
 
     # Should not raise
     for _ in range(100):
-        limiter.hit("test-key")
+        await limiter.hit("test-key")
 
 
-def test_sliding_window_rate_limiter_ignores_empty_key() -> None:
+@pytest.mark.asyncio
+async def test_sliding_window_rate_limiter_ignores_empty_key() -> None:
     """Rate limiter does not enforce when key is empty."""
 
     limiter = SlidingWindowRateLimiter(
@@ -30,44 +33,69 @@ def test_sliding_window_rate_limiter_ignores_empty_key() -> None:
 
     # Should not raise
     for _ in range(100):
-        limiter.hit("")
+        await limiter.hit("")
 
 
-def test_sliding_window_rate_limiter_reset() -> None:
+@pytest.mark.asyncio
+async def test_sliding_window_rate_limiter_reset() -> None:
     """reset() clears internal state."""
 
     limiter = SlidingWindowRateLimiter(
         2, 60, code="test", message_template="Test {key}"
     )
 
-    limiter.hit("test-key")
-    limiter.hit("test-key")
+    await limiter.hit("test-key")
+    await limiter.hit("test-key")
 
     limiter.reset()
 
     # Should not raise after reset
-    limiter.hit("test-key")
-    limiter.hit("test-key")
+    await limiter.hit("test-key")
+    await limiter.hit("test-key")
 
 
-def test_auth_rate_limiter_check_ip_and_identity() -> None:
+@pytest.mark.asyncio
+async def test_auth_rate_limiter_check_ip_and_identity() -> None:
     """AuthRateLimiter checks both IP and identity limits."""
 
     limiter = AuthRateLimiter(ip_limit=2, identity_limit=2, interval_seconds=60)
 
     # IP limiting
-    limiter.check_ip("1.2.3.4")
-    limiter.check_ip("1.2.3.4")
+    await limiter.check_ip("1.2.3.4")
+    await limiter.check_ip("1.2.3.4")
 
     with pytest.raises(AuthenticationError) as exc:
-        limiter.check_ip("1.2.3.4")
+        await limiter.check_ip("1.2.3.4")
     assert exc.value.code == "auth.rate_limited.ip"
 
     # Identity limiting
     limiter.reset()
-    limiter.check_identity("user-1")
-    limiter.check_identity("user-1")
+    await limiter.check_identity("user-1")
+    await limiter.check_identity("user-1")
 
     with pytest.raises(AuthenticationError) as exc:
-        limiter.check_identity("user-1")
+        await limiter.check_identity("user-1")
     assert exc.value.code == "auth.rate_limited.identity"
+
+
+@pytest.mark.asyncio
+async def test_auth_rate_limiters_share_backend_and_report_retry_after() -> None:
+    """Limiters sharing a backend enforce one budget with precise Retry-After."""
+
+    backend = InMemoryRateLimitBackend()
+    replica_a = AuthRateLimiter(
+        ip_limit=2, identity_limit=2, interval_seconds=60, backend=backend
+    )
+    replica_b = AuthRateLimiter(
+        ip_limit=2, identity_limit=2, interval_seconds=60, backend=backend
+    )
+
+    await replica_a.check_ip("1.2.3.4")
+    await replica_b.check_ip("1.2.3.4")
+    with pytest.raises(AuthenticationError) as exc:
+        await replica_a.check_ip("1.2.3.4")
+    assert exc.value.headers == {"Retry-After": "30"}
+
+    await replica_b.check_identity("1.2.3.4")
+    replica_a.reset()
+    await replica_b.check_ip("1.2.3.4")
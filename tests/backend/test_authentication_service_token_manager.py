@@ -1,9 +1,17 @@
 """Service token tests split from the extended suite."""
 
 from __future__ import annotations
+import asyncio
 from datetime import UTC, datetime, timedelta
+from typing import Any
 import pytest
-from orcheo_backend.app.authentication import ServiceTokenManager, ServiceTokenRecord
+from orcheo_backend.app.authentication import (
+    AuthenticationError,
+    ServiceTokenManager,
+    ServiceTokenRecord,
+    ServiceTokenUsage,
+    ServiceTokenUsageAggregator,
+)
 from orcheo_backend.app.service_token_repository import InMemoryServiceTokenRepository
 from tests.backend.authentication_test_utils import reset_auth_state
 
@@ -104,3 +112,115 @@ def test_service_token_rotation_expiry_with_non_none_expires_at() -> None:
     expected = now + timedelta(seconds=300)
     assert result is not None
     assert abs((result - expected).total_seconds()) < 1
+
+
+class _CountingRepository(InMemoryServiceTokenRepository):
+    """Repository counting hash lookups."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.hash_lookups = 0
+
+    async def find_by_hash(self, secret_hash: str) -> ServiceTokenRecord | None:
+        self.hash_lookups += 1
+        return await super().find_by_hash(secret_hash)
+
+
+@pytest.mark.asyncio
+async def test_service_token_manager_caches_verified_tokens() -> None:
+    """Repeated authentication hits the repository once per TTL window."""
+
+    now = datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
+    repository = _CountingRepository()
+    manager = ServiceTokenManager(
+        repository, clock=lambda: now, verified_ttl=timedelta(seconds=10)
+    )
+    secret, record = await manager.mint()
+
+    first = await manager.authenticate(secret)
+    second = await manager.authenticate(secret)
+    assert repository.hash_lookups == 1
+    assert (first.use_count, second.use_count) == (1, 2)
+
+    now += timedelta(seconds=11)
+    await manager.authenticate(secret)
+    assert repository.hash_lookups == 2
+
+    await manager.revoke(record.identifier)
+    with pytest.raises(AuthenticationError) as exc:
+        await manager.authenticate(secret)
+    assert exc.value.code == "auth.token_revoked"
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_service_token_manager_rejects_cached_token_after_expiry() -> None:
+    """Cached records still honour their expiry timestamp."""
+
+    now = datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
+    manager = ServiceTokenManager(
+        InMemoryServiceTokenRepository(),
+        clock=lambda: now,
+        verified_ttl=timedelta(minutes=5),
+    )
+    secret, _ = await manager.mint(expires_in=60)
+    await manager.authenticate(secret)
+
+    now += timedelta(seconds=61)
+    with pytest.raises(AuthenticationError) as exc:
+        await manager.authenticate(secret)
+    assert exc.value.code == "auth.token_expired"
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_service_token_manager_coalesces_usage_into_batches() -> None:
+    """Usage is buffered and persisted with a single batch write."""
+
+    repository = InMemoryServiceTokenRepository()
+    manager = ServiceTokenManager(repository, usage_flush_interval=0.01)
+    secret, record = await manager.mint()
+
+    for _ in range(3):
+        await manager.authenticate(secret)
+    stored = await repository.find_by_id(record.identifier)
+    assert stored is not None and stored.use_count == 0
+    assert manager.usage.pending[record.identifier].count == 3
+
+    for _ in range(100):
+        await asyncio.sleep(0.01)
+        stored = await repository.find_by_id(record.identifier)
+        if stored is not None and stored.use_count:
+            break
+    assert stored is not None
+    assert stored.use_count == 3
+    assert stored.last_used_at is not None
+    assert manager.usage.pending == {}
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_usage_aggregator_retries_failed_flushes() -> None:
+    """Usage that fails to persist is kept for the next flush."""
+
+    written: list[dict[str, ServiceTokenUsage]] = []
+
+    class FlakyRepository:
+        failures = 1
+
+        async def record_usage_batch(self, usage: Any) -> None:
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError("database unavailable")
+            written.append(dict(usage))
+
+    aggregator = ServiceTokenUsageAggregator(FlakyRepository(), flush_interval=60)
+    earlier = datetime(2025, 1, 1, tzinfo=UTC)
+    later = earlier + timedelta(seconds=5)
+    aggregator.record("token", earlier)
+
+    assert await aggregator.flush() == 0
+    aggregator.record("token", later)
+    await aggregator.aclose()
+
+    assert written == [{"token": ServiceTokenUsage(2, later)}]
@@ -100,7 +100,10 @@ async def test_authenticate_websocket_missing_token() -> None:
         websocket.state = Mock()
         websocket.close = AsyncMock()
 
-        with patch("orcheo_backend.app.authentication.get_auth_rate_limiter"):
+        with patch(
+            "orcheo_backend.app.authentication.get_auth_rate_limiter",
+            return_value=AsyncMock(),
+        ):
             with pytest.raises(AuthenticationError):
                 await authenticate_websocket(websocket)
 
@@ -139,7 +142,10 @@ async def test_authenticate_websocket_invalid_scheme() -> None:
         websocket.state = Mock()
         websocket.close = AsyncMock()
 
-        with patch("orcheo_backend.app.authentication.get_auth_rate_limiter"):
+        with patch(
+            "orcheo_backend.app.authentication.get_auth_rate_limiter",
+            return_value=AsyncMock(),
+        ):
             with pytest.raises(AuthenticationError):
                 await authenticate_websocket(websocket)
 
@@ -51,7 +51,7 @@ async def test_authenticate_websocket_rate_limit_ip_exceeded() -> None:
             mock_get_auth.return_value = mock_authenticator
 
             mock_limiter = Mock()
-            mock_limiter.check_ip = Mock(
+            mock_limiter.check_ip = AsyncMock(
                 side_effect=AuthenticationError(
                     "Rate limited",
                     code="auth.rate_limited.ip",
@@ -118,8 +118,8 @@ async def test_authenticate_websocket_rate_limit_identity_exceeded() -> None:
             mock_get_auth.return_value = mock_authenticator
 
             mock_limiter = Mock()
-            mock_limiter.check_ip = Mock()
-            mock_limiter.check_identity = Mock(
+            mock_limiter.check_ip = AsyncMock()
+            mock_limiter.check_identity = AsyncMock(
                 side_effect=AuthenticationError(
                     "Rate limited",
                     code="auth.rate_limited.identity",
@@ -179,7 +179,7 @@ async def test_authenticate_websocket_authentication_failure() -> None:
             mock_get_auth.return_value = mock_authenticator
 
             mock_limiter = Mock()
-            mock_limiter.check_ip = Mock()
+            mock_limiter.check_ip = AsyncMock()
             mock_get_limiter.return_value = mock_limiter
 
             websocket = Mock(spec=WebSocket)
@@ -137,7 +137,8 @@ def test_extract_session_subject_uses_cookie_fallback() -> None:
     assert chatkit._extract_session_subject(request) == "user-1"
 
 
-def test_rate_limit_reraises_authentication_error() -> None:
+@pytest.mark.asyncio
+async def test_rate_limit_reraises_authentication_error() -> None:
     error = AuthenticationError(
         "denied",
         code="chatkit.rate",
@@ -145,11 +146,11 @@ def test_rate_limit_reraises_authentication_error() -> None:
     )
 
     class DummyLimiter:
-        def hit(self, key: str, *, now: datetime) -> None:
+        async def hit(self, key: str, *, now: datetime) -> None:
             raise error
 
     with pytest.raises(HTTPException) as excinfo:
-        chatkit._rate_limit(DummyLimiter(), "key", now=datetime.now(tz=UTC))
+        await chatkit._rate_limit(DummyLimiter(), "key", now=datetime.now(tz=UTC))
     assert excinfo.value.status_code == status.HTTP_429_TOO_MANY_REQUESTS
 
 
@@ -11,6 +11,7 @@ from chatkit.types import (
     UserMessageTextContent,
 )
 from langchain_core.messages import AIMessage, HumanMessage
+from orcheo.graph.blobs import InMemoryBlobStore, configure_blob_store, offload_value
 from orcheo.graph.ingestion import LANGGRAPH_SCRIPT_FORMAT
 from orcheo.models.workflow import Workflow, WorkflowChatKitConfig
 from orcheo_backend.app.chatkit import message_utils as message_utils_module
@@ -161,6 +162,18 @@ def testextract_reply_from_state_from_results_dict() -> None:
     assert result == "Reply from results"
 
 
+def testextract_reply_from_state_loads_offloaded_reply() -> None:
+    store = InMemoryBlobStore()
+    configure_blob_store(store, threshold=100)
+    try:
+        reply = offload_value("x" * 200, store, threshold=100)
+        state = {"results": {"node_a": {"reply": reply}}}
+        result = extract_reply_from_state(state)
+    finally:
+        configure_blob_store(None)
+    assert result == "x" * 200
+
+
 def testextract_reply_from_state_from_results_string() -> None:
     state = {"results": {"node_a": "String result"}}
     result = extract_reply_from_state(state)
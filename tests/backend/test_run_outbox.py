@@ -0,0 +1,236 @@
+"""Tests for the run outbox relay."""
+
+from __future__ import annotations
+import asyncio
+import sys
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from datetime import datetime
+from uuid import UUID, uuid4
+import pytest
+from orcheo_backend.app.repository import RunOutboxEntry, RunOutboxStore
+from orcheo_backend.app.run_outbox import RunOutboxRelay, publish_runs_to_broker
+
+
+class FakeOutboxStore:
+    """In-memory outbox store recording relay interactions."""
+
+    def __init__(self, run_ids: Sequence[UUID] = ()) -> None:
+        self.due = list(run_ids)
+        self.attempts: dict[UUID, int] = {}
+        self.published: list[UUID] = []
+        self.rescheduled: dict[UUID, datetime] = {}
+        self.errors: list[str] = []
+        self.requeue_cutoffs: list[datetime] = []
+        self.requeue_delays: list[Callable[[int], float]] = []
+        self.notifier: Callable[[], None] | None = None
+
+    def set_run_outbox_notifier(self, notifier: Callable[[], None] | None) -> None:
+        self.notifier = notifier
+
+    async def claim_run_outbox(
+        self, *, limit: int, lease_seconds: float
+    ) -> list[RunOutboxEntry]:
+        claimed, self.due = self.due[:limit], self.due[limit:]
+        entries = []
+        for run_id in claimed:
+            self.attempts[run_id] = self.attempts.get(run_id, 0) + 1
+            entries.append(RunOutboxEntry(run_id, self.attempts[run_id]))
+        return entries
+
+    async def mark_run_outbox_published(self, run_ids: Sequence[UUID]) -> None:
+        self.published.extend(run_ids)
+
+    async def reschedule_run_outbox(
+        self, retry_at: Mapping[UUID, datetime], *, error: str
+    ) -> None:
+        self.rescheduled.update(retry_at)
+        self.errors.append(error)
+
+    async def release_run_outbox(self, run_id: UUID) -> None:
+        self.due.append(run_id)
+
+    async def requeue_stale_run_outbox(
+        self,
+        *,
+        published_before: datetime,
+        retry_delay: Callable[[int], float],
+    ) -> int:
+        self.requeue_cutoffs.append(published_before)
+        self.requeue_delays.append(retry_delay)
+        return len(self.requeue_cutoffs)
+
+
+def test_fake_store_satisfies_protocol() -> None:
+    assert isinstance(FakeOutboxStore(), RunOutboxStore)
+
+
+@pytest.mark.asyncio
+async def test_drain_publishes_in_batches() -> None:
+    run_ids = [uuid4() for _ in range(5)]
+    store = FakeOutboxStore(run_ids)
+    batches: list[list[UUID]] = []
+    relay = RunOutboxRelay(
+        store, publish=lambda ids: batches.append(list(ids)), batch_size=2
+    )
+
+    assert await relay.drain() == 5
+
+    assert batches == [run_ids[0:2], run_ids[2:4], run_ids[4:5]]
+    assert store.published == run_ids
+
+
+@pytest.mark.asyncio
+async def test_publish_failure_reschedules_with_backoff() -> None:
+    run_id = uuid4()
+    store = FakeOutboxStore([run_id])
+    store.attempts[run_id] = 2
+
+    def fail(run_ids: Sequence[UUID]) -> None:
+        raise ConnectionError("broker down")
+
+    relay = RunOutboxRelay(store, publish=fail, backoff_seconds=1.0)
+
+    assert await relay.relay_once() == 0
+
+    assert store.published == []
+    assert store.errors == ["broker down"]
+    assert run_id in store.rescheduled
+    assert relay.backoff_for(3) == 4.0
+
+
+def test_backoff_is_exponential_and_capped() -> None:
+    relay = RunOutboxRelay(
+        FakeOutboxStore(), backoff_seconds=0.5, max_backoff_seconds=3.0
+    )
+
+    assert [relay.backoff_for(n) for n in (0, 1, 2, 3, 4)] == [
+        0.5,
+        0.5,
+        1.0,
+        2.0,
+        3.0,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sweep_uses_stuck_window() -> None:
+    store = FakeOutboxStore()
+    relay = RunOutboxRelay(store, stuck_after_seconds=120)
+
+    assert await relay.sweep_once() == 1
+    assert len(store.requeue_cutoffs) == 1
+    assert store.requeue_delays == [relay.requeue_delay_for]
+
+
+def test_requeue_delay_backs_off_per_entry() -> None:
+    relay = RunOutboxRelay(
+        FakeOutboxStore(), stuck_after_seconds=60, max_requeue_delay_seconds=400
+    )
+
+    assert [relay.requeue_delay_for(n) for n in (1, 2, 3, 4, 1000)] == [
+        0.0,
+        60.0,
+        180.0,
+        400.0,
+        400.0,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_start_registers_notifier_and_wake_triggers_drain() -> None:
+    store = FakeOutboxStore()
+    published = asyncio.Event()
+    relay = RunOutboxRelay(
+        store,
+        publish=lambda ids: None,
+        poll_interval_seconds=60,
+        sweep_interval_seconds=60,
+    )
+    original = store.mark_run_outbox_published
+
+    async def mark(run_ids: Sequence[UUID]) -> None:
+        await original(run_ids)
+        published.set()
+
+    store.mark_run_outbox_published = mark  # type: ignore[method-assign]
+
+    await relay.start()
+    await relay.start()
+    assert store.notifier == relay.wake
+    await asyncio.sleep(0)
+    run_id = uuid4()
+    store.due.append(run_id)
+    assert store.notifier is not None
+    store.notifier()
+    await asyncio.wait_for(published.wait(), timeout=1)
+    await relay.stop()
+    await relay.stop()
+
+    assert store.published == [run_id]
+    assert store.notifier is None
+
+
+@pytest.mark.asyncio
+async def test_relay_loop_survives_store_errors() -> None:
+    store = FakeOutboxStore()
+    calls = 0
+
+    async def broken_claim(*, limit: int, lease_seconds: float) -> list[RunOutboxEntry]:
+        nonlocal calls
+        calls += 1
+        raise RuntimeError("database unavailable")
+
+    store.claim_run_outbox = broken_claim  # type: ignore[method-assign]
+    relay = RunOutboxRelay(store, poll_interval_seconds=0.01)
+
+    await relay.start()
+    await asyncio.sleep(0.05)
+    await relay.stop()
+
+    assert calls > 1
+
+
+def test_from_env_reads_overrides(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ORCHEO_RUN_OUTBOX_BATCH_SIZE", "7")
+    monkeypatch.setenv("ORCHEO_RUN_OUTBOX_POLL_INTERVAL_SECONDS", "not-a-number")
+
+    relay = RunOutboxRelay.from_env(FakeOutboxStore())
+
+    assert relay._batch_size == 7  # noqa: SLF001
+    assert relay._poll_interval == 1.0  # noqa: SLF001
+
+
+def test_publish_runs_to_broker_uses_run_id_as_task_id(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    producers: list[object] = []
+    published: list[tuple[tuple[str, ...], str, object]] = []
+
+    class MockApp:
+        @contextmanager
+        def producer_or_acquire(self) -> Iterator[object]:
+            producer = object()
+            producers.append(producer)
+            yield producer
+
+    class MockTask:
+        app = MockApp()
+
+        @staticmethod
+        def apply_async(
+            args: tuple[str, ...], *, task_id: str, producer: object
+        ) -> None:
+            published.append((args, task_id, producer))
+
+    mock_module = type(sys)("orcheo_backend.worker.tasks")
+    mock_module.execute_run = MockTask()  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "orcheo_backend.worker.tasks", mock_module)
+    run_ids = [uuid4(), uuid4()]
+
+    publish_runs_to_broker(run_ids)
+
+    assert [(args, task_id) for args, task_id, _ in published] == [
+        ((str(run_id),), str(run_id)) for run_id in run_ids
+    ]
+    assert len(producers) == 1
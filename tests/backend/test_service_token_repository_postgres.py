@@ -12,6 +12,7 @@ from typing import Any
 import pytest
 from orcheo_backend.app.authentication.service_tokens import (
     ServiceTokenRecord,
+    ServiceTokenUsage,
 )
 from orcheo_backend.app.service_token_repository import (
     postgres_repository as pg_repo,
@@ -403,6 +404,30 @@ async def test_postgres_service_token_repository_record_usage_token_not_found(
     await repo.record_usage("nonexistent", ip="127.0.0.1")
 
 
+@pytest.mark.asyncio
+async def test_postgres_service_token_repository_record_usage_batch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify that batched usage is written with one statement per table."""
+    repo = make_repository(monkeypatch, [{}, {}])
+    connection = repo._pool._connection  # type: ignore[union-attr]
+    used_at = datetime.now(tz=UTC)
+
+    await repo.record_usage_batch(
+        {
+            "token-1": ServiceTokenUsage(3, used_at),
+            "token-2": ServiceTokenUsage(1, used_at),
+        }
+    )
+    await repo.record_usage_batch({})
+
+    (update, update_params), (insert, insert_params) = connection.queries
+    assert update.startswith("UPDATE service_tokens")
+    assert update_params == (["token-1", "token-2"], [3, 1], [used_at, used_at])
+    assert insert.startswith("INSERT INTO service_token_audit_log")
+    assert insert_params[2] == ['{"count": 3}', '{"count": 1}']
+
+
 @pytest.mark.asyncio
 async def test_postgres_service_token_repository_get_audit_log(
     monkeypatch: pytest.MonkeyPatch,
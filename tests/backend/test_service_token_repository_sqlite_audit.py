@@ -1,9 +1,10 @@
 """Tests covering usage tracking and audit logging for the SQLite repository."""
 
 from __future__ import annotations
+from datetime import UTC, datetime
 from pathlib import Path
 import pytest
-from orcheo_backend.app.authentication import ServiceTokenRecord
+from orcheo_backend.app.authentication import ServiceTokenRecord, ServiceTokenUsage
 from orcheo_backend.app.service_token_repository import SqliteServiceTokenRepository
 
 
@@ -63,6 +64,31 @@ class TestSqliteServiceTokenRepositoryAudit:
         assert token is not None
         assert token.use_count == 3
 
+    async def test_record_usage_batch_applies_aggregated_counts(
+        self,
+        repository: SqliteServiceTokenRepository,
+        sample_token_record: ServiceTokenRecord,
+    ) -> None:
+        """record_usage_batch adds counts and logs one entry per token."""
+        await repository.create(sample_token_record)
+        used_at = datetime(2025, 6, 1, 8, 0, 0, tzinfo=UTC)
+
+        await repository.record_usage_batch(
+            {
+                "test-token-123": ServiceTokenUsage(5, used_at),
+                "missing-token": ServiceTokenUsage(1, used_at),
+            }
+        )
+
+        token = await repository.find_by_id("test-token-123")
+        assert token is not None
+        assert token.use_count == 5
+        assert token.last_used_at == used_at
+        log = await repository.get_audit_log("test-token-123")
+        assert [(entry["action"], entry["details"]) for entry in log] == [
+            ("used", '{"count": 5}')
+        ]
+
     async def test_record_usage_without_ip_and_user_agent(
         self,
         repository: SqliteServiceTokenRepository,
@@ -7,6 +7,7 @@ import httpx
 import pytest
 from orcheo.plugins import PluginLoadReport, PluginLoadResult
 from orcheo_backend.app import plugin_inventory, versioning
+from orcheo_backend.app.authentication import reset_authentication_state
 from tests.backend.authentication_test_utils import create_test_client, reset_auth_state
 
 
@@ -200,6 +201,24 @@ def test_robots_txt_is_public_when_auth_required(
     assert response.text == "User-agent: *\nDisallow: /\n"
 
 
+def test_metrics_endpoint_requires_authentication(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Metrics endpoint serves the runtime registry to authenticated scrapers."""
+    monkeypatch.setenv("ORCHEO_AUTH_MODE", "required")
+    monkeypatch.setenv("ORCHEO_AUTH_BOOTSTRAP_SERVICE_TOKEN", "metrics-token")
+    reset_authentication_state()
+
+    client = create_test_client()
+    assert client.get("/metrics").status_code == 401
+
+    response = client.get("/metrics", headers={"Authorization": "Bearer metrics-token"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE orcheo_run_duration_seconds histogram" in response.text
+
+
 def test_versioning_private_helpers_cover_error_paths(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
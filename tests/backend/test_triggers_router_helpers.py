@@ -1,11 +1,19 @@
 from __future__ import annotations
 import json
-from uuid import uuid4
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Annotated, Any, TypedDict
+from uuid import UUID, uuid4
 import pytest
 from fastapi import HTTPException
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import END, START, StateGraph
+from orcheo.graph.blobs import InMemoryBlobStore, configure_blob_store, offload_value
 from orcheo.graph.ingestion import LANGGRAPH_SCRIPT_FORMAT
-from orcheo.models import WorkflowVersion
+from orcheo.models import WorkflowRun, WorkflowVersion
+from orcheo_backend.app.history import InMemoryRunHistoryStore
 from orcheo_backend.app.routers import triggers
 
 
@@ -132,10 +140,11 @@ def test_build_webhook_state_default_shape() -> None:
     assert state["config"] == {}
 
 
-def test_extract_immediate_response_returns_content() -> None:
+@pytest.mark.asyncio
+async def test_extract_immediate_response_returns_content() -> None:
     """Immediate responses are extracted from results."""
 
-    immediate, should_process = triggers._extract_immediate_response(
+    immediate, should_process = await triggers._extract_immediate_response(
         {
             "results": {
                 "node": {
@@ -150,19 +159,23 @@ def test_extract_immediate_response_returns_content() -> None:
     assert should_process is True
 
 
-def test_extract_immediate_response_handles_missing() -> None:
+@pytest.mark.asyncio
+async def test_extract_immediate_response_handles_missing() -> None:
     """Missing immediate responses return a default tuple."""
 
-    immediate, should_process = triggers._extract_immediate_response({"results": {}})
+    immediate, should_process = await triggers._extract_immediate_response(
+        {"results": {}}
+    )
 
     assert immediate is None
     assert should_process is False
 
 
-def test_extract_immediate_response_skips_invalid_entries() -> None:
+@pytest.mark.asyncio
+async def test_extract_immediate_response_skips_invalid_entries() -> None:
     """Non-matching result entries are ignored."""
 
-    immediate, should_process = triggers._extract_immediate_response(
+    immediate, should_process = await triggers._extract_immediate_response(
         {
             "results": {
                 "node": "not-a-dict",
@@ -175,6 +188,31 @@ def test_extract_immediate_response_skips_invalid_entries() -> None:
     assert should_process is False
 
 
+@pytest.mark.asyncio
+async def test_extract_immediate_response_loads_offloaded_replies() -> None:
+    """Immediate responses offloaded to the blob store are loaded."""
+
+    store = InMemoryBlobStore()
+    configure_blob_store(store, threshold=10)
+    try:
+        reply = {"content": "x" * 40, "content_type": "text/plain"}
+        immediate, should_process = await triggers._extract_immediate_response(
+            {
+                "results": {
+                    "node": {
+                        "immediate_response": offload_value(reply, store, threshold=10),
+                        "should_process": False,
+                    }
+                }
+            }
+        )
+    finally:
+        configure_blob_store(None)
+
+    assert immediate == reply
+    assert should_process is False
+
+
 class _DummyCheckpointer:
     async def __aenter__(self) -> object:
         return self
@@ -445,3 +483,202 @@ def test_build_json_immediate_response_non_string_non_dict_content() -> None:
     assert isinstance(result, JSONResponse)
     assert json.loads(result.body) == 12345
     assert result.status_code == 201
+
+
+def _merge_results(left: dict[str, Any], right: dict[str, Any]) -> dict[str, Any]:
+    return {**left, **right}
+
+
+class _HandoffState(TypedDict, total=False):
+    inputs: dict[str, Any]
+    results: Annotated[dict[str, Any], _merge_results]
+
+
+class _HandoffRepository:
+    def __init__(self, version: WorkflowVersion, run: WorkflowRun) -> None:
+        self.version = version
+        self.run = run
+        self.enqueue_delays: list[object] = []
+        self.released: list[UUID] = []
+        self.published: list[UUID] = []
+        self.created: list[UUID] = []
+
+    async def handle_webhook_trigger(self, workflow_id: UUID, **kwargs: Any):
+        self.enqueue_delays.append(kwargs["enqueue_delay"])
+        if kwargs["run_id"] is not None:
+            self.run.id = kwargs["run_id"]
+        self.created.append(self.run.id)
+        return self.run
+
+    async def get_latest_version(self, workflow_id: UUID) -> WorkflowVersion:
+        assert workflow_id == self.version.workflow_id
+        return self.version
+
+    async def release_run_outbox(self, run_id: UUID) -> None:
+        self.released.append(run_id)
+
+
+def _handoff_graph(
+    executed: list[str], *, should_process: bool = True, reply: bool = True
+) -> StateGraph:
+    def parse(state: _HandoffState, config: RunnableConfig) -> dict[str, Any]:
+        executed.append("parse")
+        immediate = None
+        if reply and config["configurable"].get(triggers.IMMEDIATE_RESPONSE_CHECK_KEY):
+            immediate = {"content": "success"}
+        result = {"immediate_response": immediate, "should_process": should_process}
+        return {"results": {"parse": result}}
+
+    def send(state: _HandoffState) -> dict[str, Any]:
+        executed.append("reply")
+        return {"results": {"reply": {"sent": True}}}
+
+    graph = StateGraph(_HandoffState)
+    graph.add_node("parse", parse)
+    graph.add_node("reply", send)
+    graph.add_edge(START, "parse")
+    graph.add_edge("parse", "reply")
+    graph.add_edge("reply", END)
+    return graph
+
+
+def _patch_handoff_runtime(
+    monkeypatch: pytest.MonkeyPatch,
+    graph: StateGraph,
+    saver: InMemorySaver,
+    history: InMemoryRunHistoryStore,
+) -> None:
+    @asynccontextmanager
+    async def _checkpointer(settings: object) -> AsyncIterator[InMemorySaver]:
+        yield saver
+
+    @asynccontextmanager
+    async def _store(settings: object) -> AsyncIterator[None]:
+        yield None
+
+    monkeypatch.setattr(triggers, "build_graph", lambda graph_config: graph)
+    monkeypatch.setattr(triggers, "create_checkpointer", _checkpointer)
+    monkeypatch.setattr(triggers, "create_graph_store", _store)
+    monkeypatch.setattr(triggers, "get_settings", lambda: object())
+    monkeypatch.setattr(triggers, "get_history_store", lambda: history)
+
+
+def _handoff_repository() -> _HandoffRepository:
+    version = WorkflowVersion(
+        workflow_id=uuid4(),
+        version=1,
+        graph={"format": LANGGRAPH_SCRIPT_FORMAT},
+        created_by="tester",
+    )
+    run = WorkflowRun(
+        workflow_version_id=version.id,
+        triggered_by="webhook",
+        input_payload={"query_params": {"msg_signature": "abc"}},
+    )
+    return _HandoffRepository(version, run)
+
+
+async def _invoke_handoff(
+    repository: _HandoffRepository,
+) -> PlainTextResponse | JSONResponse | Response | WorkflowRun:
+    return await triggers._respond_and_hand_off(
+        repository,
+        repository,
+        object(),
+        repository.version.workflow_id,
+        "POST",
+        {},
+        {"msg_signature": "abc"},
+        {},
+        None,
+    )
+
+
+@pytest.mark.asyncio()
+async def test_respond_and_hand_off_executes_each_node_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The inline pass stops at the reply node and the resume runs the rest."""
+
+    executed: list[str] = []
+    graph = _handoff_graph(executed)
+    saver = InMemorySaver()
+    history = InMemoryRunHistoryStore()
+    _patch_handoff_runtime(monkeypatch, graph, saver, history)
+    repository = _handoff_repository()
+    run = repository.run
+
+    response = await _invoke_handoff(repository)
+
+    assert isinstance(response, PlainTextResponse)
+    assert response.body == b"success"
+    assert repository.enqueue_delays == [triggers.IMMEDIATE_RESPONSE_HANDOFF_TIMEOUT]
+    assert repository.created == [run.id]
+    assert repository.released == [run.id]
+    assert executed == ["parse"]
+    record = await history.get_history(str(run.id))
+    assert [list(step.payload) for step in record.steps] == [["parse"]]
+
+    # A worker resumes the same thread without repeating the parse node.
+    config: RunnableConfig = {"configurable": {"thread_id": str(run.id)}}
+    resumed = graph.compile(checkpointer=saver)
+    snapshot = await resumed.aget_state(config)
+    assert snapshot.metadata[triggers.WEBHOOK_HANDOFF_METADATA_KEY] is True
+    await resumed.ainvoke(None, config=config)
+    assert executed == ["parse", "reply"]
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("should_process", "reply", "expected_executed"),
+    [(False, True, ["parse"]), (True, False, ["parse", "reply"])],
+)
+async def test_respond_and_hand_off_creates_no_run_with_nothing_left(
+    monkeypatch: pytest.MonkeyPatch,
+    should_process: bool,
+    reply: bool,
+    expected_executed: list[str],
+) -> None:
+    """Pings that leave no work for a worker never create or persist a run."""
+
+    executed: list[str] = []
+    graph = _handoff_graph(executed, should_process=should_process, reply=reply)
+    history = InMemoryRunHistoryStore()
+    _patch_handoff_runtime(monkeypatch, graph, InMemorySaver(), history)
+    repository = _handoff_repository()
+
+    response = await _invoke_handoff(repository)
+
+    if reply:
+        assert isinstance(response, PlainTextResponse)
+        assert response.body == b"success"
+    else:
+        assert isinstance(response, JSONResponse)
+        assert response.status_code == 202
+    assert executed == expected_executed
+    assert repository.created == []
+    assert repository.released == []
+    workflow_id = str(repository.version.workflow_id)
+    assert await history.list_histories(workflow_id) == []
+
+
+@pytest.mark.asyncio()
+async def test_respond_and_hand_off_releases_run_on_failure(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Inline failures still release the run so a worker can finish it."""
+
+    def _raise_error(*_args: object, **_kwargs: object) -> object:
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(triggers, "build_graph", _raise_error)
+    monkeypatch.setattr(triggers, "get_settings", lambda: object())
+    monkeypatch.setattr(triggers, "get_history_store", InMemoryRunHistoryStore)
+    repository = _handoff_repository()
+    run = repository.run
+
+    response = await _invoke_handoff(repository)
+
+    assert response is run
+    assert repository.created == [run.id]
+    assert repository.released == [run.id]
@@ -574,7 +574,9 @@ async def test_stream_workflow_updates_logs_final_state(
     monkeypatch.setattr(workflow_execution, "_safe_send_json", safe_send)
     monkeypatch.setattr(workflow_execution, "_emit_trace_update", emit_update)
     monkeypatch.setattr(
-        workflow_execution, "record_workflow_step", lambda tracer, payload: None
+        workflow_execution,
+        "record_workflow_step",
+        lambda tracer, payload, **kwargs: None,
     )
     monkeypatch.setattr(
         workflow_execution,
@@ -595,6 +597,55 @@ async def test_stream_workflow_updates_logs_final_state(
     assert final_state_logs == [{"reply": "done"}]
 
 
+@pytest.mark.asyncio
+async def test_stream_workflow_updates_forwards_node_progress_as_events(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from orcheo.nodes.agent_tools.context import get_active_tool_progress_callback
+
+    safe_send = AsyncMock(return_value=True)
+    history_store = AsyncMock()
+    history_store.append_step = AsyncMock(return_value=SimpleNamespace())
+
+    class CompiledGraph:
+        async def astream(self, state: object, *, config: object, stream_mode: str):
+            callback = get_active_tool_progress_callback()
+            assert callback is not None
+            await callback({"agent": {"status": "running", "stdout": ["line"]}})
+            yield {"agent": {"status": "succeeded"}}
+
+        async def aget_state(self, config: object) -> object:
+            return SimpleNamespace(values={})
+
+    monkeypatch.setattr(workflow_execution, "_safe_send_json", safe_send)
+    monkeypatch.setattr(workflow_execution, "_emit_trace_update", AsyncMock())
+    monkeypatch.setattr(
+        workflow_execution,
+        "record_workflow_step",
+        lambda tracer, payload, **kwargs: None,
+    )
+    websocket = AsyncMock()
+
+    await workflow_execution._stream_workflow_updates(
+        CompiledGraph(),
+        {"inputs": {}},
+        {"configurable": {"thread_id": "exec"}},
+        history_store,
+        "exec",
+        websocket,
+        object(),
+    )
+
+    assert safe_send.await_args_list[0].args == (
+        websocket,
+        {"agent": {"status": "running", "stdout": ["line"]}},
+    )
+    assert safe_send.await_args_list[0].kwargs == {"kind": "event"}
+    history_store.append_step.assert_awaited_once_with(
+        "exec", {"agent": {"status": "succeeded"}}
+    )
+
+
 @pytest.mark.asyncio
 async def test_run_workflow_stream_handles_cancellation(
     monkeypatch: pytest.MonkeyPatch,
@@ -0,0 +1,244 @@
+"""Tests for the compact workflow websocket streaming protocol."""
+
+from __future__ import annotations
+import copy
+import json
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
+import ormsgpack
+import pytest
+from fastapi import WebSocket
+from orcheo_backend.app import workflow_execution
+from orcheo_backend.app.routers import websocket as websocket_routes
+from orcheo_backend.app.workflow_stream import (
+    COMPACT_PROTOCOL,
+    STATE_AFTER_ATTRIBUTE,
+    CompactWorkflowStream,
+    StreamOptions,
+    StreamOptionsError,
+    get_workflow_stream,
+    json_patch,
+)
+
+
+def _apply_patch(document: Any, patch: list[dict[str, Any]]) -> Any:
+    document = copy.deepcopy(document)
+    for operation in patch:
+        if operation["path"] == "":
+            document = copy.deepcopy(operation["value"])
+            continue
+        *parents, last = [
+            part.replace("~1", "/").replace("~0", "~")
+            for part in operation["path"].split("/")[1:]
+        ]
+        target = document
+        for part in parents:
+            target = target[int(part)] if isinstance(target, list) else target[part]
+        if operation["op"] == "remove":
+            del target[last]
+        elif isinstance(target, list):
+            if last == "-":
+                target.append(operation["value"])
+            else:
+                target[int(last)] = operation["value"]
+        else:
+            target[last] = operation["value"]
+    return document
+
+
+class _FakeWebSocket:
+    def __init__(self) -> None:
+        self.state = SimpleNamespace()
+        self.frames: list[dict[str, Any]] = []
+
+    async def send_text(self, data: str) -> None:
+        self.frames.append(json.loads(data))
+
+    async def send_bytes(self, data: bytes) -> None:
+        self.frames.append(ormsgpack.unpackb(data))
+
+
+@pytest.mark.parametrize(
+    ("before", "after"),
+    [
+        ({"a": 1, "b": {"c": [1]}}, {"a": 2, "b": {"c": [1, 2, 3]}, "d/e": None}),
+        ({"messages": ["x", "y"], "gone": True}, {"messages": ["y"]}),
+        ({"items": [{"v": 1}, {"v": 2}]}, {"items": [{"v": 1}, {"v": 5}]}),
+        ({}, {"results": {"node": "ok"}}),
+        ([1], {"not": "a list"}),
+    ],
+)
+def test_json_patch_round_trips(before: Any, after: Any) -> None:
+    assert _apply_patch(before, json_patch(before, after)) == after
+
+
+def test_json_patch_appends_only_new_list_items() -> None:
+    before = {"messages": [{"content": "long"} for _ in range(50)]}
+    after = {"messages": [*before["messages"], {"content": "new"}]}
+
+    assert json_patch(before, after) == [
+        {"op": "add", "path": "/messages/-", "value": {"content": "new"}}
+    ]
+    assert json_patch(after, after) == []
+
+
+def test_stream_options_parse() -> None:
+    assert StreamOptions.parse(None) is None
+    options = StreamOptions.parse({"channels": ["steps"], "encoding": "msgpack"})
+    assert options == StreamOptions(channels=frozenset({"steps"}), encoding="msgpack")
+    assert StreamOptions.parse({"protocol": COMPACT_PROTOCOL}) == StreamOptions()
+
+    for raw in (
+        "compact",
+        {"protocol": "v0"},
+        {"channels": ["steps", "video"]},
+        {"encoding": "xml"},
+    ):
+        with pytest.raises(StreamOptionsError):
+            StreamOptions.parse(raw)
+
+
+def _trace_update(span_id: str, before: Any, after: Any) -> dict[str, Any]:
+    return {
+        "type": "trace:update",
+        "execution_id": "exec-1",
+        "trace_id": "trace-1",
+        "spans": [
+            {
+                "span_id": span_id,
+                "name": span_id,
+                "attributes": {
+                    "orcheo.node.id": span_id,
+                    "orcheo.workflow.state.before": before,
+                    "orcheo.workflow.state.after": after,
+                },
+            }
+        ],
+        "complete": False,
+    }
+
+
+@pytest.mark.asyncio
+async def test_compact_stream_sends_state_deltas_and_strips_snapshots() -> None:
+    websocket = _FakeWebSocket()
+    stream = CompactWorkflowStream(websocket, StreamOptions())  # type: ignore[arg-type]
+    first = {"messages": ["hi"], "results": {}}
+    second = {"messages": ["hi", "there"], "results": {"b": 1}}
+
+    await stream.start()
+    await stream.send("step", {"a": {"messages": ["hi"]}})
+    await stream.send("trace", _trace_update("a", {}, first))
+    await stream.send("trace", _trace_update("b", first, second))
+    await stream.send("event", {"status": "completed"})
+
+    kinds = [frame["t"] for frame in websocket.frames]
+    assert kinds == ["hello", "step", "state", "trace", "state", "trace", "event"]
+    assert [frame["s"] for frame in websocket.frames] == list(range(1, 8))
+    assert websocket.frames[0]["protocol"] == COMPACT_PROTOCOL
+
+    state_frames = [frame for frame in websocket.frames if frame["t"] == "state"]
+    assert _apply_patch({}, state_frames[0]["p"]) == first
+    assert state_frames[1]["p"] == [
+        {"op": "add", "path": "/messages/-", "value": "there"},
+        {"op": "add", "path": "/results/b", "value": 1},
+    ]
+    trace = websocket.frames[3]["d"]
+    assert trace["spans"][0]["attributes"] == {"orcheo.node.id": "a"}
+
+
+@pytest.mark.asyncio
+async def test_compact_stream_filters_channels_and_supports_msgpack() -> None:
+    websocket = _FakeWebSocket()
+    options = StreamOptions(channels=frozenset({"tokens"}), encoding="msgpack")
+    stream = CompactWorkflowStream(websocket, options)  # type: ignore[arg-type]
+
+    assert not stream.wants_trace
+    await stream.send(
+        "step",
+        {
+            "llm": {"token_usage": {"input": 4, "output": 2}},
+            "plain": {"results": {}},
+        },
+    )
+    await stream.send("trace", _trace_update("llm", {}, {"x": 1}))
+
+    assert websocket.frames == [
+        {"t": "tokens", "node": "llm", "in": 4, "out": 2, "s": 1}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_execution_helpers_route_through_negotiated_stream() -> None:
+    websocket = _FakeWebSocket()
+    stream = CompactWorkflowStream(
+        websocket,  # type: ignore[arg-type]
+        StreamOptions(channels=frozenset({"steps"})),
+    )
+    websocket.state.workflow_stream = stream
+    history_store = AsyncMock()
+
+    assert get_workflow_stream(websocket) is stream
+    assert await workflow_execution._safe_send_json(
+        websocket,  # type: ignore[arg-type]
+        {"node": {"ok": True}},
+        kind="step",
+    )
+    await workflow_execution._emit_trace_update(
+        history_store,
+        websocket,  # type: ignore[arg-type]
+        "exec-1",
+        include_root=True,
+    )
+
+    history_store.get_history.assert_not_awaited()
+    assert websocket.frames == [{"t": "step", "d": {"node": {"ok": True}}, "s": 1}]
+
+
+@pytest.mark.asyncio
+async def test_negotiate_stream_reports_invalid_options() -> None:
+    websocket = AsyncMock(spec=WebSocket)
+    websocket.state = SimpleNamespace()
+
+    assert not await websocket_routes._negotiate_stream(
+        websocket, {"stream": {"encoding": "xml"}}
+    )
+    websocket.send_json.assert_awaited_once()
+    assert websocket.send_json.await_args.args[0]["status"] == "error"
+
+    assert await websocket_routes._negotiate_stream(
+        websocket, {"stream": {"channels": ["steps"]}}
+    )
+    assert isinstance(websocket.state.workflow_stream, CompactWorkflowStream)
+    websocket.send_text.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_negotiate_stream_starts_fresh_for_each_run_message() -> None:
+    websocket = _FakeWebSocket()
+    options = {"stream": {"channels": ["state"]}}
+    update = {
+        "spans": [
+            {
+                "span_id": "a",
+                "name": "node",
+                "attributes": {STATE_AFTER_ATTRIBUTE: {"results": {"x": 1}}},
+            }
+        ]
+    }
+
+    assert await websocket_routes._negotiate_stream(websocket, options)  # type: ignore[arg-type]
+    first = get_workflow_stream(websocket)
+    assert first is not None
+    await first.send("trace", update)
+
+    assert await websocket_routes._negotiate_stream(websocket, options)  # type: ignore[arg-type]
+    second = get_workflow_stream(websocket)
+    assert second is not None and second is not first
+    await second.send("trace", update)
+
+    # The second run diffs against an empty snapshot and restarts sequencing.
+    assert websocket.frames[2:] == websocket.frames[:2]
+
+    assert await websocket_routes._negotiate_stream(websocket, {})  # type: ignore[arg-type]
+    assert get_workflow_stream(websocket) is None
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 import os
+from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
@@ -204,6 +205,112 @@ class TestDispatchCronTriggers:
         assert result["dispatched_runs"] == expected_run_ids
 
 
+class TestPurgeListenerDedupe:
+    """Tests for the purge_listener_dedupe Celery task."""
+
+    def test_reports_purged_count(self) -> None:
+        from orcheo_backend.worker.tasks import purge_listener_dedupe
+
+        with patch("orcheo_backend.worker.tasks._get_event_loop") as mock_get_loop:
+            mock_loop = MagicMock()
+            mock_loop.run_until_complete.return_value = 3
+            mock_get_loop.return_value = mock_loop
+            with patch(
+                "orcheo_backend.worker.tasks._purge_listener_dedupe_async",
+                new=MagicMock(return_value=MagicMock()),
+            ):
+                result = purge_listener_dedupe()
+
+        assert result == {"purged": 3}
+
+    @pytest.mark.asyncio
+    async def test_async_helper_calls_repository(self) -> None:
+        from orcheo_backend.worker.tasks import _purge_listener_dedupe_async
+
+        mock_repo = AsyncMock()
+        mock_repo.purge_expired_listener_dedupe = AsyncMock(return_value=2)
+
+        with patch(
+            "orcheo_backend.app.dependencies.get_repository", return_value=mock_repo
+        ):
+            assert await _purge_listener_dedupe_async() == 2
+
+
+class TestPurgeBlobStore:
+    """Tests for the purge_blob_store Celery task."""
+
+    def test_prunes_the_configured_store(self) -> None:
+        from orcheo.graph.blobs import InMemoryBlobStore, configure_blob_store
+        from orcheo_backend.worker.tasks import purge_blob_store
+
+        store = InMemoryBlobStore()
+        store.put(b"old")
+        configure_blob_store(store, retention_days=1.0)
+        try:
+            with patch("orcheo.graph.blobs.time.time", return_value=1e12):
+                assert purge_blob_store() == {"purged": 1}
+            assert purge_blob_store() == {"purged": 0}
+        finally:
+            configure_blob_store(None)
+
+
+class TestRelayRunOutbox:
+    """Tests for the relay_run_outbox Celery task."""
+
+    def test_returns_relay_counts(self) -> None:
+        from orcheo_backend.worker.tasks import relay_run_outbox
+
+        with patch("orcheo_backend.worker.tasks._get_event_loop") as mock_get_loop:
+            mock_loop = MagicMock()
+            mock_loop.run_until_complete.return_value = {
+                "requeued": 1,
+                "published": 4,
+            }
+            mock_get_loop.return_value = mock_loop
+            with patch(
+                "orcheo_backend.worker.tasks._relay_run_outbox_async",
+                new=MagicMock(return_value=MagicMock()),
+            ):
+                result = relay_run_outbox()
+
+        assert result == {"requeued": 1, "published": 4}
+
+    @pytest.mark.asyncio
+    async def test_async_helper_skips_repositories_without_outbox(self) -> None:
+        from orcheo_backend.app.repository import InMemoryWorkflowRepository
+        from orcheo_backend.worker.tasks import _relay_run_outbox_async
+
+        with patch(
+            "orcheo_backend.app.dependencies.get_repository",
+            return_value=InMemoryWorkflowRepository(),
+        ):
+            assert await _relay_run_outbox_async() == {"requeued": 0, "published": 0}
+
+    @pytest.mark.asyncio
+    async def test_async_helper_sweeps_then_drains(self, tmp_path: Path) -> None:
+        from orcheo_backend.app.repository import SqliteWorkflowRepository
+        from orcheo_backend.worker.tasks import _relay_run_outbox_async
+
+        mock_repo = SqliteWorkflowRepository(tmp_path / "outbox.sqlite")
+        relay = MagicMock()
+        relay.sweep_once = AsyncMock(return_value=2)
+        relay.drain = AsyncMock(return_value=5)
+
+        with (
+            patch(
+                "orcheo_backend.app.dependencies.get_repository",
+                return_value=mock_repo,
+            ),
+            patch(
+                "orcheo_backend.app.run_outbox.RunOutboxRelay.from_env",
+                return_value=relay,
+            ) as from_env,
+        ):
+            assert await _relay_run_outbox_async() == {"requeued": 2, "published": 5}
+
+        from_env.assert_called_once_with(mock_repo)
+
+
 class TestExternalAgentTasks:
     """Tests for worker-side external agent helper tasks."""
 
@@ -1,6 +1,7 @@
 """Tests for Celery task signal handlers in tasks.py."""
 
 from __future__ import annotations
+import asyncio
 import time
 from unittest.mock import MagicMock, patch
 
@@ -207,3 +208,66 @@ class TestTaskFailureHandler:
             task_failure_handler(task_id=None, task=mock_task, exception=None)
 
             mock_logger.error.assert_called_once()
+
+
+class TestWorkerShutdownHandler:
+    """Tests for worker_shutdown_handler signal."""
+
+    def test_closes_pooled_clients_on_the_worker_loop(self) -> None:
+        """Shutdown drains pooled clients through the shared worker loop."""
+        from orcheo_backend.worker.tasks import worker_shutdown_handler
+
+        loop = asyncio.new_event_loop()
+        closed: list[str] = []
+
+        async def _close_http_clients() -> None:
+            closed.append("http")
+
+        async def _close_warm_process_pools() -> None:
+            closed.append("agents")
+
+        try:
+            with (
+                patch("orcheo_backend.worker.tasks._get_event_loop", return_value=loop),
+                patch(
+                    "orcheo.runtime.http_clients.close_http_clients",
+                    _close_http_clients,
+                ),
+                patch(
+                    "orcheo.external_agents.close_warm_process_pools",
+                    _close_warm_process_pools,
+                ),
+            ):
+                worker_shutdown_handler()
+        finally:
+            loop.close()
+
+        assert closed == ["http", "agents"]
+
+
+class TestCollectQueueDepth:
+    """Tests for the queue depth metrics collector."""
+
+    def test_reuses_pooled_broker_connection(self) -> None:
+        """Repeated scrapes borrow one pooled connection instead of dialling."""
+        from orcheo_backend.worker.tasks import _collect_queue_depth, celery_app
+
+        connection = MagicMock()
+        connection.__enter__.return_value = connection
+        declare = connection.default_channel.queue_declare
+        declare.return_value.message_count = 3
+        pool = MagicMock()
+        pool.acquire.return_value = connection
+
+        with (
+            patch.object(type(celery_app), "pool", pool),
+            patch.object(celery_app, "connection_for_read") as connect,
+            patch("orcheo.tracing.metrics.QUEUE_DEPTH") as depth,
+        ):
+            _collect_queue_depth()
+            _collect_queue_depth()
+
+        connect.assert_not_called()
+        assert pool.acquire.call_count == 2
+        assert connection.__exit__.call_count == 2
+        depth.set.assert_called_with(3, queue=celery_app.conf.task_default_queue)
@@ -85,6 +85,30 @@ class TestExtractOutput:
         assert result == {"final_state": {"custom": "data"}}
 
 
+@pytest.mark.asyncio
+async def test_resolved_output_loads_offloaded_results() -> None:
+    """Stored run outputs never keep blob references."""
+    from orcheo.graph.blobs import (
+        InMemoryBlobStore,
+        configure_blob_store,
+        offload_value,
+    )
+    from orcheo_backend.worker.tasks import _resolved_output
+
+    store = InMemoryBlobStore()
+    configure_blob_store(store, threshold=10)
+    try:
+        rows = ["row"] * 10
+        final_state = {
+            "results": {"node": {"rows": offload_value(rows, store, threshold=10)}}
+        }
+        output = await _resolved_output(final_state)
+    finally:
+        configure_blob_store(None)
+
+    assert output == {"final_state": {"results": {"node": {"rows": rows}}}}
+
+
 class TestHandleExecutionFailure:
     """Tests for _handle_execution_failure function."""
 
@@ -185,10 +209,22 @@ class TestExecuteWorkflow:
     """Tests for _execute_workflow function."""
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("checkpoint_metadata", "resumed"),
+        [
+            (None, False),
+            ({"step": 2}, False),
+            ({"orcheo_webhook_handoff": True, "step": 1}, True),
+        ],
+    )
     async def test_successful_execution(
-        self, mock_run: MagicMock, mock_version: MagicMock
+        self,
+        mock_run: MagicMock,
+        mock_version: MagicMock,
+        checkpoint_metadata: dict[str, Any] | None,
+        resumed: bool,
     ) -> None:
-        """Test successful workflow execution."""
+        """Only runs handed off by a webhook resume from their checkpoint."""
         from orcheo_backend.worker.tasks import _execute_workflow
 
         mock_repo = AsyncMock()
@@ -202,7 +238,9 @@ class TestExecuteWorkflow:
         mock_graph = MagicMock()
         mock_compiled = MagicMock()
         mock_compiled.astream = MagicMock(return_value=_step_stream())
-        mock_compiled.aget_state = AsyncMock(return_value=MagicMock(values={}))
+        mock_compiled.aget_state = AsyncMock(
+            return_value=MagicMock(values={}, metadata=checkpoint_metadata)
+        )
         mock_graph.compile = MagicMock(return_value=mock_compiled)
 
         mock_checkpointer = MagicMock()
@@ -268,7 +306,11 @@ class TestExecuteWorkflow:
             checkpointer=mock_checkpointer,
             store=mock_checkpointer,
         )
-        mock_history.start_run.assert_awaited_once()
+        streamed = mock_compiled.astream.call_args
+        assert (streamed.args[0] is None) is resumed
+        assert mock_history.start_run.await_count == (0 if resumed else 1)
+        handoff = streamed.kwargs["config"].get("metadata", {})
+        assert handoff.get("orcheo_webhook_handoff", False) is resumed
         mock_history.append_step.assert_awaited()
         mock_history.mark_completed.assert_awaited_once()
 
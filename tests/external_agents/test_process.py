@@ -5,9 +5,11 @@ import asyncio
 import os
 import signal
 import sys
+from pathlib import Path
 import pytest
 from orcheo.external_agents.process import (
     _read_stream,
+    _StreamCapture,
     _terminate_process_group,
     execute_process,
 )
@@ -42,12 +44,117 @@ async def test_execute_process_handles_timeout() -> None:
     assert result.exit_code is not None
 
 
+@pytest.mark.asyncio
+async def test_execute_process_writes_input_text_to_stdin() -> None:
+    """Input text is written to stdin, which is then closed."""
+    result = await execute_process(
+        [sys.executable, "-c", "import sys; print(sys.stdin.read().upper())"],
+        input_text="hello",
+    )
+
+    assert result.stdout.strip() == "HELLO"
+    assert result.exit_code == 0
+
+
+@pytest.mark.asyncio
+async def test_execute_process_times_out_while_writing_stdin() -> None:
+    """The timeout also bounds writing input to a process that never reads it."""
+    result = await asyncio.wait_for(
+        execute_process(
+            [sys.executable, "-c", "import time; time.sleep(30)"],
+            input_text="x" * (4 * 1024 * 1024),
+            timeout_seconds=0.5,
+        ),
+        timeout=10,
+    )
+
+    assert result.timed_out is True
+
+
+@pytest.mark.asyncio
+async def test_execute_process_streams_lines_and_spills_long_output(
+    tmp_path: Path,
+) -> None:
+    """Lines are forwarded as written; only a bounded tail stays in memory."""
+    lines: list[tuple[str, str]] = []
+
+    async def on_output(stream: str, line: str) -> None:
+        lines.append((stream, line))
+
+    script = (
+        "import sys\n"
+        "for i in range(2000): print(f'line {i:04d}')\n"
+        "print('warn', file=sys.stderr)\n"
+        "sys.stdout.write('partial')"
+    )
+    result = await execute_process(
+        [sys.executable, "-c", script],
+        on_output=on_output,
+        max_output_bytes=1024,
+        log_dir=tmp_path / "logs",
+    )
+
+    stdout_lines = [line for stream, line in lines if stream == "stdout"]
+    assert stdout_lines[0] == "line 0000"
+    assert stdout_lines[-2:] == ["line 1999", "partial"]
+    assert len(stdout_lines) == 2001
+    assert ("stderr", "warn") in lines
+    assert len(result.stdout.encode()) <= 1024
+    assert result.stdout.endswith("line 1999\npartial")
+    assert result.stdout_truncated is True
+    assert result.stdout_log_path is not None
+    log_text = result.stdout_log_path.read_text()
+    assert log_text.startswith("line 0000\n")
+    assert log_text.endswith("partial")
+    assert result.stderr == "warn\n"
+    assert result.stderr_truncated is False
+    assert result.stderr_log_path is None
+    assert [path.name for path in (tmp_path / "logs").iterdir()] == [
+        result.stdout_log_path.name
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_capture_stops_forwarding_after_callback_failure() -> None:
+    """A failing output callback does not interrupt capturing the stream."""
+    calls: list[str] = []
+
+    async def on_output(stream: str, line: str) -> None:
+        calls.append(line)
+        raise RuntimeError("client gone")
+
+    capture = _StreamCapture("stdout", on_output=on_output)
+    await capture.feed(b"first\nsecond\n")
+    await capture.finish()
+
+    assert calls == ["first"]
+    assert capture.text() == "first\nsecond\n"
+
+
+@pytest.mark.asyncio
+async def test_read_stream_closes_log_when_cancelled(tmp_path: Path) -> None:
+    """Cancelling a reader before EOF still closes its spilled log file."""
+    stream = asyncio.StreamReader()
+    stream.feed_data(b"partial output")
+    capture = _StreamCapture("stdout", max_bytes=4, log_path=tmp_path / "out.log")
+    task = asyncio.create_task(_read_stream(stream, capture))
+    while capture.total_bytes == 0:
+        await asyncio.sleep(0)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert capture._log is None
+    assert (tmp_path / "out.log").read_bytes() == b"partial output"
+
+
 @pytest.mark.asyncio
 async def test_read_stream_no_stream_returns_immediately() -> None:
     """The reader should exit gracefully when no stream is provided."""
-    chunks: list[bytes] = []
-    await _read_stream(None, chunks)
-    assert chunks == []
+    capture = _StreamCapture("stdout")
+    await _read_stream(None, capture)
+    assert capture.total_bytes == 0
 
 
 @pytest.mark.asyncio
@@ -1,6 +1,7 @@
 """Tests for external agent runtime helpers and manager behavior."""
 
 from __future__ import annotations
+import asyncio
 import multiprocessing
 import subprocess
 import sys
@@ -11,7 +12,11 @@ from pathlib import Path
 from unittest.mock import Mock
 import pytest
 import orcheo.external_agents.paths as external_agent_paths
-from orcheo.external_agents.manifest import RuntimeManifestStore, provider_lock
+from orcheo.external_agents.manifest import (
+    RuntimeManifestStore,
+    async_provider_lock,
+    provider_lock,
+)
 from orcheo.external_agents.models import (
     AuthProbeResult,
     AuthStatus,
@@ -512,6 +517,74 @@ async def test_runtime_manager_installs_and_reuses_runtime(tmp_path: Path) -> No
     assert second.maintenance_due is False
 
 
+@pytest.mark.asyncio
+async def test_runtime_manager_shares_concurrent_installs_and_caches(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Concurrent resolutions share one install and later ones skip the lock."""
+    provider = FakeProvider(version="1.0.0")
+    manager = ExternalAgentRuntimeManager(
+        runtime_root=tmp_path,
+        providers={provider.name: provider},
+    )
+    install = Mock(wraps=manager._install_latest_locked)
+    monkeypatch.setattr(manager, "_install_latest_locked", install)
+
+    results = await asyncio.gather(
+        *(manager.resolve_runtime(provider.name) for _ in range(4))
+    )
+
+    assert install.call_count == 1
+    assert {result.runtime.install_dir for result in results} == {
+        results[0].runtime.install_dir
+    }
+    load = Mock(wraps=manager.manifest_store.load)
+    monkeypatch.setattr(manager.manifest_store, "load", load)
+    async with async_provider_lock(tmp_path, provider.name):
+        cached = await asyncio.wait_for(manager.resolve_runtime(provider.name), 1)
+    assert cached.runtime.version == "1.0.0"
+    load.assert_not_called()
+
+    manifest = RuntimeManifestStore(tmp_path).load(provider.name)
+    assert manifest is not None
+    manifest.installed_at = datetime.now(UTC) - timedelta(days=10)
+    RuntimeManifestStore(tmp_path).save(manifest)
+    refreshed = await manager.resolve_runtime(provider.name)
+    assert refreshed.maintenance_due is True
+    load.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_runtime_manager_lock_timeout_keeps_event_loop_responsive(
+    tmp_path: Path,
+) -> None:
+    """Waiting on a held provider lock yields to other coroutines and times out."""
+    provider = FakeProvider(version="1.0.0")
+    manager = ExternalAgentRuntimeManager(
+        runtime_root=tmp_path,
+        providers={provider.name: provider},
+        lock_timeout=0.2,
+    )
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticking = asyncio.create_task(ticker())
+    try:
+        async with async_provider_lock(tmp_path, provider.name):
+            with pytest.raises(ProviderLockUnavailableError):
+                await manager.resolve_runtime(provider.name)
+    finally:
+        ticking.cancel()
+
+    assert ticks >= 5
+
+
 @pytest.mark.asyncio
 async def test_runtime_manager_successful_maintenance_keeps_previous_version(
     tmp_path: Path,
@@ -1074,6 +1147,76 @@ def test_gemini_provider_builds_expected_command_without_system_prompt() -> None
     ]
 
 
+@pytest.mark.parametrize(
+    ("provider", "expected_command"),
+    [
+        (
+            CodexProvider(),
+            [
+                "/tmp/agent/bin/agent",
+                "exec",
+                "--dangerously-bypass-approvals-and-sandbox",
+                "--skip-git-repo-check",
+                "-",
+            ],
+        ),
+        (
+            GeminiProvider(),
+            [
+                "/tmp/agent/bin/agent",
+                "--approval-mode",
+                "yolo",
+                "--output-format",
+                "text",
+            ],
+        ),
+    ],
+)
+def test_providers_build_prompt_independent_stdin_commands(
+    provider: CodexProvider | GeminiProvider,
+    expected_command: list[str],
+) -> None:
+    runtime = ResolvedRuntime(
+        provider=provider.name,
+        version="0.0.1",
+        install_dir=Path("/tmp/agent"),
+        executable_path=Path("/tmp/agent/bin/agent"),
+        package_name=provider.package_name,
+    )
+
+    stdin_command = provider.build_stdin_command(
+        runtime, prompt="review diff", system_prompt="be concise"
+    )
+
+    assert stdin_command == (
+        expected_command,
+        "System instructions:\nbe concise\n\nTask:\nreview diff",
+    )
+
+
+def test_claude_provider_builds_stdin_command() -> None:
+    provider = ClaudeCodeProvider()
+    runtime = ResolvedRuntime(
+        provider="claude_code",
+        version="0.0.1",
+        install_dir=Path("/tmp/claude"),
+        executable_path=Path("/tmp/claude/bin/claude"),
+        package_name=provider.package_name,
+    )
+
+    stdin_command = provider.build_stdin_command(runtime, prompt="review")
+
+    assert stdin_command is not None
+    command, input_text = stdin_command
+    assert input_text == "review"
+    assert "review" not in command
+    assert command[:3] == [
+        "/tmp/claude/bin/claude",
+        "--dangerously-skip-permissions",
+        "--print",
+    ]
+
+
 def test_gemini_provider_serialize_returns_none_when_no_auth_files(
     tmp_path: Path,
 ) -> None:
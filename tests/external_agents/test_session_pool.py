@@ -0,0 +1,71 @@
+"""Tests for warm pools of pre-started external agent processes."""
+
+from __future__ import annotations
+import asyncio
+import os
+import sys
+from pathlib import Path
+import pytest
+from orcheo.external_agents import session_pool
+from orcheo.external_agents.process import execute_process
+from orcheo.external_agents.session_pool import WarmProcessPool, WarmProcessProfile
+
+
+ECHO_COMMAND = [sys.executable, "-c", "import sys; print(sys.stdin.read()[::-1])"]
+
+
+async def _wait_for_idle(pool: WarmProcessPool, count: int) -> None:
+    for _ in range(200):
+        if pool.idle_count() == count:
+            return
+        await asyncio.sleep(0.01)
+    pytest.fail(f"pool never reached {count} idle processes")
+
+
+def test_profile_distinguishes_environments(tmp_path: Path) -> None:
+    first = WarmProcessProfile.create(["agent"], cwd=tmp_path, env={"A": "1"})
+
+    assert first == WarmProcessProfile.create(["agent"], cwd=tmp_path, env={"A": "1"})
+    assert first != WarmProcessProfile.create(["agent"], cwd=tmp_path, env={"A": "2"})
+
+
+@pytest.mark.asyncio
+async def test_pool_serves_warm_processes_and_tops_up(tmp_path: Path) -> None:
+    pool = WarmProcessPool()
+    env = dict(os.environ)
+
+    assert await pool.acquire(ECHO_COMMAND, cwd=tmp_path, env=env, size=2) is None
+    await _wait_for_idle(pool, 2)
+
+    process = await pool.acquire(ECHO_COMMAND, cwd=tmp_path, env=env, size=2)
+    assert process is not None
+    result = await execute_process(
+        ECHO_COMMAND, input_text="warm", process=process, timeout_seconds=10
+    )
+
+    assert result.stdout.strip() == "mraw"
+    await _wait_for_idle(pool, 2)
+    await pool.aclose()
+    assert pool.idle_count() == 0
+    assert await pool.acquire(ECHO_COMMAND, cwd=tmp_path, env=env, size=2) is None
+
+
+@pytest.mark.asyncio
+async def test_pool_reaps_idle_processes(tmp_path: Path) -> None:
+    pool = WarmProcessPool(idle_timeout=0.05)
+
+    await pool.acquire(ECHO_COMMAND, cwd=tmp_path, env=dict(os.environ), size=1)
+    await _wait_for_idle(pool, 1)
+    await _wait_for_idle(pool, 0)
+
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_module_helpers_share_the_loop_pool() -> None:
+    pool = session_pool.get_warm_process_pool()
+
+    assert session_pool.get_warm_process_pool() is pool
+    await session_pool.close_warm_process_pools()
+    assert session_pool.get_warm_process_pool() is not pool
+    await session_pool.close_warm_process_pools()
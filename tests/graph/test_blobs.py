@@ -0,0 +1,305 @@
+"""Tests for offloading large node outputs to blob stores."""
+
+from __future__ import annotations
+import os
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+import pytest
+from langchain_core.runnables import RunnableConfig
+from orcheo.edges.base import BaseEdge
+from orcheo.graph import blobs
+from orcheo.graph.blobs import (
+    BLOB_REF_KEY,
+    BlobNotFoundError,
+    FilesystemBlobStore,
+    InMemoryBlobStore,
+    PostgresBlobStore,
+    SQLiteBlobStore,
+    configure_blob_store,
+    is_blob_ref,
+    resolve_blob_refs,
+)
+from orcheo.graph.state import State
+from orcheo.nodes.base import TaskNode
+
+
+class _ProducerNode(TaskNode):
+    async def run(self, state: State, config: RunnableConfig) -> dict[str, Any]:
+        return {"documents": [{"text": "x" * 50} for _ in range(10)], "count": 10}
+
+
+class _ConsumerNode(TaskNode):
+    documents: Any = None
+
+    async def run(self, state: State, config: RunnableConfig) -> dict[str, Any]:
+        direct = state["results"]["producer"]["documents"]
+        return {"templated": len(self.documents), "direct": len(direct)}
+
+
+class _DocumentsEdge(BaseEdge):
+    async def run(self, state: State, config: RunnableConfig) -> str:
+        documents = state["results"]["producer"]["documents"]
+        return "many" if len(documents) > 5 else "few"
+
+
+@pytest.fixture
+def blob_store() -> Iterator[InMemoryBlobStore]:
+    store = InMemoryBlobStore()
+    configure_blob_store(store, threshold=100)
+    yield store
+    configure_blob_store(None)
+
+
+@pytest.mark.parametrize("backend", ["filesystem", "sqlite"])
+def test_blob_stores_round_trip_and_deduplicate(tmp_path: Path, backend: str) -> None:
+    store: FilesystemBlobStore | SQLiteBlobStore = (
+        FilesystemBlobStore(tmp_path / "blobs")
+        if backend == "filesystem"
+        else SQLiteBlobStore(tmp_path / "blobs.sqlite")
+    )
+
+    digest = store.put(b"payload")
+
+    assert store.put(b"payload") == digest
+    assert store.get(digest) == b"payload"
+    with pytest.raises(BlobNotFoundError):
+        store.get("0" * 64)
+
+
+@pytest.mark.parametrize("backend", ["memory", "filesystem", "sqlite"])
+def test_blob_stores_prune_blobs_not_written_since_cutoff(
+    tmp_path: Path, backend: str
+) -> None:
+    store: InMemoryBlobStore | FilesystemBlobStore | SQLiteBlobStore = (
+        InMemoryBlobStore()
+        if backend == "memory"
+        else FilesystemBlobStore(tmp_path / "blobs")
+        if backend == "filesystem"
+        else SQLiteBlobStore(tmp_path / "blobs.sqlite")
+    )
+    stale = store.put(b"stale")
+    cutoff = time.time() + 1
+    with patch("orcheo.graph.blobs.time.time", return_value=cutoff + 10):
+        fresh = store.put(b"fresh")
+    if backend == "filesystem":
+        os.utime(store._path(stale), (cutoff - 10, cutoff - 10))  # type: ignore[union-attr]
+        os.utime(store._path(fresh), (cutoff + 10, cutoff + 10))  # type: ignore[union-attr]
+
+    assert store.prune(cutoff) == 1
+    assert store.get(fresh) == b"fresh"
+    with pytest.raises(BlobNotFoundError):
+        store.get(stale)
+
+
+def test_postgres_blob_store_uses_shared_table() -> None:
+    class _Cursor:
+        def __init__(self, row: Any = None, rowcount: int = 0) -> None:
+            self._row = row
+            self.rowcount = rowcount
+
+        def fetchone(self) -> Any:
+            return self._row
+
+    class _Connection:
+        def __init__(self) -> None:
+            self.queries: list[tuple[str, Any]] = []
+            self.responses: list[_Cursor] = []
+
+        def execute(self, query: str, params: Any = None) -> _Cursor:
+            self.queries.append((query, params))
+            return self.responses.pop(0) if self.responses else _Cursor()
+
+        def __enter__(self) -> _Connection:
+            return self
+
+        def __exit__(self, *exc: object) -> None:
+            return None
+
+    connection = _Connection()
+    pool = MagicMock()
+    pool.connection.return_value = connection
+    with patch("psycopg_pool.ConnectionPool", return_value=pool):
+        store = PostgresBlobStore("postgresql://blobs")
+
+    digest = store.put(b"payload")
+    assert any(
+        "CREATE TABLE IF NOT EXISTS orcheo_blobs" in q for q, _ in connection.queries
+    )
+    assert connection.queries[-1][1] == (digest, b"payload")
+    assert "ON CONFLICT (digest) DO UPDATE SET stored_at" in connection.queries[-1][0]
+
+    connection.responses = [_Cursor(row=(memoryview(b"payload"),)), _Cursor()]
+    assert store.get(digest) == b"payload"
+    with pytest.raises(BlobNotFoundError):
+        store.get("0" * 64)
+
+    connection.responses = [_Cursor(rowcount=3)]
+    assert store.prune(100.0) == 3
+    assert connection.queries[-1][1] == (100.0,)
+    store.close()
+    pool.close.assert_called_once_with()
+
+
+def test_blob_store_from_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ORCHEO_BLOB_STORE_BACKEND", "filesystem")
+    monkeypatch.setenv("ORCHEO_BLOB_STORE_PATH", str(tmp_path))
+    assert isinstance(blobs.blob_store_from_env(), FilesystemBlobStore)
+
+    monkeypatch.setenv("ORCHEO_BLOB_STORE_BACKEND", "postgres")
+    monkeypatch.delenv("ORCHEO_BLOB_STORE_DSN", raising=False)
+    monkeypatch.delenv("ORCHEO_POSTGRES_DSN", raising=False)
+    with pytest.raises(ValueError, match="ORCHEO_BLOB_STORE_DSN"):
+        blobs.blob_store_from_env()
+    monkeypatch.setenv("ORCHEO_POSTGRES_DSN", "postgresql://shared")
+    with patch.object(blobs, "PostgresBlobStore") as store_cls:
+        assert blobs.blob_store_from_env() is store_cls.return_value
+    store_cls.assert_called_once_with("postgresql://shared")
+
+    monkeypatch.setenv("ORCHEO_BLOB_STORE_BACKEND", "none")
+    assert blobs.blob_store_from_env() is None
+
+
+def test_prune_blob_store_honours_retention(blob_store: InMemoryBlobStore) -> None:
+    blob_store.put(b"payload")
+
+    assert blobs.prune_blob_store() == 0
+    with patch("orcheo.graph.blobs.time.time", return_value=time.time() + 31 * 86400):
+        assert blobs.prune_blob_store() == 1
+
+    blob_store.put(b"payload")
+    configure_blob_store(blob_store, retention_days=0)
+    with patch("orcheo.graph.blobs.time.time", return_value=time.time() + 1e9):
+        assert blobs.prune_blob_store() == 0
+
+
+@pytest.mark.asyncio
+async def test_aresolve_blob_refs_loads_in_a_worker_thread() -> None:
+    reader_threads: list[threading.Thread] = []
+
+    class _RecordingStore(InMemoryBlobStore):
+        def get(self, digest: str) -> bytes:
+            reader_threads.append(threading.current_thread())
+            return super().get(digest)
+
+    store = _RecordingStore()
+    configure_blob_store(store, threshold=10)
+    try:
+        plain = {"results": {"node": {"count": 1}}}
+        assert await blobs.aresolve_blob_refs(plain) is plain
+        ref = blobs.offload_value(["x" * 20], store, threshold=10)
+        step = {"node": {"items": ref}}
+        assert await blobs.aresolve_blob_refs(step) == {"node": {"items": ["x" * 20]}}
+    finally:
+        configure_blob_store(None)
+
+    assert reader_threads
+    assert threading.main_thread() not in reader_threads
+
+
+def test_offload_result_keeps_small_fields_inline(
+    blob_store: InMemoryBlobStore,
+) -> None:
+    result = {"rows": list(range(100)), "count": 100, "status": "ok"}
+
+    offloaded = blobs.offload_result(result)
+
+    assert offloaded["count"] == 100
+    assert offloaded["status"] == "ok"
+    assert is_blob_ref(offloaded["rows"])
+    assert offloaded["rows"]["type"] == "list"
+    assert resolve_blob_refs(offloaded) == result
+    small = {"count": 1}
+    assert blobs.offload_result(small) is small
+
+
+@pytest.mark.asyncio
+async def test_task_nodes_offload_and_load_references(
+    blob_store: InMemoryBlobStore,
+) -> None:
+    producer = _ProducerNode(name="producer")
+    consumer = _ConsumerNode(name="consumer", documents="{{producer.documents}}")
+    state = State({"results": {}})
+
+    produced = (await producer(state, RunnableConfig()))["results"]["producer"]
+    assert produced["count"] == 10
+    assert set(produced["documents"]) == {BLOB_REF_KEY, "size", "type"}
+
+    state["results"]["producer"] = produced
+    consumed = (await consumer(state, RunnableConfig()))["results"]["consumer"]
+
+    assert consumed == {"templated": 10, "direct": 10}
+    assert is_blob_ref(state["results"]["producer"]["documents"])
+
+
+@pytest.mark.asyncio
+async def test_task_nodes_write_blobs_off_the_event_loop() -> None:
+    writer_threads: list[threading.Thread] = []
+
+    class _RecordingStore(InMemoryBlobStore):
+        def put(self, data: bytes) -> str:
+            writer_threads.append(threading.current_thread())
+            return super().put(data)
+
+    configure_blob_store(_RecordingStore(), threshold=100)
+    try:
+        await _ProducerNode(name="producer")(State({"results": {}}), RunnableConfig())
+    finally:
+        configure_blob_store(None)
+
+    assert writer_threads
+    assert threading.main_thread() not in writer_threads
+
+
+@pytest.mark.asyncio
+async def test_templates_load_blobs_off_the_event_loop() -> None:
+    reader_threads: list[threading.Thread] = []
+
+    class _RecordingStore(InMemoryBlobStore):
+        def get(self, digest: str) -> bytes:
+            reader_threads.append(threading.current_thread())
+            return super().get(digest)
+
+    configure_blob_store(_RecordingStore(), threshold=100)
+    try:
+        state = State({"results": {}})
+        state["results"]["producer"] = (
+            await _ProducerNode(name="producer")(state, RunnableConfig())
+        )["results"]["producer"]
+        consumer = _ConsumerNode(name="consumer", documents="{{producer.documents}}")
+        resolved = await consumer.aresolved_for_run(
+            blobs.with_resolved_blobs(state), config=RunnableConfig()
+        )
+    finally:
+        configure_blob_store(None)
+
+    assert len(resolved.documents) == 10
+    assert reader_threads
+    assert threading.main_thread() not in reader_threads
+
+
+@pytest.mark.asyncio
+async def test_edges_load_offloaded_inputs(blob_store: InMemoryBlobStore) -> None:
+    producer = _ProducerNode(name="producer")
+    state = State({"results": {}})
+    state["results"]["producer"] = (await producer(state, RunnableConfig()))["results"][
+        "producer"
+    ]
+
+    route = await _DocumentsEdge(name="route")(state, RunnableConfig())
+
+    assert route == "many"
+    assert is_blob_ref(state["results"]["producer"]["documents"])
+
+
+@pytest.mark.asyncio
+async def test_offloading_is_disabled_without_store() -> None:
+    configure_blob_store(None)
+    output = await _ProducerNode(name="producer")(
+        State({"results": {}}), RunnableConfig()
+    )
+
+    assert len(output["results"]["producer"]["documents"]) == 10
@@ -2,7 +2,7 @@ import pytest
 from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.graph import END, START, StateGraph
-from orcheo.graph.state import State
+from orcheo.graph.state import State, dict_reducer
 from orcheo.nodes.base import TaskNode
 
 
@@ -56,3 +56,17 @@ async def test_state() -> None:
             "node3": ["c"],
         },
     }
+
+
+def test_dict_reducer_shares_values_without_mutating_inputs() -> None:
+    rows = [{"id": 1}]
+    left = {"node1": {"rows": rows}}
+
+    merged = dict_reducer(left, {"node2": "b"})
+
+    assert merged == {"node1": {"rows": rows}, "node2": "b"}
+    assert merged is not left
+    assert left == {"node1": {"rows": rows}}
+    assert merged["node1"]["rows"] is rows
+    assert dict_reducer(merged, {}) is merged
+    assert dict_reducer(merged, {"node2": merged["node2"]}) is merged
@@ -77,13 +77,13 @@ class RecordingRepository:
         self.cursor = cursor
         return cursor
 
-    async def dispatch_listener_event(
+    async def dispatch_listener_events(
         self,
         subscription_id: UUID,
-        payload: ListenerDispatchPayload,
-    ) -> object | None:
-        self.dispatched.append(payload)
-        return payload
+        payloads: list[ListenerDispatchPayload],
+    ) -> list[Any]:
+        self.dispatched.extend(payloads)
+        return list(payloads)
 
 
 class DummyWebSocket:
@@ -59,11 +59,11 @@ class TelegramRecordingRepository:
         self.cursor = cursor
         return cursor
 
-    async def dispatch_listener_event(
-        self, subscription_id: Any, payload: ListenerDispatchPayload
-    ) -> Any:
-        self.dispatched.append(payload)
-        return payload
+    async def dispatch_listener_events(
+        self, subscription_id: Any, payloads: list[ListenerDispatchPayload]
+    ) -> list[Any]:
+        self.dispatched.extend(payloads)
+        return list(payloads)
 
 
 def telegram_subscription(**config: Any) -> ListenerSubscription:
@@ -340,6 +340,38 @@ async def test_poll_once_dispatches_and_saves_cursor() -> None:
     assert adapter._status == "healthy"
 
 
+@pytest.mark.asyncio
+async def test_poll_once_dispatches_updates_in_one_batch() -> None:
+    calls: list[list[ListenerDispatchPayload]] = []
+
+    class BatchRepository(TelegramRecordingRepository):
+        async def dispatch_listener_events(
+            self, subscription_id: Any, payloads: list[ListenerDispatchPayload]
+        ) -> list[Any]:
+            calls.append(list(payloads))
+            return await super().dispatch_listener_events(subscription_id, payloads)
+
+    updates = [
+        build_telegram_update(update_id=10),
+        {"update_id": 11, "edited_message": {"chat": {"type": "private"}}},
+        build_telegram_update(update_id=12),
+    ]
+    repository = BatchRepository()
+    adapter = TelegramPollingAdapter(
+        repository=repository,
+        subscription=telegram_subscription(),
+        runtime_id="runtime",
+        client=StubPollingClient(updates),
+    )
+
+    offset = await adapter.poll_once(token="token", offset=None)
+
+    assert offset == 13
+    assert [[p.dedupe_key for p in batch] for batch in calls] == [
+        ["telegram:10", "telegram:12"]
+    ]
+
+
 @pytest.mark.asyncio
 async def test_poll_once_skips_updates_missing_id() -> None:
     updates = [build_telegram_update(update_id=None)]
@@ -1,11 +1,13 @@
 """Tests for ConversationalBatchEvalNode."""
 
 import asyncio
+import copy
 from typing import Any
 import pytest
 from langchain_core.runnables import RunnableConfig
 from langgraph.graph import END, StateGraph
 from orcheo.graph.state import State
+from orcheo.nodes.agent_tools.context import tool_progress_context
 from orcheo.nodes.base import TaskNode
 from orcheo.nodes.evaluation.batch import ConversationalBatchEvalNode
 
@@ -739,3 +741,163 @@ async def test_batch_eval_resolve_max_concurrency_none_defaults_to_one() -> None
     result = await node.run(State(inputs={"conversations": QRECC_CONVERSATIONS}), {})
     assert result["total_conversations"] == 2
     assert result["total_turns"] == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_eval_reports_throughput_and_latency_stats() -> None:
+    node = ConversationalBatchEvalNode(name="batch")
+    state = State(inputs={"conversations": QRECC_CONVERSATIONS})
+
+    result = await node.run(state, {})
+
+    stats = result["stats"]
+    assert stats["conversations_processed"] == 2
+    assert stats["conversations_resumed"] == 0
+    assert stats["turn_latency"]["count"] == 3
+    assert stats["conversation_latency"]["p50_ms"] >= 0.0
+    assert stats["turns_per_second"] > 0
+
+
+@pytest.mark.asyncio
+async def test_batch_eval_streams_results_and_resumes_from_checkpoint(
+    tmp_path: Any,
+) -> None:
+    checkpoint = tmp_path / "batch.jsonl"
+    events: list[dict[str, Any]] = []
+
+    async def progress(payload: dict[str, Any]) -> None:
+        events.append(payload)
+
+    node = ConversationalBatchEvalNode(name="batch", checkpoint_path=str(checkpoint))
+    with tool_progress_context(progress):
+        first = await node.run(State(inputs={"conversations": QRECC_CONVERSATIONS}), {})
+
+    assert [event["batch"]["conversation_id"] for event in events] == [
+        "conv1",
+        "conv2",
+    ]
+    assert {event["batch"]["event"] for event in events} == {"conversation_complete"}
+    assert len(checkpoint.read_text().splitlines()) == 2
+
+    lines = checkpoint.read_text().splitlines()
+    checkpoint.write_text(lines[0] + "\n" + lines[1][:10], encoding="utf-8")
+    events.clear()
+
+    with tool_progress_context(progress):
+        resumed = await node.run(
+            State(inputs={"conversations": QRECC_CONVERSATIONS}), {}
+        )
+
+    assert [event["batch"]["conversation_id"] for event in events] == ["conv2"]
+    assert resumed["predictions"] == first["predictions"]
+    assert resumed["stats"]["conversations_resumed"] == 1
+    assert resumed["stats"]["conversations_processed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_eval_checkpoint_is_invalidated_by_changed_cases_or_config(
+    tmp_path: Any,
+) -> None:
+    checkpoint = tmp_path / "batch.jsonl"
+    node = ConversationalBatchEvalNode(name="batch", checkpoint_path=str(checkpoint))
+    await node.run(State(inputs={"conversations": QRECC_CONVERSATIONS}), {})
+
+    edited = copy.deepcopy(QRECC_CONVERSATIONS)
+    edited[1]["turns"][0]["gold_rewrite"] = "What is the Java language?"
+    result = await node.run(State(inputs={"conversations": edited}), {})
+
+    assert result["stats"]["conversations_resumed"] == 1
+    assert result["references"][-1] == "What is the Java language?"
+
+    piped = ConversationalBatchEvalNode(
+        name="batch",
+        checkpoint_path=str(checkpoint),
+        pipeline=_build_pipeline_graph(EchoRewriteNode(name="rewrite")),
+    )
+    result = await piped.run(State(inputs={"conversations": edited}), {})
+
+    assert result["stats"]["conversations_resumed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_eval_pipelines_turns_within_conversation() -> None:
+    active = 0
+    peak = 0
+
+    class SlowEcho(TaskNode):
+        async def run(self, state: State, config: RunnableConfig) -> dict[str, Any]:
+            nonlocal active, peak
+            del config
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            inputs = state.get("inputs", {})
+            return {"query": f"{inputs['message']}|{len(inputs['history'])}"}
+
+    conversation = {
+        "conversation_id": "c",
+        "turns": [{"raw_question": f"q{i}", "gold_rewrite": "g"} for i in range(4)],
+    }
+    node = ConversationalBatchEvalNode(
+        name="batch",
+        max_turn_concurrency=4,
+        pipeline=_build_pipeline_graph(SlowEcho(name="rewrite")),
+    )
+
+    result = await node.run(State(inputs={"conversations": [conversation]}), {})
+
+    assert peak == 4
+    assert result["predictions"] == ["q0|0", "q1|1", "q2|2", "q3|3"]
+
+
+@pytest.mark.asyncio
+async def test_batch_eval_cancels_remaining_work_on_failure() -> None:
+    started: list[str] = []
+
+    class Failing(TaskNode):
+        async def run(self, state: State, config: RunnableConfig) -> dict[str, Any]:
+            del config
+            message = state.get("inputs", {})["message"]
+            started.append(message)
+            if message == "boom":
+                raise RuntimeError("pipeline failed")
+            await asyncio.sleep(0.01)
+            return {"query": message}
+
+    conversation = {
+        "conversation_id": "c",
+        "turns": [
+            {"raw_question": "boom", "gold_rewrite": "g"},
+            {"raw_question": "later", "gold_rewrite": "g"},
+        ],
+    }
+    node = ConversationalBatchEvalNode(
+        name="batch",
+        pipeline=_build_pipeline_graph(Failing(name="rewrite")),
+    )
+
+    with pytest.raises(RuntimeError, match="pipeline failed"):
+        await node.run(State(inputs={"conversations": [conversation]}), {})
+
+    assert started == ["boom"]
+
+
+def test_batch_eval_validates_max_turn_concurrency() -> None:
+    with pytest.raises(ValueError, match="max_turn_concurrency must be an integer"):
+        ConversationalBatchEvalNode(name="batch", max_turn_concurrency="many")
+    templated = ConversationalBatchEvalNode(
+        name="batch", max_turn_concurrency="{{inputs.turns}}"
+    )
+    with pytest.raises(ValueError, match="must resolve to an integer"):
+        templated._resolve_max_turn_concurrency()
+    with pytest.raises(ValueError, match=">= 1"):
+        ConversationalBatchEvalNode(
+            name="batch", max_turn_concurrency=0
+        )._resolve_max_turn_concurrency()
+    assert (
+        ConversationalBatchEvalNode(
+            name="batch", max_turn_concurrency=None
+        )._resolve_max_turn_concurrency()
+        == 1
+    )
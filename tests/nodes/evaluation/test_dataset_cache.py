@@ -0,0 +1,134 @@
+"""Tests for the evaluation dataset cache and streaming loaders."""
+
+import json
+from pathlib import Path
+import httpx
+import pytest
+import respx
+from orcheo.graph.state import State
+from orcheo.nodes.evaluation.dataset_cache import (
+    DatasetCache,
+    is_jsonl,
+    load_json_source,
+    read_json_file,
+)
+from orcheo.nodes.evaluation.datasets import (
+    MultiDoc2DialDatasetNode,
+    QReCCDatasetNode,
+)
+
+
+QRECC_RECORDS = [
+    {"Conversation_no": 2, "Turn_no": 1, "Question": "q2", "Answer": "a2"},
+    {"Conversation_no": 1, "Turn_no": 1, "Question": "q1", "Answer": "a1"},
+    {"Conversation_no": 1, "Turn_no": 2, "Question": "q1b", "Answer": "a1b"},
+]
+
+
+def test_is_jsonl_detects_suffix_and_ignores_query() -> None:
+    assert is_jsonl("data.jsonl")
+    assert is_jsonl("https://example.com/data.NDJSON?token=1")
+    assert not is_jsonl("data.json")
+
+
+def test_read_json_file_stops_at_limit(tmp_path: Path) -> None:
+    path = tmp_path / "rows.jsonl"
+    path.write_text('{"id": 1}\n\n{"id": 2}\n{"id": 3}\n', encoding="utf-8")
+
+    assert read_json_file(path, jsonl=True, limit=2) == [{"id": 1}, {"id": 2}]
+    assert len(read_json_file(path, jsonl=True)) == 3
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_fetch_stores_blob_and_revalidates_with_etag(tmp_path: Path) -> None:
+    cache = DatasetCache(tmp_path)
+    url = "https://example.com/data.json"
+    route = respx.get(url).mock(
+        return_value=httpx.Response(200, json=[{"id": 1}], headers={"ETag": '"v1"'})
+    )
+
+    first = await cache.fetch(url, timeout=5.0)
+    assert first.parent == tmp_path / "blobs"
+    assert json.loads(first.read_text()) == [{"id": 1}]
+
+    route.mock(return_value=httpx.Response(304))
+    second = await cache.fetch(url, timeout=5.0)
+
+    assert second == first
+    assert route.calls.last.request.headers["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_fetch_falls_back_to_cached_blob_on_network_error(
+    tmp_path: Path,
+) -> None:
+    cache = DatasetCache(tmp_path)
+    url = "https://example.com/data.json"
+    route = respx.get(url).mock(return_value=httpx.Response(200, json=[1]))
+    blob = await cache.fetch(url, timeout=5.0)
+
+    route.mock(side_effect=httpx.ConnectError("offline"))
+
+    assert await cache.fetch(url, timeout=5.0) == blob
+
+    with pytest.raises(httpx.ConnectError):
+        await DatasetCache(tmp_path / "empty").fetch(url, timeout=5.0)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_load_json_source_parses_jsonl_urls_without_cache() -> None:
+    url = "https://example.com/rows.jsonl"
+    respx.get(url).mock(return_value=httpx.Response(200, text='{"a": 1}\n{"a": 2}\n'))
+
+    assert await load_json_source(url, http_timeout=5.0, limit=1) == [{"a": 1}]
+
+
+@pytest.mark.asyncio
+async def test_qrecc_node_reuses_prevalidated_snapshot(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    data_path = tmp_path / "qrecc.json"
+    data_path.write_text(json.dumps(QRECC_RECORDS), encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    node = QReCCDatasetNode(
+        name="qrecc", data_path=str(data_path), cache_dir=str(cache_dir)
+    )
+
+    first = await node.run(State(inputs={}), {})
+    assert [c["conversation_id"] for c in first["conversations"]] == ["1", "2"]
+    assert list((cache_dir / "snapshots").glob("QReCCDatasetNode-*.jsonl"))
+
+    def fail_parse(*_: object) -> None:
+        raise AssertionError("snapshot should skip parsing")
+
+    monkeypatch.setattr(QReCCDatasetNode, "_parse_conversations", fail_parse)
+    limited = QReCCDatasetNode(
+        name="qrecc",
+        data_path=str(data_path),
+        cache_dir=str(cache_dir),
+        max_conversations=1,
+    )
+    second = await limited.run(State(inputs={}), {})
+
+    assert second["total_conversations"] == 1
+    assert second["total_turns"] == 2
+    assert second["conversations"] == first["conversations"][:1]
+
+
+@pytest.mark.asyncio
+async def test_md2d_node_streams_jsonl_until_limit(tmp_path: Path) -> None:
+    data_path = tmp_path / "md2d.jsonl"
+    lines = [
+        json.dumps({"dial_id": f"d{i}", "domain": "ssa", "turns": []}) for i in range(3)
+    ]
+    data_path.write_text("\n".join(lines) + "\n{not json", encoding="utf-8")
+
+    node = MultiDoc2DialDatasetNode(
+        name="md2d", data_path=str(data_path), max_conversations=2
+    )
+    result = await node.run(State(inputs={}), {})
+
+    assert [c["conversation_id"] for c in result["conversations"]] == ["d0", "d1"]
@@ -173,24 +173,13 @@ async def test_dataset_node_loads_json_from_url(
         def __init__(self, *, timeout: float) -> None:
             assert timeout == 5.0
 
-        async def __aenter__(self) -> "DummyClient":
-            return self
-
-        async def __aexit__(
-            self,
-            exc_type: type[BaseException] | None,
-            exc: BaseException | None,
-            tb: object | None,
-        ) -> None:
-            return None
-
         async def get(self, url: str, *, follow_redirects: bool) -> DummyResponse:
             assert url == "https://example.com/data.json"
             assert follow_redirects is True
             return DummyResponse()
 
     monkeypatch.setattr(
-        "orcheo.nodes.evaluation.datasets.httpx.AsyncClient",
+        "orcheo.nodes.evaluation.dataset_cache.get_http_client",
         DummyClient,
     )
 
@@ -531,24 +520,13 @@ async def test_md2d_corpus_loader_node_loads_from_url(
         def __init__(self, *, timeout: float) -> None:
             assert timeout == 7.0
 
-        async def __aenter__(self) -> "DummyClient":
-            return self
-
-        async def __aexit__(
-            self,
-            exc_type: type[BaseException] | None,
-            exc: BaseException | None,
-            tb: object | None,
-        ) -> None:
-            return None
-
         async def get(self, url: str, *, follow_redirects: bool) -> DummyResponse:
             assert url == "https://example.com/doc2dial_doc.json"
             assert follow_redirects is True
             return DummyResponse()
 
     monkeypatch.setattr(
-        "orcheo.nodes.evaluation.datasets.httpx.AsyncClient",
+        "orcheo.nodes.evaluation.dataset_cache.get_http_client",
         DummyClient,
     )
 
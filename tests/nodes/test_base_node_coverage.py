@@ -132,6 +132,22 @@ def test_serialize_result_handles_computed_fields_and_collections() -> None:
     }
 
 
+def test_serialize_result_reuses_plain_json_containers() -> None:
+    class ExampleModel(BaseModel):
+        value: int
+
+    node = SerializationNode(name="serialize")
+    plain = {"rows": [{"id": 1, "tags": ["a"]}], "count": 1, "missing": None}
+    mixed = {"rows": plain["rows"], "model": ExampleModel(value=1)}
+
+    assert node._serialize_result(plain) is plain
+    serialized = node._serialize_result(mixed)
+    assert serialized == {"rows": plain["rows"], "model": {"value": 1}}
+    assert serialized is not mixed
+    assert serialized["rows"] is plain["rows"]
+    assert isinstance(mixed["model"], ExampleModel)
+
+
 @pytest.mark.asyncio
 async def test_noop_task_node_run_returns_empty_payload() -> None:
     node = NoOpTaskNode(name="noop")
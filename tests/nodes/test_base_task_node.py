@@ -267,3 +267,55 @@ async def test_task_node_call_re_resolves_templates_per_invocation() -> None:
     assert first == {"results": {"test_task": {"result": "first"}}}
     assert second == {"results": {"test_task": {"result": "second"}}}
     assert node.input_var == "{{payload.value}}"
+
+
+class ConfigTaskNode(TaskNode):
+    """Task node with a large nested configuration."""
+
+    pipeline: list[dict[str, Any]] = Field(default_factory=list)
+    prompt: str = ""
+
+    async def run(self, state: State, config: RunnableConfig) -> dict[str, Any]:
+        return {"pipeline": self.pipeline, "prompt": self.prompt}
+
+
+def test_resolution_plan_only_touches_template_paths(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from orcheo.nodes import base
+
+    static = [{"$match": {"field": f"value-{index}"}} for index in range(50)]
+    node = ConfigTaskNode(
+        name="config",
+        pipeline=[*static, {"$limit": "{{limit}}"}],
+        prompt="Hi {{user.name}}, you have {{user.count}} items {{missing.x}}",
+    )
+    state = State({"results": {"limit": 5, "user": {"name": "Ada", "count": 2}}})
+
+    first = node.resolved_for_run(state)
+
+    def fail_compile(value: Any) -> None:
+        raise AssertionError("plans should be reused")
+
+    monkeypatch.setattr(base, "_compile_plan", fail_compile)
+    second = node.resolved_for_run(state)
+
+    for resolved in (first, second):
+        assert resolved.pipeline[:50] == static
+        assert resolved.pipeline[0] is node.pipeline[0]
+        assert resolved.pipeline[50] == {"$limit": 5}
+        assert resolved.prompt == "Hi Ada, you have 2 items {{missing.x}}"
+    assert node.pipeline[50] == {"$limit": "{{limit}}"}
+    assert node == ConfigTaskNode(
+        name="config", pipeline=node.pipeline, prompt=node.prompt
+    )
+
+
+def test_resolution_plan_recompiles_reassigned_fields() -> None:
+    node = ConfigTaskNode(name="config", prompt="plain")
+    state = State({"results": {"value": "resolved"}})
+
+    assert node.resolved_for_run(state) is node
+
+    node.prompt = "{{value}}"
+    assert node.resolved_for_run(state).prompt == "resolved"
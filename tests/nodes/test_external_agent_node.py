@@ -10,6 +10,7 @@ from orcheo.external_agents.models import (
     AuthProbeResult,
     AuthStatus,
     ProcessExecutionResult,
+    ProviderLockUnavailableError,
     ResolvedRuntime,
     RuntimeInstallError,
     RuntimeManifest,
@@ -18,6 +19,7 @@ from orcheo.external_agents.models import (
     WorkingDirectoryValidationError,
 )
 from orcheo.graph.state import State
+from orcheo.nodes.agent_tools.context import tool_progress_context
 from orcheo.nodes.external_agent import ExternalAgentNode
 
 
@@ -59,6 +61,15 @@ class DummyProvider:
     ) -> list[str]:
         return [runtime.executable_path.name, prompt, system_prompt or ""]
 
+    def build_stdin_command(
+        self,
+        runtime: ResolvedRuntime,
+        *,
+        prompt: str,
+        system_prompt: str | None = None,
+    ) -> tuple[list[str], str] | None:
+        return [runtime.executable_path.name, "-"], prompt
+
     def build_environment(
         self,
         environ: dict[str, str] | None = None,
@@ -378,6 +389,20 @@ async def test_run_reports_runtime_verification_failure(tmp_path: Path) -> None:
     assert result["reason"] == "runtime_verification_failed"
 
 
+@pytest.mark.asyncio
+async def test_run_reports_runtime_lock_timeout(tmp_path: Path) -> None:
+    manager = FakeRuntimeManager(
+        provider=DummyProvider(),
+        resolve_error=ProviderLockUnavailableError("busy"),
+    )
+    node = _make_node(manager)
+    state = _make_state({"prompt": "run"})
+
+    result = await node.run(state, RunnableConfig())
+
+    assert result["reason"] == "runtime_lock_timeout"
+
+
 @pytest.mark.asyncio
 async def test_run_requires_auth_before_execution(tmp_path: Path) -> None:
     resolution = _make_runtime_resolution(tmp_path)
@@ -484,6 +509,89 @@ async def test_run_succeeds_with_zero_exit(
     assert result["stdout"] == "ok"
 
 
+@pytest.mark.asyncio
+async def test_run_streams_output_lines_as_batched_progress(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    resolution = _make_runtime_resolution(tmp_path)
+    manager = FakeRuntimeManager(provider=DummyProvider(), resolution=resolution)
+    node = _make_node(manager)
+    state = _make_state({"prompt": "run"})
+    updates: list[Any] = []
+    log_path = tmp_path / "provider" / "logs" / "run.stdout.log"
+
+    async def fake_execute(*args: object, **kwargs: Any) -> ProcessExecutionResult:
+        assert kwargs["max_output_bytes"] == node.max_output_bytes
+        assert kwargs["log_dir"] == tmp_path / "provider" / "logs"
+        for index in range(60):
+            await kwargs["on_output"]("stdout", f"line {index}")
+        await kwargs["on_output"]("stderr", "warn")
+        return ProcessExecutionResult(
+            command=["dummy"],
+            stdout="line 59\n",
+            stdout_truncated=True,
+            stdout_log_path=log_path,
+            exit_code=0,
+            duration_seconds=0,
+        )
+
+    async def collect(update: Any) -> None:
+        updates.append(update)
+
+    monkeypatch.setattr("orcheo.nodes.external_agent.execute_process", fake_execute)
+
+    with tool_progress_context(collect):
+        result = await node.run(state, RunnableConfig())
+
+    assert [len(update["test-node"].get("stdout", [])) for update in updates] == [
+        50,
+        10,
+    ]
+    assert updates[0]["test-node"]["status"] == "running"
+    assert updates[1]["test-node"]["stderr"] == ["warn"]
+    assert result["stdout_truncated"] is True
+    assert result["stdout_log_path"] == str(log_path)
+    assert result["stderr_log_path"] is None
+
+
+@pytest.mark.asyncio
+async def test_run_uses_warm_process_pool_when_enabled(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    resolution = _make_runtime_resolution(tmp_path)
+    manager = FakeRuntimeManager(provider=DummyProvider(), resolution=resolution)
+    node = _make_node(manager)
+    node.warm_pool_size = 2
+    state = _make_state({"prompt": "run"})
+    warm_process = object()
+    acquired: list[tuple[list[str], Path, int]] = []
+
+    class FakePool:
+        async def acquire(
+            self, command: list[str], *, cwd: Path, env: object, size: int
+        ) -> object:
+            acquired.append((command, cwd, size))
+            return warm_process
+
+    async def fake_execute(*args: object, **kwargs: Any) -> ProcessExecutionResult:
+        assert kwargs["input_text"] == "run"
+        assert kwargs["process"] is warm_process
+        return ProcessExecutionResult(
+            command=["dummy-agent", "-"], stdout="ok", exit_code=0, duration_seconds=0
+        )
+
+    monkeypatch.setattr(
+        "orcheo.nodes.external_agent.get_warm_process_pool", lambda: FakePool()
+    )
+    monkeypatch.setattr("orcheo.nodes.external_agent.execute_process", fake_execute)
+
+    result = await node.run(state, RunnableConfig())
+
+    assert result["status"] == "succeeded"
+    assert result["command"] == ["dummy-agent", "-"]
+    assert acquired == [(["dummy-agent", "-"], Path("workspace"), 2)]
+
+
 @pytest.mark.asyncio
 async def test_run_logs_bypass_flag_audit_event(
     monkeypatch: pytest.MonkeyPatch,
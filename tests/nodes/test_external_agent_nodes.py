@@ -279,12 +279,12 @@ def test_compute_run_updates_raises_on_non_optional_credential_error(
     state = State({"inputs": {}, "results": {}})
     error = CredentialReferenceNotFoundError("missing")
 
-    def failing_decode(value: Any, _: State) -> Any:
+    def failing_decode(key: str, value: Any, _: State) -> Any:
         if value is node.prompt:
             raise error
         return value
 
-    monkeypatch.setattr(node, "_decode_value", failing_decode)
+    monkeypatch.setattr(node, "_decode_field", failing_decode)
 
     with pytest.raises(CredentialReferenceNotFoundError):
         node._compute_run_updates(state)
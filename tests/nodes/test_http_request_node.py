@@ -1,15 +1,21 @@
 """Tests covering HttpRequestNode behavior."""
 
 from __future__ import annotations
+import json
+import os
+import tempfile
+from collections.abc import AsyncIterator
 from datetime import timedelta
+from pathlib import Path
 from typing import Any
+from urllib.parse import parse_qsl
 import httpx
 import pytest
 import respx
 from httpx import Response
 from langchain_core.runnables import RunnableConfig
 from orcheo.graph.state import State
-from orcheo.nodes.data import HttpRequestNode
+from orcheo.nodes.data import HttpRequestNode, http_request
 
 
 @pytest.mark.asyncio
@@ -87,19 +93,17 @@ async def test_http_request_node_sends_json_body(
 
     captured: dict[str, Any] = {}
 
-    async def fake_request(
-        self, method: str, url: str, **kwargs: Any
-    ) -> httpx.Response:
-        captured["method"] = method
-        captured["url"] = url
-        captured["json"] = kwargs.get("json")
+    async def fake_send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        captured["method"] = request.method
+        captured["url"] = str(request.url)
+        captured["json"] = json.loads(request.content)
         return httpx.Response(
             201,
             json={"ok": True},
             extensions={"elapsed": timedelta(seconds=1)},
         )
 
-    monkeypatch.setattr(httpx.AsyncClient, "request", fake_request)
+    monkeypatch.setattr(httpx.AsyncClient, "send", fake_send)
 
     node = HttpRequestNode(
         name="http",
@@ -128,18 +132,16 @@ async def test_http_request_node_sends_form_data(
 
     captured: dict[str, Any] = {}
 
-    async def fake_request(
-        self, method: str, url: str, **kwargs: Any
-    ) -> httpx.Response:
-        captured["method"] = method
-        captured["url"] = url
-        captured["data"] = kwargs.get("data")
+    async def fake_send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        captured["method"] = request.method
+        captured["url"] = str(request.url)
+        captured["data"] = dict(parse_qsl(request.content.decode()))
         return httpx.Response(
             200,
             json={"success": True},
         )
 
-    monkeypatch.setattr(httpx.AsyncClient, "request", fake_request)
+    monkeypatch.setattr(httpx.AsyncClient, "send", fake_send)
 
     node = HttpRequestNode(
         name="http",
@@ -172,12 +174,10 @@ async def test_http_request_node_handles_elapsed_from_response_object(
         def elapsed(self) -> timedelta:
             return self._elapsed
 
-    async def fake_request(
-        self, method: str, url: str, **kwargs: Any
-    ) -> httpx.Response:
+    async def fake_send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
         return MockResponse(200, json={"ok": True})
 
-    monkeypatch.setattr(httpx.AsyncClient, "request", fake_request)
+    monkeypatch.setattr(httpx.AsyncClient, "send", fake_send)
 
     node = HttpRequestNode(
         name="http",
@@ -189,3 +189,170 @@ async def test_http_request_node_handles_elapsed_from_response_object(
     payload = (await node(state, RunnableConfig()))["results"]["http"]
 
     assert payload["elapsed"] == 2.5
+
+
+@pytest.mark.asyncio
+async def test_http_request_node_truncates_and_keeps_single_representation() -> None:
+    """max_bytes caps the body and output keeps only the requested form."""
+
+    state = State({"results": {}})
+
+    with respx.mock(base_url="https://example.com") as router:
+        router.get("/big").respond(200, text="x" * 100)
+        router.get("/doc").respond(200, json={"a": 1})
+        text = await HttpRequestNode(
+            name="http", url="https://example.com/big", output="text", max_bytes=10
+        ).run(state, RunnableConfig())
+        raw = await HttpRequestNode(
+            name="http", url="https://example.com/big", output="bytes", max_bytes=3
+        ).run(state, RunnableConfig())
+        doc = await HttpRequestNode(
+            name="http", url="https://example.com/doc", output="json"
+        ).run(state, RunnableConfig())
+
+    assert text["content"] == "x" * 10
+    assert text["truncated"] is True
+    assert text["size"] == 10
+    assert "json" not in text
+    assert raw["content"] == "eHh4"
+    assert raw["content_encoding"] == "base64"
+    assert doc["json"] == {"a": 1}
+    assert doc["truncated"] is False
+    assert "content" not in doc
+
+
+@pytest.mark.asyncio
+async def test_http_request_node_writes_file_outputs(tmp_path: Path) -> None:
+    """File output and spill_threshold return a file reference."""
+
+    state = State({"results": {}})
+
+    with respx.mock(base_url="https://example.com") as router:
+        router.get("/download").respond(
+            200, content=b"0123456789", headers={"content-type": "text/csv"}
+        )
+        stored = await HttpRequestNode(
+            name="http",
+            url="https://example.com/download",
+            output="file",
+            output_dir=str(tmp_path),
+        ).run(state, RunnableConfig())
+        spilled = await HttpRequestNode(
+            name="http",
+            url="https://example.com/download",
+            spill_threshold=4,
+            output_dir=str(tmp_path),
+        ).run(state, RunnableConfig())
+
+    for payload in (stored, spilled):
+        reference = payload["file"]
+        assert "content" not in payload
+        assert reference["size"] == 10
+        assert reference["content_type"] == "text/csv"
+        assert Path(reference["path"]).read_bytes() == b"0123456789"
+        assert Path(reference["path"]).parent == tmp_path
+
+
+@pytest.mark.asyncio
+async def test_http_request_node_prunes_default_output_dir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Spilled bodies in the default directory are capped at the retention limit."""
+
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    monkeypatch.setattr(http_request, "MAX_RETAINED_BODIES", 2)
+    node = HttpRequestNode(
+        name="http", url="https://example.com/download", output="file"
+    )
+    paths: list[Path] = []
+
+    with respx.mock(base_url="https://example.com") as router:
+        router.get("/download").respond(200, content=b"body")
+        for index in range(4):
+            payload = await node.run(State({"results": {}}), RunnableConfig())
+            path = Path(payload["file"]["path"])
+            os.utime(path, (index, index))
+            paths.append(path)
+
+    assert paths[0].parent == tmp_path / "orcheo-http"
+    assert sorted((tmp_path / "orcheo-http").glob("*.body")) == sorted(paths[-2:])
+
+
+@pytest.mark.asyncio
+async def test_http_request_node_parses_ndjson_and_lines() -> None:
+    """Streaming line outputs parse each record and drop truncated tails."""
+
+    state = State({"results": {}})
+    body = b'{"n": 1}\n\n{"n": 2}\r\n{"n": 3}'
+
+    with respx.mock(base_url="https://example.com") as router:
+        router.get("/events").respond(200, content=body)
+        records = await HttpRequestNode(
+            name="http", url="https://example.com/events", output="ndjson"
+        ).run(state, RunnableConfig())
+        lines = await HttpRequestNode(
+            name="http",
+            url="https://example.com/events",
+            output="lines",
+            max_bytes=len(body) - 2,
+        ).run(state, RunnableConfig())
+
+        router.get("/broken").respond(200, content=b"not json\n")
+        with pytest.raises(ValueError, match="Invalid NDJSON line"):
+            await HttpRequestNode(
+                name="http", url="https://example.com/broken", output="ndjson"
+            ).run(state, RunnableConfig())
+
+    assert records["items"] == [{"n": 1}, {"n": 2}, {"n": 3}]
+    assert lines["items"] == ['{"n": 1}', '{"n": 2}']
+    assert lines["truncated"] is True
+
+
+class _ChunkedStream(httpx.AsyncByteStream):
+    def __init__(self, chunks: list[bytes], error: Exception | None = None) -> None:
+        self._chunks = chunks
+        self._error = error
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self._chunks:
+            yield chunk
+        if self._error is not None:
+            raise self._error
+
+
+@pytest.mark.asyncio
+async def test_http_request_node_joins_lines_split_across_chunks() -> None:
+    """Records spanning several chunks are reassembled before parsing."""
+
+    chunks = [b'{"n"', b": 1", b'}\n{"n": 2}\n{"n":', b" 3}"]
+
+    with respx.mock(base_url="https://example.com") as router:
+        router.get("/events").mock(
+            return_value=Response(200, stream=_ChunkedStream(chunks))
+        )
+        result = await HttpRequestNode(
+            name="http", url="https://example.com/events", output="ndjson"
+        ).run(State({"results": {}}), RunnableConfig())
+
+    assert result["items"] == [{"n": 1}, {"n": 2}, {"n": 3}]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("output", ["auto", "ndjson"])
+@pytest.mark.parametrize(
+    "error",
+    [httpx.ReadError("reset"), httpx.RemoteProtocolError("incomplete body")],
+)
+async def test_http_request_node_wraps_errors_while_reading_body(
+    output: str, error: Exception
+) -> None:
+    """Transport failures after the headers arrive surface as ValueError."""
+
+    with respx.mock(base_url="https://example.com") as router:
+        router.get("/flaky").mock(
+            return_value=Response(200, stream=_ChunkedStream([b"{}\n"], error))
+        )
+        with pytest.raises(ValueError, match="HTTP request failed"):
+            await HttpRequestNode(
+                name="http", url="https://example.com/flaky", output=output
+            ).run(State({"results": {}}), RunnableConfig())
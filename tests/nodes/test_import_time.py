@@ -0,0 +1,61 @@
+"""Cold-start guards for the lazily populated node registry."""
+
+from __future__ import annotations
+import subprocess
+import sys
+import pytest
+from orcheo.nodes.manifest import BUILTIN_NODES
+
+
+HEAVY_DEPENDENCIES = {"deepagents", "langchain_mcp_adapters", "motor", "pymongo"}
+"""Third-party packages only specific node modules need."""
+
+
+def _imported_modules(module: str) -> set[str]:
+    """Return the modules imported by ``import module`` in a fresh interpreter."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return {
+        line.rsplit("|", 1)[-1].strip()
+        for line in completed.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+
+@pytest.mark.parametrize(
+    ("entrypoint", "allowed_node_modules"),
+    [
+        ("orcheo.nodes", set()),
+        ("orcheo_sdk.cli.main", {"orcheo.nodes.base", "orcheo.nodes.telegram"}),
+        (
+            "orcheo_backend.app",
+            {
+                "orcheo.nodes.agentensor",
+                "orcheo.nodes.base",
+                "orcheo.nodes.browser",
+                "orcheo.nodes.telegram",
+            },
+        ),
+        (
+            "orcheo_backend.worker.tasks",
+            {
+                "orcheo.nodes.agentensor",
+                "orcheo.nodes.base",
+                "orcheo.nodes.browser",
+                "orcheo.nodes.telegram",
+            },
+        ),
+    ],
+)
+def test_entrypoints_do_not_import_unused_node_modules(
+    entrypoint: str, allowed_node_modules: set[str]
+) -> None:
+    imported = _imported_modules(entrypoint)
+
+    assert entrypoint in imported
+    assert imported & set(BUILTIN_NODES) <= allowed_node_modules
+    assert not imported & HEAVY_DEPENDENCIES
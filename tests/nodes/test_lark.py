@@ -27,11 +27,9 @@ async def test_lark_tenant_access_token_node_returns_normalized_payload() -> Non
     token_response.raise_for_status = MagicMock()
 
     mock_client = AsyncMock()
-    mock_client.__aenter__.return_value = mock_client
-    mock_client.__aexit__.return_value = None
     mock_client.post = AsyncMock(return_value=token_response)
 
-    with patch("orcheo.nodes.lark.httpx.AsyncClient", return_value=mock_client):
+    with patch("orcheo.nodes.lark.get_http_client", return_value=mock_client):
         result = await node.run(
             State(messages=[], inputs={}, results={}), RunnableConfig()
         )
@@ -79,11 +77,9 @@ async def test_lark_send_message_replies_in_thread() -> None:
     mock_response.raise_for_status = MagicMock()
 
     mock_client = AsyncMock()
-    mock_client.__aenter__.return_value = mock_client
-    mock_client.__aexit__.return_value = None
     mock_client.post = AsyncMock(return_value=mock_response)
 
-    with patch("orcheo.nodes.lark.httpx.AsyncClient", return_value=mock_client):
+    with patch("orcheo.nodes.lark.get_http_client", return_value=mock_client):
         result = await node.run(state, RunnableConfig())
 
     assert result["is_error"] is False
@@ -123,11 +119,9 @@ async def test_lark_send_message_fetches_token_for_new_message() -> None:
     send_response.raise_for_status = MagicMock()
 
     mock_client = AsyncMock()
-    mock_client.__aenter__.return_value = mock_client
-    mock_client.__aexit__.return_value = None
     mock_client.post = AsyncMock(side_effect=[token_response, send_response])
 
-    with patch("orcheo.nodes.lark.httpx.AsyncClient", return_value=mock_client):
+    with patch("orcheo.nodes.lark.get_http_client", return_value=mock_client):
         result = await node.run(state, RunnableConfig())
 
     assert result["is_error"] is False
@@ -186,11 +180,9 @@ async def test_lark_fetch_tenant_token_api_error_code() -> None:
     token_response.raise_for_status = MagicMock()
 
     mock_client = AsyncMock()
-    mock_client.__aenter__.return_value = mock_client
-    mock_client.__aexit__.return_value = None
     mock_client.post = AsyncMock(return_value=token_response)
 
-    with patch("orcheo.nodes.lark.httpx.AsyncClient", return_value=mock_client):
+    with patch("orcheo.nodes.lark.get_http_client", return_value=mock_client):
         with pytest.raises(ValueError, match="invalid app_id"):
             await node._fetch_tenant_access_token()
 
@@ -214,11 +206,9 @@ async def test_lark_fetch_tenant_token_missing_token_field() -> None:
     token_response.raise_for_status = MagicMock()
 
     mock_client = AsyncMock()
-    mock_client.__aenter__.return_value = mock_client
-    mock_client.__aexit__.return_value = None
     mock_client.post = AsyncMock(return_value=token_response)
 
-    with patch("orcheo.nodes.lark.httpx.AsyncClient", return_value=mock_client):
+    with patch("orcheo.nodes.lark.get_http_client", return_value=mock_client):
         with pytest.raises(ValueError, match="missing tenant_access_token"):
             await node._fetch_tenant_access_token()
 
@@ -245,11 +235,9 @@ async def test_lark_resolve_access_token_results_not_dict() -> None:
     token_response.raise_for_status = MagicMock()
 
     mock_client = AsyncMock()
-    mock_client.__aenter__.return_value = mock_client
-    mock_client.__aexit__.return_value = None
     mock_client.post = AsyncMock(return_value=token_response)
 
-    with patch("orcheo.nodes.lark.httpx.AsyncClient", return_value=mock_client):
+    with patch("orcheo.nodes.lark.get_http_client", return_value=mock_client):
         token = await node._resolve_access_token(state)
     assert token == "fetched_token"
 
@@ -301,11 +289,9 @@ async def test_lark_resolve_access_token_token_result_not_dict() -> None:
     token_response.raise_for_status = MagicMock()
 
     mock_client = AsyncMock()
-    mock_client.__aenter__.return_value = mock_client
-    mock_client.__aexit__.return_value = None
     mock_client.post = AsyncMock(return_value=token_response)
 
-    with patch("orcheo.nodes.lark.httpx.AsyncClient", return_value=mock_client):
+    with patch("orcheo.nodes.lark.get_http_client", return_value=mock_client):
         token = await node._resolve_access_token(state)
     assert token == "fetched_token"
 
@@ -336,11 +322,9 @@ async def test_lark_resolve_access_token_json_payload_not_dict() -> None:
     token_response.raise_for_status = MagicMock()
 
     mock_client = AsyncMock()
-    mock_client.__aenter__.return_value = mock_client
-    mock_client.__aexit__.return_value = None
     mock_client.post = AsyncMock(return_value=token_response)
 
-    with patch("orcheo.nodes.lark.httpx.AsyncClient", return_value=mock_client):
+    with patch("orcheo.nodes.lark.get_http_client", return_value=mock_client):
         token = await node._resolve_access_token(state)
     assert token == "fetched_token"
 
@@ -371,11 +355,9 @@ async def test_lark_resolve_access_token_empty_token_string() -> None:
     token_response.raise_for_status = MagicMock()
 
     mock_client = AsyncMock()
-    mock_client.__aenter__.return_value = mock_client
-    mock_client.__aexit__.return_value = None
     mock_client.post = AsyncMock(return_value=token_response)
 
-    with patch("orcheo.nodes.lark.httpx.AsyncClient", return_value=mock_client):
+    with patch("orcheo.nodes.lark.get_http_client", return_value=mock_client):
         token = await node._resolve_access_token(state)
     assert token == "fetched_token"
 
@@ -406,11 +388,9 @@ async def test_lark_send_message_delivery_error_code() -> None:
     send_response.raise_for_status = MagicMock()
 
     mock_client = AsyncMock()
-    mock_client.__aenter__.return_value = mock_client
-    mock_client.__aexit__.return_value = None
     mock_client.post = AsyncMock(return_value=send_response)
 
-    with patch("orcheo.nodes.lark.httpx.AsyncClient", return_value=mock_client):
+    with patch("orcheo.nodes.lark.get_http_client", return_value=mock_client):
         result = await node.run(state, RunnableConfig())
 
     assert result["is_error"] is True
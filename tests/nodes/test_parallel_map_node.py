@@ -0,0 +1,141 @@
+import asyncio
+from typing import Any
+import pytest
+from langchain_core.runnables import RunnableConfig
+from orcheo.graph.state import State
+from orcheo.nodes.base import TaskNode
+from orcheo.nodes.logic import ParallelMapNode
+from orcheo.nodes.registry import NodeMetadata, registry
+
+
+_concurrency = {"in_flight": 0, "peak": 0}
+
+
+@registry.register(
+    NodeMetadata(
+        name="ParallelMapProbeNode",
+        description="Test node tracking concurrent executions",
+        category="test",
+    )
+)
+class ParallelMapProbeNode(TaskNode):
+    value: Any = None
+    delay: float = 0.0
+
+    async def run(self, state: State, config: RunnableConfig) -> dict[str, Any]:
+        _concurrency["in_flight"] += 1
+        _concurrency["peak"] = max(_concurrency["peak"], _concurrency["in_flight"])
+        try:
+            await asyncio.sleep(self.delay)
+            if self.value == "boom":
+                raise RuntimeError("item failed")
+            return {"value": self.value}
+        finally:
+            _concurrency["in_flight"] -= 1
+
+
+def _node(**kwargs: Any) -> ParallelMapNode:
+    return ParallelMapNode(
+        name="map",
+        steps=[
+            {
+                "type": "ParallelMapProbeNode",
+                "name": "probe",
+                "value": "{{map.item}}",
+                "delay": 0.01,
+            },
+            {
+                "type": "SetVariableNode",
+                "name": "shape",
+                "variables": {"doubled": "{{probe.value}}{{probe.value}}"},
+            },
+        ],
+        **kwargs,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_probe() -> None:
+    _concurrency["peak"] = 0
+
+
+@pytest.mark.asyncio
+async def test_parallel_map_bounds_concurrency_and_keeps_order() -> None:
+    node = _node(items="{{source.items}}", max_concurrency=3)
+    state = State({"results": {"source": {"items": list("abcdefgh")}}})
+
+    payload = (await node(state, RunnableConfig()))["results"]["map"]
+
+    assert payload["done"] is True
+    assert payload["total"] == 8
+    assert [output["doubled"] for output in payload["outputs"]] == [
+        c * 2 for c in "abcdefgh"
+    ]
+    assert payload["errors"] == []
+    assert _concurrency["peak"] == 3
+
+
+@pytest.mark.asyncio
+async def test_parallel_map_error_policies() -> None:
+    items = ["a", "boom", "c"]
+    state = State({"results": {}})
+
+    with pytest.raises(RuntimeError, match="item failed"):
+        await _node(items=items).run(state, RunnableConfig())
+
+    kept = await _node(items=items, error_policy="continue").run(
+        state, RunnableConfig()
+    )
+    assert kept["outputs"] == [{"doubled": "aa"}, None, {"doubled": "cc"}]
+    assert kept["errors"] == [{"index": 1, "error": "item failed"}]
+
+    skipped = await _node(items=items, error_policy="skip", result_step="probe").run(
+        state, RunnableConfig()
+    )
+    assert skipped["outputs"] == [{"value": "a"}, {"value": "c"}]
+
+
+@pytest.mark.asyncio
+async def test_parallel_map_processes_chunks_across_invocations() -> None:
+    node = _node(items=list("abcde"), chunk_size=2, result_step="probe")
+    state = State({"results": {}})
+    invocations = 0
+
+    while True:
+        invocations += 1
+        output = await node(state, RunnableConfig())
+        state["results"]["map"] = output["results"]["map"]
+        if state["results"]["map"]["done"]:
+            break
+
+    assert invocations == 3
+    assert [entry["value"] for entry in state["results"]["map"]["outputs"]] == list(
+        "abcde"
+    )
+
+    restarted = await node(state, RunnableConfig())
+    assert restarted["results"]["map"]["index"] == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("items", ["not a list", "{{missing.items}}"])
+async def test_parallel_map_rejects_non_list_items(items: str) -> None:
+    node = ParallelMapNode(name="map", items=items)
+
+    with pytest.raises(ValueError, match="expects items to resolve to a list"):
+        await node(State({"results": {}}), RunnableConfig())
+
+
+@pytest.mark.asyncio
+async def test_parallel_map_handles_empty_items() -> None:
+    payload = await ParallelMapNode(name="map", items=[]).run(
+        State({"results": {}}), RunnableConfig()
+    )
+
+    assert payload == {
+        "done": True,
+        "index": 0,
+        "total": 0,
+        "outputs": [],
+        "errors": [],
+    }
@@ -1,6 +1,11 @@
 """Tests for the node registry module."""
 
+import sys
+from pathlib import Path
+import pytest
+from orcheo.nodes.manifest import BUILTIN_NODES
 from orcheo.nodes.registry import NodeMetadata, NodeRegistry
+from orcheo.nodes.registry import registry as global_registry
 
 
 def test_get_metadata_by_callable_exact_match() -> None:
@@ -84,3 +89,41 @@ def test_list_metadata_returns_sorted_entries() -> None:
 
     names = [item.name for item in registry.list_metadata()]
     assert names == ["alpha", "Beta"]
+
+
+def test_declared_node_is_imported_on_first_lookup(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Declared nodes expose metadata at once and import their module lazily."""
+
+    (tmp_path / "lazy_registry_fixture.py").write_text(
+        "from orcheo.nodes.registry import NodeMetadata, registry\n"
+        "@registry.register(NodeMetadata(name='LazyFixtureNode', description='d'))\n"
+        "class LazyFixtureNode:\n"
+        "    pass\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    metadata = NodeMetadata(name="LazyFixtureNode", description="d")
+    global_registry.declare("lazy_registry_fixture", metadata)
+    try:
+        assert global_registry.get_metadata("LazyFixtureNode") == metadata
+        assert "lazy_registry_fixture" not in sys.modules
+
+        node = global_registry.get_node("LazyFixtureNode")
+
+        assert node is sys.modules["lazy_registry_fixture"].LazyFixtureNode
+        assert global_registry.get_node("LazyFixtureNode") is node
+    finally:
+        global_registry.unregister("LazyFixtureNode")
+        sys.modules.pop("lazy_registry_fixture", None)
+
+
+def test_builtin_manifest_matches_registered_nodes() -> None:
+    """Every manifest entry is registered by its module with equal metadata."""
+
+    for module, entries in BUILTIN_NODES.items():
+        for metadata in entries:
+            node = global_registry.get_node(metadata.name)
+            assert node is not None, metadata.name
+            assert node.__module__ == module
+            assert global_registry.get_metadata(metadata.name) == metadata
@@ -37,10 +37,7 @@ async def test_rss_node_run():
     mock_client = AsyncMock()
     mock_client.get.side_effect = [mock_resp1, mock_resp2]
 
-    with patch("orcheo.nodes.rss.httpx.AsyncClient") as mock_cls:
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
-
+    with patch("orcheo.nodes.rss.get_http_client", return_value=mock_client):
         result = await node.run(state, config)
 
     assert result["fetched_count"] == 3
@@ -50,8 +47,18 @@ async def test_rss_node_run():
     assert result["documents"][1]["title"] == "Test Entry 2"
     assert result["documents"][2]["title"] == "Test Entry 3"
     assert mock_client.get.call_count == 2
-    mock_client.get.assert_any_call("https://example.com/feed1.xml", timeout=15.0)
-    mock_client.get.assert_any_call("https://example.com/feed2.xml", timeout=15.0)
+    mock_client.get.assert_any_call(
+        "https://example.com/feed1.xml",
+        timeout=15.0,
+        headers=RSS_REQUEST_HEADERS,
+        follow_redirects=True,
+    )
+    mock_client.get.assert_any_call(
+        "https://example.com/feed2.xml",
+        timeout=15.0,
+        headers=RSS_REQUEST_HEADERS,
+        follow_redirects=True,
+    )
 
 
 @pytest.mark.asyncio
@@ -65,16 +72,16 @@ async def test_rss_node_normalizes_single_source_string() -> None:
     mock_client = AsyncMock()
     mock_client.get.return_value = mock_resp
 
-    with patch("orcheo.nodes.rss.httpx.AsyncClient") as mock_cls:
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
-
+    with patch("orcheo.nodes.rss.get_http_client", return_value=mock_client):
         result = await node.run({}, RunnableConfig())
 
     assert node.sources == ["https://example.com/feed.xml"]
     assert result["failed_sources"] == 0
     mock_client.get.assert_called_once_with(
-        "https://example.com/feed.xml", timeout=15.0
+        "https://example.com/feed.xml",
+        timeout=15.0,
+        headers=RSS_REQUEST_HEADERS,
+        follow_redirects=True,
     )
 
 
@@ -109,10 +116,7 @@ async def test_rss_node_parses_atom_links_with_href():
     mock_client = AsyncMock()
     mock_client.get.return_value = mock_resp
 
-    with patch("orcheo.nodes.rss.httpx.AsyncClient") as mock_cls:
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
-
+    with patch("orcheo.nodes.rss.get_http_client", return_value=mock_client):
         result = await node.run(state, config)
 
     assert result["fetched_count"] == 1
@@ -137,17 +141,17 @@ async def test_rss_node_run_empty_feeds():
     mock_client = AsyncMock()
     mock_client.get.return_value = mock_resp
 
-    with patch("orcheo.nodes.rss.httpx.AsyncClient") as mock_cls:
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
-
+    with patch("orcheo.nodes.rss.get_http_client", return_value=mock_client):
         result = await node.run(state, config)
 
     assert result["documents"] == []
     assert result["fetched_count"] == 0
     assert len(result["errors"]) == 1
     mock_client.get.assert_called_once_with(
-        "https://example.com/empty.xml", timeout=15.0
+        "https://example.com/empty.xml",
+        timeout=15.0,
+        headers=RSS_REQUEST_HEADERS,
+        follow_redirects=True,
     )
 
 
@@ -165,10 +169,7 @@ async def test_rss_node_run_malformed_xml_returns_structured_error():
     mock_client = AsyncMock()
     mock_client.get.return_value = mock_resp
 
-    with patch("orcheo.nodes.rss.httpx.AsyncClient") as mock_cls:
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
-
+    with patch("orcheo.nodes.rss.get_http_client", return_value=mock_client):
         result = await node.run(state, config)
 
     assert result["documents"] == []
@@ -191,10 +192,7 @@ async def test_rss_node_run_no_sources():
 
     mock_client = AsyncMock()
 
-    with patch("orcheo.nodes.rss.httpx.AsyncClient") as mock_cls:
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
-
+    with patch("orcheo.nodes.rss.get_http_client", return_value=mock_client):
         result = await node.run(state, config)
 
     assert result["documents"] == []
@@ -220,10 +218,7 @@ async def test_rss_node_run_non_2xx_response_is_reported_as_error():
     mock_client = AsyncMock()
     mock_client.get.return_value = mock_resp
 
-    with patch("orcheo.nodes.rss.httpx.AsyncClient") as mock_cls:
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
-
+    with patch("orcheo.nodes.rss.get_http_client", return_value=mock_client):
         result = await node.run(state, config)
 
     assert result["documents"] == []
@@ -232,13 +227,16 @@ async def test_rss_node_run_non_2xx_response_is_reported_as_error():
     assert result["failed_sources"] == 1
     assert result["errors"][0]["source"] == "https://example.com/protected.xml"
     mock_client.get.assert_called_once_with(
-        "https://example.com/protected.xml", timeout=15.0
+        "https://example.com/protected.xml",
+        timeout=15.0,
+        headers=RSS_REQUEST_HEADERS,
+        follow_redirects=True,
     )
 
 
 @pytest.mark.asyncio
 async def test_rss_node_configures_http_client_for_redirects_and_feed_headers():
-    """RSS client should follow redirects and advertise feed-friendly headers."""
+    """RSS requests should follow redirects and advertise feed-friendly headers."""
     sources = ["https://example.com/feed.xml"]
     node = RSSNode(name="test_rss", sources=sources)
     state = {}
@@ -250,15 +248,14 @@ async def test_rss_node_configures_http_client_for_redirects_and_feed_headers():
     mock_client = AsyncMock()
     mock_client.get.return_value = mock_resp
 
-    with patch("orcheo.nodes.rss.httpx.AsyncClient") as mock_cls:
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
-
+    with patch("orcheo.nodes.rss.get_http_client", return_value=mock_client):
         await node.run(state, config)
 
-    mock_cls.assert_called_once_with(
-        follow_redirects=True,
+    mock_client.get.assert_called_once_with(
+        "https://example.com/feed.xml",
+        timeout=15.0,
         headers=RSS_REQUEST_HEADERS,
+        follow_redirects=True,
     )
 
 
@@ -22,19 +22,16 @@ class FakeResponse:
         return self._payload
 
 
-def _async_client_context(
+def _fake_client(
     *,
     get: AsyncMock | None = None,
     post: AsyncMock | None = None,
 ) -> AsyncMock:
-    """Return an async context manager wrapping a fake httpx client."""
+    """Return a fake shared httpx client."""
     client = AsyncMock()
     client.get = get or AsyncMock()
     client.post = post or AsyncMock()
-    context_manager = AsyncMock()
-    context_manager.__aenter__.return_value = client
-    context_manager.__aexit__.return_value = None
-    return context_manager
+    return client
 
 
 @pytest.fixture
@@ -65,8 +62,8 @@ async def test_slack_node_posts_message_with_full_payload(
     post_mock = AsyncMock(return_value=FakeResponse({"ok": True, "ts": "123.456"}))
 
     with patch(
-        "orcheo.nodes.slack.httpx.AsyncClient",
-        return_value=_async_client_context(post=post_mock),
+        "orcheo.nodes.slack.get_http_client",
+        return_value=_fake_client(post=post_mock),
     ):
         result = await slack_node.run({}, None)
 
@@ -117,8 +114,8 @@ async def test_slack_node_lists_public_channels(slack_node: SlackNode) -> None:
     )
 
     with patch(
-        "orcheo.nodes.slack.httpx.AsyncClient",
-        return_value=_async_client_context(get=get_mock),
+        "orcheo.nodes.slack.get_http_client",
+        return_value=_fake_client(get=get_mock),
     ):
         result = await slack_node.run({}, None)
 
@@ -152,8 +149,8 @@ async def test_slack_node_lists_predefined_channels(slack_node: SlackNode) -> No
     )
 
     with patch(
-        "orcheo.nodes.slack.httpx.AsyncClient",
-        return_value=_async_client_context(get=get_mock),
+        "orcheo.nodes.slack.get_http_client",
+        return_value=_fake_client(get=get_mock),
     ):
         result = await slack_node.run({}, None)
 
@@ -177,8 +174,8 @@ async def test_slack_node_adds_reaction(slack_node: SlackNode) -> None:
     post_mock = AsyncMock(return_value=FakeResponse({"ok": True}))
 
     with patch(
-        "orcheo.nodes.slack.httpx.AsyncClient",
-        return_value=_async_client_context(post=post_mock),
+        "orcheo.nodes.slack.get_http_client",
+        return_value=_fake_client(post=post_mock),
     ):
         result = await slack_node.run({}, None)
 
@@ -205,8 +202,8 @@ async def test_slack_node_gets_channel_history(slack_node: SlackNode) -> None:
     get_mock = AsyncMock(return_value=FakeResponse({"ok": True, "messages": []}))
 
     with patch(
-        "orcheo.nodes.slack.httpx.AsyncClient",
-        return_value=_async_client_context(get=get_mock),
+        "orcheo.nodes.slack.get_http_client",
+        return_value=_fake_client(get=get_mock),
     ):
         result = await slack_node.run({}, None)
 
@@ -229,8 +226,8 @@ async def test_slack_node_gets_thread_replies(slack_node: SlackNode) -> None:
     get_mock = AsyncMock(return_value=FakeResponse({"ok": True, "messages": []}))
 
     with patch(
-        "orcheo.nodes.slack.httpx.AsyncClient",
-        return_value=_async_client_context(get=get_mock),
+        "orcheo.nodes.slack.get_http_client",
+        return_value=_fake_client(get=get_mock),
     ):
         result = await slack_node.run({}, None)
 
@@ -256,8 +253,8 @@ async def test_slack_node_gets_users_and_profile(slack_node: SlackNode) -> None:
     )
 
     with patch(
-        "orcheo.nodes.slack.httpx.AsyncClient",
-        return_value=_async_client_context(get=get_mock),
+        "orcheo.nodes.slack.get_http_client",
+        return_value=_fake_client(get=get_mock),
     ):
         slack_node.tool_name = "slack_get_users"
         slack_node.kwargs = {"limit": 15}
@@ -285,8 +282,8 @@ async def test_slack_node_returns_http_errors(slack_node: SlackNode) -> None:
     post_mock = AsyncMock(side_effect=httpx.HTTPError("boom"))
 
     with patch(
-        "orcheo.nodes.slack.httpx.AsyncClient",
-        return_value=_async_client_context(post=post_mock),
+        "orcheo.nodes.slack.get_http_client",
+        return_value=_fake_client(post=post_mock),
     ):
         result = await slack_node.run({}, None)
 
@@ -359,8 +356,8 @@ async def test_slack_node_replies_to_thread_with_valid_payload(
     post_mock = AsyncMock(return_value=FakeResponse({"ok": True, "ts": "789.000"}))
 
     with patch(
-        "orcheo.nodes.slack.httpx.AsyncClient",
-        return_value=_async_client_context(post=post_mock),
+        "orcheo.nodes.slack.get_http_client",
+        return_value=_fake_client(post=post_mock),
     ):
         result = await slack_node.run({}, None)
 
@@ -395,8 +392,8 @@ async def test_slack_node_lists_predefined_channels_skips_blank_entries(
     )
 
     with patch(
-        "orcheo.nodes.slack.httpx.AsyncClient",
-        return_value=_async_client_context(get=get_mock),
+        "orcheo.nodes.slack.get_http_client",
+        return_value=_fake_client(get=get_mock),
     ):
         result = await slack_node.run({}, None)
 
@@ -420,8 +417,8 @@ async def test_slack_node_lists_predefined_channels_returns_api_errors(
     )
 
     with patch(
-        "orcheo.nodes.slack.httpx.AsyncClient",
-        return_value=_async_client_context(get=get_mock),
+        "orcheo.nodes.slack.get_http_client",
+        return_value=_fake_client(get=get_mock),
     ):
         result = await slack_node.run({}, None)
 
@@ -443,8 +440,8 @@ async def test_slack_node_lists_public_channels_omits_invalid_cursor(
     get_mock = AsyncMock(return_value=FakeResponse({"ok": True, "channels": []}))
 
     with patch(
-        "orcheo.nodes.slack.httpx.AsyncClient",
-        return_value=_async_client_context(get=get_mock),
+        "orcheo.nodes.slack.get_http_client",
+        return_value=_fake_client(get=get_mock),
     ):
         result = await slack_node.run({}, None)
 
@@ -893,9 +893,8 @@ class TestWeComAccessTokenNode:
 
         mock_client = AsyncMock()
         mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.aclose = AsyncMock()
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run({}, RunnableConfig())
 
         assert result["access_token"] == "test_access_token"
@@ -924,9 +923,8 @@ class TestWeComAccessTokenNode:
 
         mock_client = AsyncMock()
         mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.aclose = AsyncMock()
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             with pytest.raises(
                 ValueError, match="WeCom token error: invalid credential"
             ):
@@ -961,10 +959,8 @@ class TestWeComSendMessageNode:
 
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.aclose = AsyncMock()
-        mock_client.aclose = AsyncMock()
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is False
@@ -998,10 +994,8 @@ class TestWeComSendMessageNode:
 
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.aclose = AsyncMock()
-        mock_client.aclose = AsyncMock()
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is False
@@ -1031,9 +1025,8 @@ class TestWeComSendMessageNode:
 
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.aclose = AsyncMock()
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is False
@@ -1102,9 +1095,8 @@ class TestWeComSendMessageNode:
 
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.aclose = AsyncMock()
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is False
@@ -1136,9 +1128,8 @@ class TestWeComSendMessageNode:
 
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.aclose = AsyncMock()
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is True
@@ -1168,7 +1159,7 @@ class TestWeComGroupPushNode:
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=mock_response)
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is False
@@ -1197,7 +1188,7 @@ class TestWeComGroupPushNode:
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=mock_response)
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is True
@@ -1393,9 +1384,8 @@ class TestWeComCustomerServiceSyncNode:
 
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(side_effect=[sync_response, customer_response])
-        mock_client.aclose = AsyncMock()
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is False
@@ -1481,9 +1471,8 @@ class TestWeComCustomerServiceSyncNode:
 
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=sync_response)
-        mock_client.aclose = AsyncMock()
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is False
@@ -1543,9 +1532,8 @@ class TestWeComCustomerServiceSyncNode:
 
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(side_effect=[sync_response, customer_response])
-        mock_client.aclose = AsyncMock()
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is False
@@ -1618,9 +1606,8 @@ class TestWeComCustomerServiceSyncNode:
 
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(side_effect=[sync_response, customer_response])
-        mock_client.aclose = AsyncMock()
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is False
@@ -1658,9 +1645,8 @@ class TestWeComCustomerServiceSyncNode:
 
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=sync_response)
-        mock_client.aclose = AsyncMock()
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is True
@@ -1706,9 +1692,8 @@ class TestWeComCustomerServiceSendNode:
 
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=send_response)
-        mock_client.aclose = AsyncMock()
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is False
@@ -1816,9 +1801,8 @@ class TestWeComCustomerServiceSendNode:
 
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=send_response)
-        mock_client.aclose = AsyncMock()
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is True
@@ -1858,9 +1842,8 @@ class TestWeComCustomerServiceSendNode:
 
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=send_response)
-        mock_client.aclose = AsyncMock()
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             with pytest.raises(ValueError, match="WeCom customer service send failed"):
                 await node.run(state, RunnableConfig())
 
@@ -1900,9 +1883,8 @@ class TestWeComCustomerServiceSendNode:
 
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=send_response)
-        mock_client.aclose = AsyncMock()
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is False
@@ -1934,9 +1916,8 @@ class TestWeComCustomerServiceSendNode:
 
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=send_response)
-        mock_client.aclose = AsyncMock()
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             with patch("orcheo.nodes.wecom.hashlib.sha1") as mock_sha1:
                 mock_sha1.return_value.hexdigest.return_value = "fallback-hash"
                 result = await node.run(state, RunnableConfig())
@@ -1973,9 +1954,8 @@ class TestWeComCustomerServiceSendNode:
 
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=send_response)
-        mock_client.aclose = AsyncMock()
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             with patch(
                 "orcheo.nodes.wecom._store_cs_message",
                 new=AsyncMock(side_effect=redis.RedisError("write failure")),
@@ -2009,12 +1989,11 @@ class TestWeComCustomerServiceSendNode:
 
         mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=send_response)
-        mock_client.aclose = AsyncMock()
 
         fake_redis = AsyncMock()
         fake_redis.aclose = AsyncMock()
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             with patch("redis.asyncio.from_url", return_value=fake_redis):
                 result = await node.run(state, RunnableConfig())
 
@@ -362,10 +362,8 @@ class TestWeComAIBotResponseNode:
 
         mock_client = MagicMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is False
@@ -403,10 +401,8 @@ class TestWeComAIBotResponseNode:
 
         mock_client = MagicMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is False
@@ -442,10 +438,8 @@ class TestWeComAIBotResponseNode:
 
         mock_client = MagicMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is False
@@ -534,10 +528,8 @@ class TestWeComAIBotResponseNode:
 
         mock_client = MagicMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is False
@@ -566,10 +558,8 @@ class TestWeComAIBotResponseNode:
 
         mock_client = MagicMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is False
@@ -614,10 +604,8 @@ class TestWeComAIBotResponseNode:
 
         mock_client = MagicMock()
         mock_client.post = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is True
@@ -650,10 +638,8 @@ class TestWeComAIBotResponseNode:
                 response=mock_response,
             )
         )
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is True
@@ -680,10 +666,8 @@ class TestWeComAIBotResponseNode:
         mock_client.post = AsyncMock(
             side_effect=httpx.RequestError("Connection failed")
         )
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is True
@@ -710,10 +694,8 @@ class TestWeComAIBotResponseNode:
 
         mock_client = MagicMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is True
@@ -744,10 +726,8 @@ class TestWeComAIBotResponseNode:
 
         mock_client = MagicMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
-        with patch("orcheo.nodes.wecom.httpx.AsyncClient", return_value=mock_client):
+        with patch("orcheo.nodes.wecom.get_http_client", return_value=mock_client):
             result = await node.run(state, RunnableConfig())
 
         assert result["is_error"] is True
@@ -109,17 +109,15 @@ async def test_message_delivery_integration() -> None:
     token_response.raise_for_status = MagicMock()
     token_client = AsyncMock()
     token_client.get = AsyncMock(return_value=token_response)
-    token_client.aclose = AsyncMock()
 
     send_response = MagicMock()
     send_response.json.return_value = {"errcode": 0, "errmsg": "ok"}
     send_response.raise_for_status = MagicMock()
     send_client = AsyncMock()
     send_client.post = AsyncMock(return_value=send_response)
-    send_client.aclose = AsyncMock()
 
     with patch(
-        "orcheo.nodes.wecom.httpx.AsyncClient",
+        "orcheo.nodes.wecom.get_http_client",
         side_effect=[token_client, send_client],
     ):
         token_result = await access_token_node.run(
@@ -0,0 +1,225 @@
+"""Tests for the shared pooled HTTP clients."""
+
+from __future__ import annotations
+import asyncio
+import socket
+from typing import Any
+import httpcore
+import httpx
+import pytest
+import respx
+from orcheo.runtime import http_clients
+from orcheo.runtime.http_clients import (
+    HttpClientManager,
+    _CachingNetworkBackend,
+    _DnsCache,
+)
+from orcheo.tracing.metrics import HTTP_CLIENT_REQUEST_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_manager_reuses_clients_per_profile() -> None:
+    manager = HttpClientManager(http2=False)
+
+    client = manager.get_client(timeout=5.0)
+
+    assert manager.get_client(timeout=5.0) is client
+    assert manager.get_client(timeout=10.0) is not client
+    assert manager.get_client(timeout=5.0, verify=False) is not client
+
+    await manager.aclose()
+    assert client.is_closed
+    assert manager.get_client(timeout=5.0) is not client
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_manager_bounds_requests_per_host_and_records_latency() -> None:
+    manager = HttpClientManager(max_connections_per_host=2, http2=False)
+    in_flight = {"current": 0, "peak": 0}
+    before = HTTP_CLIENT_REQUEST_SECONDS.count(host="limited.test", outcome="2xx")
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        in_flight["current"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+        await asyncio.sleep(0.01)
+        in_flight["current"] -= 1
+        return httpx.Response(200, json={"ok": True})
+
+    with respx.mock:
+        respx.get("https://limited.test/item").mock(side_effect=respond)
+        client = manager.get_client()
+        responses = await asyncio.gather(
+            *(client.get("https://limited.test/item") for _ in range(6))
+        )
+
+    assert [response.json() for response in responses] == [{"ok": True}] * 6
+    assert in_flight["peak"] == 2
+    assert (
+        HTTP_CLIENT_REQUEST_SECONDS.count(host="limited.test", outcome="2xx")
+        == before + 6
+    )
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_streamed_responses_hold_the_host_slot_until_closed() -> None:
+    manager = HttpClientManager(max_connections_per_host=1, http2=False)
+
+    with respx.mock:
+        respx.get("https://stream.test/").mock(return_value=httpx.Response(200))
+        client = manager.get_client()
+        async with client.stream("GET", "https://stream.test/"):
+            blocked = asyncio.create_task(client.get("https://stream.test/"))
+            await asyncio.sleep(0.01)
+            assert not blocked.done()
+        assert (await blocked).status_code == 200
+
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_shared_clients_do_not_persist_cookies() -> None:
+    manager = HttpClientManager(http2=False)
+    client = manager.get_client()
+
+    with respx.mock:
+        respx.get("https://cookies.test/login").mock(
+            return_value=httpx.Response(
+                200, headers={"Set-Cookie": "session=secret; Path=/"}
+            )
+        )
+        route = respx.get("https://cookies.test/profile").mock(
+            return_value=httpx.Response(200)
+        )
+        await client.get("https://cookies.test/login")
+        await manager.get_client().get("https://cookies.test/profile")
+
+    assert "cookie" not in route.calls.last.request.headers
+    assert not client.cookies
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_streamed_responses_release_the_host_slot_once_read() -> None:
+    manager = HttpClientManager(max_connections_per_host=1, http2=False)
+
+    with respx.mock:
+        respx.get("https://read.test/").mock(return_value=httpx.Response(200))
+        client = manager.get_client()
+        response = await client.send(
+            client.build_request("GET", "https://read.test/"), stream=True
+        )
+        await response.aread()
+        assert (await client.get("https://read.test/")).status_code == 200
+
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_waiting_for_a_host_slot_honours_the_pool_timeout() -> None:
+    manager = HttpClientManager(max_connections_per_host=1, http2=False)
+
+    with respx.mock:
+        respx.get("https://busy.test/").mock(return_value=httpx.Response(200))
+        client = manager.get_client()
+        async with client.stream("GET", "https://busy.test/"):
+            with pytest.raises(httpx.PoolTimeout):
+                await client.get(
+                    "https://busy.test/", timeout=httpx.Timeout(5.0, pool=0.01)
+                )
+        assert (await client.get("https://busy.test/")).status_code == 200
+
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_clients_without_a_proxy_honour_proxy_environment(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+    monkeypatch.setenv("NO_PROXY", "direct.test")
+    manager = HttpClientManager(http2=False)
+
+    client = manager.get_client()
+    proxied = client._transport_for_url(httpx.URL("https://api.test/"))
+    direct = client._transport_for_url(httpx.URL("https://direct.test/"))
+    explicit = manager.get_client(proxy="http://other.internal:8080")
+
+    assert proxied is not client._transport
+    assert isinstance(proxied._transport._pool, httpcore.AsyncHTTPProxy)  # type: ignore[attr-defined]
+    assert direct is client._transport
+    assert client._transport_for_url(httpx.URL("http://api.test/")) is direct
+    assert not explicit._mounts
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_dns_cache_rotates_lookups_until_forgotten(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    lookups: list[str] = []
+
+    async def fake_getaddrinfo(host: str, port: int, **kwargs: Any) -> list[Any]:
+        lookups.append(host)
+        return [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", (address, port))
+            for address in ("10.0.0.1", "10.0.0.2", "10.0.0.1")
+        ]
+
+    loop = asyncio.get_running_loop()
+    monkeypatch.setattr(loop, "getaddrinfo", fake_getaddrinfo)
+    cache = _DnsCache(ttl=60.0)
+
+    first = await cache.resolve("api.example.com", 443)
+    assert first == ["10.0.0.1", "10.0.0.2"]
+    assert await cache.resolve("api.example.com", 443) == ["10.0.0.2", "10.0.0.1"]
+    assert await cache.resolve("api.example.com", 443) == ["10.0.0.1", "10.0.0.2"]
+    assert await cache.resolve("127.0.0.1", 443) == ["127.0.0.1"]
+    assert lookups == ["api.example.com"]
+
+    cache.forget("api.example.com", 443)
+    await cache.resolve("api.example.com", 443)
+    assert lookups == ["api.example.com", "api.example.com"]
+
+    expired = _DnsCache(ttl=0.0)
+    await expired.resolve("api.example.com", 443)
+    await expired.resolve("api.example.com", 443)
+    assert len(lookups) == 4
+
+
+@pytest.mark.asyncio
+async def test_connections_fall_back_to_the_next_resolved_address() -> None:
+    attempts: list[str] = []
+
+    class _Backend:
+        async def connect_tcp(self, host: str, port: int, **kwargs: Any) -> str:
+            attempts.append(host)
+            if host == "10.0.0.1":
+                raise httpcore.ConnectError("refused")
+            return host
+
+    class _Cache:
+        forgotten = False
+
+        async def resolve(self, host: str, port: int) -> list[str]:
+            return ["10.0.0.1", "10.0.0.2"]
+
+        def forget(self, host: str, port: int) -> None:
+            self.forgotten = True
+
+    cache = _Cache()
+    backend = _CachingNetworkBackend(_Backend(), cache)  # type: ignore[arg-type]
+
+    assert await backend.connect_tcp("api.example.com", 443) == "10.0.0.2"
+    assert attempts == ["10.0.0.1", "10.0.0.2"]
+    assert not cache.forgotten
+
+
+@pytest.mark.asyncio
+async def test_module_helpers_share_the_process_manager() -> None:
+    client = http_clients.get_http_client(timeout=3.0)
+
+    assert http_clients.get_http_client(timeout=3.0) is client
+    await http_clients.close_http_clients()
+    assert client.is_closed
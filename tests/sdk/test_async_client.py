@@ -0,0 +1,309 @@
+"""Tests for the asynchronous Orcheo client and bulk run triggering."""
+
+from __future__ import annotations
+import asyncio
+import json
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from orcheo_backend.app import create_app
+from orcheo_backend.app.authentication import reset_authentication_state
+from orcheo_backend.app.repository import InMemoryWorkflowRepository
+from orcheo_sdk import AsyncOrcheoClient, OrcheoClient, WorkflowExecutionError
+
+
+_SCRIPT = """
+from langgraph.graph import END, START, StateGraph
+
+def build_graph():
+    graph = StateGraph(dict)
+    graph.add_node("start", lambda state: state)
+    graph.add_edge(START, "start")
+    graph.add_edge("start", END)
+    return graph
+""".strip()
+
+
+def _client(handler, **kwargs) -> AsyncOrcheoClient:
+    return AsyncOrcheoClient(
+        OrcheoClient(base_url="http://localhost"),
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_client_retries_with_backoff_and_auth_header() -> None:
+    delays: list[float] = []
+    calls: list[httpx.Request] = []
+
+    async def record_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) < 3:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(201, json={"status": "pending"})
+
+    async with _client(
+        handler,
+        auth_token="secret",
+        backoff_factor=0.1,
+        sleep=record_sleep,
+    ) as client:
+        payload = await client.trigger_run(
+            "wf",
+            workflow_version_id="v1",
+            triggered_by="tester",
+            inputs={"a": 1},
+            runnable_config={"tags": ["x"]},
+        )
+
+    assert payload == {"status": "pending"}
+    assert delays == [0.1, 0.2]
+    assert calls[0].headers["Authorization"] == "Bearer secret"
+    assert json.loads(calls[0].content) == {
+        "workflow_version_id": "v1",
+        "triggered_by": "tester",
+        "input_payload": {"a": 1},
+        "runnable_config": {"tags": ["x"]},
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_client_raises_on_non_retryable_status() -> None:
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(404)
+
+    async with _client(handler) as client:
+        with pytest.raises(WorkflowExecutionError) as exc_info:
+            await client.trigger_run("wf", workflow_version_id="v", triggered_by="t")
+
+    assert exc_info.value.status_code == 404
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_raises_after_transport_errors() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("down", request=request)
+
+    async def no_sleep(delay: float) -> None:
+        return None
+
+    async with _client(handler, max_retries=1, sleep=no_sleep) as client:
+        with pytest.raises(WorkflowExecutionError) as exc_info:
+            await client.trigger_run("wf", workflow_version_id="v", triggered_by="t")
+
+    assert exc_info.value.status_code is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "failure",
+    [
+        httpx.ReadTimeout("slow"),
+        httpx.RemoteProtocolError("dropped"),
+        httpx.Response(503),
+    ],
+)
+async def test_trigger_run_is_not_resent_after_reaching_the_server(
+    failure: Exception | httpx.Response,
+) -> None:
+    calls: list[httpx.Request] = []
+
+    async def no_sleep(delay: float) -> None:
+        return None
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if isinstance(failure, httpx.Response):
+            return failure
+        raise failure
+
+    async with _client(handler, sleep=no_sleep) as client:
+        with pytest.raises(WorkflowExecutionError):
+            await client.trigger_run("wf", workflow_version_id="v", triggered_by="t")
+        with pytest.raises(WorkflowExecutionError):
+            await client.trigger_runs(
+                "wf",
+                [{"a": 1}],
+                workflow_version_id="v",
+                triggered_by="t",
+                batch_size=None,
+            )
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_requests_are_not_resent_after_reaching_the_server() -> None:
+    calls: list[str] = []
+
+    async def no_sleep(delay: float) -> None:
+        return None
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        if len(calls) == 2:
+            return httpx.Response(503)
+        return httpx.Response(201, json=[{"status": "pending"}])
+
+    async with _client(handler, sleep=no_sleep) as client:
+        with pytest.raises(WorkflowExecutionError) as exc_info:
+            await client.trigger_runs(
+                "wf", [{"a": 1}], workflow_version_id="v", triggered_by="t"
+            )
+
+    assert exc_info.value.status_code == 503
+    assert calls == ["/api/workflows/wf/runs/batch"] * 2
+
+
+@pytest.mark.asyncio
+async def test_trigger_runs_chunks_batches_with_bounded_concurrency() -> None:
+    in_flight = 0
+    peak = 0
+    batch_sizes: list[int] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        assert request.url.path == "/api/workflows/wf/runs/batch"
+        runs = json.loads(request.content)["runs"]
+        batch_sizes.append(len(runs))
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(201, json=[run["input_payload"] for run in runs])
+
+    async with _client(handler) as client:
+        results = await client.trigger_runs(
+            "wf",
+            [{"i": i} for i in range(25)],
+            workflow_version_id="v",
+            triggered_by="pipeline",
+            batch_size=4,
+            max_concurrency=2,
+        )
+
+    assert results == [{"i": i} for i in range(25)]
+    assert sorted(batch_sizes) == [1, 4, 4, 4, 4, 4, 4]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_trigger_runs_without_batch_endpoint_and_failure_cancels() -> None:
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        payload = json.loads(request.content)["input_payload"]
+        if payload["i"] == 1:
+            return httpx.Response(400)
+        return httpx.Response(201, json=payload)
+
+    async with _client(handler) as client:
+        assert (
+            await client.trigger_runs(
+                "wf", [], workflow_version_id="v", triggered_by="t"
+            )
+            == []
+        )
+        single = await client.trigger_runs(
+            "wf",
+            [{"i": 0}],
+            workflow_version_id="v",
+            triggered_by="t",
+            batch_size=None,
+        )
+        with pytest.raises(WorkflowExecutionError):
+            await client.trigger_runs(
+                "wf",
+                [{"i": 0}, {"i": 1}],
+                workflow_version_id="v",
+                triggered_by="t",
+                batch_size=None,
+            )
+        with pytest.raises(ValueError):
+            await client.trigger_runs(
+                "wf", [], workflow_version_id="v", triggered_by="t", batch_size=0
+            )
+
+    assert single == [{"i": 0}]
+    assert set(paths) == {"/api/workflows/wf/runs"}
+
+
+@pytest.mark.asyncio
+async def test_async_client_does_not_close_external_http_client() -> None:
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})),
+        base_url="http://localhost",
+    )
+    client = AsyncOrcheoClient(
+        OrcheoClient(base_url="http://localhost"), http_client=http_client
+    )
+
+    assert await client.get_credential_health("wf") == {}
+    assert await client.validate_credentials("wf") == {}
+    await client.aclose()
+
+    assert not http_client.is_closed
+    await http_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_trigger_runs_against_backend_batch_endpoint(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ORCHEO_AUTH_MODE", "disabled")
+    reset_authentication_state()
+    app = create_app(InMemoryWorkflowRepository())
+
+    with TestClient(app) as api_client:
+        workflow = api_client.post(
+            "/api/workflows", json={"name": "Bulk", "actor": "t"}
+        )
+        workflow_id = workflow.json()["id"]
+        version = api_client.post(
+            f"/api/workflows/{workflow_id}/versions/ingest",
+            json={"script": _SCRIPT, "entrypoint": "build_graph", "created_by": "t"},
+        )
+        version_id = version.json()["id"]
+
+        def dispatch(request: httpx.Request) -> httpx.Response:
+            response = api_client.request(
+                request.method,
+                request.url.path,
+                headers={"content-type": "application/json"},
+                content=request.content,
+            )
+            return httpx.Response(response.status_code, content=response.content)
+
+        async with _client(dispatch) as client:
+            runs = await client.trigger_runs(
+                workflow_id,
+                [{"value": i} for i in range(5)],
+                workflow_version_id=version_id,
+                triggered_by="pipeline",
+                batch_size=2,
+            )
+            with pytest.raises(WorkflowExecutionError) as exc_info:
+                await client.trigger_runs(
+                    workflow_id,
+                    [{"value": 0}],
+                    workflow_version_id="00000000-0000-0000-0000-000000000000",
+                    triggered_by="pipeline",
+                )
+
+        listed = api_client.get(f"/api/workflows/{workflow_id}/runs").json()
+
+    assert [run["input_payload"] for run in runs] == [{"value": i} for i in range(5)]
+    assert all(run["status"] == "pending" for run in runs)
+    assert exc_info.value.status_code == 404
+    assert len(listed) == 5
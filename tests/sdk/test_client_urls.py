@@ -12,6 +12,13 @@ def test_workflow_trigger_url(client: OrcheoClient) -> None:
     )
 
 
+def test_workflow_batch_trigger_url(client: OrcheoClient) -> None:
+    assert (
+        client.workflow_batch_trigger_url("demo")
+        == "http://localhost:8000/api/workflows/demo/runs/batch"
+    )
+
+
 def test_workflow_trigger_url_requires_identifier(client: OrcheoClient) -> None:
     with pytest.raises(ValueError):
         client.workflow_trigger_url("   ")
@@ -183,6 +183,42 @@ async def test_process_stream_messages_machine_verbose_prints_json(
     assert not state.console.messages
 
 
+@pytest.mark.asyncio()
+async def test_process_stream_messages_unwraps_compact_frames() -> None:
+    state = make_state()
+    messages = [
+        json.dumps({"t": "hello", "protocol": "orcheo.compact.v1", "s": 1}),
+        json.dumps(
+            {
+                "t": "trace",
+                "s": 2,
+                "d": {"type": "trace:update", "spans": [{"name": "loader"}]},
+            }
+        ),
+        json.dumps({"t": "state", "s": 3, "p": []}),
+        json.dumps({"t": "step", "s": 4, "d": {"loader": {"results": {}}}}),
+        json.dumps({"t": "event", "s": 5, "d": {"status": "completed"}}),
+    ]
+
+    class FakeWebSocket:
+        def __init__(self, payloads: list[str]) -> None:
+            self._payloads = iter(payloads)
+
+        def __aiter__(self) -> FakeWebSocket:
+            return self
+
+        async def __anext__(self) -> str:
+            try:
+                return next(self._payloads)
+            except StopIteration as exc:
+                raise StopAsyncIteration from exc
+
+    result = await _process_stream_messages(state, FakeWebSocket(messages))
+    assert result == "completed"
+    assert any("Trace update: loader" in msg for msg in state.console.messages)
+    assert any("loader" in msg and "results" in msg for msg in state.console.messages)
+
+
 @pytest.mark.parametrize(
     ("status", "expected", "fragment"),
     [
@@ -245,6 +245,10 @@ async def test_stream_workflow_run_succeeds(
     assert payload["triggered_by"] == "cli-actor"
     assert payload["runnable_config"] == {"priority": "high"}
     assert payload["stored_runnable_config"] == {"tags": ["stored"]}
+    assert payload["stream"] == {
+        "protocol": "orcheo.compact.v1",
+        "channels": ["steps", "trace"],
+    }
 
 
 @pytest.mark.asyncio()
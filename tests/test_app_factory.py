@@ -3,6 +3,7 @@
 import importlib
 import json
 import sys
+from pathlib import Path
 from types import ModuleType
 import pytest
 from fastapi import Request
@@ -15,7 +16,11 @@ from orcheo_backend.app.factory import (
     _authentication_error_handler,
     _load_allowed_origins,
 )
-from orcheo_backend.app.repository import InMemoryWorkflowRepository
+from orcheo_backend.app.repository import (
+    InMemoryWorkflowRepository,
+    SqliteWorkflowRepository,
+)
+from orcheo_backend.app.run_outbox import RunOutboxRelay
 
 
 backend_module = importlib.import_module("orcheo_backend.app")
@@ -74,6 +79,25 @@ def test_create_app_allows_dependency_override() -> None:
     assert override() is repository
 
 
+def test_create_app_runs_outbox_relay_for_sql_repositories(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """SQL repositories get a run outbox relay for the app lifespan."""
+    monkeypatch.setenv("ORCHEO_AUTH_MODE", "disabled")
+    repository = SqliteWorkflowRepository(tmp_path / "outbox.sqlite")
+    app = create_app(repository)
+
+    with TestClient(app):
+        relay = app.state.run_outbox_relay
+        assert isinstance(relay, RunOutboxRelay)
+        assert repository._run_outbox_notifier == relay.wake
+
+    assert repository._run_outbox_notifier is None
+
+    with TestClient(create_app(InMemoryWorkflowRepository())) as client:
+        assert client.app.state.run_outbox_relay is None
+
+
 def test_create_app_rejects_public_deployment_without_auth(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -202,3 +202,64 @@ async def test_listener_supervisor_tracks_consecutive_adapter_failures() -> None
     assert subscription.assigned_runtime is None
 
     await supervisor.shutdown()
+
+
+@pytest.mark.asyncio()
+async def test_listener_supervisor_reconciles_incrementally() -> None:
+    repository = InMemoryWorkflowRepository()
+    workflow = await repository.create_workflow(
+        name="Incremental Flow",
+        slug=None,
+        description=None,
+        tags=None,
+        draft_access=WorkflowDraftAccess.PERSONAL,
+        actor="author",
+    )
+    await repository.create_version(
+        workflow.id,
+        graph=_listener_graph(
+            {
+                "node_name": "telegram_listener",
+                "platform": "telegram",
+                "token": "[[telegram_one]]",
+            }
+        ),
+        metadata={},
+        notes=None,
+        created_by="author",
+    )
+    feed_requests: list[object] = []
+    list_subscriptions = repository.list_listener_subscriptions
+
+    async def record_feed(**kwargs):
+        feed_requests.append(kwargs.get("updated_since"))
+        return await list_subscriptions(**kwargs)
+
+    async def fail_single_claim(*args, **kwargs):
+        raise AssertionError("incremental reconcile must not claim one by one")
+
+    repository.list_listener_subscriptions = record_feed  # type: ignore[method-assign]
+    repository.claim_listener_subscription = fail_single_claim  # type: ignore[method-assign]
+    supervisor = ListenerSupervisor(
+        repository=repository,
+        runtime_id="runtime-1",
+        adapter_factory=lambda subscription: StubAdapter(subscription),
+        reconcile_interval_seconds=0.01,
+    )
+
+    await supervisor.run_once()
+    await supervisor.run_once()
+    assert len(supervisor.health()) == 1
+    assert feed_requests[0] is None
+    assert feed_requests[1] is not None
+
+    subscription = (await list_subscriptions(workflow_id=workflow.id))[0]
+    await repository.update_listener_subscription_status(
+        subscription.id,
+        status=ListenerSubscriptionStatus.PAUSED,
+        actor="author",
+    )
+    await supervisor.run_once()
+    assert supervisor.health() == []
+
+    await supervisor.shutdown()
@@ -112,13 +112,13 @@ class RecordingDiscordRepository:
         self.cursor = cursor
         return cursor
 
-    async def dispatch_listener_event(
+    async def dispatch_listener_events(
         self,
         subscription_id: UUID,
-        payload: ListenerDispatchPayload,
-    ) -> ListenerDispatchPayload:
-        self.dispatched.append(payload)
-        return payload
+        payloads: list[ListenerDispatchPayload],
+    ) -> list[Any]:
+        self.dispatched.extend(payloads)
+        return list(payloads)
 
 
 def _build_subscription(config: dict[str, Any] | None = None) -> ListenerSubscription:
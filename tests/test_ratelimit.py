@@ -0,0 +1,164 @@
+"""Tests for the shared GCRA rate limiting backends."""
+
+from __future__ import annotations
+import asyncio
+import threading
+import fakeredis
+import pytest
+from orcheo import ratelimit
+from orcheo.ratelimit import (
+    InMemoryRateLimitBackend,
+    RateLimitBackend,
+    RateLimitDecision,
+    RedisRateLimitBackend,
+    create_rate_limit_backend,
+)
+
+
+SECOND = 1_000_000_000
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_700_000_000 * SECOND
+
+    def __call__(self) -> int:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += int(seconds * SECOND)
+
+
+async def _acquire_many(backend: RateLimitBackend, key: str, count: int) -> list[bool]:
+    return [
+        (await backend.acquire(key, limit=3, period_seconds=60)).allowed
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_in_memory_backend_allows_burst_then_refills() -> None:
+    clock = _Clock()
+    backend = InMemoryRateLimitBackend(clock=clock)
+
+    assert await _acquire_many(backend, "k", 4) == [True, True, True, False]
+    denied = await backend.acquire("k", limit=3, period_seconds=60)
+    assert denied == RateLimitDecision(False, 20.0)
+
+    clock.advance(20)
+    assert await _acquire_many(backend, "k", 2) == [True, False]
+    assert await _acquire_many(backend, "other", 1) == [True]
+
+
+@pytest.mark.asyncio
+async def test_in_memory_backend_honours_explicit_now() -> None:
+    backend = InMemoryRateLimitBackend()
+
+    for offset in (0.0, 0.1):
+        decision = await backend.acquire(
+            "k", limit=2, period_seconds=1, now=100 + offset
+        )
+        assert decision.allowed
+    assert not (
+        await backend.acquire("k", limit=2, period_seconds=1, now=100.2)
+    ).allowed
+    assert (await backend.acquire("k", limit=2, period_seconds=1, now=105)).allowed
+
+
+@pytest.mark.asyncio
+async def test_in_memory_backend_evicts_idle_then_least_recent_keys() -> None:
+    clock = _Clock()
+    backend = InMemoryRateLimitBackend(max_keys=2, clock=clock)
+
+    await backend.acquire("idle", limit=1, period_seconds=1)
+    clock.advance(5)
+    await backend.acquire("a", limit=1, period_seconds=60)
+    assert list(backend._tats) == ["a"]
+
+    await backend.acquire("b", limit=1, period_seconds=60)
+    assert not (await backend.acquire("a", limit=1, period_seconds=60)).allowed
+    await backend.acquire("c", limit=1, period_seconds=60)
+    assert list(backend._tats) == ["a", "c"]
+
+
+@pytest.mark.asyncio
+async def test_in_memory_backend_reset_by_prefix() -> None:
+    backend = InMemoryRateLimitBackend()
+    for key in ("auth:1", "auth:2", "webhook:1"):
+        await backend.acquire(key, limit=1, period_seconds=60)
+
+    backend.reset("auth:")
+    assert list(backend._tats) == ["webhook:1"]
+
+    backend.reset()
+    assert backend._tats == {}
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_shares_limits_between_replicas() -> None:
+    clock = _Clock()
+    server = fakeredis.FakeServer()
+    replica_a = RedisRateLimitBackend(fakeredis.FakeRedis(server=server), clock=clock)
+    replica_b = RedisRateLimitBackend(fakeredis.FakeRedis(server=server), clock=clock)
+
+    assert await _acquire_many(replica_a, "k", 2) == [True, True]
+    assert await _acquire_many(replica_b, "k", 2) == [True, False]
+
+    client = fakeredis.FakeRedis(server=server)
+    assert 0 < client.pttl("orcheo:ratelimit:k") <= 60_000
+
+    replica_b.reset()
+    assert await _acquire_many(replica_a, "k", 1) == [True]
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_allows_requests_when_unavailable() -> None:
+    class BrokenClient:
+        def pipeline(self) -> None:
+            raise ConnectionError("redis down")
+
+    backend = RedisRateLimitBackend(BrokenClient())
+
+    assert (await backend.acquire("k", limit=1, period_seconds=60)).allowed
+    assert (await backend.acquire("k", limit=1, period_seconds=60)).allowed
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_does_not_block_event_loop() -> None:
+    release = threading.Event()
+
+    class SlowPipeline:
+        def __enter__(self) -> SlowPipeline:
+            release.wait(timeout=5)
+            raise ConnectionError("redis timed out")
+
+        def __exit__(self, *exc_info: object) -> None:
+            return None
+
+    class SlowClient:
+        def pipeline(self) -> SlowPipeline:
+            return SlowPipeline()
+
+    backend = RedisRateLimitBackend(SlowClient())
+    pending = asyncio.create_task(backend.acquire("k", limit=1, period_seconds=60))
+
+    await asyncio.sleep(0.01)
+    assert not pending.done()
+    release.set()
+    assert (await pending).allowed
+
+
+def test_create_rate_limit_backend_from_environment(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv("ORCHEO_RATE_LIMIT_BACKEND", raising=False)
+    first = create_rate_limit_backend()
+    assert isinstance(first, InMemoryRateLimitBackend)
+    assert create_rate_limit_backend() is not first
+
+    monkeypatch.setenv("ORCHEO_RATE_LIMIT_BACKEND", "redis")
+    monkeypatch.setenv("ORCHEO_RATE_LIMIT_REDIS_URL", "redis://example:6379/3")
+    monkeypatch.setattr(ratelimit, "_redis_backends", {})
+    shared = create_rate_limit_backend()
+    assert isinstance(shared, RedisRateLimitBackend)
+    assert create_rate_limit_backend() is shared
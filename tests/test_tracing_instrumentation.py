@@ -0,0 +1,202 @@
+"""Tests for callback-driven workflow node instrumentation."""
+
+from __future__ import annotations
+import asyncio
+from typing import Any, TypedDict
+from uuid import uuid4
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+from langchain_core.tools import tool
+from langgraph.graph import END, START, StateGraph
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import StatusCode, Tracer
+from orcheo.nodes.logic.utilities import SetVariableNode
+from orcheo.tracing import WorkflowInstrumentation, record_workflow_step
+from orcheo.tracing.instrumentation import _llm_token_usage
+from orcheo.tracing.metrics import NODE_DURATION_SECONDS
+
+
+class _State(TypedDict, total=False):
+    answer: str
+    tool_result: str
+
+
+def _build_tracer() -> tuple[Tracer, InMemorySpanExporter]:
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return provider.get_tracer(__name__), exporter
+
+
+@tool
+def lookup(query: str) -> str:
+    """Return a canned lookup result."""
+    return f"result for {query}"
+
+
+def _build_graph(*, fail: bool = False) -> Any:
+    model = GenericFakeChatModel(
+        messages=iter(
+            [
+                AIMessage(
+                    content="hello",
+                    usage_metadata={
+                        "input_tokens": 7,
+                        "output_tokens": 3,
+                        "total_tokens": 10,
+                    },
+                )
+            ]
+        )
+    )
+
+    async def ask(state: _State) -> _State:
+        await asyncio.sleep(0.02)
+        reply = await model.ainvoke("hi")
+        return {"answer": str(reply.content)}
+
+    async def use_tool(state: _State) -> _State:
+        if fail:
+            raise RuntimeError("tool node failed")
+        return {"tool_result": await lookup.ainvoke({"query": state["answer"]})}
+
+    graph = StateGraph(_State)
+    graph.add_node("ask", ask)
+    graph.add_node("use_tool", use_tool)
+    graph.add_edge(START, "ask")
+    graph.add_edge("ask", "use_tool")
+    graph.add_edge("use_tool", END)
+    return graph.compile()
+
+
+def _spans_by_name(exporter: InMemorySpanExporter) -> dict[str, ReadableSpan]:
+    return {span.name: span for span in exporter.get_finished_spans()}
+
+
+@pytest.mark.asyncio
+async def test_instrumentation_times_nodes_and_nests_llm_and_tool_spans() -> None:
+    tracer, exporter = _build_tracer()
+    with tracer.start_as_current_span("workflow.execution") as root:
+        instrumentation = WorkflowInstrumentation(tracer, parent=root)
+        async for step in _build_graph().astream(
+            {}, config=instrumentation.attach({}), stream_mode="updates"
+        ):
+            record_workflow_step(tracer, step, instrumentation=instrumentation)
+        instrumentation.close()
+
+    spans = _spans_by_name(exporter)
+    ask, use_tool = spans["ask"], spans["use_tool"]
+    chat, tool_span = spans["GenericFakeChatModel"], spans["lookup"]
+
+    assert ask.parent is not None
+    assert ask.parent.span_id == spans["workflow.execution"].context.span_id
+    assert ask.end_time is not None and ask.start_time is not None
+    assert ask.end_time - ask.start_time >= 20_000_000
+    assert ask.attributes is not None
+    assert ask.attributes["orcheo.node.step"] == 1
+    assert ask.attributes["orcheo.node.duration_ms"] >= 20
+    assert ask.attributes["orcheo.token.input"] == 7
+    assert ask.attributes["orcheo.token.output"] == 3
+    assert ask.attributes["orcheo.node.llm_calls"] == 1
+    assert ask.status.status_code is StatusCode.OK
+
+    assert chat.parent is not None and chat.parent.span_id == ask.context.span_id
+    assert chat.attributes is not None
+    assert chat.attributes["orcheo.span.kind"] == "llm"
+    assert chat.attributes["orcheo.token.input"] == 7
+    assert tool_span.parent is not None
+    assert tool_span.parent.span_id == use_tool.context.span_id
+    assert use_tool.attributes is not None
+    assert use_tool.attributes["orcheo.node.tool_calls"] == 1
+    assert use_tool.start_time is not None
+    assert use_tool.start_time >= ask.end_time
+    assert use_tool.attributes["orcheo.node.queue_delay_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_instrumentation_marks_failed_nodes() -> None:
+    tracer, exporter = _build_tracer()
+    instrumentation = WorkflowInstrumentation(tracer)
+
+    with pytest.raises(RuntimeError, match="tool node failed"):
+        async for step in _build_graph(fail=True).astream(
+            {}, config=instrumentation.attach({}), stream_mode="updates"
+        ):
+            record_workflow_step(tracer, step, instrumentation=instrumentation)
+    instrumentation.close()
+
+    spans = _spans_by_name(exporter)
+    assert spans["use_tool"].status.status_code is StatusCode.ERROR
+    assert spans["ask"].status.status_code is StatusCode.OK
+
+
+@pytest.mark.asyncio
+async def test_node_durations_are_labelled_by_node_class() -> None:
+    tracer, exporter = _build_tracer()
+    NODE_DURATION_SECONDS.clear()
+
+    async def tenant_specific_step(state: dict[str, Any]) -> dict[str, Any]:
+        return {}
+
+    graph = StateGraph(dict)
+    graph.add_node("customer-42-greeting", SetVariableNode(name="customer-42-greeting"))
+    graph.add_node("customer-42-cleanup", tenant_specific_step)
+    graph.add_edge(START, "customer-42-greeting")
+    graph.add_edge("customer-42-greeting", "customer-42-cleanup")
+    graph.add_edge("customer-42-cleanup", END)
+    compiled = graph.compile()
+
+    instrumentation = WorkflowInstrumentation(tracer, graph=compiled)
+    async for step in compiled.astream(
+        {}, config=instrumentation.attach({}), stream_mode="updates"
+    ):
+        record_workflow_step(tracer, step, instrumentation=instrumentation)
+    instrumentation.close()
+
+    assert NODE_DURATION_SECONDS.count(node_type="SetVariableNode", status="success")
+    assert NODE_DURATION_SECONDS.count(node_type="function", status="success")
+    labels = {
+        value
+        for _, sample_labels, _ in NODE_DURATION_SECONDS.samples()
+        for value in sample_labels.values()
+    }
+    assert not any("customer-42" in value for value in labels)
+    span = _spans_by_name(exporter)["customer-42-greeting"]
+    assert span.attributes is not None
+    assert span.attributes["orcheo.node.type"] == "SetVariableNode"
+
+
+def test_close_ends_spans_without_step_payloads() -> None:
+    tracer, exporter = _build_tracer()
+    instrumentation = WorkflowInstrumentation(tracer)
+    run_id = uuid4()
+
+    instrumentation.on_chain_start(
+        {},
+        {},
+        run_id=run_id,
+        metadata={"langgraph_node": "silent", "langgraph_step": 2},
+        name="silent",
+    )
+    instrumentation.on_chain_end({}, run_id=run_id)
+    assert exporter.get_finished_spans() == ()
+
+    instrumentation.close()
+    assert [span.name for span in exporter.get_finished_spans()] == ["silent"]
+    assert instrumentation.take_finished("silent") is None
+
+
+def test_llm_token_usage_falls_back_to_llm_output() -> None:
+    response = LLMResult(
+        generations=[[ChatGeneration(message=AIMessage(content="x"))]],
+        llm_output={"token_usage": {"prompt_tokens": 4, "completion_tokens": 2}},
+    )
+
+    assert _llm_token_usage(response) == (4, 2)
+    assert _llm_token_usage(LLMResult(generations=[])) == (0, 0)
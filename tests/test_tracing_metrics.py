@@ -0,0 +1,162 @@
+"""Tests for the Prometheus-compatible metrics registry."""
+
+from __future__ import annotations
+import asyncio
+import gc
+import urllib.request
+from typing import Any
+import pytest
+from orcheo.tracing import metrics
+from orcheo.tracing.metrics import (
+    CONTENT_TYPE_LATEST,
+    MetricsRegistry,
+    start_metrics_server,
+    track_connection_pool,
+    track_run,
+    track_trigger_dispatch,
+)
+
+
+def test_registry_renders_text_exposition_format() -> None:
+    registry = MetricsRegistry()
+    runs = registry.counter("runs_total", "Runs.\nSecond line", ("source",))
+    inflight = registry.gauge("inflight", "In flight.")
+    latency = registry.histogram(
+        "latency_seconds", "Latency.", ("op",), buckets=(0.1, 1.0)
+    )
+
+    runs.inc(source='we"b')
+    runs.inc(2, source='we"b')
+    inflight.inc()
+    inflight.dec(3)
+    for value in (0.05, 0.5, 5.0):
+        latency.observe(value, op="write")
+
+    assert registry.render().splitlines() == [
+        "# HELP runs_total Runs.\\nSecond line",
+        "# TYPE runs_total counter",
+        'runs_total{source="we\\"b"} 3.0',
+        "# HELP inflight In flight.",
+        "# TYPE inflight gauge",
+        "inflight -2.0",
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{op="write",le="0.1"} 1.0',
+        'latency_seconds_bucket{op="write",le="1.0"} 2.0',
+        'latency_seconds_bucket{op="write",le="+Inf"} 3.0',
+        'latency_seconds_sum{op="write"} 5.55',
+        'latency_seconds_count{op="write"} 3.0',
+    ]
+
+
+def test_registry_validates_labels_and_shapes() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("events_total", "Events.", ("kind",))
+
+    assert registry.counter("events_total", "Events.", ("kind",)) is counter
+    with pytest.raises(ValueError, match="different shape"):
+        registry.gauge("events_total", "Events.", ("kind",))
+    with pytest.raises(ValueError, match="expects labels"):
+        counter.inc(other="x")
+    with pytest.raises(ValueError, match="non-negative"):
+        counter.inc(-1, kind="x")
+    with pytest.raises(ValueError, match="finite bucket"):
+        registry.histogram("empty", "Empty.", buckets=(float("inf"),))
+
+
+@pytest.mark.asyncio
+async def test_histogram_timer_wraps_sync_and_async_callables() -> None:
+    registry = MetricsRegistry()
+    latency = registry.histogram("op_seconds", "Latency.", ("op",))
+
+    @latency.time(op="async")
+    async def work() -> str:
+        await asyncio.sleep(0)
+        return "done"
+
+    @latency.time(op="sync")
+    def fail() -> None:
+        raise RuntimeError("boom")
+
+    assert await work() == "done"
+    with pytest.raises(RuntimeError):
+        fail()
+    with latency.time(op="block"):
+        pass
+
+    assert [latency.count(op=op) for op in ("async", "sync", "block")] == [1, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_track_run_reports_status_and_in_progress() -> None:
+    source = "test-track-run"
+
+    with track_run(source):
+        assert metrics.RUNS_IN_PROGRESS.value(source=source) == 1
+    with track_run(source) as outcome:
+        outcome.status = "failed"
+    with pytest.raises(asyncio.CancelledError), track_run(source):
+        raise asyncio.CancelledError
+
+    assert metrics.RUNS_IN_PROGRESS.value(source=source) == 0
+    for status in ("succeeded", "failed", "cancelled"):
+        assert metrics.RUN_DURATION_SECONDS.count(source=source, status=status) == 1
+
+
+@pytest.mark.asyncio
+async def test_track_trigger_dispatch_counts_enqueued_runs() -> None:
+    trigger = "test-dispatch"
+
+    @track_trigger_dispatch(trigger)
+    async def dispatch(count: int) -> list[int]:
+        if count < 0:
+            raise ValueError("bad request")
+        return list(range(count))
+
+    assert await dispatch(3) == [0, 1, 2]
+    with pytest.raises(ValueError):
+        await dispatch(-1)
+
+    assert metrics.TRIGGER_RUNS_TOTAL.value(trigger=trigger) == 3
+    histogram = metrics.TRIGGER_DISPATCH_SECONDS
+    assert histogram.count(trigger=trigger, outcome="success") == 1
+    assert histogram.count(trigger=trigger, outcome="error") == 1
+
+
+def test_connection_pools_are_reported_until_collected() -> None:
+    class FakePool:
+        def get_stats(self) -> dict[str, Any]:
+            return {"pool_max": 10, "pool_size": 4, "pool_available": 1}
+
+    pool = FakePool()
+    track_connection_pool("test-pool", pool)
+    track_connection_pool("unhashable", {})
+
+    rendered = metrics.render_metrics()
+    assert 'orcheo_db_pool_connections{pool="test-pool",state="size"} 4.0' in rendered
+    assert metrics.DB_POOL_CONNECTIONS.value(pool="test-pool", state="waiting") == 0
+
+    del pool
+    gc.collect()
+    assert 'pool="test-pool"' not in metrics.render_metrics()
+
+
+def test_metrics_server_serves_registry_and_skips_taken_ports() -> None:
+    registry = MetricsRegistry()
+    registry.counter("served_total", "Served.").inc()
+    first = start_metrics_server(0, host="127.0.0.1", registry=registry)
+    port = first.server_address[1]
+    second = start_metrics_server(
+        port, host="127.0.0.1", registry=registry, max_port_offset=5
+    )
+    try:
+        assert second.server_address[1] != port
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE_LATEST
+            assert b"served_total 1.0" in response.read()
+        with pytest.raises(OSError):
+            start_metrics_server(port, host="127.0.0.1", registry=registry)
+    finally:
+        for server in (first, second):
+            server.shutdown()
+            server.server_close()
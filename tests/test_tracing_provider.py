@@ -144,3 +144,21 @@ def test_build_exporter_requires_otlp_dependency(
         provider._build_exporter("otlp", {})
 
     assert errors
+
+
+def test_configure_tracing_samples_nothing_without_exporter(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Spans are not recorded when no exporter would receive them."""
+
+    monkeypatch.setattr(provider, "_configured", False)
+    monkeypatch.setattr(provider, "get_settings", lambda: {"TRACING_EXPORTER": "none"})
+    installed: list[Any] = []
+    monkeypatch.setattr(provider.trace, "set_tracer_provider", installed.append)
+
+    provider.configure_tracing(force=True)
+
+    (tracer_provider,) = installed
+    span = tracer_provider.get_tracer(__name__).start_span("unsampled")
+    assert not span.is_recording()
+    assert span.get_span_context().is_valid
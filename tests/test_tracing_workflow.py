@@ -8,6 +8,7 @@ from opentelemetry.sdk.trace.export import SimpleSpanProcessor
 from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
     InMemorySpanExporter,
 )
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF
 from opentelemetry.trace import StatusCode, Tracer
 from orcheo import config
 from orcheo.agentensor.prompts import TrainablePrompt
@@ -360,3 +361,63 @@ def test_preview_text_truncates_long_values(monkeypatch: pytest.MonkeyPatch) ->
 
     assert preview.endswith("…")
     assert len(preview) == settings.tracing_preview_max_length
+
+
+def test_record_workflow_step_skips_work_for_unsampled_traces(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider(sampler=ALWAYS_OFF)
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracer = provider.get_tracer(__name__)
+
+    def fail_sanitize(text: str) -> str:
+        raise AssertionError("previews must not be built for unsampled traces")
+
+    monkeypatch.setattr(workflow_module, "_sanitize_text", fail_sanitize)
+    monkeypatch.setattr(workflow_module, "_node_attributes", fail_sanitize)
+
+    with tracer.start_as_current_span("workflow.execution"):
+        record_workflow_step(tracer, {"node-1": {"messages": ["hello"]}})
+    record_workflow_step(tracer, {"node-1": {"prompts": ["hello"]}})
+
+    assert exporter.get_finished_spans() == ()
+
+
+def test_record_workflow_step_caps_events_per_span(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tracer, exporter = _build_tracer()
+    monkeypatch.setattr(
+        workflow_module,
+        "_tracing_limits",
+        lambda: workflow_module._TracingLimits(
+            preview_max_length=32, high_token_threshold=1000, max_events_per_span=3
+        ),
+    )
+
+    record_workflow_step(
+        tracer, {"node-1": {"messages": [f"message {i}" for i in range(10)]}}
+    )
+
+    (span,) = exporter.get_finished_spans()
+    assert len(span.events) == 3
+    assert span.attributes["orcheo.span.events_dropped"] == 7
+
+
+def test_tracing_limits_are_cached_until_settings_reload(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ORCHEO_TRACING_PREVIEW_MAX_LENGTH", "100")
+    config.get_settings(refresh=True)
+    first = workflow_module._tracing_limits()
+    assert workflow_module._tracing_limits() is first
+    assert first.preview_max_length == 100
+
+    monkeypatch.setenv("ORCHEO_TRACING_PREVIEW_MAX_LENGTH", "200")
+    assert workflow_module._tracing_limits() is first
+    config.get_settings(refresh=True)
+    assert workflow_module._tracing_limits().preview_max_length == 200
+
+    monkeypatch.delenv("ORCHEO_TRACING_PREVIEW_MAX_LENGTH", raising=False)
+    config.get_settings(refresh=True)
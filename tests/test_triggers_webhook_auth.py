@@ -1,6 +1,6 @@
 from __future__ import annotations
-from datetime import UTC, datetime, timedelta
 import pytest
+from orcheo.ratelimit import InMemoryRateLimitBackend
 from orcheo.triggers.webhook import (
     RateLimitConfig,
     RateLimitExceededError,
@@ -12,7 +12,8 @@ from orcheo.triggers.webhook import (
 from tests.triggers_webhook_helpers import make_request
 
 
-def test_webhook_authentication_error_includes_status_code() -> None:
+@pytest.mark.asyncio
+async def test_webhook_authentication_error_includes_status_code() -> None:
     """Invalid authentication should raise the dedicated error."""
 
     config = WebhookTriggerConfig(
@@ -24,12 +25,13 @@ def test_webhook_authentication_error_includes_status_code() -> None:
     request = make_request(headers={"x-secret": "invalid"})
 
     with pytest.raises(WebhookAuthenticationError) as exc:
-        state.validate(request)
+        await state.validate(request)
 
     assert exc.value.status_code == 401
 
 
-def test_webhook_missing_secret_header_is_rejected() -> None:
+@pytest.mark.asyncio
+async def test_webhook_missing_secret_header_is_rejected() -> None:
     """Requests omitting the shared secret header should be denied."""
 
     config = WebhookTriggerConfig(
@@ -39,7 +41,7 @@ def test_webhook_missing_secret_header_is_rejected() -> None:
     state = WebhookTriggerState(config)
 
     with pytest.raises(WebhookAuthenticationError):
-        state.validate(make_request(headers={}))
+        await state.validate(make_request(headers={}))
 
 
 def test_webhook_state_scrubs_shared_secret_header() -> None:
@@ -58,7 +60,8 @@ def test_webhook_state_scrubs_shared_secret_header() -> None:
     assert sanitized["content-type"] == "application/json"
 
 
-def test_webhook_required_headers_validation() -> None:
+@pytest.mark.asyncio
+async def test_webhook_required_headers_validation() -> None:
     """Missing required headers should fail validation with status 400."""
 
     config = WebhookTriggerConfig(required_headers={"X-Custom": "expected"})
@@ -67,22 +70,24 @@ def test_webhook_required_headers_validation() -> None:
     request = make_request(headers={})
 
     with pytest.raises(WebhookValidationError) as exc:
-        state.validate(request)
+        await state.validate(request)
 
     assert exc.value.status_code == 400
     assert "header" in str(exc.value)
 
 
-def test_webhook_required_headers_success() -> None:
+@pytest.mark.asyncio
+async def test_webhook_required_headers_success() -> None:
     """Requests with all required headers should succeed."""
 
     config = WebhookTriggerConfig(required_headers={"X-Custom": "expected"})
     state = WebhookTriggerState(config)
 
-    state.validate(make_request(headers={"X-Custom": "expected"}))
+    await state.validate(make_request(headers={"X-Custom": "expected"}))
 
 
-def test_webhook_required_query_validation() -> None:
+@pytest.mark.asyncio
+async def test_webhook_required_query_validation() -> None:
     """Missing required query parameters should fail validation."""
 
     config = WebhookTriggerConfig(required_query_params={"token": "abc"})
@@ -91,39 +96,70 @@ def test_webhook_required_query_validation() -> None:
     request = make_request(query_params={})
 
     with pytest.raises(WebhookValidationError) as exc:
-        state.validate(request)
+        await state.validate(request)
 
     assert exc.value.status_code == 400
     assert "query" in str(exc.value)
 
 
-def test_webhook_required_query_success() -> None:
+@pytest.mark.asyncio
+async def test_webhook_required_query_success() -> None:
     """Requests containing required query parameters should validate."""
 
     config = WebhookTriggerConfig(required_query_params={"token": "abc"})
     state = WebhookTriggerState(config)
 
-    state.validate(make_request(query_params={"token": "abc"}))
+    await state.validate(make_request(query_params={"token": "abc"}))
 
 
-def test_webhook_rate_limit_purges_outdated_entries() -> None:
-    """Rate limit enforcement should drop invocations outside the window."""
+@pytest.mark.asyncio
+async def test_webhook_rate_limit_recovers_after_interval() -> None:
+    """Capacity returns once the configured interval has elapsed."""
 
+    clock = [0]
     config = WebhookTriggerConfig(
         rate_limit=RateLimitConfig(limit=2, interval_seconds=1)
     )
-    state = WebhookTriggerState(config)
+    state = WebhookTriggerState(
+        config, rate_limit_backend=InMemoryRateLimitBackend(clock=lambda: clock[0])
+    )
+
+    await state.validate(make_request())
+    await state.validate(make_request())
+    with pytest.raises(RateLimitExceededError):
+        await state.validate(make_request())
 
-    stale_time = datetime.now(tz=UTC) - timedelta(seconds=5)
-    state._recent_invocations.append(stale_time)
+    clock[0] += 5_000_000_000
+    await state.validate(make_request())
+    await state.validate(make_request())
 
-    state.validate(make_request())
 
-    assert len(state._recent_invocations) == 1
-    assert state._recent_invocations[0] >= stale_time
+@pytest.mark.asyncio
+async def test_webhook_states_share_backend_by_key() -> None:
+    """States sharing a backend and key share one limit; other keys do not."""
+
+    backend = InMemoryRateLimitBackend()
+    config = WebhookTriggerConfig(
+        rate_limit=RateLimitConfig(limit=1, interval_seconds=60)
+    )
+    first = WebhookTriggerState(
+        config, rate_limit_backend=backend, rate_limit_key="webhook:a"
+    )
+    replica = WebhookTriggerState(
+        config, rate_limit_backend=backend, rate_limit_key="webhook:a"
+    )
+    other = WebhookTriggerState(
+        config, rate_limit_backend=backend, rate_limit_key="webhook:b"
+    )
+
+    await first.validate(make_request())
+    with pytest.raises(RateLimitExceededError):
+        await replica.validate(make_request())
+    await other.validate(make_request())
 
 
-def test_webhook_rate_limit_exceeded() -> None:
+@pytest.mark.asyncio
+async def test_webhook_rate_limit_exceeded() -> None:
     """Exceeding the configured rate limit should raise an error."""
 
     config = WebhookTriggerConfig(
@@ -131,10 +167,10 @@ def test_webhook_rate_limit_exceeded() -> None:
     )
     state = WebhookTriggerState(config)
 
-    state.validate(make_request())
+    await state.validate(make_request())
 
     with pytest.raises(RateLimitExceededError):
-        state.validate(make_request())
+        await state.validate(make_request())
 
 
 def test_webhook_shared_secret_validation_with_none_secret() -> None:
@@ -89,14 +89,15 @@ def test_webhook_method_not_allowed_empty_set() -> None:
     assert "none" in str(error)
 
 
-def test_webhook_method_validation_rejects_disallowed() -> None:
+@pytest.mark.asyncio
+async def test_webhook_method_validation_rejects_disallowed() -> None:
     """Request method validation should reject disallowed methods."""
 
     config = WebhookTriggerConfig(allowed_methods=["POST"])
     state = WebhookTriggerState(config)
 
     with pytest.raises(MethodNotAllowedError):
-        state.validate(make_request(method="GET"))
+        await state.validate(make_request(method="GET"))
 
 
 def test_webhook_state_config_property() -> None:
@@ -111,16 +112,16 @@ def test_webhook_state_config_property() -> None:
     assert state.config.allowed_methods == ["POST"]
 
 
-def test_webhook_state_update_config() -> None:
-    """Updating config should replace state and clear rate limit data."""
+@pytest.mark.asyncio
+async def test_webhook_state_update_config() -> None:
+    """Updating config replaces state but leaves rate limits to an explicit reset."""
 
     config1 = WebhookTriggerConfig(
         rate_limit=RateLimitConfig(limit=1, interval_seconds=60)
     )
     state = WebhookTriggerState(config1)
 
-    state.validate(make_request())
-    assert len(state._recent_invocations) == 1
+    await state.validate(make_request())
 
     old_time = datetime.now(tz=UTC) - timedelta(seconds=10)
     state._recent_signatures.append(("sig1", old_time))
@@ -130,6 +131,9 @@ def test_webhook_state_update_config() -> None:
     state.update_config(config2)
 
     assert state.config.allowed_methods == ["GET"]
-    assert len(state._recent_invocations) == 0
+    assert state._rate_limit_backend._tats != {}
     assert len(state._recent_signatures) == 0
     assert len(state._signature_cache) == 0
+
+    await state.reset_rate_limit()
+    assert state._rate_limit_backend._tats == {}
@@ -12,7 +12,8 @@ from orcheo.triggers.webhook import (
 from tests.triggers_webhook_helpers import make_request, sign_payload
 
 
-def test_webhook_validates_hmac_signature() -> None:
+@pytest.mark.asyncio
+async def test_webhook_validates_hmac_signature() -> None:
     """Valid HMAC signatures should be accepted."""
 
     secret = "super-secret"
@@ -35,7 +36,7 @@ def test_webhook_validates_hmac_signature() -> None:
     )
     state = WebhookTriggerState(config)
 
-    state.validate(
+    await state.validate(
         make_request(
             payload=payload,
             headers={
@@ -46,7 +47,8 @@ def test_webhook_validates_hmac_signature() -> None:
     )
 
 
-def test_webhook_rejects_invalid_hmac_signature() -> None:
+@pytest.mark.asyncio
+async def test_webhook_rejects_invalid_hmac_signature() -> None:
     """Invalid HMAC signatures should be rejected with 401."""
 
     secret = "super-secret"
@@ -70,7 +72,7 @@ def test_webhook_rejects_invalid_hmac_signature() -> None:
     invalid_signature = signature[:-1] + ("0" if signature[-1] != "0" else "1")
 
     with pytest.raises(WebhookAuthenticationError):
-        state.validate(
+        await state.validate(
             make_request(
                 payload=payload,
                 headers={
@@ -81,7 +83,8 @@ def test_webhook_rejects_invalid_hmac_signature() -> None:
         )
 
 
-def test_webhook_hmac_requires_timestamp_when_configured() -> None:
+@pytest.mark.asyncio
+async def test_webhook_hmac_requires_timestamp_when_configured() -> None:
     """Timestamp header must be present when configured for HMAC verification."""
 
     secret = "super-secret"
@@ -96,12 +99,13 @@ def test_webhook_hmac_requires_timestamp_when_configured() -> None:
     state = WebhookTriggerState(config)
 
     with pytest.raises(WebhookAuthenticationError):
-        state.validate(
+        await state.validate(
             make_request(payload=payload, headers={"x-signature": signature})
         )
 
 
-def test_webhook_hmac_replay_protection() -> None:
+@pytest.mark.asyncio
+async def test_webhook_hmac_replay_protection() -> None:
     """Replaying the same signature should trigger authentication failure."""
 
     secret = "super-secret"
@@ -129,13 +133,14 @@ def test_webhook_hmac_replay_protection() -> None:
         },
     )
 
-    state.validate(request)
+    await state.validate(request)
 
     with pytest.raises(WebhookAuthenticationError):
-        state.validate(request)
+        await state.validate(request)
 
 
-def test_webhook_hmac_timestamp_tolerance() -> None:
+@pytest.mark.asyncio
+async def test_webhook_hmac_timestamp_tolerance() -> None:
     """Signatures outside the tolerance window should be rejected."""
 
     secret = "super-secret"
@@ -156,7 +161,7 @@ def test_webhook_hmac_timestamp_tolerance() -> None:
     state = WebhookTriggerState(config)
 
     with pytest.raises(WebhookAuthenticationError):
-        state.validate(
+        await state.validate(
             make_request(
                 payload=payload,
                 headers={
@@ -195,7 +200,8 @@ def test_webhook_hmac_validation_with_none_header() -> None:
     state._validate_hmac_signature(request)
 
 
-def test_webhook_hmac_validation_missing_signature_header() -> None:
+@pytest.mark.asyncio
+async def test_webhook_hmac_validation_missing_signature_header() -> None:
     """HMAC validation should reject requests missing the signature header."""
 
     config = WebhookTriggerConfig(
@@ -207,10 +213,11 @@ def test_webhook_hmac_validation_missing_signature_header() -> None:
     request = make_request(payload={"test": "data"}, headers={})
 
     with pytest.raises(WebhookAuthenticationError):
-        state.validate(request)
+        await state.validate(request)
 
 
-def test_webhook_hmac_without_timestamp_header() -> None:
+@pytest.mark.asyncio
+async def test_webhook_hmac_without_timestamp_header() -> None:
     """HMAC validation should work without timestamp header."""
 
     secret = "super-secret"
@@ -228,7 +235,7 @@ def test_webhook_hmac_without_timestamp_header() -> None:
     )
     state = WebhookTriggerState(config)
 
-    state.validate(
+    await state.validate(
         make_request(
             payload=payload,
             headers={"x-signature": signature},
@@ -11,14 +11,15 @@ from orcheo.triggers import (
 )
 
 
-def test_error_handling_and_validation() -> None:
+@pytest.mark.asyncio
+async def test_error_handling_and_validation() -> None:
     """Error handling validates inputs and logs appropriately."""
 
     layer = TriggerLayer()
     workflow_id = uuid4()
 
     with pytest.raises(ValueError, match="workflow_id cannot be None"):
-        layer.prepare_webhook_dispatch(
+        await layer.prepare_webhook_dispatch(
             None,
             WebhookRequest(
                 method="POST",
@@ -29,7 +30,7 @@ def test_error_handling_and_validation() -> None:
         )
 
     with pytest.raises(ValueError, match="request cannot be None"):
-        layer.prepare_webhook_dispatch(workflow_id, None)
+        await layer.prepare_webhook_dispatch(workflow_id, None)
 
     with pytest.raises(ValueError, match="now parameter cannot be None"):
         layer.collect_due_cron_dispatches(now=None)
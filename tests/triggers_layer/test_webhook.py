@@ -19,7 +19,8 @@ from orcheo.vault.oauth import (
 )
 
 
-def test_webhook_dispatch_validation_and_normalization() -> None:
+@pytest.mark.asyncio
+async def test_webhook_dispatch_validation_and_normalization() -> None:
     """Webhook dispatch plans include normalized payload and metadata."""
 
     workflow_id = uuid4()
@@ -42,7 +43,7 @@ def test_webhook_dispatch_validation_and_normalization() -> None:
         source_ip="203.0.113.5",
     )
 
-    dispatch = layer.prepare_webhook_dispatch(workflow_id, request)
+    dispatch = await layer.prepare_webhook_dispatch(workflow_id, request)
     assert dispatch.triggered_by == "webhook"
     assert dispatch.actor == "webhook"
     assert dispatch.input_payload["headers"]["x-auth"] == "secret"
@@ -50,7 +51,8 @@ def test_webhook_dispatch_validation_and_normalization() -> None:
     assert dispatch.input_payload["source_ip"] == "203.0.113.5"
 
 
-def test_webhook_dispatch_redacts_shared_secret_header() -> None:
+@pytest.mark.asyncio
+async def test_webhook_dispatch_redacts_shared_secret_header() -> None:
     """Shared secret headers are removed from dispatch payloads."""
 
     workflow_id = uuid4()
@@ -70,13 +72,14 @@ def test_webhook_dispatch_redacts_shared_secret_header() -> None:
         source_ip=None,
     )
 
-    dispatch = layer.prepare_webhook_dispatch(workflow_id, request)
+    dispatch = await layer.prepare_webhook_dispatch(workflow_id, request)
 
     assert "x-secret" not in dispatch.input_payload["headers"]
     assert dispatch.input_payload["headers"]["x-other"] == "value"
 
 
-def test_trigger_layer_blocks_unhealthy_workflows() -> None:
+@pytest.mark.asyncio
+async def test_trigger_layer_blocks_unhealthy_workflows() -> None:
     workflow_id = uuid4()
     report = CredentialHealthReport(
         workflow_id=workflow_id,
@@ -114,10 +117,11 @@ def test_trigger_layer_blocks_unhealthy_workflows() -> None:
     )
 
     with pytest.raises(CredentialHealthError):
-        layer.prepare_webhook_dispatch(workflow_id, request)
+        await layer.prepare_webhook_dispatch(workflow_id, request)
 
 
-def test_trigger_layer_health_guard_can_be_replaced() -> None:
+@pytest.mark.asyncio
+async def test_trigger_layer_health_guard_can_be_replaced() -> None:
     workflow_id = uuid4()
 
     class Guard:
@@ -143,7 +147,7 @@ def test_trigger_layer_health_guard_can_be_replaced() -> None:
         source_ip=None,
     )
 
-    layer.prepare_webhook_dispatch(workflow_id, request)
+    await layer.prepare_webhook_dispatch(workflow_id, request)
     assert guard.calls == 1
 
 
@@ -162,7 +166,8 @@ def test_trigger_layer_allows_missing_health_report() -> None:
     layer._ensure_healthy(workflow_id)
 
 
-def test_malformed_configuration_handling() -> None:
+@pytest.mark.asyncio
+async def test_malformed_configuration_handling() -> None:
     """Malformed configurations are handled gracefully."""
 
     layer = TriggerLayer()
@@ -180,4 +185,37 @@ def test_malformed_configuration_handling() -> None:
     )
 
     with pytest.raises(WebhookValidationError):
-        layer.prepare_webhook_dispatch(workflow_id, invalid_request)
+        await layer.prepare_webhook_dispatch(workflow_id, invalid_request)
+
+
+@pytest.mark.asyncio
+async def test_webhook_rate_limits_reset_only_when_changed() -> None:
+    """Rate limit state survives restores and unrelated configuration edits."""
+
+    workflow_id = uuid4()
+    layer = TriggerLayer()
+    limited = WebhookTriggerConfig(
+        rate_limit=RateLimitConfig(limit=1, interval_seconds=60)
+    )
+    layer.configure_webhook(workflow_id, limited)
+    request = WebhookRequest(
+        method="POST", headers={}, query_params={}, payload={}, source_ip=None
+    )
+    await layer.prepare_webhook_dispatch(workflow_id, request)
+
+    # Restoring stored configuration keeps the consumed capacity.
+    layer.configure_webhook(workflow_id, limited)
+    with pytest.raises(WebhookValidationError):
+        await layer.prepare_webhook_dispatch(workflow_id, request)
+
+    await layer.update_webhook_config(
+        workflow_id, limited.model_copy(update={"allowed_methods": ["POST", "PUT"]})
+    )
+    with pytest.raises(WebhookValidationError):
+        await layer.prepare_webhook_dispatch(workflow_id, request)
+
+    await layer.update_webhook_config(
+        workflow_id,
+        WebhookTriggerConfig(rate_limit=RateLimitConfig(limit=2, interval_seconds=60)),
+    )
+    await layer.prepare_webhook_dispatch(workflow_id, request)